@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Backfill relevance_tier and published_at onto existing entity mentions.
+
+Signal queries filter entity_mentions by the relevance_tier copied from the
+parent article. Mentions created before that field existed need it copied
+over once. The job walks articles in _id order and records the last processed
+_id in the backfill_checkpoints collection, so an interrupted run resumes
+where it stopped.
+
+Usage:
+    poetry run python scripts/backfill_mention_relevance_tiers.py [--dry-run] [--batch-size N] [--reset]
+
+Options:
+    --dry-run        Show what would be done without making changes
+    --batch-size N   Articles per batch (default 500)
+    --reset          Ignore the saved checkpoint and start from the beginning
+"""
+
+import asyncio
+import argparse
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateMany
+from src.crypto_news_aggregator.core.config import settings
+
+JOB_NAME = "mention_relevance_tiers"
+
+
+async def backfill_mention_relevance_tiers(
+    dry_run: bool = False,
+    batch_size: int = 500,
+    reset: bool = False,
+):
+    """
+    Copy relevance_tier and published_at from each article onto its mentions.
+
+    Args:
+        dry_run: If True, don't actually update, just show what would happen
+        batch_size: Number of articles to process per batch
+        reset: If True, discard the saved checkpoint and start over
+    """
+    client = AsyncIOMotorClient(settings.MONGODB_URI)
+    db = client[settings.MONGODB_NAME]
+    checkpoints = db.backfill_checkpoints
+
+    print(f"Connected to MongoDB: {settings.MONGODB_NAME}")
+
+    if reset and not dry_run:
+        await checkpoints.delete_one({"_id": JOB_NAME})
+        print("Checkpoint reset")
+
+    checkpoint = None if reset else await checkpoints.find_one({"_id": JOB_NAME})
+    last_id = checkpoint.get("last_article_id") if checkpoint else None
+    if last_id:
+        print(f"Resuming after article {last_id}")
+
+    if dry_run:
+        print("\n🔍 DRY RUN - No changes will be made\n")
+
+    articles_processed = 0
+    mentions_updated = 0
+
+    while True:
+        query = {"_id": {"$gt": last_id}} if last_id else {}
+        cursor = (
+            db.articles.find(query, {"relevance_tier": 1, "published_at": 1})
+            .sort("_id", 1)
+            .limit(batch_size)
+        )
+        articles = await cursor.to_list(length=batch_size)
+
+        if not articles:
+            break
+
+        operations = [
+            UpdateMany(
+                {"article_id": str(article["_id"])},
+                {
+                    "$set": {
+                        "relevance_tier": article.get("relevance_tier"),
+                        "published_at": article.get("published_at"),
+                    }
+                },
+            )
+            for article in articles
+        ]
+
+        if not dry_run:
+            result = await db.entity_mentions.bulk_write(operations, ordered=False)
+            mentions_updated += result.modified_count
+
+        last_id = articles[-1]["_id"]
+        articles_processed += len(articles)
+
+        if not dry_run:
+            await checkpoints.update_one(
+                {"_id": JOB_NAME},
+                {
+                    "$set": {
+                        "last_article_id": last_id,
+                        "updated_at": datetime.now(timezone.utc),
+                    },
+                    "$inc": {
+                        "articles_processed": len(articles),
+                        "mentions_updated": result.modified_count,
+                    },
+                },
+                upsert=True,
+            )
+
+        print(f"  Processed {articles_processed} articles, updated {mentions_updated} mentions")
+
+    # Print summary
+    print("\n" + "=" * 60)
+    print("BACKFILL SUMMARY")
+    print("=" * 60)
+    print(f"\nArticles processed: {articles_processed}")
+
+    if dry_run:
+        print("\n⚠️  DRY RUN - No changes were made")
+        print("   Run without --dry-run to apply changes")
+    else:
+        print(f"Mentions updated: {mentions_updated}")
+        print("\n✅ Backfill complete")
+
+    client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Backfill relevance_tier and published_at onto entity mentions"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be done without making changes"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Articles per batch (default 500)"
+    )
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Ignore the saved checkpoint and start from the beginning"
+    )
+
+    args = parser.parse_args()
+
+    asyncio.run(backfill_mention_relevance_tiers(
+        dry_run=args.dry_run,
+        batch_size=args.batch_size,
+        reset=args.reset,
+    ))
+
+
+if __name__ == "__main__":
+    main()
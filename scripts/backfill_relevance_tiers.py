@@ -6,11 +6,12 @@ This script classifies all articles that don't have a relevance_tier set.
 It's safe to run multiple times - it only processes unclassified articles.
 
 Usage:
-    poetry run python scripts/backfill_relevance_tiers.py [--dry-run] [--limit N]
+    poetry run python scripts/backfill_relevance_tiers.py [--dry-run] [--limit N] [--processes N]
 
 Options:
-    --dry-run    Show what would be done without making changes
-    --limit N    Only process N articles (useful for testing)
+    --dry-run        Show what would be done without making changes
+    --limit N        Only process N articles (useful for testing)
+    --processes N    Classify each batch across N worker processes
 """
 
 import asyncio
@@ -25,16 +26,17 @@ sys.path.insert(0, str(project_root))
 
 from motor.motor_asyncio import AsyncIOMotorClient
 from src.crypto_news_aggregator.core.config import settings
-from src.crypto_news_aggregator.services.relevance_classifier import classify_article
+from src.crypto_news_aggregator.services.relevance_classifier import get_classifier
 
 
-async def backfill_relevance_tiers(dry_run: bool = False, limit: int = None):
+async def backfill_relevance_tiers(dry_run: bool = False, limit: int = None, processes: int = None):
     """
     Backfill relevance_tier for all articles missing it.
 
     Args:
         dry_run: If True, don't actually update, just show what would happen
         limit: If set, only process this many articles
+        processes: If set, classify each batch across this many processes
     """
     # Connect to MongoDB
     client = AsyncIOMotorClient(settings.MONGODB_URI)
@@ -87,20 +89,23 @@ async def backfill_relevance_tiers(dry_run: bool = False, limit: int = None):
 
         batch_updates = []
 
-        for article in articles:
+        # Classify the whole batch at once (first 1000 chars of body text)
+        classifications = get_classifier().classify_batch(
+            [
+                {
+                    "title": article.get("title", ""),
+                    "text": (article.get("text") or article.get("content") or article.get("description") or "")[:1000],
+                }
+                for article in articles
+            ],
+            processes=processes,
+        )
+
+        for article, classification in zip(articles, classifications):
             article_id = article.get("_id")
             title = article.get("title", "")
-            text = article.get("text") or article.get("content") or article.get("description") or ""
-            source = article.get("source", "")
 
             try:
-                # Classify the article
-                classification = classify_article(
-                    title=title,
-                    text=text[:1000],  # First 1000 chars
-                    source=source
-                )
-
                 tier = classification["tier"]
                 reason = classification["reason"]
 
@@ -189,12 +194,19 @@ def main():
         default=None,
         help="Only process N articles (useful for testing)"
     )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="Classify each batch across N worker processes"
+    )
 
     args = parser.parse_args()
 
     asyncio.run(backfill_relevance_tiers(
         dry_run=args.dry_run,
-        limit=args.limit
+        limit=args.limit,
+        processes=args.processes
     ))
 
 
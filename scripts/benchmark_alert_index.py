@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark price alert evaluation with the sorted alert index.
+
+Generates N active alerts spread over the tracked coins (a mix of above,
+below, percent_up and percent_down conditions around each coin's price) and
+evaluates a stream of price ticks two ways:
+
+- linear: every alert's condition checked against the tick price in Python
+  (what check_and_send_alerts did per alert)
+- index: PriceAlertIndex.evaluate, two binary searches per symbol
+
+Alerts that fire are released again so every tick sees the full set.
+
+Usage:
+    poetry run python scripts/benchmark_alert_index.py [--alerts 1000 10000 100000] [--ticks 50]
+
+Options:
+    --alerts N...    Alert counts to benchmark (default 1000 10000 100000)
+    --ticks N        Price ticks per run (default 50)
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from bson import ObjectId
+
+from crypto_news_aggregator.models.alert import AlertInDB
+from crypto_news_aggregator.services.alert_index import PriceAlertIndex
+from crypto_news_aggregator.services.price_service import COIN_ID_TO_SYMBOL
+
+CONDITIONS = ["above", "below", "percent_up", "percent_down"]
+
+
+def generate_alerts(count, prices, rng):
+    """Alerts as users set them: price levels beyond the current price, percent moves from it."""
+    user_id = str(ObjectId())
+    alerts = []
+    for _ in range(count):
+        coin = rng.choice(list(prices))
+        price = prices[coin]
+        condition = rng.choice(CONDITIONS)
+        alerts.append(
+            AlertInDB(
+                _id=str(ObjectId()),
+                user_id=user_id,
+                user_email="bench@example.com",
+                crypto_id=coin,
+                condition=condition,
+                threshold=price * (rng.uniform(1.0, 1.3) if condition == "above" else rng.uniform(0.7, 1.0)),
+                threshold_percent=rng.uniform(1, 10),
+                last_triggered_price=price,
+            )
+        )
+    return alerts
+
+
+def linear_hits(alerts, ticks):
+    """The old evaluation: every alert checked against its coin's price."""
+    hits = 0
+    for tick in ticks:
+        for alert in alerts:
+            price = tick[alert.crypto_id]
+            change = (price - alert.last_triggered_price) / alert.last_triggered_price * 100
+            if (
+                (alert.condition == "percent_up" and change >= alert.threshold_percent)
+                or (alert.condition == "percent_down" and change <= -alert.threshold_percent)
+                or (alert.condition == "above" and price >= alert.threshold)
+                or (alert.condition == "below" and price <= alert.threshold)
+            ):
+                hits += 1
+    return hits
+
+
+def index_hits(index, ticks, now):
+    hits = 0
+    for tick in ticks:
+        for symbol, price in tick.items():
+            triggered = index.evaluate(symbol, price, now)
+            hits += len(triggered)
+            for hit in triggered:
+                index.release(hit.alert.id)
+    return hits
+
+
+def run(sizes, tick_count):
+    rng = random.Random(7)
+    prices = {coin: rng.uniform(1, 60000) for coin in COIN_ID_TO_SYMBOL}
+    ticks = [
+        {coin: price * rng.uniform(0.97, 1.03) for coin, price in prices.items()}
+        for _ in range(tick_count)
+    ]
+    now = datetime.now(timezone.utc)
+
+    print(f"{'alerts':>8} {'build (ms)':>11} {'index/tick (ms)':>16} {'linear/tick (ms)':>17} {'speedup':>8} {'hits':>9}")
+    print("-" * 76)
+    for count in sizes:
+        alerts = generate_alerts(count, prices, rng)
+
+        start = time.perf_counter()
+        index = PriceAlertIndex()
+        for alert in alerts:
+            index.add(alert)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        hits = index_hits(index, ticks, now)
+        index_ms = (time.perf_counter() - start) * 1000 / tick_count
+
+        start = time.perf_counter()
+        expected = linear_hits(alerts, ticks)
+        linear_ms = (time.perf_counter() - start) * 1000 / tick_count
+
+        assert hits == expected, (hits, expected)
+        print(
+            f"{count:>8} {build_ms:>11.0f} {index_ms:>16.2f} {linear_ms:>17.1f} "
+            f"{linear_ms / index_ms:>7.0f}x {hits:>9}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--alerts", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--ticks", type=int, default=50)
+    args = parser.parse_args()
+    run(args.alerts, args.ticks)
+
+
+if __name__ == "__main__":
+    main()
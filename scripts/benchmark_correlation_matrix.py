@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vectorized correlation matrix against per-pair alignment.
+
+Generates synthetic daily prices for N coins (correlated through a shared
+market factor, with ~5% of days missing per coin) and computes every pairwise
+correlation of daily returns two ways:
+
+- per pair: date-keyed dicts aligned in Python and one np.corrcoef call per
+  pair (what calculate_correlation did for each target coin)
+- matrix: CorrelationMatrix.from_prices, one vectorized pass over all pairs
+
+Reports the time per full all-pairs computation and the largest difference
+between the two results.
+
+Usage:
+    poetry run python scripts/benchmark_correlation_matrix.py [--sizes 10 50 200] [--days 365] [--repeat 3]
+
+Options:
+    --sizes N...     Coin counts to benchmark (default 10 50 200)
+    --days N         Days of prices per coin (default 365)
+    --repeat N       Timed runs per size; the best is reported (default 3)
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from crypto_news_aggregator.services.correlation_matrix import CorrelationMatrix, log_returns
+
+
+def generate_prices(coins, days, seed=7):
+    rng = np.random.default_rng(seed)
+    market = rng.normal(scale=0.02, size=(days, 1))
+    returns = market * rng.uniform(0.2, 1.5, size=coins) + rng.normal(scale=0.02, size=(days, coins))
+    prices = 100 * np.exp(np.cumsum(returns, axis=0))
+    prices[rng.random((days, coins)) < 0.05] = np.nan
+    timestamps = [datetime(2025, 1, 1) + timedelta(days=i) for i in range(days)]
+    return timestamps, prices
+
+
+def per_pair(timestamps, returns):
+    """All-pairs correlation the old way: dict alignment and np.corrcoef per pair."""
+    series = [
+        {ts.date(): value for ts, value in zip(timestamps, returns[:, i]) if not np.isnan(value)}
+        for i in range(returns.shape[1])
+    ]
+    result = np.full((len(series), len(series)), np.nan)
+    for i, base in enumerate(series):
+        for j, target in enumerate(series):
+            aligned_base, aligned_target = [], []
+            for day, value in target.items():
+                if day in base:
+                    aligned_base.append(base[day])
+                    aligned_target.append(value)
+            if len(aligned_base) >= 5:
+                result[i, j] = np.corrcoef(aligned_base, aligned_target)[0, 1]
+    return result
+
+
+def best_of(repeat, fn):
+    best, value = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, value
+
+
+def run(sizes, days, repeat):
+    print(f"{'coins':>6} {'pairs':>7} {'matrix (ms)':>12} {'per pair (ms)':>14} {'speedup':>9} {'max |diff|':>11}")
+    print("-" * 64)
+    for coins in sizes:
+        timestamps, prices = generate_prices(coins, days)
+        symbols = [f"coin-{i}" for i in range(coins)]
+
+        matrix_ms, matrix = best_of(
+            repeat, lambda: CorrelationMatrix.from_prices(symbols, timestamps, prices)
+        )
+        pair_ms, expected = best_of(
+            1 if coins > 50 else repeat, lambda: per_pair(timestamps[1:], log_returns(prices))
+        )
+        np.fill_diagonal(expected, 1.0)
+        diff = np.nanmax(np.abs(matrix.correlations - expected))
+        print(
+            f"{coins:>6} {coins * coins:>7} {matrix_ms:>12.2f} {pair_ms:>14.1f} "
+            f"{pair_ms / matrix_ms:>8.0f}x {diff:>11.1e}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.sizes, args.days, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark the single-pass entity matcher against per-entity regexes.
+
+Builds synthetic entity dictionaries of increasing size (each entity has a
+name, a ticker and a "$" ticker variant) and times how long it takes to find
+the entities in a typical ~2,000 character article, using
+EntityMatcher.find_all and using the previous approach of one compiled
+``\\b(...)\\b`` regex per entity. Both must find the same entities.
+
+Usage:
+    poetry run python scripts/benchmark_entity_matcher.py [--sizes 100 1000 10000] [--articles 50]
+
+Options:
+    --sizes N...     Dictionary sizes (entities) to benchmark (default 100 1000 10000)
+    --articles N     Articles matched per size (default 50)
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from crypto_news_aggregator.services.entity_matcher import EntityMatcher
+
+FILLER = (
+    "markets traders said the rally continued as institutional demand rose "
+    "while analysts pointed to inflows regulators and liquidity across venues"
+).split()
+
+
+def generate_mapping(size, seed=7):
+    """Synthetic canonical name -> variants mapping with ``size`` entities."""
+    rng = random.Random(seed)
+    mapping = {}
+    for i in range(size):
+        ticker = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(4)) + str(i)
+        mapping[f"Token {i}"] = [ticker, f"${ticker}", f"token{i} network"]
+    return mapping
+
+
+def generate_articles(mapping, count, seed=11):
+    """~2,000 character articles mentioning a handful of dictionary entries."""
+    rng = random.Random(seed)
+    variants = [v for vs in mapping.values() for v in vs]
+    articles = []
+    for _ in range(count):
+        words = [rng.choice(FILLER) for _ in range(280)]
+        for _ in range(8):
+            words[rng.randrange(len(words))] = rng.choice(variants).upper()
+        articles.append(" ".join(words))
+    return articles
+
+
+def regex_entities(patterns, text):
+    text = text.lower()
+    return {canonical for canonical, pattern in patterns.items() if pattern.search(text)}
+
+
+def run(sizes, article_count):
+    print(f"{'entities':>10} {'matcher (ms/article)':>21} {'regex (ms/article)':>19} {'speedup':>9}")
+    print("-" * 63)
+    for size in sizes:
+        mapping = generate_mapping(size)
+        articles = generate_articles(mapping, article_count)
+
+        matcher = EntityMatcher(mapping)
+        patterns = {
+            canonical: re.compile(r"\b(" + "|".join(re.escape(v) for v in variants) + r")\b", re.IGNORECASE)
+            for canonical, variants in mapping.items()
+        }
+
+        start = time.perf_counter()
+        found = [set(matcher.counts(article)) for article in articles]
+        matcher_ms = (time.perf_counter() - start) * 1000 / article_count
+
+        start = time.perf_counter()
+        expected = [regex_entities(patterns, article) for article in articles]
+        regex_ms = (time.perf_counter() - start) * 1000 / article_count
+
+        if found != expected:
+            print(f"❌ Entity mismatch at {size} entities")
+            return 1
+
+        print(f"{size:>10} {matcher_ms:>21.3f} {regex_ms:>19.3f} {regex_ms / matcher_ms:>8.1f}x")
+
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the single-pass entity matcher"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10000],
+        help="Dictionary sizes (entities) to benchmark"
+    )
+    parser.add_argument(
+        "--articles",
+        type=int,
+        default=50,
+        help="Articles matched per size"
+    )
+
+    args = parser.parse_args()
+    sys.exit(run(args.sizes, args.articles))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark narrative matching through the fingerprint index against a full scan.
+
+Builds synthetic narrative collections of increasing size (spread over a few
+hundred nucleus entities and focuses) and times how long it takes to find the
+best match for a batch of cluster fingerprints, by scoring every narrative
+with calculate_fingerprint_similarity (the previous find_matching_narrative
+loop) and by scoring only the top-k candidates from
+NarrativeFingerprintIndex. Reports how often both find an equally good match
+(ties between narratives are common, so scores are compared, not IDs).
+
+Usage:
+    poetry run python scripts/benchmark_narrative_index.py [--sizes 1000 10000 50000] [--queries 200] [--top-k 20]
+
+Options:
+    --sizes N...     Narrative counts to benchmark (default 1000 10000 50000)
+    --queries N      Cluster fingerprints matched per size (default 200)
+    --top-k N        Candidates scored per cluster (default 20)
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from crypto_news_aggregator.services.narrative_index import NarrativeFingerprintIndex
+from crypto_news_aggregator.services.narrative_themes import calculate_fingerprint_similarity
+
+FOCUS_WORDS = (
+    "price surge regulatory action etf approval network upgrade security breach "
+    "treasury purchase lawsuit settlement exchange listing governance vote"
+).split()
+
+
+def generate_fingerprint(rng, entities):
+    return {
+        "nucleus_entity": rng.choice(entities),
+        "narrative_focus": " ".join(rng.sample(FOCUS_WORDS, 2)),
+        "top_actors": rng.sample(entities, 4),
+        "key_actions": [rng.choice(FOCUS_WORDS)],
+    }
+
+
+def generate_narratives(size, seed=7):
+    rng = random.Random(seed)
+    entities = [f"Entity {i}" for i in range(max(50, size // 50))]
+    return entities, [(f"n{i}", generate_fingerprint(rng, entities)) for i in range(size)]
+
+
+def best_score(fingerprint, candidates):
+    """Best similarity among ``candidates``, or 0.0 below the match threshold."""
+    best = max((calculate_fingerprint_similarity(fingerprint, candidate) for candidate in candidates), default=0.0)
+    return best if best >= 0.5 else 0.0
+
+
+def run(sizes, query_count, top_k):
+    print(f"{'narratives':>10} {'index (ms/match)':>17} {'scan (ms/match)':>16} {'speedup':>9} {'same score':>11}")
+    print("-" * 67)
+    for size in sizes:
+        entities, narratives = generate_narratives(size)
+        by_id = dict(narratives)
+        rng = random.Random(11)
+        queries = [generate_fingerprint(rng, entities) for _ in range(query_count)]
+
+        start = time.perf_counter()
+        index = NarrativeFingerprintIndex()
+        for narrative_id, fingerprint in narratives:
+            index.add(narrative_id, fingerprint)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        found = [
+            best_score(query, [by_id[nid] for nid in index.candidates(query, limit=top_k)])
+            for query in queries
+        ]
+        index_ms = (time.perf_counter() - start) * 1000 / query_count
+
+        start = time.perf_counter()
+        expected = [best_score(query, by_id.values()) for query in queries]
+        scan_ms = (time.perf_counter() - start) * 1000 / query_count
+
+        same = sum(a == b for a, b in zip(found, expected)) / query_count
+        print(
+            f"{size:>10} {index_ms:>17.3f} {scan_ms:>16.3f} {scan_ms / index_ms:>8.1f}x {same:>10.1%}"
+            f"   (build {build_ms:.0f} ms)"
+        )
+
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark narrative matching through the fingerprint index"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 50000],
+        help="Narrative counts to benchmark"
+    )
+    parser.add_argument(
+        "--queries",
+        type=int,
+        default=200,
+        help="Cluster fingerprints matched per size"
+    )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=20,
+        help="Candidates scored per cluster"
+    )
+
+    args = parser.parse_args()
+    sys.exit(run(args.sizes, args.queries, args.top_k))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark the prefiltered relevance classifier against per-pattern matching.
+
+Generates synthetic title/body pairs (mostly ordinary crypto news, with some
+high- and low-signal phrases mixed in) and times classifying them with
+RelevanceClassifier.classify_batch, with classify_batch across a process
+pool, and with the previous approach of searching every compiled pattern in
+turn. All three must produce the same tiers, reasons and patterns.
+
+Usage:
+    poetry run python scripts/benchmark_relevance_classifier.py [--sizes 1000 10000] [--processes 4]
+
+Options:
+    --sizes N...     Batch sizes (articles) to benchmark (default 1000 10000 50000)
+    --processes N    Worker processes for the pooled run (default 4)
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from crypto_news_aggregator.services.relevance_classifier import RelevanceClassifier
+
+FILLER = (
+    "bitcoin ethereum markets traders said the network upgrade continued as "
+    "developers shipped a release while analysts watched liquidity and fees"
+).split()
+
+SIGNAL_PHRASES = [
+    "SEC", "hacked", "record inflow", "BlackRock", "legal tender",
+    "to the moon", "price prediction 2026", "year in review", "playstation",
+]
+
+
+class SequentialClassifier:
+    """The previous classifier: every pattern searched one after another."""
+
+    def __init__(self):
+        def compile_all(*groups):
+            return [re.compile(p, re.IGNORECASE) for group in groups for p in group]
+
+        c = RelevanceClassifier
+        self.tier3 = compile_all(c.NON_CRYPTO_PATTERNS, c.SPECULATION_PATTERNS,
+                                 c.PRICE_PREDICTION_PATTERNS, c.RETROSPECTIVE_PATTERNS)
+        self.tier1 = compile_all(c.REGULATORY_KEYWORDS, c.SECURITY_KEYWORDS, c.MARKET_DATA_KEYWORDS,
+                                 c.INSTITUTIONAL_KEYWORDS, c.ADOPTION_KEYWORDS)
+        self.exceptions = compile_all(c.HISTORICAL_SECURITY_PATTERNS)
+
+    @staticmethod
+    def first(text, patterns):
+        for pattern in patterns:
+            if pattern.search(text):
+                return pattern.pattern
+        return None
+
+    def classify(self, title, text):
+        title_lower = title.lower()
+        pattern = self.first(title_lower, self.tier3)
+        if pattern:
+            return 3, "low_signal", pattern
+        pattern = self.first(title_lower, self.tier1)
+        if pattern:
+            if self.first(title_lower, self.exceptions):
+                return 2, "historical_security", pattern
+            return 1, "high_signal_title", pattern
+        if text:
+            pattern = self.first(text[:1000].lower(), self.tier1)
+            if pattern:
+                return 1, "high_signal_body", pattern
+        return 2, "default", None
+
+
+def generate_articles(count, seed=3):
+    """Titles of ~10 words and bodies of ~1,000 characters."""
+    rng = random.Random(seed)
+    articles = []
+    for _ in range(count):
+        title = [rng.choice(FILLER) for _ in range(10)]
+        body = [rng.choice(FILLER) for _ in range(150)]
+        if rng.random() < 0.2:
+            title[rng.randrange(len(title))] = rng.choice(SIGNAL_PHRASES)
+        if rng.random() < 0.2:
+            body[rng.randrange(len(body))] = rng.choice(SIGNAL_PHRASES)
+        articles.append({"title": " ".join(title).capitalize(), "text": " ".join(body)})
+    return articles
+
+
+def key(result):
+    return result["tier"], result["reason"], result["matched_pattern"]
+
+
+def run(sizes, processes):
+    classifier = RelevanceClassifier()
+    sequential = SequentialClassifier()
+
+    print(f"{'articles':>9} {'sequential (/s)':>16} {'rule sets (/s)':>14} {f'{processes} procs (/s)':>13} {'speedup':>8}")
+    print("-" * 65)
+    for size in sizes:
+        articles = generate_articles(size)
+
+        start = time.perf_counter()
+        expected = [sequential.classify(a["title"], a["text"]) for a in articles]
+        sequential_rate = size / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        batched = classifier.classify_batch(articles)
+        batched_rate = size / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        pooled = classifier.classify_batch(articles, processes=processes)
+        pooled_rate = size / (time.perf_counter() - start)
+
+        if [key(r) for r in batched] != expected or [key(r) for r in pooled] != expected:
+            print(f"❌ Classification mismatch at {size} articles")
+            return 1
+
+        print(
+            f"{size:>9} {sequential_rate:>16,.0f} {batched_rate:>14,.0f} "
+            f"{pooled_rate:>13,.0f} {batched_rate / sequential_rate:>7.1f}x"
+        )
+
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the prefiltered relevance classifier"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 50000],
+        help="Batch sizes (articles) to benchmark"
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=4,
+        help="Worker processes for the pooled run"
+    )
+
+    args = parser.parse_args()
+    sys.exit(run(args.sizes, args.processes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark indexed salience clustering against the original algorithm.
+
+Generates a deterministic synthetic article set (overlapping nuclei, actors
+and tensions, similar in shape to a 48h detection window) and times
+cluster_by_narrative_salience against the original O(articles x clusters x
+cluster_size) implementation, verifying both produce identical clusters.
+
+Usage:
+    poetry run python scripts/benchmark_salience_clustering.py [--sizes 1000 5000 20000] [--reference-limit N]
+
+Options:
+    --sizes N...           Article counts to benchmark (default 1000 5000 20000)
+    --reference-limit N    Skip the original algorithm above N articles (default 20000)
+"""
+
+import asyncio
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from crypto_news_aggregator.services.narrative_themes import cluster_by_narrative_salience
+
+
+def reference_cluster(articles, min_cluster_size=3):
+    """The original clustering loop, rebuilding every cluster's aggregates per article."""
+    clusters = []
+    for article in articles:
+        nucleus = article.get('nucleus_entity')
+        actors = article.get('actors') or []
+        actor_salience = article.get('actor_salience') or {}
+        tensions = article.get('tensions') or []
+        if not nucleus or not actors:
+            continue
+        core_actors = [a for a in actors if actor_salience.get(a, 0) >= 4.5]
+
+        best_cluster = None
+        best_strength = 0.0
+        for cluster in clusters:
+            cluster_nucleus = cluster[0].get('nucleus_entity')
+            cluster_core_actors = set()
+            cluster_tensions = set()
+            for cluster_article in cluster:
+                cluster_tensions.update(cluster_article.get('tensions') or [])
+                c_salience = cluster_article.get('actor_salience') or {}
+                cluster_core_actors.update(
+                    a for a in cluster_article.get('actors') or []
+                    if c_salience.get(a, 0) >= 4.5
+                )
+            link_strength = 0.0
+            if nucleus == cluster_nucleus:
+                link_strength += 1.0
+            shared_core = len(set(core_actors) & cluster_core_actors)
+            if shared_core >= 2:
+                link_strength += 0.7
+            elif shared_core >= 1:
+                link_strength += 0.4
+            if set(tensions) & cluster_tensions:
+                link_strength += 0.3
+            if link_strength > best_strength:
+                best_strength = link_strength
+                best_cluster = cluster
+
+        if best_strength >= 0.8 and best_cluster is not None:
+            best_cluster.append(article)
+        else:
+            clusters.append([article])
+    return [c for c in clusters if len(c) >= min_cluster_size]
+
+
+def generate_articles(count, seed=42):
+    """Synthetic articles whose vocabulary grows with the window size."""
+    rng = random.Random(seed)
+    entities = [f"Entity{i}" for i in range(max(50, count // 10))]
+    tensions = [f"Tension{i}" for i in range(max(20, count // 50))]
+    articles = []
+    for i in range(count):
+        actors = rng.sample(entities, rng.randint(1, 5))
+        articles.append({
+            "id": str(i),
+            "title": f"Article {i}",
+            "nucleus_entity": rng.choice(actors),
+            "actors": actors,
+            "actor_salience": {a: rng.choice([2, 3, 4, 4.5, 5]) for a in actors},
+            "tensions": rng.sample(tensions, rng.randint(0, 2)),
+        })
+    return articles
+
+
+async def run(sizes, reference_limit):
+    logging.disable(logging.INFO)
+
+    print(f"{'articles':>10} {'indexed (s)':>12} {'original (s)':>13} {'speedup':>9} {'clusters':>9}")
+    print("-" * 58)
+    for size in sizes:
+        articles = generate_articles(size)
+
+        start = time.perf_counter()
+        indexed = await cluster_by_narrative_salience(articles)
+        indexed_time = time.perf_counter() - start
+
+        if size <= reference_limit:
+            start = time.perf_counter()
+            expected = reference_cluster(articles)
+            reference_time = time.perf_counter() - start
+
+            if [[a["id"] for a in c] for c in indexed] != [[a["id"] for a in c] for c in expected]:
+                print(f"❌ Cluster mismatch at {size} articles")
+                return 1
+
+            print(f"{size:>10} {indexed_time:>12.3f} {reference_time:>13.3f} "
+                  f"{reference_time / indexed_time:>8.1f}x {len(indexed):>9}")
+        else:
+            print(f"{size:>10} {indexed_time:>12.3f} {'skipped':>13} {'-':>9} {len(indexed):>9}")
+
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark indexed salience clustering"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 5000, 20000],
+        help="Article counts to benchmark"
+    )
+    parser.add_argument(
+        "--reference-limit",
+        type=int,
+        default=20000,
+        help="Skip the original algorithm above this many articles"
+    )
+
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.sizes, args.reference_limit)))
+
+
+if __name__ == "__main__":
+    main()
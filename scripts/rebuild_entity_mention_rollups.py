@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Rebuild or verify the hourly entity mention rollups.
+
+The entity_mention_rollups collection is maintained incrementally at ingest.
+Use this script to populate it from historical entity_mentions, to repair
+drift, or to check that it agrees with the raw collection.
+
+Usage:
+    poetry run python scripts/rebuild_entity_mention_rollups.py rebuild [--days N]
+    poetry run python scripts/rebuild_entity_mention_rollups.py check [--days N]
+
+Commands:
+    rebuild    Recompute rollup buckets for the last N days from raw mentions
+    check      Report buckets whose counts differ from raw mentions (exit 1 on mismatch)
+
+Options:
+    --days N   Number of days to cover (default 60, enough for 30d trending)
+"""
+
+import asyncio
+import argparse
+import sys
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from crypto_news_aggregator.db.mongodb import initialize_mongodb, mongo_manager
+from crypto_news_aggregator.db.operations.entity_mention_rollups import (
+    rebuild_rollups,
+    check_rollup_consistency,
+)
+
+
+async def run(command: str, days: int) -> int:
+    await initialize_mongodb()
+    start = datetime.now(timezone.utc) - timedelta(days=days)
+
+    try:
+        if command == "rebuild":
+            print(f"Rebuilding rollups for the last {days} days...")
+            stats = await rebuild_rollups(start)
+            print(f"\n✅ Scanned {stats['mentions_scanned']} mentions, "
+                  f"wrote {stats['buckets_written']} buckets")
+            return 0
+
+        print(f"Checking rollups for the last {days} days...")
+        mismatches = await check_rollup_consistency(start)
+        if not mismatches:
+            print("\n✅ Rollups match raw entity_mentions")
+            return 0
+
+        print(f"\n⚠️  {len(mismatches)} mismatched buckets:")
+        for mismatch in mismatches[:50]:
+            print(
+                f"  {mismatch['hour'].isoformat()}  {mismatch['entity']:<30} "
+                f"tier={mismatch['relevance_tier']}  raw={mismatch['raw_count']}  "
+                f"rollup={mismatch['rollup_count']}"
+            )
+        if len(mismatches) > 50:
+            print(f"  ... and {len(mismatches) - 50} more")
+        print("\nRun with 'rebuild' to repair")
+        return 1
+    finally:
+        await mongo_manager.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild or verify hourly entity mention rollups"
+    )
+    parser.add_argument("command", choices=["rebuild", "check"])
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=60,
+        help="Number of days to cover (default 60)"
+    )
+
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.command, args.days)))
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,11 @@ from zoneinfo import ZoneInfo
 from fastapi import APIRouter, Depends, Security
 
 from ..core.auth import get_api_key
+from ..core.leases import HOLDER_ID
+from ..core.response_cache import get_response_cache_metrics
 from ..db.mongodb import get_mongodb
+from ..db.operations.leases import get_leases
+from ..llm.cache import LLMResponseCache
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 logger = logging.getLogger(__name__)
@@ -254,6 +258,9 @@ async def get_cache_stats(
     
     total_requests = hits + misses
     hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
+
+    # Lookup-level hit rates per operation, split by cache tier
+    lookup_stats = await LLMResponseCache(db).get_stats()
     
     return {
         "cache_entries": {
@@ -266,7 +273,46 @@ async def get_cache_stats(
             "cache_misses": misses,
             "total_requests": total_requests,
             "hit_rate_percent": round(hit_rate, 2)
-        }
+        },
+        "by_operation": lookup_stats["by_operation"],
+    }
+
+
+@router.get("/cache/responses")
+async def get_response_cache_stats(
+    _api_key: str = Security(get_api_key)
+) -> Dict[str, Any]:
+    """Get hit/miss counters for the in-process API response caches (this instance only)"""
+    return {"caches": get_response_cache_metrics()}
+
+
+@router.get("/leases")
+async def get_job_leases(
+    _api_key: str = Security(get_api_key)
+) -> Dict[str, Any]:
+    """
+    Get the background job leases and which process holds each one.
+
+    Returns:
+        - this_process: Holder ID of the instance serving the request
+        - leases: One entry per job with holder, fencing token, expiry and
+          whether the lease is currently held
+    """
+    leases = await get_leases()
+    return {
+        "this_process": HOLDER_ID,
+        "leases": [
+            {
+                "name": lease["_id"],
+                "holder": lease.get("holder"),
+                "held": lease["held"],
+                "token": lease.get("token"),
+                "expires_at": lease.get("expires_at"),
+                "acquired_at": lease.get("acquired_at"),
+                "renewed_at": lease.get("renewed_at"),
+            }
+            for lease in leases
+        ],
     }
 
 
@@ -8,12 +8,17 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import JSONResponse
 from bson import ObjectId
 
+from ....core.response_cache import ResponseCache
 from ....models.article import ArticleInDB
-from ....services.article_service import article_service
+from ....services.article_service import NOT_DUPLICATE, article_service
 from ....core.auth import get_api_key
 
 router = APIRouter()
 
+# Read-mostly feed and aggregate endpoints; served stale for up to two more
+# minutes while a background task refreshes them
+articles_cache = ResponseCache("articles", ttl_seconds=60, stale_ttl_seconds=120)
+
 
 @router.get("/")
 async def list_articles(
@@ -70,7 +75,14 @@ async def get_recent_articles(
     Get recent articles in chronological order with clickable links.
     Returns title, url, source, published_at, and first 3 entities.
     Public endpoint - no authentication required.
+    Results are cached for 60 seconds.
     """
+    return await articles_cache.get_or_compute(
+        f"recent:{limit}", lambda: _fetch_recent_articles(limit)
+    )
+
+
+async def _fetch_recent_articles(limit: int) -> dict:
     from ....db.mongodb import mongo_manager
     
     db = await mongo_manager.get_async_database()
@@ -79,7 +91,7 @@ async def get_recent_articles(
     
     # Fetch recent articles sorted by published_at DESC
     cursor = articles_collection.find(
-        {},
+        NOT_DUPLICATE,
         {
             "title": 1,
             "url": 1,
@@ -183,13 +195,20 @@ async def get_trending_keywords(
     """
     Get trending keywords from recent articles.
     """
+    return await articles_cache.get_or_compute(
+        f"keywords:{hours}:{limit}:{min_mentions}",
+        lambda: _fetch_trending_keywords(hours, limit, min_mentions),
+    )
+
+
+async def _fetch_trending_keywords(hours: int, limit: int, min_mentions: int) -> List[dict]:
     # Calculate time window
     time_window = datetime.utcnow() - timedelta(hours=hours)
 
     # This is a simplified implementation - in a real app, you might want to use
     # a more sophisticated approach like TF-IDF or a dedicated search engine
     pipeline = [
-        {"$match": {"published_at": {"$gte": time_window}}},
+        {"$match": {"published_at": {"$gte": time_window}, **NOT_DUPLICATE}},
         {"$unwind": "$keywords"},
         {"$group": {"_id": "$keywords", "count": {"$sum": 1}}},
         {"$match": {"count": {"$gte": min_mentions}}},
@@ -214,6 +233,13 @@ async def get_sentiment_trends(
     """
     Get sentiment trends over time.
     """
+    return await articles_cache.get_or_compute(
+        f"sentiment:{hours}:{interval}",
+        lambda: _fetch_sentiment_trends(hours, interval),
+    )
+
+
+async def _fetch_sentiment_trends(hours: int, interval: int) -> dict:
     # Calculate time window
     end_time = datetime.utcnow()
     start_time = end_time - timedelta(hours=hours)
@@ -238,6 +264,7 @@ async def get_sentiment_trends(
             "$match": {
                 "published_at": {"$gte": start_time, "$lte": end_time},
                 "sentiment.score": {"$exists": True},
+                **NOT_DUPLICATE,
             }
         },
         {
@@ -316,11 +343,17 @@ async def get_source_stats(
     """
     Get statistics by source.
     """
+    return await articles_cache.get_or_compute(
+        f"sources:{hours}:{limit}", lambda: _fetch_source_stats(hours, limit)
+    )
+
+
+async def _fetch_source_stats(hours: int, limit: int) -> List[dict]:
     # Calculate time window
     time_window = datetime.utcnow() - timedelta(hours=hours)
 
     pipeline = [
-        {"$match": {"published_at": {"$gte": time_window}}},
+        {"$match": {"published_at": {"$gte": time_window}, **NOT_DUPLICATE}},
         {
             "$group": {
                 "_id": "$source.id",
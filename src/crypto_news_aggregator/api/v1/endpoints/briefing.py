@@ -10,6 +10,7 @@ from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Query, HTTPException
 from pydantic import BaseModel, Field
 
+from ....core.response_cache import ResponseCache
 from ....db.mongodb import mongo_manager
 from ....db.operations.briefing import (
     get_latest_briefing,
@@ -26,6 +27,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Formatted briefings change at most a few times a day (cleared on manual
+# generation), so the latest/history reads are cached for a minute
+briefing_cache = ResponseCache("briefing", ttl_seconds=60, stale_ttl_seconds=60, max_entries=64)
+
 
 # =============================================================================
 # Response Models
@@ -237,17 +242,16 @@ async def get_latest_briefing_endpoint():
         LatestBriefingResponse with briefing and next_briefing_at
     """
     try:
-        briefing = await get_latest_briefing()
+        formatted = await briefing_cache.get_or_compute("latest", _fetch_latest_formatted_briefing)
         next_briefing = _calculate_next_briefing_time()
 
-        if not briefing:
+        if not formatted:
             # Return null briefing when none exist yet
             return LatestBriefingResponse(
                 briefing=None,
                 next_briefing_at=next_briefing["next_time_utc"],
             )
 
-        formatted = _format_briefing(briefing)
         return LatestBriefingResponse(
             briefing=BriefingResponse(**formatted),
             next_briefing_at=next_briefing["next_time_utc"],
@@ -258,6 +262,11 @@ async def get_latest_briefing_endpoint():
         raise HTTPException(status_code=500, detail="Failed to fetch briefing")
 
 
+async def _fetch_latest_formatted_briefing() -> Optional[Dict[str, Any]]:
+    briefing = await get_latest_briefing()
+    return _format_briefing(briefing) if briefing else None
+
+
 @router.get("/morning", response_model=BriefingResponse)
 async def get_morning_briefing_endpoint(
     date: Optional[str] = Query(
@@ -360,18 +369,20 @@ async def get_briefing_history_endpoint(
         List of briefings, sorted by most recent first
     """
     try:
-        briefings = await get_briefings_last_n_days(days=days)
-
-        if not briefings:
-            return []
-
-        return [BriefingResponse(**_format_briefing(b)) for b in briefings]
+        return await briefing_cache.get_or_compute(
+            f"history:{days}", lambda: _fetch_briefing_history(days)
+        )
 
     except Exception as e:
         logger.exception(f"Error fetching briefing history: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch briefing history")
 
 
+async def _fetch_briefing_history(days: int) -> List[BriefingResponse]:
+    briefings = await get_briefings_last_n_days(days=days)
+    return [BriefingResponse(**_format_briefing(b)) for b in briefings or []]
+
+
 @router.get("/next", response_model=NextBriefingResponse)
 async def get_next_briefing_time_endpoint():
     """
@@ -438,6 +449,8 @@ async def generate_briefing_endpoint(request: GenerateBriefingRequest):
             raise HTTPException(status_code=400, detail="Invalid briefing type. Use 'morning', 'afternoon', or 'evening'")
 
         if briefing:
+            # Serve the new briefing immediately instead of a cached older one
+            briefing_cache.clear()
             return GenerateBriefingResponse(
                 success=True,
                 message=f"Successfully generated {request.type} briefing",
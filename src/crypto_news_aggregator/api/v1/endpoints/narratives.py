@@ -14,15 +14,16 @@ from bson import ObjectId
 
 from ....db.operations.narratives import get_active_narratives, get_narrative_timeline, get_resurrected_narratives, get_archived_narratives
 from ....core.redis_rest_client import redis_client
+from ....core.response_cache import ResponseCache
 from ....db.mongodb import mongo_manager
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# In-memory cache for narratives with 1-minute TTL
-_narratives_cache: Dict[str, tuple[Any, datetime]] = {}
-_narratives_cache_ttl = timedelta(minutes=1)
+# Active narrative responses: fresh for 1 minute, then served stale for up to
+# another minute while they are recomputed in the background
+narratives_cache = ResponseCache("narratives", ttl_seconds=60, stale_ttl_seconds=60)
 
 
 async def get_articles_for_narrative(article_ids: List[str], limit: int = 20) -> List[Dict[str, Any]]:
@@ -257,7 +258,8 @@ async def get_active_narratives_endpoint(
     Returns the most recently updated narratives, representing groups of
     co-occurring crypto entities with AI-generated thematic summaries.
     
-    Results are cached in-memory for 1 minute to reduce database load.
+    Results are cached in-memory for 1 minute to reduce database load;
+    concurrent misses share one database query.
     
     Args:
         limit: Maximum number of narratives (1-200, default 50)
@@ -266,193 +268,184 @@ async def get_active_narratives_endpoint(
     Returns:
         List of narrative objects with theme, entities, story, and metadata
     """
-    # Check in-memory cache
-    cache_key = f"narratives:active:{limit}:{lifecycle_state or 'all'}"
+    cache_key = f"active:{limit}:{lifecycle_state or 'all'}"
+
+    try:
+        return await narratives_cache.get_or_compute(
+            cache_key, lambda: _fetch_active_narratives(limit, lifecycle_state)
+        )
+    except Exception as e:
+        logger.exception(f"Error fetching active narratives: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch narratives")
+
+
+async def _fetch_active_narratives(limit: int, lifecycle_state: Optional[str]) -> List[NarrativeResponse]:
+    """Fetch active narratives using the optimized aggregation pipeline."""
+    db = await mongo_manager.get_async_database()
+    narratives_collection = db.narratives
     
-    if cache_key in _narratives_cache:
-        cached_data, cached_time = _narratives_cache[cache_key]
-        if datetime.now() - cached_time < _narratives_cache_ttl:
-            return cached_data
-        else:
-            # Remove expired entry
-            del _narratives_cache[cache_key]
+    # Build match filter for active states
+    active_states = ['emerging', 'rising', 'hot', 'cooling', 'reactivated']
+    match_stage = {
+        '$or': [
+            {'lifecycle_state': {'$in': active_states}},
+            {'lifecycle_state': {'$exists': False}}
+        ]
+    }
+    if lifecycle_state:
+        match_stage = {'lifecycle_state': lifecycle_state}
     
-    # Cache miss - fetch from database using optimized aggregation pipeline
-    try:
-        db = await mongo_manager.get_async_database()
-        narratives_collection = db.narratives
+    # Single aggregation pipeline (use inclusion-only projection)
+    pipeline = [
+        {'$match': match_stage},
+        {'$sort': {'last_updated': -1}},
+        {'$limit': limit},
+        # Lookup articles to get the most recent article timestamp
+        {'$lookup': {
+            'from': 'articles',
+            'let': {'article_ids': '$article_ids'},
+            'pipeline': [
+                {'$match': {
+                    '$expr': {
+                        '$in': [{'$toString': '$_id'}, '$$article_ids']
+                    }
+                }},
+                {'$project': {'published_at': 1}},
+                {'$sort': {'published_at': -1}},
+                {'$limit': 1}
+            ],
+            'as': 'recent_articles'
+        }},
+        # Add computed field for last_article_at
+        {'$addFields': {
+            'last_article_at': {
+                '$arrayElemAt': ['$recent_articles.published_at', 0]
+            }
+        }},
+        {'$project': {
+            '_id': 1,
+            'theme': 1,
+            'title': 1,
+            'summary': 1,
+            'entities': 1,
+            'article_count': 1,
+            'mention_velocity': 1,
+            'lifecycle': 1,
+            'lifecycle_state': 1,
+            'momentum': 1,
+            'recency_score': 1,
+            'entity_relationships': 1,
+            'first_seen': 1,
+            'last_updated': 1,
+            'last_article_at': 1,
+            'days_active': 1,
+            'peak_activity': 1,
+            'reawakening_count': 1,
+            'reawakened_from': 1,
+            'resurrection_velocity': 1
+            # Exclude heavy fields by not including them: fingerprint, lifecycle_history, timeline_data
+        }}
+    ]
+    
+    cursor = narratives_collection.aggregate(pipeline)
+    narratives = await cursor.to_list(length=None)
+    
+    if not narratives:
+        return []
+    
+    # Convert to response models and fetch articles
+    response_data = []
+    for narrative in narratives:
+        # Handle both old (updated_at) and new (last_updated) field names
+        last_updated = narrative.get("last_updated") or narrative.get("updated_at")
+        if last_updated:
+            last_updated_str = last_updated.isoformat() if hasattr(last_updated, 'isoformat') else str(last_updated)
+        else:
+            # Fallback to current time if no timestamp
+            from datetime import timezone as tz
+            last_updated_str = datetime.now(tz.utc).isoformat()
         
-        # Build match filter for active states
-        active_states = ['emerging', 'rising', 'hot', 'cooling', 'reactivated']
-        match_stage = {
-            '$or': [
-                {'lifecycle_state': {'$in': active_states}},
-                {'lifecycle_state': {'$exists': False}}
-            ]
-        }
-        if lifecycle_state:
-            match_stage = {'lifecycle_state': lifecycle_state}
+        first_seen = narrative.get("first_seen") or narrative.get("created_at")
+        if first_seen:
+            first_seen_str = first_seen.isoformat() if hasattr(first_seen, 'isoformat') else str(first_seen)
+        else:
+            # Use last_updated as fallback
+            first_seen_str = last_updated_str
         
-        # Single aggregation pipeline (use inclusion-only projection)
-        pipeline = [
-            {'$match': match_stage},
-            {'$sort': {'last_updated': -1}},
-            {'$limit': limit},
-            # Lookup articles to get the most recent article timestamp
-            {'$lookup': {
-                'from': 'articles',
-                'let': {'article_ids': '$article_ids'},
-                'pipeline': [
-                    {'$match': {
-                        '$expr': {
-                            '$in': [{'$toString': '$_id'}, '$$article_ids']
-                        }
-                    }},
-                    {'$project': {'published_at': 1}},
-                    {'$sort': {'published_at': -1}},
-                    {'$limit': 1}
-                ],
-                'as': 'recent_articles'
-            }},
-            # Add computed field for last_article_at
-            {'$addFields': {
-                'last_article_at': {
-                    '$arrayElemAt': ['$recent_articles.published_at', 0]
-                }
-            }},
-            {'$project': {
-                '_id': 1,
-                'theme': 1,
-                'title': 1,
-                'summary': 1,
-                'entities': 1,
-                'article_count': 1,
-                'mention_velocity': 1,
-                'lifecycle': 1,
-                'lifecycle_state': 1,
-                'momentum': 1,
-                'recency_score': 1,
-                'entity_relationships': 1,
-                'first_seen': 1,
-                'last_updated': 1,
-                'last_article_at': 1,
-                'days_active': 1,
-                'peak_activity': 1,
-                'reawakening_count': 1,
-                'reawakened_from': 1,
-                'resurrection_velocity': 1
-                # Exclude heavy fields by not including them: fingerprint, lifecycle_history, timeline_data
-            }}
-        ]
+        # DEBUG: Log timestamp ordering
+        theme = narrative.get("theme", "unknown")
+        if first_seen and last_updated:
+            if first_seen > last_updated:
+                logger.warning(f"[API TIMESTAMP BUG] Narrative '{theme}': first_seen={first_seen_str} > last_updated={last_updated_str}")
+            else:
+                logger.debug(f"[API TIMESTAMP OK] Narrative '{theme}': first_seen={first_seen_str} <= last_updated={last_updated_str}")
         
-        cursor = narratives_collection.aggregate(pipeline)
-        narratives = await cursor.to_list(length=None)
+        # Handle both old (story) and new (summary) field names
+        summary = narrative.get("summary") or narrative.get("story", "")
         
-        if not narratives:
-            return []
+        # Get timeline tracking fields
+        days_active = narrative.get("days_active", 1)
+        peak_activity = narrative.get("peak_activity")
         
-        # Convert to response models and fetch articles
-        response_data = []
-        for narrative in narratives:
-            # Handle both old (updated_at) and new (last_updated) field names
-            last_updated = narrative.get("last_updated") or narrative.get("updated_at")
-            if last_updated:
-                last_updated_str = last_updated.isoformat() if hasattr(last_updated, 'isoformat') else str(last_updated)
-            else:
-                # Fallback to current time if no timestamp
-                from datetime import timezone as tz
-                last_updated_str = datetime.now(tz.utc).isoformat()
-            
-            first_seen = narrative.get("first_seen") or narrative.get("created_at")
-            if first_seen:
-                first_seen_str = first_seen.isoformat() if hasattr(first_seen, 'isoformat') else str(first_seen)
-            else:
-                # Use last_updated as fallback
-                first_seen_str = last_updated_str
-            
-            # DEBUG: Log timestamp ordering
-            theme = narrative.get("theme", "unknown")
-            if first_seen and last_updated:
-                if first_seen > last_updated:
-                    logger.warning(f"[API TIMESTAMP BUG] Narrative '{theme}': first_seen={first_seen_str} > last_updated={last_updated_str}")
-                else:
-                    logger.debug(f"[API TIMESTAMP OK] Narrative '{theme}': first_seen={first_seen_str} <= last_updated={last_updated_str}")
-            
-            # Handle both old (story) and new (summary) field names
-            summary = narrative.get("summary") or narrative.get("story", "")
-            
-            # Get timeline tracking fields
-            days_active = narrative.get("days_active", 1)
-            peak_activity = narrative.get("peak_activity")
-            
-            # Don't fetch articles for list view - only fetch when user requests details
-            # This prevents N+1 query problem and speeds up initial page load from 2 minutes to <1 second
-            articles = []
-            
-            # Lifecycle fields (heavy fields excluded in projection)
-            lifecycle_state = narrative.get("lifecycle_state")
-            
-            # Handle reawakened_from timestamp
-            reawakened_from = narrative.get("reawakened_from")
-            reawakened_from_str = None
-            if reawakened_from:
-                reawakened_from_str = reawakened_from.isoformat() if hasattr(reawakened_from, 'isoformat') else str(reawakened_from)
-            
-            # Handle last_article_at timestamp (most recent article published_at)
-            last_article_at = narrative.get("last_article_at")
-            last_article_at_str = None
-            if last_article_at:
-                last_article_at_str = last_article_at.isoformat() if hasattr(last_article_at, 'isoformat') else str(last_article_at)
-                # DEBUG: Log when last_article_at differs from last_updated
-                if last_article_at_str != last_updated_str:
-                    logger.debug(f"[API DEBUG] Narrative '{narrative.get('theme')}': last_article_at={last_article_at_str}, last_updated={last_updated_str}")
-            else:
-                # Fallback to last_updated if no articles found
-                last_article_at_str = last_updated_str
-                logger.debug(f"[API DEBUG] Narrative '{narrative.get('theme')}': No last_article_at, using last_updated={last_updated_str}")
-            
-            narrative_id = str(narrative.get("_id", ""))
-            response_data.append({
-                "id": narrative_id,  # Include as 'id' for Pydantic model
-                "_id": narrative_id,  # Also include as '_id' for frontend compatibility
-                "theme": narrative.get("theme", ""),
-                "title": narrative.get("title", narrative.get("theme", "")),  # Fallback to theme if no title
-                "summary": summary,
-                "entities": narrative.get("entities", []),
-                "article_count": narrative.get("article_count", 0),
-                "mention_velocity": narrative.get("mention_velocity", 0.0),
-                "lifecycle": narrative.get("lifecycle", "emerging"),
-                "lifecycle_state": lifecycle_state,
-                "lifecycle_history": None,  # Excluded for performance
-                "fingerprint": None,  # Excluded for performance
-                "momentum": narrative.get("momentum", "unknown"),
-                "recency_score": narrative.get("recency_score", 0.0),
-                "entity_relationships": narrative.get("entity_relationships", []),
-                "first_seen": first_seen_str,
-                "last_updated": last_updated_str,
-                "last_article_at": last_article_at_str,
-                "days_active": days_active,
-                "peak_activity": peak_activity,
-                "articles": articles,
-                "reawakening_count": narrative.get("reawakening_count"),
-                "reawakened_from": reawakened_from_str,
-                "resurrection_velocity": narrative.get("resurrection_velocity"),
-                # Add backward compatibility fields for old UI
-                "updated_at": last_updated_str,
-                "story": summary
-            })
+        # Don't fetch articles for list view - only fetch when user requests details
+        # This prevents N+1 query problem and speeds up initial page load from 2 minutes to <1 second
+        articles = []
+        
+        # Lifecycle fields (heavy fields excluded in projection)
+        lifecycle_state = narrative.get("lifecycle_state")
         
-        # Convert to response models
-        response = [NarrativeResponse(**n) for n in response_data]
+        # Handle reawakened_from timestamp
+        reawakened_from = narrative.get("reawakened_from")
+        reawakened_from_str = None
+        if reawakened_from:
+            reawakened_from_str = reawakened_from.isoformat() if hasattr(reawakened_from, 'isoformat') else str(reawakened_from)
         
-        # Store in cache with current timestamp (1-minute TTL)
-        _narratives_cache[cache_key] = (response, datetime.now())
+        # Handle last_article_at timestamp (most recent article published_at)
+        last_article_at = narrative.get("last_article_at")
+        last_article_at_str = None
+        if last_article_at:
+            last_article_at_str = last_article_at.isoformat() if hasattr(last_article_at, 'isoformat') else str(last_article_at)
+            # DEBUG: Log when last_article_at differs from last_updated
+            if last_article_at_str != last_updated_str:
+                logger.debug(f"[API DEBUG] Narrative '{narrative.get('theme')}': last_article_at={last_article_at_str}, last_updated={last_updated_str}")
+        else:
+            # Fallback to last_updated if no articles found
+            last_article_at_str = last_updated_str
+            logger.debug(f"[API DEBUG] Narrative '{narrative.get('theme')}': No last_article_at, using last_updated={last_updated_str}")
         
-        return response
+        narrative_id = str(narrative.get("_id", ""))
+        response_data.append({
+            "id": narrative_id,  # Include as 'id' for Pydantic model
+            "_id": narrative_id,  # Also include as '_id' for frontend compatibility
+            "theme": narrative.get("theme", ""),
+            "title": narrative.get("title", narrative.get("theme", "")),  # Fallback to theme if no title
+            "summary": summary,
+            "entities": narrative.get("entities", []),
+            "article_count": narrative.get("article_count", 0),
+            "mention_velocity": narrative.get("mention_velocity", 0.0),
+            "lifecycle": narrative.get("lifecycle", "emerging"),
+            "lifecycle_state": lifecycle_state,
+            "lifecycle_history": None,  # Excluded for performance
+            "fingerprint": None,  # Excluded for performance
+            "momentum": narrative.get("momentum", "unknown"),
+            "recency_score": narrative.get("recency_score", 0.0),
+            "entity_relationships": narrative.get("entity_relationships", []),
+            "first_seen": first_seen_str,
+            "last_updated": last_updated_str,
+            "last_article_at": last_article_at_str,
+            "days_active": days_active,
+            "peak_activity": peak_activity,
+            "articles": articles,
+            "reawakening_count": narrative.get("reawakening_count"),
+            "reawakened_from": reawakened_from_str,
+            "resurrection_velocity": narrative.get("resurrection_velocity"),
+            # Add backward compatibility fields for old UI
+            "updated_at": last_updated_str,
+            "story": summary
+        })
     
-    except Exception as e:
-        logger.exception(f"Error fetching active narratives: {e}")
-        raise HTTPException(status_code=500, detail="Failed to fetch narratives")
+    # Convert to response models
+    return [NarrativeResponse(**n) for n in response_data]
 
 
 @router.get("/archived", response_model=List[NarrativeResponse])
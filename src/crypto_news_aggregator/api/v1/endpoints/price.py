@@ -43,7 +43,7 @@ async def get_bitcoin_price_history(
     if hours < 1 or hours > 168:  # Limit to 1 hour to 1 week
         raise HTTPException(status_code=400, detail="Hours must be between 1 and 168")
 
-    history = price_service.get_recent_price_history(hours=hours)
+    history = await price_service.get_recent_price_history(hours=hours)
     return {
         "symbol": "BTC",
         "prices": [
@@ -1,20 +1,31 @@
 import asyncio
+import inspect
 import logging
 import re
 import time
 from collections import Counter
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from typing import Iterable, List, Sequence, Dict, Any, Optional
 
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
 from ..services.rss_service import RSSService
 from ..db.operations.articles import create_or_update_articles
-from ..db.operations.entity_mentions import create_entity_mentions_batch
+from ..db.operations.entity_mentions import (
+    create_entity_mentions_batch,
+    update_mentions_relevance,
+)
 from ..llm.factory import get_llm_provider, get_optimized_llm
 from ..db.mongodb import mongo_manager
 from ..core.config import settings
-from ..services.entity_normalization import normalize_entity_name
+from ..services.entity_normalization import find_entities, normalize_entity_name
 from ..services.selective_processor import create_processor
 from ..services.relevance_classifier import classify_article
+from ..services.article_enrichment import ENRICHMENT_OPERATION, enrich_article as enrich_article_combined
+from ..services.near_duplicates import article_signature, get_near_duplicate_index
 
 logger = logging.getLogger(__name__)
 
@@ -100,11 +111,17 @@ async def fetch_and_process_rss_feeds():
     logger.info(f"Processing {len(articles)} articles after blacklist filter")
     await create_or_update_articles(articles)
 
+    # Only remember which entries were seen once they are stored
+    try:
+        await rss_service.save_feed_states()
+    except Exception as e:
+        logger.warning(f"Failed to save RSS feed state: {e}")
+
     # Run LLM analysis on the newly fetched articles
     await process_new_articles_from_mongodb()
 
 
-def _tokenize_for_keywords(text: str) -> Iterable[str]:
+def _tokenize_words(text: str) -> Iterable[str]:
     for token in re.findall(r"\b[A-Za-z][A-Za-z0-9\-\$]{2,}\b", text):
         lowered = token.lower()
         if lowered in _STOPWORDS:
@@ -114,6 +131,24 @@ def _tokenize_for_keywords(text: str) -> Iterable[str]:
         yield token.strip("$#")
 
 
+def _tokenize_for_keywords(text: str) -> Iterable[str]:
+    """
+    Keyword tokens, with known entities counted under their canonical name.
+
+    "BTC", "$BTC" and "Bitcoin" all become "Bitcoin". All-lowercase ticker
+    variants ("link", "op", "near") are left as ordinary words, since in
+    prose they are usually not the token.
+    """
+    position = 0
+    for match in find_entities(text):
+        if match.text.islower() and match.text.lower() != match.canonical.lower():
+            continue
+        yield from _tokenize_words(text[position:match.start])
+        yield match.canonical
+        position = match.end
+    yield from _tokenize_words(text[position:])
+
+
 def _select_keywords(
     tokens: Sequence[str], max_keywords: int = _MAX_KEYWORDS
 ) -> List[str]:
@@ -144,6 +179,19 @@ def _derive_sentiment_label(score: float) -> str:
     return "neutral"
 
 
+async def _call_llm(llm_client, method_name: str, *args):
+    """
+    Call an LLM provider method without blocking the event loop.
+
+    Providers with a native ``<method>_async`` coroutine use it (and the
+    shared pooled HTTP client); anything else runs in a worker thread.
+    """
+    async_method = getattr(llm_client, f"{method_name}_async", None)
+    if async_method is not None and inspect.iscoroutinefunction(async_method):
+        return await async_method(*args)
+    return await asyncio.to_thread(getattr(llm_client, method_name), *args)
+
+
 def _normalize_entity(entity_value: str, entity_type: str) -> str:
     """Normalize entity values for consistency.
 
@@ -276,7 +324,7 @@ async def _process_entity_extraction_batch(
 
     # Call batch entity extraction
     try:
-        result = llm_client.extract_entities_batch(batch_input)
+        result = await _call_llm(llm_client, "extract_entities_batch", batch_input)
 
         # Normalize and deduplicate entities in results
         for article_result in result.get("results", []):
@@ -393,7 +441,600 @@ async def _retry_individual_extractions(
     }
 
 
-async def process_new_articles_from_mongodb():
+ENRICHMENT_QUERY = {
+    # Near-duplicates share their canonical article's enrichment
+    "is_duplicate": {"$ne": True},
+    "$or": [
+        {"relevance_score": {"$exists": False}},
+        {"relevance_score": None},
+        {"relevance_score": 0.0},
+        {"sentiment_score": {"$exists": False}},
+        {"sentiment_score": None},
+        {"sentiment_score": 0.0},
+        {"sentiment": {"$exists": False}},
+        {"relevance_tier": {"$exists": False}},
+        {"relevance_tier": None},
+    ]
+}
+
+# Seconds the writer waits for more results before flushing a partial batch
+_WRITER_FLUSH_INTERVAL = 1.0
+
+
+@dataclass
+class EnrichmentPipelineMetrics:
+    """Per-stage counters and timings for one enrichment pipeline run."""
+
+    articles_queued: int = 0
+    articles_enriched: int = 0
+    articles_skipped: int = 0
+    articles_failed: int = 0
+    near_duplicates: int = 0
+    llm_extractions: int = 0
+    regex_extractions: int = 0
+    combined_enrichments: int = 0
+    mentions_written: int = 0
+    write_batches: int = 0
+    write_errors: int = 0
+    tier_counts: Dict[int, int] = field(default_factory=lambda: {1: 0, 2: 0, 3: 0})
+    # Time spent inside each stage (summed across workers)
+    extraction_seconds: float = 0.0
+    enrichment_seconds: float = 0.0
+    write_seconds: float = 0.0
+    # Backpressure: time a stage spent blocked on a full downstream queue
+    producer_blocked_seconds: float = 0.0
+    workers_blocked_seconds: float = 0.0
+    max_work_queue_depth: int = 0
+    max_write_queue_depth: int = 0
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+_last_pipeline_metrics: Optional[EnrichmentPipelineMetrics] = None
+
+
+def get_enrichment_pipeline_metrics() -> Optional[Dict[str, Any]]:
+    """Return the metrics of the most recent enrichment pipeline run, if any."""
+    return _last_pipeline_metrics.to_dict() if _last_pipeline_metrics else None
+
+
+def _near_duplicate_update(article: Dict[str, Any], index) -> Optional[UpdateOne]:
+    """
+    Check an article against the near-duplicate index.
+
+    Returns:
+        The update marking it as a duplicate of its canonical article, or
+        None if it is an original (it is then added to the index)
+    """
+    signature = article.get("minhash") or article_signature(article)
+    if not signature:
+        return None
+    match = index.check(str(article["_id"]), signature)
+    if match is None:
+        return None
+    canonical_id, similarity = match
+    return UpdateOne(
+        {"_id": article["_id"]},
+        {"$set": {
+            "is_duplicate": True,
+            "duplicate_of": ObjectId(canonical_id) if ObjectId.is_valid(canonical_id) else canonical_id,
+            "duplicate_similarity": round(similarity, 3),
+            "updated_at": datetime.now(timezone.utc),
+        }},
+    )
+
+
+async def _put_with_backpressure(queue: asyncio.Queue, item: Any) -> float:
+    """Put an item on a bounded queue, returning the seconds spent blocked."""
+    if not queue.full():
+        queue.put_nowait(item)
+        return 0.0
+    started = time.perf_counter()
+    await queue.put(item)
+    return time.perf_counter() - started
+
+
+async def _run_stages(tasks: List[asyncio.Task]) -> None:
+    """
+    Wait for every pipeline stage, failing fast.
+
+    On the first exception the remaining stages are cancelled, so none is
+    left blocked on a queue that nobody reads any more, and the exception is
+    raised. The stages are also cancelled if the wait itself is.
+    """
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    for task in done:
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()
+
+
+def _llm_entity_data(
+    article_id_str: str,
+    entities: List[Dict[str, Any]],
+    sentiment: str = "neutral",
+) -> Dict[str, Any]:
+    """Convert optimized LLM entities to the structured entity format."""
+    return {
+        "article_id": article_id_str,
+        "primary_entities": [
+            {
+                "name": e.get("name"),
+                "type": e.get("type"),
+                "confidence": e.get("confidence", 0.9),
+                "ticker": None
+            }
+            for e in entities if e.get("is_primary", False)
+        ],
+        "context_entities": [
+            {
+                "name": e.get("name"),
+                "type": e.get("type"),
+                "confidence": e.get("confidence", 0.9)
+            }
+            for e in entities if not e.get("is_primary", False)
+        ],
+        "sentiment": sentiment,
+        "method": "llm"
+    }
+
+
+def _regex_entity_data(article_id_str: str, regex_entities: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert regex entity mentions to the structured entity format."""
+    return {
+        "article_id": article_id_str,
+        "primary_entities": [
+            {
+                "name": e.get("entity"),
+                "type": e.get("entity_type"),
+                "confidence": e.get("confidence", 0.7),
+                "ticker": None
+            }
+            for e in regex_entities if e.get("is_primary", False)
+        ],
+        "context_entities": [
+            {
+                "name": e.get("entity"),
+                "type": e.get("entity_type"),
+                "confidence": e.get("confidence", 0.7)
+            }
+            for e in regex_entities if not e.get("is_primary", False)
+        ],
+        "sentiment": "neutral",
+        "method": "regex"
+    }
+
+
+async def _extract_entities_selective(
+    batch: List[Dict[str, Any]],
+    optimized_llm,
+    selective_processor,
+    metrics: EnrichmentPipelineMetrics,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract entities for a batch with the optimized LLM or regex fallback.
+
+    Articles that need the LLM are sent in a single extract_entities_batch
+    call, which packs them into as few requests as possible.
+
+    Returns:
+        Dict mapping article id (str) to its structured entity data
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+
+    # Decide processing method
+    llm_articles = [article for article in batch if selective_processor.should_use_llm(article)]
+
+    if llm_articles:
+        # Use optimized LLM (with caching)
+        try:
+            entity_results = await optimized_llm.extract_entities_batch([
+                {
+                    "title": article.get("title", ""),
+                    "text": article.get("text") or article.get("content") or article.get("description") or ""
+                }
+                for article in llm_articles
+            ])
+            for article, entity_result in zip(llm_articles, entity_results):
+                article_id_str = str(article.get("_id"))
+                entities = entity_result.get("entities", []) if entity_result else []
+                results[article_id_str] = _llm_entity_data(article_id_str, entities)
+                metrics.llm_extractions += 1
+                logger.debug(f"🤖 Article {article_id_str}: LLM extraction, {len(entities)} entities")
+        except Exception as e:
+            logger.error(f"LLM extraction failed for {len(llm_articles)} article(s): {e}")
+            # Fall back to regex
+
+    for article in batch:
+        article_id_str = str(article.get("_id"))
+        if article_id_str in results:
+            continue
+
+        # Use regex extraction (free, fast)
+        try:
+            regex_entities = await selective_processor.extract_entities_simple(
+                article.get("_id"),
+                article
+            )
+        except Exception as e:
+            logger.error(f"Regex extraction failed for {article_id_str}: {e}")
+            continue
+        results[article_id_str] = _regex_entity_data(article_id_str, regex_entities)
+        metrics.regex_extractions += 1
+        logger.debug(f"📝 Article {article_id_str}: Regex extraction, {len(regex_entities)} entities")
+
+    return results
+
+
+async def _enrich_combined_selective(
+    batch: List[Dict[str, Any]],
+    optimized_llm,
+    selective_processor,
+    metrics: EnrichmentPipelineMetrics,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Enrich LLM-selected articles with one combined call each.
+
+    Scores, themes, entities and narrative elements come back from a single
+    request instead of four. Articles whose combined call fails are left out
+    so the caller can fall back to separate extraction and scoring.
+
+    Returns:
+        Dict mapping article id (str) to its combined enrichment result
+    """
+    llm_articles = [article for article in batch if selective_processor.should_use_llm(article)]
+    if not llm_articles:
+        return {}
+
+    outcomes = await asyncio.gather(
+        *[enrich_article_combined(article, optimized_llm) for article in llm_articles],
+        return_exceptions=True,
+    )
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for article, outcome in zip(llm_articles, outcomes):
+        article_id_str = str(article.get("_id"))
+        if isinstance(outcome, BaseException):
+            logger.error(f"Combined enrichment failed for {article_id_str}: {outcome}")
+        elif outcome:
+            results[article_id_str] = outcome
+            metrics.combined_enrichments += 1
+            metrics.llm_extractions += 1
+    return results
+
+
+async def _enrich_article(
+    article: Dict[str, Any],
+    entity_data: Dict[str, Any],
+    llm_client,
+    combined: Optional[Dict[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Score one article and prepare its database writes.
+
+    When ``combined`` (a result of the combined enrichment call) is given,
+    scores, themes and narrative elements are taken from it instead of
+    calling ``llm_client``.
+
+    Returns:
+        Dict with the article UpdateOne, the mentions to insert and whether
+        the article's relevance tier changed, or None if the article has no text
+    """
+    article_id = article.get("_id")
+    title = article.get("title") or ""
+    body_parts = [
+        article.get("text") or "",
+        article.get("content") or "",
+        article.get("description") or "",
+    ]
+    combined_text = " ".join(
+        part.strip() for part in [title, *body_parts] if part
+    ).strip()
+
+    if not combined_text:
+        logger.debug("Skipping article %s due to missing text", article_id)
+        return None
+
+    # Classify article relevance tier (rule-based, no LLM cost)
+    classification = classify_article(
+        title=title,
+        text=combined_text[:1000],  # First 1000 chars for classification
+        source=article.get("source")
+    )
+    relevance_tier = classification["tier"]
+    relevance_reason = classification["reason"]
+
+    tier_emoji = {1: "🔥", 2: "📰", 3: "🔇"}[relevance_tier]
+    logger.debug(
+        f"{tier_emoji} Article {article_id}: Tier {relevance_tier} ({relevance_reason})"
+    )
+
+    if combined is not None:
+        relevance_score = combined["relevance_score"]
+        sentiment_score = combined["sentiment_score"]
+        themes: List[str] = combined.get("themes") or []
+        provider = ENRICHMENT_OPERATION
+    else:
+        # Relevance, sentiment and themes are independent, so run them concurrently
+        relevance_result, sentiment_result, themes_result = await asyncio.gather(
+            _call_llm(llm_client, "score_relevance", combined_text),
+            _call_llm(llm_client, "analyze_sentiment", combined_text),
+            _call_llm(llm_client, "extract_themes", [combined_text]),
+            return_exceptions=True,
+        )
+
+        try:
+            if isinstance(relevance_result, BaseException):
+                raise relevance_result
+            relevance_score = float(relevance_result)
+        except Exception as exc:
+            logger.warning("Relevance scoring failed for %s: %s", article_id, exc)
+            relevance_score = 0.0
+
+        try:
+            if isinstance(sentiment_result, BaseException):
+                raise sentiment_result
+            sentiment_score = float(sentiment_result)
+        except Exception as exc:
+            logger.warning("Sentiment analysis failed for %s: %s", article_id, exc)
+            sentiment_score = 0.0
+
+        try:
+            if isinstance(themes_result, BaseException):
+                raise themes_result
+            themes = (
+                [str(theme) for theme in themes_result]
+                if isinstance(themes_result, list)
+                else []
+            )
+        except Exception as exc:
+            logger.warning("Theme extraction failed for %s: %s", article_id, exc)
+            themes = []
+
+        provider = str(getattr(llm_client, "model_name", llm_client.__class__.__name__))
+
+    sentiment_label = _derive_sentiment_label(sentiment_score)
+
+    keyword_tokens = list(_tokenize_for_keywords(combined_text))
+    keywords = _select_keywords(keyword_tokens)
+
+    if themes:
+        for theme in themes:
+            normalized_theme = theme.strip()
+            if normalized_theme and normalized_theme not in keywords:
+                keywords.append(normalized_theme)
+                if len(keywords) >= _MAX_KEYWORDS:
+                    break
+
+    sentiment_payload = {
+        "score": sentiment_score,
+        "magnitude": abs(sentiment_score),
+        "label": sentiment_label,
+        "provider": provider,
+        "updated_at": datetime.now(timezone.utc),
+    }
+
+    # Get entity extraction results for this article
+    article_id_str = str(article_id)
+    
+    # Parse new structured entity format
+    primary_entities = entity_data.get("primary_entities", [])
+    context_entities = entity_data.get("context_entities", [])
+    entity_sentiment = entity_data.get("sentiment", sentiment_label)
+    
+    # Log entity extraction for this article
+    if primary_entities or context_entities:
+        logger.info(
+            f"Article {article_id_str}: {len(primary_entities)} primary, {len(context_entities)} context entities"
+        )
+    else:
+        logger.warning(f"Article {article_id_str}: No entities extracted")
+    
+    # Combine all entities for storage in article document
+    all_entities = []
+    for entity in primary_entities:
+        all_entities.append({
+            "name": entity.get("name"),
+            "type": entity.get("type"),
+            "ticker": entity.get("ticker"),
+            "confidence": entity.get("confidence", 1.0),
+            "is_primary": True,
+        })
+    for entity in context_entities:
+        all_entities.append({
+            "name": entity.get("name"),
+            "type": entity.get("type"),
+            "confidence": entity.get("confidence", 1.0),
+            "is_primary": False,
+        })
+
+    update_operations = {
+        "$set": {
+            "relevance_score": relevance_score,
+            "relevance_tier": relevance_tier,
+            "relevance_reason": relevance_reason,
+            "sentiment_score": sentiment_score,
+            "sentiment_label": sentiment_label,
+            "sentiment": sentiment_payload,
+            "themes": themes,
+            "keywords": keywords,
+            "entities": all_entities,
+            "updated_at": datetime.now(timezone.utc),
+        }
+    }
+
+    if combined and combined.get("narrative_hash"):
+        update_operations["$set"].update({
+            "actors": combined["actors"],
+            "actor_salience": combined["actor_salience"],
+            "nucleus_entity": combined["nucleus_entity"],
+            "narrative_focus": combined["narrative_focus"],
+            "actions": combined["actions"],
+            "tensions": combined["tensions"],
+            "implications": combined["implications"],
+            "narrative_summary": combined["narrative_summary"],
+            "narrative_hash": combined["narrative_hash"],
+            "narrative_extracted_at": datetime.now(timezone.utc),
+        })
+
+    # Create entity mentions for tracking
+    article_source = article.get("source") or article.get("source_id") or "unknown"
+    published_at = article.get("published_at")
+    mentions_to_create = []
+
+    if primary_entities or context_entities:
+        logger.debug(f"Preparing entity mentions for article {article_id_str}")
+        
+        # Process primary entities
+        for entity in primary_entities:
+            entity_name = entity.get("name")
+            entity_type = entity.get("type")
+            ticker = entity.get("ticker")
+            
+            # Ensure entity name is normalized (defense in depth)
+            if entity_name:
+                normalized_name = normalize_entity_name(entity_name)
+                if normalized_name != entity_name:
+                    logger.info(f"Entity mention normalized: '{entity_name}' → '{normalized_name}'")
+                    entity_name = normalized_name
+            
+            # Create mention for the entity name (already normalized by LLM + double-check above)
+            if entity_name:
+                mentions_to_create.append(
+                    {
+                        "entity": entity_name,
+                        "entity_type": entity_type,
+                        "article_id": article_id_str,
+                        "sentiment": entity_sentiment,
+                        "confidence": entity.get("confidence", 1.0),
+                        "source": article_source,
+                        "is_primary": True,
+                        "relevance_tier": relevance_tier,
+                        "published_at": published_at,
+                        "metadata": {
+                            "article_title": title,
+                            "extraction_batch": True,
+                            "ticker": ticker,
+                        },
+                    }
+                )
+            
+            # DO NOT create separate ticker mentions - they're already normalized to entity_name
+        
+        # Process context entities
+        for entity in context_entities:
+            entity_name = entity.get("name")
+            entity_type = entity.get("type")
+            
+            # Normalize context entities if they're crypto-related
+            if entity_name and entity_type in ["cryptocurrency", "blockchain"]:
+                normalized_name = normalize_entity_name(entity_name)
+                if normalized_name != entity_name:
+                    logger.info(f"Context entity normalized: '{entity_name}' → '{normalized_name}'")
+                    entity_name = normalized_name
+            
+            if entity_name:
+                mentions_to_create.append(
+                    {
+                        "entity": entity_name,
+                        "entity_type": entity_type,
+                        "article_id": article_id_str,
+                        "sentiment": entity_sentiment,
+                        "confidence": entity.get("confidence", 1.0),
+                        "source": article_source,
+                        "is_primary": False,
+                        "relevance_tier": relevance_tier,
+                        "published_at": published_at,
+                        "metadata": {
+                            "article_title": title,
+                            "extraction_batch": True,
+                        },
+                    }
+                )
+
+    return {
+        "update": UpdateOne({"_id": article_id}, update_operations),
+        "article_id": article_id_str,
+        "relevance_tier": relevance_tier,
+        "published_at": published_at,
+        # Keep denormalized tier on existing mentions in sync when an
+        # article is reclassified
+        "reclassified": article.get("relevance_tier") != relevance_tier,
+        "mentions": mentions_to_create,
+    }
+
+
+async def _flush_enrichment_writes(
+    collection,
+    pending: List[Dict[str, Any]],
+    metrics: EnrichmentPipelineMetrics,
+) -> int:
+    """
+    Write a batch of enrichment results.
+
+    Article updates go out as one unordered bulk_write and all entity mentions
+    as one batch insert.
+
+    Returns:
+        Number of articles successfully updated
+    """
+    started = time.perf_counter()
+    written = len(pending)
+
+    try:
+        await collection.bulk_write([item["update"] for item in pending], ordered=False)
+    except BulkWriteError as exc:
+        write_errors = exc.details.get("writeErrors", [])
+        failed_indexes = {error["index"] for error in write_errors}
+        logger.error(f"Failed to update {len(failed_indexes)} enriched article(s): {write_errors[:3]}")
+        metrics.write_errors += len(failed_indexes)
+        pending = [item for i, item in enumerate(pending) if i not in failed_indexes]
+        written = len(pending)
+    except Exception as exc:
+        logger.error(f"Failed to write enrichment batch of {len(pending)} article(s): {exc}")
+        metrics.write_errors += len(pending)
+        metrics.write_seconds += time.perf_counter() - started
+        return 0
+
+    for item in pending:
+        if item["reclassified"]:
+            try:
+                await update_mentions_relevance(
+                    item["article_id"], item["relevance_tier"], item["published_at"]
+                )
+            except Exception as exc:
+                logger.error(f"Failed to update mention tiers for {item['article_id']}: {exc}")
+
+    mentions = [mention for item in pending for mention in item["mentions"]]
+    if mentions:
+        try:
+            await create_entity_mentions_batch(mentions)
+            metrics.mentions_written += len(mentions)
+        except Exception as exc:
+            logger.error(
+                "Failed to create %d entity mentions for %d article(s): %s",
+                len(mentions),
+                len(pending),
+                exc,
+            )
+
+    metrics.write_batches += 1
+    metrics.write_seconds += time.perf_counter() - started
+    logger.info(f"💾 Wrote {written} enriched article(s) and {len(mentions)} entity mentions")
+    return written
+
+
+async def process_new_articles_from_mongodb(
+    concurrency: Optional[int] = None,
+    write_batch_size: Optional[int] = None,
+) -> int:
     """
     Analyzes and enriches new articles from MongoDB that haven't been processed yet.
     
@@ -401,7 +1042,29 @@ async def process_new_articles_from_mongodb():
     - OptimizedAnthropicLLM with caching and Haiku model (12x cheaper)
     - SelectiveArticleProcessor to decide LLM vs regex extraction (~50% reduction)
     - Combined savings: ~85% cost reduction
+
+    Articles flow through a staged pipeline connected by bounded queues:
+    1. Producer: a single cursor over unenriched articles, grouped into
+       batches of ENTITY_EXTRACTION_BATCH_SIZE
+    2. Workers: ``concurrency`` tasks that extract entities and score
+       relevance/sentiment/themes for a batch. With ENRICHMENT_COMBINED_CALL,
+       LLM-selected articles get all of these plus narrative elements from
+       one combined request (see ``services.article_enrichment``)
+    3. Writer: flushes results with bulk_write and batched mention inserts
+
+    When a downstream stage falls behind, the bounded queues block the
+    upstream one; time spent blocked is reported in the pipeline metrics
+    (see ``get_enrichment_pipeline_metrics``).
+
+    Args:
+        concurrency: Number of enrichment workers (defaults to ENRICHMENT_CONCURRENCY)
+        write_batch_size: Articles per bulk write (defaults to ENRICHMENT_WRITE_BATCH_SIZE)
+
+    Returns:
+        Number of articles enriched
     """
+    global _last_pipeline_metrics
+
     db = await mongo_manager.get_async_database()
     collection = db.articles
     
@@ -420,143 +1083,172 @@ async def process_new_articles_from_mongodb():
     # Keep standard LLM for sentiment/relevance (not entity extraction)
     llm_client = get_llm_provider()
 
-    enrichment_query = {
-        "$or": [
-            {"relevance_score": {"$exists": False}},
-            {"relevance_score": None},
-            {"relevance_score": 0.0},
-            {"sentiment_score": {"$exists": False}},
-            {"sentiment_score": None},
-            {"sentiment_score": 0.0},
-            {"sentiment": {"$exists": False}},
-            {"relevance_tier": {"$exists": False}},
-            {"relevance_tier": None},
-        ]
-    }
+    concurrency = max(1, concurrency or settings.ENRICHMENT_CONCURRENCY)
+    write_batch_size = max(1, write_batch_size or settings.ENRICHMENT_WRITE_BATCH_SIZE)
+    batch_size = settings.ENTITY_EXTRACTION_BATCH_SIZE
 
-    # Collect articles into batches for entity extraction
-    articles_list = []
-    async for article in collection.find(enrichment_query):
-        articles_list.append(article)
+    near_duplicate_index = None
+    if settings.NEAR_DUPLICATE_DETECTION:
+        try:
+            near_duplicate_index = await get_near_duplicate_index(db)
+        except Exception as e:
+            logger.warning(f"Near-duplicate index unavailable, enriching every article: {e}")
+
+    metrics = EnrichmentPipelineMetrics()
+    work_queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    write_queue: asyncio.Queue = asyncio.Queue(maxsize=write_batch_size * 2)
+    pipeline_started = time.perf_counter()
+
+    async def produce() -> None:
+        # Updated articles can be returned again by a cursor whose index keys
+        # they modified, so remember what has already been queued
+        seen_ids = set()
+        batch: List[Dict[str, Any]] = []
+        duplicate_updates: List[UpdateOne] = []
+        async for article in collection.find(ENRICHMENT_QUERY):
+            if article["_id"] in seen_ids:
+                continue
+            seen_ids.add(article["_id"])
+            if near_duplicate_index is not None:
+                update = _near_duplicate_update(article, near_duplicate_index)
+                if update is not None:
+                    duplicate_updates.append(update)
+                    metrics.near_duplicates += 1
+                    if len(duplicate_updates) >= write_batch_size:
+                        await collection.bulk_write(duplicate_updates, ordered=False)
+                        duplicate_updates = []
+                    continue
+            batch.append(article)
+            metrics.articles_queued += 1
+            if len(batch) >= batch_size:
+                metrics.producer_blocked_seconds += await _put_with_backpressure(work_queue, batch)
+                metrics.max_work_queue_depth = max(metrics.max_work_queue_depth, work_queue.qsize())
+                batch = []
+        if batch:
+            metrics.producer_blocked_seconds += await _put_with_backpressure(work_queue, batch)
+        if duplicate_updates:
+            await collection.bulk_write(duplicate_updates, ordered=False)
+        # Only reached when every article was queued; on failure the workers are cancelled
+        for _ in range(concurrency):
+            await work_queue.put(None)
+
+    async def work() -> None:
+        while True:
+            batch = await work_queue.get()
+            if batch is None:
+                return
+
+            started = time.perf_counter()
+            entity_extraction_results = {}
+            combined_results = {}
+            if optimized_llm and settings.ENRICHMENT_COMBINED_CALL:
+                combined_results = await _enrich_combined_selective(
+                    batch, optimized_llm, selective_processor, metrics
+                )
+                for article_id_str, combined in combined_results.items():
+                    entity_extraction_results[article_id_str] = _llm_entity_data(
+                        article_id_str,
+                        combined["entities"],
+                        _derive_sentiment_label(combined["sentiment_score"]),
+                    )
+            if optimized_llm:
+                remaining = [
+                    article for article in batch
+                    if str(article.get("_id")) not in combined_results
+                ]
+                if remaining:
+                    entity_extraction_results.update(await _extract_entities_selective(
+                        remaining, optimized_llm, selective_processor, metrics
+                    ))
+            else:
+                # Fallback to original batch processing
+                try:
+                    extraction_result = await _process_entity_extraction_batch(batch, llm_client)
+                    entity_extraction_results = {
+                        result["article_id"]: result
+                        for result in extraction_result.get("results", [])
+                        if result.get("article_id")
+                    }
+                except Exception as exc:
+                    logger.error(f"Entity extraction failed for batch of {len(batch)}: {exc}")
+                metrics.llm_extractions += len(batch)
+            metrics.extraction_seconds += time.perf_counter() - started
+
+            started = time.perf_counter()
+            enrichments = await asyncio.gather(
+                *[
+                    _enrich_article(
+                        article,
+                        entity_extraction_results.get(str(article.get("_id")), {}),
+                        llm_client,
+                        combined_results.get(str(article.get("_id"))),
+                    )
+                    for article in batch
+                ],
+                return_exceptions=True,
+            )
+            metrics.enrichment_seconds += time.perf_counter() - started
 
-    if not articles_list:
-        logger.debug("No articles to enrich")
-        return 0
+            for article, enrichment in zip(batch, enrichments):
+                if isinstance(enrichment, BaseException):
+                    logger.error(
+                        "Failed to enrich article %s: %s", article.get("_id"), enrichment
+                    )
+                    metrics.articles_failed += 1
+                elif enrichment is None:
+                    metrics.articles_skipped += 1
+                else:
+                    metrics.tier_counts[enrichment["relevance_tier"]] += 1
+                    metrics.workers_blocked_seconds += await _put_with_backpressure(
+                        write_queue, enrichment
+                    )
+                    metrics.max_write_queue_depth = max(
+                        metrics.max_write_queue_depth, write_queue.qsize()
+                    )
 
-    logger.info(f"🚀 Processing {len(articles_list)} articles with cost-optimized extraction")
+    async def write() -> None:
+        pending: List[Dict[str, Any]] = []
+        done = False
+        while not done:
+            try:
+                item = await asyncio.wait_for(write_queue.get(), timeout=_WRITER_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                item = False  # Flush whatever is pending while workers are busy
+            if item is None:
+                done = True
+            elif item is not False:
+                pending.append(item)
+
+            if pending and (done or item is False or len(pending) >= write_batch_size):
+                metrics.articles_enriched += await _flush_enrichment_writes(collection, pending, metrics)
+                pending = []
+
+    async def feed() -> None:
+        await _run_stages(
+            [asyncio.create_task(produce())]
+            + [asyncio.create_task(work()) for _ in range(concurrency)]
+        )
+        # Every worker has exited, so the writer can drain and stop
+        await write_queue.put(None)
 
-    # Process entity extraction using selective processing
-    batch_size = settings.ENTITY_EXTRACTION_BATCH_SIZE
-    entity_extraction_results = {}
-    total_llm_processed = 0
-    total_regex_processed = 0
+    # A failing stage cancels the others instead of leaving them blocked on a
+    # full queue; unwritten articles still match ENRICHMENT_QUERY next run
+    await _run_stages([asyncio.create_task(feed()), asyncio.create_task(write())])
 
-    for i in range(0, len(articles_list), batch_size):
-        batch = articles_list[i : i + batch_size]
-        logger.info(
-            "Processing entity extraction batch %d-%d of %d articles",
-            i,
-            min(i + batch_size, len(articles_list)),
-            len(articles_list),
-        )
+    metrics.elapsed_seconds = time.perf_counter() - pipeline_started
+    _last_pipeline_metrics = metrics
 
-        # Use selective processing if optimized LLM is available
-        if optimized_llm:
-            # Process each article with selective method
-            for article in batch:
-                article_id_str = str(article.get("_id"))
-                
-                # Decide processing method
-                use_llm = selective_processor.should_use_llm(article)
-                method_emoji = "🤖" if use_llm else "📝"
-                
-                if use_llm:
-                    # Use optimized LLM (with caching)
-                    try:
-                        entity_results = await optimized_llm.extract_entities_batch([{
-                            "title": article.get("title", ""),
-                            "text": article.get("text") or article.get("content") or article.get("description") or ""
-                        }])
-                        entities = entity_results[0].get("entities", []) if entity_results else []
-                        
-                        # Convert to expected format
-                        entity_extraction_results[article_id_str] = {
-                            "article_id": article_id_str,
-                            "primary_entities": [
-                                {
-                                    "name": e.get("name"),
-                                    "type": e.get("type"),
-                                    "confidence": e.get("confidence", 0.9),
-                                    "ticker": None
-                                }
-                                for e in entities if e.get("is_primary", False)
-                            ],
-                            "context_entities": [
-                                {
-                                    "name": e.get("name"),
-                                    "type": e.get("type"),
-                                    "confidence": e.get("confidence", 0.9)
-                                }
-                                for e in entities if not e.get("is_primary", False)
-                            ],
-                            "sentiment": "neutral",
-                            "method": "llm"
-                        }
-                        total_llm_processed += 1
-                        logger.debug(f"{method_emoji} Article {article_id_str}: LLM extraction, {len(entities)} entities")
-                    except Exception as e:
-                        logger.error(f"LLM extraction failed for {article_id_str}: {e}")
-                        # Fall back to regex
-                        use_llm = False
-                
-                if not use_llm:
-                    # Use regex extraction (free, fast)
-                    regex_entities = await selective_processor.extract_entities_simple(
-                        article.get("_id"),
-                        article
-                    )
-                    
-                    entity_extraction_results[article_id_str] = {
-                        "article_id": article_id_str,
-                        "primary_entities": [
-                            {
-                                "name": e.get("entity"),
-                                "type": e.get("entity_type"),
-                                "confidence": e.get("confidence", 0.7),
-                                "ticker": None
-                            }
-                            for e in regex_entities if e.get("is_primary", False)
-                        ],
-                        "context_entities": [
-                            {
-                                "name": e.get("entity"),
-                                "type": e.get("entity_type"),
-                                "confidence": e.get("confidence", 0.7)
-                            }
-                            for e in regex_entities if not e.get("is_primary", False)
-                        ],
-                        "sentiment": "neutral",
-                        "method": "regex"
-                    }
-                    total_regex_processed += 1
-                    logger.debug(f"{method_emoji} Article {article_id_str}: Regex extraction, {len(regex_entities)} entities")
-        else:
-            # Fallback to original batch processing
-            extraction_result = await _process_entity_extraction_batch(batch, llm_client)
-            
-            for result in extraction_result.get("results", []):
-                article_id = result.get("article_id")
-                if article_id:
-                    entity_extraction_results[article_id] = result
-            
-            total_llm_processed += len(batch)
+    if not metrics.articles_queued:
+        logger.debug(f"No articles to enrich ({metrics.near_duplicates} near-duplicates skipped)")
+        return 0
 
     # Log processing summary
+    total_extracted = metrics.llm_extractions + metrics.regex_extractions
     logger.info(
-        f"📊 Entity extraction complete: {total_llm_processed} LLM, {total_regex_processed} regex "
-        f"({total_regex_processed / max(1, total_llm_processed + total_regex_processed) * 100:.1f}% cost savings)"
+        f"📊 Entity extraction complete: {metrics.llm_extractions} LLM, {metrics.regex_extractions} regex "
+        f"({metrics.regex_extractions / max(1, total_extracted) * 100:.1f}% cost savings)"
     )
-    
+
     # Log cache and cost stats if using optimized LLM
     if optimized_llm:
         try:
@@ -574,234 +1266,26 @@ async def process_new_articles_from_mongodb():
         except Exception as e:
             logger.warning(f"Failed to get cache/cost stats: {e}")
 
-    # Now process articles individually for other enrichments
-    processed = 0
-    tier_counts = {1: 0, 2: 0, 3: 0}  # Track tier distribution
-    async for article in collection.find(enrichment_query):
-        article_id = article.get("_id")
-        try:
-            title = article.get("title") or ""
-            body_parts = [
-                article.get("text") or "",
-                article.get("content") or "",
-                article.get("description") or "",
-            ]
-            combined_text = " ".join(
-                part.strip() for part in [title, *body_parts] if part
-            ).strip()
-
-            if not combined_text:
-                logger.debug("Skipping article %s due to missing text", article_id)
-                continue
-
-            # Classify article relevance tier (rule-based, no LLM cost)
-            classification = classify_article(
-                title=title,
-                text=combined_text[:1000],  # First 1000 chars for classification
-                source=article.get("source")
-            )
-            relevance_tier = classification["tier"]
-            relevance_reason = classification["reason"]
-
-            tier_emoji = {1: "🔥", 2: "📰", 3: "🔇"}[relevance_tier]
-            tier_counts[relevance_tier] += 1
-            logger.debug(
-                f"{tier_emoji} Article {article_id}: Tier {relevance_tier} ({relevance_reason})"
-            )
-
-            try:
-                relevance_score = float(llm_client.score_relevance(combined_text))
-            except Exception as exc:
-                logger.warning("Relevance scoring failed for %s: %s", article_id, exc)
-                relevance_score = 0.0
-
-            try:
-                sentiment_score = float(llm_client.analyze_sentiment(combined_text))
-            except Exception as exc:
-                logger.warning("Sentiment analysis failed for %s: %s", article_id, exc)
-                sentiment_score = 0.0
-
-            try:
-                extracted_themes = llm_client.extract_themes([combined_text])
-                themes: List[str] = (
-                    [str(theme) for theme in extracted_themes]
-                    if isinstance(extracted_themes, list)
-                    else []
-                )
-            except Exception as exc:
-                logger.warning("Theme extraction failed for %s: %s", article_id, exc)
-                themes = []
-
-            sentiment_label = _derive_sentiment_label(sentiment_score)
-
-            keyword_tokens = list(_tokenize_for_keywords(combined_text))
-            keywords = _select_keywords(keyword_tokens)
-
-            if themes:
-                for theme in themes:
-                    normalized_theme = theme.strip()
-                    if normalized_theme and normalized_theme not in keywords:
-                        keywords.append(normalized_theme)
-                        if len(keywords) >= _MAX_KEYWORDS:
-                            break
-
-            sentiment_payload = {
-                "score": sentiment_score,
-                "magnitude": abs(sentiment_score),
-                "label": sentiment_label,
-                "provider": str(
-                    getattr(llm_client, "model_name", llm_client.__class__.__name__)
-                ),
-                "updated_at": datetime.now(timezone.utc),
-            }
-
-            # Get entity extraction results for this article
-            article_id_str = str(article_id)
-            entity_data = entity_extraction_results.get(article_id_str, {})
-            
-            # Parse new structured entity format
-            primary_entities = entity_data.get("primary_entities", [])
-            context_entities = entity_data.get("context_entities", [])
-            entity_sentiment = entity_data.get("sentiment", sentiment_label)
-            
-            # Log entity extraction for this article
-            if primary_entities or context_entities:
-                logger.info(
-                    f"Article {article_id_str}: {len(primary_entities)} primary, {len(context_entities)} context entities"
-                )
-            else:
-                logger.warning(f"Article {article_id_str}: No entities extracted")
-            
-            # Combine all entities for storage in article document
-            all_entities = []
-            for entity in primary_entities:
-                all_entities.append({
-                    "name": entity.get("name"),
-                    "type": entity.get("type"),
-                    "ticker": entity.get("ticker"),
-                    "confidence": entity.get("confidence", 1.0),
-                    "is_primary": True,
-                })
-            for entity in context_entities:
-                all_entities.append({
-                    "name": entity.get("name"),
-                    "type": entity.get("type"),
-                    "confidence": entity.get("confidence", 1.0),
-                    "is_primary": False,
-                })
-
-            update_operations = {
-                "$set": {
-                    "relevance_score": relevance_score,
-                    "relevance_tier": relevance_tier,
-                    "relevance_reason": relevance_reason,
-                    "sentiment_score": sentiment_score,
-                    "sentiment_label": sentiment_label,
-                    "sentiment": sentiment_payload,
-                    "themes": themes,
-                    "keywords": keywords,
-                    "entities": all_entities,
-                    "updated_at": datetime.now(timezone.utc),
-                }
-            }
-
-            await collection.update_one({"_id": article_id}, update_operations)
-
-            # Create entity mentions for tracking
-            article_source = article.get("source") or article.get("source_id") or "unknown"
-            
-            if primary_entities or context_entities:
-                mentions_to_create = []
-                logger.info(f"Preparing to create entity mentions for article {article_id_str}")
-                
-                # Process primary entities
-                for entity in primary_entities:
-                    entity_name = entity.get("name")
-                    entity_type = entity.get("type")
-                    ticker = entity.get("ticker")
-                    
-                    # Ensure entity name is normalized (defense in depth)
-                    if entity_name:
-                        normalized_name = normalize_entity_name(entity_name)
-                        if normalized_name != entity_name:
-                            logger.info(f"Entity mention normalized: '{entity_name}' → '{normalized_name}'")
-                            entity_name = normalized_name
-                    
-                    # Create mention for the entity name (already normalized by LLM + double-check above)
-                    if entity_name:
-                        mentions_to_create.append(
-                            {
-                                "entity": entity_name,
-                                "entity_type": entity_type,
-                                "article_id": article_id_str,
-                                "sentiment": entity_sentiment,
-                                "confidence": entity.get("confidence", 1.0),
-                                "source": article_source,
-                                "is_primary": True,
-                                "metadata": {
-                                    "article_title": title,
-                                    "extraction_batch": True,
-                                    "ticker": ticker,
-                                },
-                            }
-                        )
-                    
-                    # DO NOT create separate ticker mentions - they're already normalized to entity_name
-                
-                # Process context entities
-                for entity in context_entities:
-                    entity_name = entity.get("name")
-                    entity_type = entity.get("type")
-                    
-                    # Normalize context entities if they're crypto-related
-                    if entity_name and entity_type in ["cryptocurrency", "blockchain"]:
-                        normalized_name = normalize_entity_name(entity_name)
-                        if normalized_name != entity_name:
-                            logger.info(f"Context entity normalized: '{entity_name}' → '{normalized_name}'")
-                            entity_name = normalized_name
-                    
-                    if entity_name:
-                        mentions_to_create.append(
-                            {
-                                "entity": entity_name,
-                                "entity_type": entity_type,
-                                "article_id": article_id_str,
-                                "sentiment": entity_sentiment,
-                                "confidence": entity.get("confidence", 1.0),
-                                "source": article_source,
-                                "is_primary": False,
-                                "metadata": {
-                                    "article_title": title,
-                                    "extraction_batch": True,
-                                },
-                            }
-                        )
-
-                try:
-                    logger.info(f"Attempting to save {len(mentions_to_create)} entity mentions to database")
-                    await create_entity_mentions_batch(mentions_to_create)
-                    logger.info(f"Successfully saved {len(mentions_to_create)} entity mentions")
-                except Exception as exc:
-                    logger.error(
-                        "Failed to create entity mentions for article %s: %s",
-                        article_id,
-                        exc,
-                    )
-
-            processed += 1
-        except Exception as exc:
-            logger.exception("Failed to enrich article %s: %s", article_id, exc)
-
+    processed = metrics.articles_enriched
     if processed:
         logger.info(
             "Enriched %s article(s) with sentiment, themes, keywords, and entities",
             processed,
         )
         # Log tier distribution
+        tier_counts = metrics.tier_counts
         logger.info(
             f"📊 Relevance tiers: 🔥 High={tier_counts[1]}, 📰 Medium={tier_counts[2]}, 🔇 Low={tier_counts[3]}"
         )
 
+    logger.info(
+        f"⏱️ Enrichment pipeline: {metrics.articles_queued} queued, "
+        f"{metrics.near_duplicates} near-duplicates skipped in {metrics.elapsed_seconds:.1f}s "
+        f"(extract {metrics.extraction_seconds:.1f}s, enrich {metrics.enrichment_seconds:.1f}s, "
+        f"write {metrics.write_seconds:.1f}s; blocked: producer {metrics.producer_blocked_seconds:.1f}s, "
+        f"workers {metrics.workers_blocked_seconds:.1f}s)"
+    )
+
     return processed
 
 
@@ -0,0 +1,368 @@
+"""
+Async Redis client used by the API caches.
+
+``RedisRESTClient`` makes blocking ``requests`` calls without a session and
+puts values in the URL path; called from request handlers it stalls the
+event loop for a full TLS round-trip. This module exposes one async
+interface with three backends:
+
+- ``UpstashRedis``: Upstash REST API over a pooled ``httpx.AsyncClient``.
+  Commands are sent as JSON bodies, and pipelines go to the ``/pipeline``
+  (or ``/multi-exec``) endpoint in a single request.
+- ``NativeRedis``: the Redis protocol through ``redis.asyncio`` and its
+  connection pool (REDIS_HOST / REDIS_PORT / REDIS_DB).
+- ``InMemoryRedis``: a dict-backed fake with expiry, for tests and local runs.
+
+Every backend implements ``execute`` and ``pipeline``; the typed helpers
+(``get``, ``mget``, ``mset``, ...) are built on those two. Use
+``get_redis_client()`` for the shared client of the running event loop.
+"""
+
+import asyncio
+import fnmatch
+import json
+import logging
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - depends on installed extras
+    aioredis = None
+
+Command = Sequence[Any]
+
+
+class RedisCommandError(Exception):
+    """Redis rejected a command."""
+
+
+def encode_value(value: Any) -> str:
+    """Encode a value the way RedisRESTClient did: scalars as text, the rest as JSON."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (int, float)):
+        return str(value)
+    return json.dumps(value)
+
+
+class AsyncRedisClient:
+    """Typed Redis commands on top of a backend's ``execute`` and ``pipeline``."""
+
+    enabled = True
+
+    async def execute(self, *command: Any) -> Any:
+        """Run one command and return its result."""
+        raise NotImplementedError
+
+    async def pipeline(self, commands: Sequence[Command], transaction: bool = False) -> List[Any]:
+        """
+        Run several commands in one round-trip.
+
+        Args:
+            commands: Commands as argument lists, e.g. ``[["GET", "k"], ["TTL", "k"]]``
+            transaction: Run them atomically (MULTI/EXEC)
+
+        Returns:
+            One result per command
+
+        Raises:
+            RedisCommandError: If any command failed
+        """
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        """Release pooled connections."""
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self.execute("GET", key)
+
+    async def set(self, key: str, value: Any, ex: Optional[int] = None) -> bool:
+        command = ["SET", key, encode_value(value)]
+        if ex is not None:
+            command += ["EX", int(ex)]
+        return await self.execute(*command) == "OK"
+
+    async def mget(self, keys: Sequence[str]) -> List[Optional[str]]:
+        """Values of ``keys`` in order (None for missing keys)."""
+        if not keys:
+            return []
+        return list(await self.execute("MGET", *keys))
+
+    async def mset(self, mapping: Dict[str, Any], ex: Optional[int] = None) -> bool:
+        """
+        Set several keys in one round-trip.
+
+        MSET has no expiry option, so with ``ex`` the keys are written as one
+        pipeline of ``SET ... EX`` commands instead.
+        """
+        if not mapping:
+            return True
+        if ex is None:
+            args = [part for key, value in mapping.items() for part in (key, encode_value(value))]
+            return await self.execute("MSET", *args) == "OK"
+        results = await self.pipeline(
+            [["SET", key, encode_value(value), "EX", int(ex)] for key, value in mapping.items()]
+        )
+        return all(result == "OK" for result in results)
+
+    async def delete(self, *keys: str) -> int:
+        if not keys:
+            return 0
+        return int(await self.execute("DEL", *keys) or 0)
+
+    async def exists(self, key: str) -> bool:
+        return bool(await self.execute("EXISTS", key))
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        return bool(await self.execute("EXPIRE", key, int(seconds)))
+
+    async def ttl(self, key: str) -> int:
+        """Seconds to live; -2 if the key doesn't exist, -1 if it has no TTL."""
+        return int(await self.execute("TTL", key))
+
+    async def ping(self) -> bool:
+        try:
+            return await self.execute("PING") in ("PONG", True)
+        except Exception:
+            return False
+
+
+class DisabledRedis(AsyncRedisClient):
+    """Stand-in when no Redis is configured: every command is a no-op."""
+
+    enabled = False
+
+    async def execute(self, *command: Any) -> Any:
+        return None
+
+    async def pipeline(self, commands: Sequence[Command], transaction: bool = False) -> List[Any]:
+        return [None] * len(commands)
+
+    async def mget(self, keys: Sequence[str]) -> List[Optional[str]]:
+        return [None] * len(keys)
+
+
+class UpstashRedis(AsyncRedisClient):
+    """
+    Upstash REST backend.
+
+    Instances are bound to the event loop they were created on (the httpx
+    pool can't be shared across loops).
+    """
+
+    def __init__(self, base_url: str, token: str, max_connections: int = 20, timeout: float = 5.0):
+        self.base_url = base_url.rstrip("/")
+        self._client = httpx.AsyncClient(
+            headers={"Authorization": f"Bearer {token}"},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=httpx.Timeout(timeout),
+        )
+
+    @property
+    def is_closed(self) -> bool:
+        return self._client.is_closed
+
+    async def _post(self, path: str, body: Any) -> Any:
+        response = await self._client.post(f"{self.base_url}{path}", json=body)
+        # Command errors come back as 400 with an "error" field
+        if response.status_code != 400:
+            response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _result(reply: Dict[str, Any]) -> Any:
+        if "error" in reply:
+            raise RedisCommandError(reply["error"])
+        return reply.get("result")
+
+    async def execute(self, *command: Any) -> Any:
+        return self._result(await self._post("", [str(part) for part in command]))
+
+    async def pipeline(self, commands: Sequence[Command], transaction: bool = False) -> List[Any]:
+        if not commands:
+            return []
+        replies = await self._post(
+            "/multi-exec" if transaction else "/pipeline",
+            [[str(part) for part in command] for command in commands],
+        )
+        if isinstance(replies, dict):
+            # A transaction that fails as a whole returns a single error
+            self._result(replies)
+        return [self._result(reply) for reply in replies]
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+class NativeRedis(AsyncRedisClient):
+    """Redis protocol backend using redis.asyncio's connection pool."""
+
+    def __init__(self, host: str, port: int, db: int = 0, max_connections: int = 20):
+        if aioredis is None:
+            raise RuntimeError("The 'redis' package is required for the native Redis backend")
+        self._client = aioredis.Redis(
+            host=host,
+            port=port,
+            db=db,
+            decode_responses=True,
+            max_connections=max_connections,
+        )
+        self._closed = False
+
+    @property
+    def is_closed(self) -> bool:
+        return self._closed
+
+    async def execute(self, *command: Any) -> Any:
+        try:
+            return await self._client.execute_command(*command)
+        except aioredis.ResponseError as exc:
+            raise RedisCommandError(str(exc)) from exc
+
+    async def pipeline(self, commands: Sequence[Command], transaction: bool = False) -> List[Any]:
+        if not commands:
+            return []
+        async with self._client.pipeline(transaction=transaction) as pipe:
+            for command in commands:
+                pipe.execute_command(*command)
+            try:
+                return await pipe.execute()
+            except aioredis.ResponseError as exc:
+                raise RedisCommandError(str(exc)) from exc
+
+    async def aclose(self) -> None:
+        self._closed = True
+        await self._client.aclose()
+
+
+class InMemoryRedis(AsyncRedisClient):
+    """
+    Dict-backed fake implementing the commands the typed helpers use
+    (PING, GET, SET [EX], MGET, MSET, DEL, EXISTS, EXPIRE, TTL, KEYS).
+
+    ``commands`` records every command executed, for assertions in tests.
+    """
+
+    def __init__(self):
+        # key -> (value, expires_at in monotonic time or None)
+        self._data: Dict[str, Tuple[str, Optional[float]]] = {}
+        self.commands: List[Tuple[Any, ...]] = []
+        self.round_trips = 0
+
+    def _live(self, key: str) -> Optional[Tuple[str, Optional[float]]]:
+        entry = self._data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            del self._data[key]
+            return None
+        return entry
+
+    def _run(self, name: str, args: List[Any]) -> Any:
+        self.commands.append((name, *args))
+        if name == "PING":
+            return "PONG"
+        if name == "GET":
+            entry = self._live(args[0])
+            return entry[0] if entry else None
+        if name == "SET":
+            expires_at = None
+            if len(args) == 4 and str(args[2]).upper() == "EX":
+                expires_at = time.monotonic() + int(args[3])
+            self._data[args[0]] = (str(args[1]), expires_at)
+            return "OK"
+        if name == "MGET":
+            return [entry[0] if entry else None for entry in map(self._live, args)]
+        if name == "MSET":
+            for key, value in zip(args[::2], args[1::2]):
+                self._data[key] = (str(value), None)
+            return "OK"
+        if name == "DEL":
+            return sum(self._data.pop(key, None) is not None for key in args if self._live(key))
+        if name == "EXISTS":
+            return sum(1 for key in args if self._live(key))
+        if name == "EXPIRE":
+            entry = self._live(args[0])
+            if entry is None:
+                return 0
+            self._data[args[0]] = (entry[0], time.monotonic() + int(args[1]))
+            return 1
+        if name == "TTL":
+            entry = self._live(args[0])
+            if entry is None:
+                return -2
+            if entry[1] is None:
+                return -1
+            return max(0, round(entry[1] - time.monotonic()))
+        if name == "KEYS":
+            return [key for key in list(self._data) if self._live(key) and fnmatch.fnmatchcase(key, args[0])]
+        raise RedisCommandError(f"ERR unknown command '{name}'")
+
+    async def execute(self, *command: Any) -> Any:
+        self.round_trips += 1
+        return self._run(str(command[0]).upper(), list(command[1:]))
+
+    async def pipeline(self, commands: Sequence[Command], transaction: bool = False) -> List[Any]:
+        self.round_trips += 1
+        return [self._run(str(command[0]).upper(), list(command[1:])) for command in commands]
+
+
+def create_redis_client() -> AsyncRedisClient:
+    """Build a client for REDIS_CLIENT_BACKEND ("upstash", "native" or "memory")."""
+    settings = get_settings()
+    backend = settings.REDIS_CLIENT_BACKEND.lower()
+    if backend == "native":
+        return NativeRedis(
+            settings.REDIS_HOST,
+            settings.REDIS_PORT,
+            settings.REDIS_DB,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+        )
+    if backend == "memory":
+        return InMemoryRedis()
+    if backend == "upstash" and settings.UPSTASH_REDIS_REST_URL and settings.UPSTASH_REDIS_TOKEN:
+        return UpstashRedis(
+            settings.UPSTASH_REDIS_REST_URL,
+            settings.UPSTASH_REDIS_TOKEN,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+        )
+    return DisabledRedis()
+
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncRedisClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_redis_client() -> AsyncRedisClient:
+    """
+    Get the shared Redis client for the running event loop.
+
+    Pooled connections cannot be shared across event loops, so Celery tasks
+    that each call ``asyncio.run`` get their own client.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or getattr(client, "is_closed", False):
+        client = create_redis_client()
+        _clients[loop] = client
+        logger.info(f"Created {type(client).__name__} client")
+    return client
+
+
+async def close_redis_client() -> None:
+    """Close the shared Redis client for the running event loop, if any."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -47,7 +47,33 @@ class Settings(BaseSettings):
     ANTHROPIC_ENTITY_FALLBACK_MODEL: str = "claude-3-5-sonnet-20241022"
     ANTHROPIC_ENTITY_INPUT_COST_PER_1K_TOKENS: float = 0.0
     ANTHROPIC_ENTITY_OUTPUT_COST_PER_1K_TOKENS: float = 0.0
+    ANTHROPIC_MAX_CONCURRENT_REQUESTS: int = 8  # In-flight requests per event loop
+    ANTHROPIC_MAX_CONNECTIONS: int = 20  # Pooled keep-alive connections
+    LLM_CACHE_MEMORY_MAX_ENTRIES: int = 5000  # In-process LLM response cache entries
+    LLM_CACHE_MEMORY_MAX_BYTES: int = 50_000_000  # In-process LLM response cache size
+    LLM_CACHE_MEMORY_TTL_SECONDS: int = 3600  # Upper bound on in-process entry lifetime
     ENTITY_EXTRACTION_BATCH_SIZE: int = 10
+    ENRICHMENT_CONCURRENCY: int = 4  # Concurrent enrichment workers (each handles one batch)
+    ENRICHMENT_WRITE_BATCH_SIZE: int = 50  # Enriched articles per bulk write
+    ENRICHMENT_COMBINED_CALL: bool = True  # One LLM call for scores, themes, entities and narrative elements
+    NEAR_DUPLICATE_DETECTION: bool = True  # Skip enrichment for syndicated copies of stored articles
+    NEAR_DUPLICATE_THRESHOLD: float = 0.5  # Estimated shingle Jaccard similarity that counts as a duplicate
+    NEAR_DUPLICATE_WINDOW_DAYS: int = 7  # How far back the in-process index looks on startup
+    NEAR_DUPLICATE_INDEX_MAX_ENTRIES: int = 20000
+    RSS_FETCH_CONCURRENCY: int = 6  # Feeds downloaded at the same time
+    RSS_FEED_TIMEOUT_SECONDS: float = 20.0  # Per-feed budget for download and parse
+    NARRATIVE_MATCH_TOP_K: int = 20  # Candidate narratives scored exactly per cluster
+    NARRATIVE_INDEX_WINDOW_DAYS: int = 30  # Narratives held in the in-process fingerprint index
+    NARRATIVE_INDEX_REFRESH_MINUTES: int = 60  # Rebuild the index to pick up writes from other processes
+    NARRATIVE_INCREMENTAL_DETECTION: bool = True  # Worker only clusters articles new since the last cycle
+    NARRATIVE_FULL_REBUILD_HOURS: int = 6  # Re-cluster the whole window this often in incremental mode
+    LEADER_ELECTION_ENABLED: bool = True  # Run each background job in only one process (Mongo leases)
+    LEASE_TTL_SECONDS: int = 30  # Job lease lifetime; renewed every third of it
+    PRICE_HISTORY_BATCH_SIZE: int = 200  # Price samples buffered per write
+    PRICE_HISTORY_FLUSH_SECONDS: float = 60.0  # Write buffered samples at least this often
+    BRIEFING_SOURCE_TIMEOUT_SECONDS: float = 30.0  # Budget per briefing input source (memory, signals, ...)
+    BRIEFING_PROMPT_CACHING: bool = True  # Send system prompt and briefing data as cached prompt prefixes
+    BRIEFING_SINGLE_CALL_REFINE: bool = True  # Critique and revise a briefing in one LLM call
     POLYMARKET_API_KEY: str = ""
 
     # Reddit settings
@@ -83,6 +109,11 @@ class Settings(BaseSettings):
     UPSTASH_REDIS_REST_URL: str = ""  # e.g., "https://your-instance.upstash.io"
     UPSTASH_REDIS_TOKEN: str = ""  # Your Upstash REST token
 
+    # Async Redis client for the API caches: "upstash" (REST, disabled when
+    # not configured), "native" (REDIS_HOST/PORT/DB) or "memory"
+    REDIS_CLIENT_BACKEND: str = "upstash"
+    REDIS_MAX_CONNECTIONS: int = 20  # Pooled connections per event loop
+
     # Celery settings (using Redis for local development)
     # Allow override via environment variable for production deployments (e.g., Railway)
     CELERY_BROKER_URL: str = ""
@@ -133,7 +164,10 @@ class Settings(BaseSettings):
 
     # Alert Settings
     ALERT_COOLDOWN_MINUTES: int = 60  # 1 hour between alerts for same condition
+    ALERT_INDEX_REFRESH_MINUTES: int = 10  # Full reload of the in-process alert index (changes sync every check)
     PRICE_CHECK_INTERVAL: int = 300  # 5 minutes between price checks
+    PRICE_TICK_MIN_INTERVAL: int = 30  # Fastest price polling while prices move quickly
+    PRICE_TICK_VOLATILE_MOVE_PERCENT: float = 0.5  # Move per PRICE_CHECK_INTERVAL that speeds up polling
     PRICE_CHANGE_THRESHOLD: float = 1.0  # 1% change to trigger alerts
 
     # CoinGecko API settings
@@ -0,0 +1,138 @@
+"""
+Lease-based leader election for background jobs.
+
+The API lifespan starts the background loops in every gunicorn worker, and
+worker.py starts them again in its own process. Wrapping a loop in
+``run_as_leader`` makes it a singleton across all of those processes:
+
+- Every process competes for a lease named after the job (stored in the
+  ``leases`` collection, see db.operations.leases). The winner runs the job;
+  the others stay on standby and retry every ``LEASE_TTL_SECONDS / 3``.
+- The leader renews its lease on the same heartbeat. If a renewal fails, or
+  the lease can't be renewed before it would expire, the job is cancelled,
+  because another process may already have taken over.
+- A leader that shuts down releases its lease so a standby takes over on its
+  next heartbeat. A crashed leader is replaced once its lease expires.
+- Each acquisition gets a new fencing token. Code that persists state
+  across cycles can pass ``current_lease().token`` with its writes, so a
+  paused leader that has been replaced can't overwrite newer state.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from .config import get_settings
+from ..db.operations.leases import acquire_lease, release_lease, renew_lease
+
+logger = logging.getLogger(__name__)
+
+# Identifies this process as a lease holder (and in GET /admin/leases)
+HOLDER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+@dataclass(frozen=True)
+class Lease:
+    """A lease held by this process."""
+
+    name: str
+    holder: str
+    token: int
+
+
+_current_lease: ContextVar[Optional[Lease]] = ContextVar("current_lease", default=None)
+
+
+def current_lease() -> Optional[Lease]:
+    """The lease the calling job runs under, or None outside run_as_leader."""
+    return _current_lease.get()
+
+
+async def _run_under(lease: Lease, job: Callable[[], Awaitable[Any]]) -> Any:
+    _current_lease.set(lease)
+    return await job()
+
+
+async def run_as_leader(
+    name: str,
+    job: Callable[[], Awaitable[Any]],
+    ttl_seconds: Optional[float] = None,
+) -> None:
+    """
+    Run ``job`` only while this process holds the ``name`` lease.
+
+    Returns when the job returns. If the job raises or the lease is lost,
+    the job is stopped and this process goes back to standby.
+
+    Args:
+        name: Lease (job) name, shared by every process running the job
+        job: Factory for the job coroutine (called again after a failover)
+        ttl_seconds: Lease lifetime (default LEASE_TTL_SECONDS)
+    """
+    settings = get_settings()
+    if not settings.LEADER_ELECTION_ENABLED:
+        await job()
+        return
+
+    ttl = ttl_seconds or settings.LEASE_TTL_SECONDS
+    heartbeat = ttl / 3
+
+    while True:
+        try:
+            token = await acquire_lease(name, HOLDER_ID, ttl)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning(f"Could not acquire lease '{name}': {exc}")
+            token = None
+        if token is None:
+            await asyncio.sleep(heartbeat)
+            continue
+
+        # Only trust the lease until it would expire without a renewal
+        valid_until = time.monotonic() + ttl
+        lease = Lease(name, HOLDER_ID, token)
+        logger.info(f"Acquired lease '{name}' (token {token}); starting job")
+        task = asyncio.create_task(_run_under(lease, job), name=f"lease:{name}")
+        try:
+            while True:
+                done, _ = await asyncio.wait({task}, timeout=heartbeat)
+                if done:
+                    break
+                renewed_at = time.monotonic()
+                try:
+                    held = await renew_lease(name, HOLDER_ID, token, ttl)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    logger.warning(f"Could not renew lease '{name}': {exc}")
+                    held = time.monotonic() + heartbeat < valid_until
+                else:
+                    if held:
+                        valid_until = renewed_at + ttl
+                if not held:
+                    logger.warning(f"Lost lease '{name}' (token {token}); stopping job")
+                    task.cancel()
+                    await asyncio.gather(task, return_exceptions=True)
+                    break
+        finally:
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+            try:
+                await release_lease(name, HOLDER_ID, token)
+            except Exception as exc:
+                logger.warning(f"Could not release lease '{name}': {exc}")
+
+        if task.done() and not task.cancelled():
+            if task.exception() is None:
+                logger.info(f"Job '{name}' finished; released lease")
+                return
+            logger.error(f"Job '{name}' failed: {task.exception()!r}; released lease")
+        await asyncio.sleep(heartbeat)
@@ -0,0 +1,305 @@
+"""
+Shared cache for computed API responses.
+
+Endpoints wrap expensive computations with ``ResponseCache.fetch``:
+- Bounded in-process LRU with a freshness TTL
+- Stale-while-revalidate: for ``stale_ttl_seconds`` after an entry goes
+  stale it is still served while one background task recomputes it, so
+  requests at a TTL boundary don't wait on the recompute
+- Single-flight: concurrent misses for the same key share one computation
+  instead of stampeding the database
+- Optional Redis backing (see core.async_redis) so entries survive restarts
+  and are shared between API instances
+- Hit/miss/stale counters per key prefix (see ``get_response_cache_metrics``)
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from . import async_redis
+
+logger = logging.getLogger(__name__)
+
+# Lookup statuses reported by ResponseCache.fetch
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+COALESCED = "coalesced"
+
+
+@dataclass
+class CacheMetrics:
+    """Counters for one key prefix."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+    redis_hits: int = 0
+    redis_errors: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        served = self.hits + self.stale_hits + self.coalesced
+        total = served + self.misses
+        data["hit_rate_percent"] = round(served / total * 100, 2) if total else 0.0
+        return data
+
+
+@dataclass
+class CacheLookup:
+    """Result of ``ResponseCache.fetch``: the value and where it came from."""
+
+    value: Any
+    status: str
+
+    @property
+    def cached(self) -> bool:
+        return self.status != MISS
+
+
+_registry: Dict[str, "ResponseCache"] = {}
+
+
+def get_response_cache_metrics() -> Dict[str, Dict[str, Any]]:
+    """Metrics for every response cache, keyed by ``<namespace>:<key prefix>``."""
+    metrics = {}
+    for cache in _registry.values():
+        for prefix, counters in cache.metrics.items():
+            metrics[f"{cache.namespace}:{prefix}"] = counters.to_dict()
+    return metrics
+
+
+class ResponseCache:
+    """
+    In-process LRU response cache with stale-while-revalidate and single-flight.
+
+    Keys are namespaced (``<namespace>:<key>``) and metrics are grouped by the
+    first ``:``-separated segment of the key.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: float,
+        stale_ttl_seconds: float = 0,
+        max_entries: int = 256,
+        use_redis: bool = False,
+        serialize: Callable[[Any], Any] = lambda value: value,
+        deserialize: Callable[[Any], Any] = lambda value: value,
+    ):
+        """
+        Args:
+            namespace: Name of the cache, prepended to every key
+            ttl_seconds: How long an entry is fresh
+            stale_ttl_seconds: How long after that a stale entry may be served
+                while it is refreshed in the background
+            max_entries: LRU bound for the in-process tier
+            use_redis: Also store entries in Redis when it is configured
+            serialize: Converts values to JSON-compatible data for Redis
+            deserialize: Inverse of ``serialize``
+        """
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.max_entries = max_entries
+        self.use_redis = use_redis
+        self._serialize = serialize
+        self._deserialize = deserialize
+        # key -> (value, fresh_until, stale_until), in monotonic time
+        self._entries: "OrderedDict[str, Tuple[Any, float, float]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._refreshing: Set[str] = set()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self.metrics: Dict[str, CacheMetrics] = {}
+        _registry[namespace] = self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _metrics(self, key: str) -> CacheMetrics:
+        prefix = key.split(":", 1)[0]
+        if prefix not in self.metrics:
+            self.metrics[prefix] = CacheMetrics()
+        return self.metrics[prefix]
+
+    def _redis(self) -> Optional[async_redis.AsyncRedisClient]:
+        if not self.use_redis:
+            return None
+        client = async_redis.get_redis_client()
+        return client if client.enabled else None
+
+    def _store(self, key: str, value: Any, age: float = 0.0) -> None:
+        now = time.monotonic()
+        fresh_until = now + self.ttl_seconds - age
+        self._entries.pop(key, None)
+        self._entries[key] = (value, fresh_until, fresh_until + self.stale_ttl_seconds)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._metrics(evicted).evictions += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the fresh in-process value for ``key``, if any (no metrics, no refresh)."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value in the in-process tier."""
+        self._store(key, value)
+
+    def invalidate(self, key: str) -> None:
+        """Drop ``key`` from the in-process tier."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every in-process entry (e.g. after the underlying data changed)."""
+        self._entries.clear()
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for ``key``, computing it on a miss."""
+        return (await self.fetch(key, compute)).value
+
+    async def fetch(self, key: str, compute: Callable[[], Awaitable[Any]]) -> CacheLookup:
+        """
+        Look up ``key``, computing it with ``compute`` on a miss.
+
+        Exceptions from ``compute`` propagate to every caller waiting on that
+        computation and nothing is cached.
+
+        Returns:
+            CacheLookup with the value and its status (fresh, stale, miss or coalesced)
+        """
+        metrics = self._metrics(key)
+        now = time.monotonic()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, fresh_until, stale_until = entry
+            if now < fresh_until:
+                self._entries.move_to_end(key)
+                metrics.hits += 1
+                return CacheLookup(value, FRESH)
+            if now < stale_until:
+                self._entries.move_to_end(key)
+                metrics.stale_hits += 1
+                self._refresh_in_background(key, compute)
+                return CacheLookup(value, STALE)
+            del self._entries[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            metrics.coalesced += 1
+            return CacheLookup(await asyncio.shield(inflight), COALESCED)
+
+        cached = await self._redis_get(key)
+        if cached is not None:
+            value, age = cached
+            if age < self.ttl_seconds:
+                metrics.hits += 1
+                return CacheLookup(value, FRESH)
+            metrics.stale_hits += 1
+            self._refresh_in_background(key, compute)
+            return CacheLookup(value, STALE)
+
+        metrics.misses += 1
+        return CacheLookup(await self._compute(key, compute), MISS)
+
+    async def _compute(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``compute`` once per key at a time and store the result."""
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Nobody may be waiting; don't log "exception was never retrieved"
+            future.exception()
+            raise
+        else:
+            self._store(key, value)
+            future.set_result(value)
+            await self._redis_set(key, value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def _refresh_in_background(self, key: str, compute: Callable[[], Awaitable[Any]]) -> None:
+        # A burst of stale hits schedules only one refresh
+        if key in self._inflight or key in self._refreshing:
+            return
+        self._refreshing.add(key)
+
+        async def refresh() -> None:
+            metrics = self._metrics(key)
+            metrics.refreshes += 1
+            try:
+                await self._compute(key, compute)
+            except Exception as exc:
+                # Keep serving the stale value until it expires
+                metrics.refresh_errors += 1
+                logger.warning(f"Background refresh of {self.namespace}:{key} failed: {exc}")
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _redis_get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Read ``key`` from Redis into the in-process tier; returns (value, age in seconds)."""
+        client = self._redis()
+        if client is None:
+            return None
+        metrics = self._metrics(key)
+        try:
+            raw = await client.get(f"{self.namespace}:{key}")
+            if not raw:
+                return None
+            payload = json.loads(raw)
+            age = max(0.0, time.time() - payload["stored_at"])
+            if age >= self.ttl_seconds + self.stale_ttl_seconds:
+                return None
+            value = self._deserialize(payload["value"])
+        except Exception as exc:
+            metrics.redis_errors += 1
+            logger.warning(f"Redis read for {self.namespace}:{key} failed: {exc}")
+            return None
+        metrics.redis_hits += 1
+        self._store(key, value, age=age)
+        return value, age
+
+    async def _redis_set(self, key: str, value: Any) -> None:
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            payload = json.dumps(
+                {"stored_at": time.time(), "value": self._serialize(value)},
+                default=str,
+            )
+            await client.set(
+                f"{self.namespace}:{key}",
+                payload,
+                ex=int(self.ttl_seconds + self.stale_ttl_seconds),
+            )
+        except Exception as exc:
+            self._metrics(key).redis_errors += 1
+            logger.warning(f"Redis write for {self.namespace}:{key} failed: {exc}")
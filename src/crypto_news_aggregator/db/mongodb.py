@@ -23,6 +23,7 @@ from typing import (
 from pymongo import MongoClient, IndexModel, TEXT, ASCENDING, DESCENDING
 from pymongo.database import Database
 from pymongo.collection import Collection
+from pymongo.errors import CollectionInvalid, OperationFailure
 from motor.motor_asyncio import (
     AsyncIOMotorClient,
     AsyncIOMotorDatabase,
@@ -98,6 +99,9 @@ ARTICLE_INDEXES = [
     {"keys": [("keywords", 1)], "name": "keywords_idx"},
     {"keys": [("is_duplicate", 1)], "name": "is_duplicate"},
     {"keys": [("processed", 1)], "name": "processed_flag"},
+    # Incremental narrative detection reads articles created or extracted since its watermark
+    {"keys": [("created_at", 1)], "name": "created_at"},
+    {"keys": [("narrative_extracted_at", 1)], "name": "narrative_extracted_at"},
 ]
 
 ALERT_INDEXES = [
@@ -141,6 +145,39 @@ PRICE_HISTORY_INDEXES = [
     },
 ]
 
+# Raw price samples live in a time-series collection (created explicitly in
+# initialize_indexes); OHLC rollups in a regular collection with a TTL field
+PRICE_SAMPLES_TIMESERIES = {
+    "timeField": "timestamp",
+    "metaField": "symbol",
+    "granularity": "seconds",
+}
+PRICE_SAMPLES_RETENTION_SECONDS = 7 * 24 * 60 * 60  # 7 days
+
+PRICE_SAMPLE_INDEXES = [
+    {"keys": [("symbol", 1), ("timestamp", -1)], "name": "symbol_timestamp_desc"},
+]
+
+PRICE_ROLLUP_INDEXES = [
+    {
+        "keys": [("symbol", 1), ("resolution", 1), ("bucket", 1)],
+        "name": "symbol_resolution_bucket_unique",
+        "unique": True,
+        "background": True,
+    },
+    {
+        "keys": [("resolution", 1), ("bucket", 1)],
+        "name": "resolution_bucket_compound",
+        "background": True,
+    },
+    {
+        "keys": [("expires_at", 1)],
+        "name": "price_rollups_ttl",
+        "expireAfterSeconds": 0,
+        "background": True,
+    },
+]
+
 ENTITY_MENTIONS_INDEXES = [
     {
         "keys": [("entity_type", 1)],
@@ -167,6 +204,26 @@ ENTITY_MENTIONS_INDEXES = [
         "name": "entity_timestamp_compound",
         "background": True,
     },
+    {
+        # Signal queries: primary mentions from high/medium tier articles in a time window
+        "keys": [("is_primary", 1), ("relevance_tier", 1), ("created_at", 1), ("entity", 1)],
+        "name": "primary_tier_created_entity_compound",
+        "background": True,
+    },
+]
+
+ENTITY_MENTION_ROLLUP_INDEXES = [
+    {
+        "keys": [("entity", 1), ("hour", 1), ("relevance_tier", 1)],
+        "name": "entity_hour_tier_unique",
+        "unique": True,
+        "background": True,
+    },
+    {
+        "keys": [("hour", 1), ("relevance_tier", 1), ("entity", 1)],
+        "name": "hour_tier_entity_compound",
+        "background": True,
+    },
 ]
 
 
@@ -235,8 +292,11 @@ COLLECTION_SOURCES = "sources"
 COLLECTION_TRENDS = "trends"
 COLLECTION_ALERTS = "alerts"
 COLLECTION_PRICE_HISTORY = "price_history"
+COLLECTION_PRICE_SAMPLES = "price_samples"
+COLLECTION_PRICE_ROLLUPS = "price_rollups"
 COLLECTION_TWEETS = "tweets"
 COLLECTION_ENTITY_MENTIONS = "entity_mentions"
+COLLECTION_ENTITY_MENTION_ROLLUPS = "entity_mention_rollups"
 
 # Database name
 DB_NAME = "crypto_news"
@@ -588,6 +648,22 @@ class MongoManager:
             if not await self._has_index(price_history_col, index_options.get("name")):
                 await price_history_col.create_index(keys, **index_options)
 
+        # Create the price samples time-series collection and rollup indexes
+        await self._ensure_price_samples_collection()
+        price_samples_col = await self.get_async_collection(COLLECTION_PRICE_SAMPLES)
+        price_rollups_col = await self.get_async_collection(COLLECTION_PRICE_ROLLUPS)
+        if force_recreate:
+            await price_rollups_col.drop_indexes()
+        for collection, indexes in (
+            (price_samples_col, PRICE_SAMPLE_INDEXES),
+            (price_rollups_col, PRICE_ROLLUP_INDEXES),
+        ):
+            for index_info in indexes:
+                index_options = index_info.copy()
+                keys = index_options.pop("keys")
+                if not await self._has_index(collection, index_options.get("name")):
+                    await collection.create_index(keys, **index_options)
+
         # Create indexes for tweets collection
         tweets_col = await self.get_async_collection(COLLECTION_TWEETS)
         for index_info in TWEET_INDEXES:
@@ -603,6 +679,16 @@ class MongoManager:
             if not await self._has_index(entity_mentions_col, index_options.get("name")):
                 await entity_mentions_col.create_index(keys, **index_options)
 
+        # Create indexes for hourly entity mention rollups
+        rollups_col = await self.get_async_collection(COLLECTION_ENTITY_MENTION_ROLLUPS)
+        if force_recreate:
+            await rollups_col.drop_indexes()
+        for index_info in ENTITY_MENTION_ROLLUP_INDEXES:
+            index_options = index_info.copy()
+            keys = index_options.pop("keys")
+            if not await self._has_index(rollups_col, index_options.get("name")):
+                await rollups_col.create_index(keys, **index_options)
+
         logger.info("MongoDB indexes initialized successfully")
         self._indexes_created = True
 
@@ -619,6 +705,24 @@ class MongoManager:
                 return True
         return False
 
+    async def _ensure_price_samples_collection(self) -> None:
+        """Create the price samples time-series collection if it doesn't exist."""
+        db = await self.get_async_database()
+        if await db.list_collection_names(filter={"name": COLLECTION_PRICE_SAMPLES}):
+            return
+        try:
+            await db.create_collection(
+                COLLECTION_PRICE_SAMPLES,
+                timeseries=PRICE_SAMPLES_TIMESERIES,
+                expireAfterSeconds=PRICE_SAMPLES_RETENTION_SECONDS,
+            )
+        except CollectionInvalid:
+            # Created concurrently by another process
+            pass
+        except OperationFailure as e:
+            # Time-series collections need MongoDB 5.0+; inserts then create a regular collection
+            logger.warning(f"Could not create time-series collection {COLLECTION_PRICE_SAMPLES}: {e}")
+
     @asynccontextmanager
     async def get_session(self):
         """Async context manager for MongoDB transactions."""
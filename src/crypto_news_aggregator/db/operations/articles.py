@@ -1,34 +1,136 @@
-from typing import List
+import logging
+from dataclasses import dataclass
+from typing import List, Dict, Optional
 from datetime import datetime, timezone
+
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
 from crypto_news_aggregator.models.article import ArticleCreate, ArticleInDB
 from crypto_news_aggregator.db.mongodb import mongo_manager
 
+logger = logging.getLogger(__name__)
+
+# Per-article outcomes of bulk_upsert_articles
+INSERTED = "inserted"
+UPDATED = "updated"
+DUPLICATE = "duplicate"
+FAILED = "failed"
+
+DUPLICATE_KEY_ERROR = 11000
+
+# Fields refreshed on every ingest; everything else is written only on insert
+MUTABLE_FIELDS = ("metrics",)
+
+
+@dataclass
+class ArticleUpsertResult:
+    """Outcome of upserting one article."""
+
+    url: str
+    status: str
+    article_id: Optional[ObjectId] = None
+
+
+def _upsert_operation(article: ArticleCreate, now: datetime) -> UpdateOne:
+    """Build the upsert for one article, keyed on its URL (the url_unique index)."""
+    article_data = article.model_dump()
+    article_data["url"] = str(article_data["url"])
+    mutable = {field: article_data.pop(field) for field in MUTABLE_FIELDS}
+    article_data.update({"created_at": now, "updated_at": now})
+    return UpdateOne(
+        {"url": article_data["url"]},
+        {"$set": mutable, "$setOnInsert": article_data},
+        upsert=True,
+    )
+
+
+async def bulk_upsert_articles(articles: List[ArticleCreate]) -> List[ArticleUpsertResult]:
+    """
+    Insert new articles and refresh the metrics of known ones in one bulk write.
+
+    Articles are matched on URL. Repeats of a URL within the batch are
+    reported as duplicates and not written. Upserts that lose a url_unique
+    race against another worker are retried once as plain updates.
+
+    Args:
+        articles: Articles to ingest
+
+    Returns:
+        One result per input article, in input order
+    """
+    results: List[ArticleUpsertResult] = []
+    # Index into ``operations`` for each result that was written
+    op_positions: Dict[int, int] = {}
+    operations: List[UpdateOne] = []
+    seen_urls = set()
+    now = datetime.now(timezone.utc)
+
+    for article in articles:
+        url = str(article.url)
+        if url in seen_urls:
+            results.append(ArticleUpsertResult(url, DUPLICATE))
+            continue
+        seen_urls.add(url)
+        op_positions[len(results)] = len(operations)
+        operations.append(_upsert_operation(article, now))
+        results.append(ArticleUpsertResult(url, UPDATED))
+
+    if not operations:
+        return results
 
-async def create_or_update_articles(articles: List[ArticleCreate]):
-    """Creates new articles or updates existing ones in the database."""
     db = await mongo_manager.get_async_database()
     collection = db.articles
 
-    for article in articles:
-        # Ensure URL is a string before database operations
-        if hasattr(article, "url") and not isinstance(article.url, str):
-            article.url = str(article.url)
-        existing_article = await collection.find_one({"source_id": article.source_id})
-        if existing_article:
-            # Update metrics if the article already exists
-            await collection.update_one(
-                {"_id": existing_article["_id"]},
-                {"$set": {"metrics": article.metrics.model_dump()}},
-            )
-        else:
-            # Insert new article
-            # Prepare article data for database insertion
-            article_data = article.model_dump()
-            # Add required fields for database storage
-            article_data.update(
-                {
-                    "created_at": datetime.now(timezone.utc),
-                    "updated_at": datetime.now(timezone.utc),
-                }
-            )
-            await collection.insert_one(article_data)
+    upserted: Dict[int, ObjectId] = {}
+    failed: Dict[int, dict] = {}
+    try:
+        write_result = await collection.bulk_write(operations, ordered=False)
+        upserted = dict(write_result.upserted_ids or {})
+    except BulkWriteError as exc:
+        upserted = {item["index"]: item["_id"] for item in exc.details.get("upserted", [])}
+        failed = {error["index"]: error for error in exc.details.get("writeErrors", [])}
+
+    # A concurrent worker inserted the same URL between our match and insert;
+    # the document exists now, so the retry matches it and only refreshes metrics
+    raced = [index for index, error in failed.items() if error.get("code") == DUPLICATE_KEY_ERROR]
+    if raced:
+        retry_ops = [operations[index] for index in raced]
+        try:
+            await collection.bulk_write(retry_ops, ordered=False)
+            for index in raced:
+                del failed[index]
+        except BulkWriteError as exc:
+            still_failed = {raced[error["index"]] for error in exc.details.get("writeErrors", [])}
+            for index in raced:
+                if index not in still_failed:
+                    del failed[index]
+
+    for position, op_index in op_positions.items():
+        result = results[position]
+        if op_index in upserted:
+            result.status = INSERTED
+            result.article_id = upserted[op_index]
+        elif op_index in failed:
+            error = failed[op_index]
+            result.status = DUPLICATE if error.get("code") == DUPLICATE_KEY_ERROR else FAILED
+            if result.status == FAILED:
+                logger.error(f"Failed to upsert article {result.url}: {error.get('errmsg')}")
+
+    return results
+
+
+async def create_or_update_articles(articles: List[ArticleCreate]) -> Dict[str, int]:
+    """
+    Creates new articles or updates existing ones in the database.
+
+    Returns:
+        Count of articles per status (inserted, updated, duplicate, failed)
+    """
+    counts = {INSERTED: 0, UPDATED: 0, DUPLICATE: 0, FAILED: 0}
+    for result in await bulk_upsert_articles(articles):
+        counts[result.status] += 1
+    if articles:
+        logger.info(f"Upserted {len(articles)} articles: {counts}")
+    return counts
@@ -0,0 +1,495 @@
+"""
+Database operations for hourly entity mention rollups.
+
+Each rollup document pre-aggregates the primary mentions of one entity for
+one hour bucket and one relevance tier:
+
+    {
+        "entity": "Bitcoin",
+        "hour": datetime(2025, 1, 1, 13),   # naive UTC, truncated to the hour
+        "relevance_tier": 1,                # copied from the mentions (may be None)
+        "entity_type": "cryptocurrency",
+        "mention_count": 12,
+        "sources": {"coindesk": 7, "decrypt": 5},
+        "sentiment": {"positive": 4, "neutral": 6, "negative": 2},
+        "first_mention_at": datetime(...),
+        "last_mention_at": datetime(...),
+    }
+
+Rollups are updated incrementally whenever mentions are created, deleted or
+reclassified, so trending queries sum a few hundred bucket documents per
+entity instead of scanning the raw entity_mentions collection.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone, timedelta
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+from pymongo import UpdateOne, InsertOne
+
+from crypto_news_aggregator.db.mongodb import mongo_manager
+
+logger = logging.getLogger(__name__)
+
+SENTIMENT_LABELS = ("positive", "neutral", "negative")
+
+
+def hour_bucket(timestamp: datetime) -> datetime:
+    """Truncate a timestamp to its hour bucket (naive UTC)."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp.replace(minute=0, second=0, microsecond=0)
+
+
+def source_key(source: Optional[str]) -> str:
+    """Make a source name safe to use as a MongoDB field name."""
+    key = (source or "unknown").replace(".", "_")
+    return key.lstrip("$") or "unknown"
+
+
+def build_rollup_increments(
+    mentions: Iterable[Dict[str, Any]],
+) -> Dict[Tuple[str, datetime, Optional[int]], Dict[str, Any]]:
+    """
+    Group mention documents into per-bucket increments.
+
+    Only primary mentions are rolled up, matching the signal calculations.
+
+    Args:
+        mentions: Entity mention documents (as stored in entity_mentions)
+
+    Returns:
+        Dict keyed by (entity, hour, relevance_tier) with count, per-source
+        counts, sentiment histogram, entity_type and first/last mention times
+    """
+    buckets: Dict[Tuple[str, datetime, Optional[int]], Dict[str, Any]] = {}
+
+    for mention in mentions:
+        if not mention.get("is_primary"):
+            continue
+        created_at = mention.get("created_at")
+        if not mention.get("entity") or created_at is None:
+            continue
+
+        key = (mention["entity"], hour_bucket(created_at), mention.get("relevance_tier"))
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = {
+                "entity_type": mention.get("entity_type"),
+                "mention_count": 0,
+                "sources": defaultdict(int),
+                "sentiment": defaultdict(int),
+                "first_mention_at": created_at,
+                "last_mention_at": created_at,
+            }
+
+        sentiment = mention.get("sentiment")
+        if sentiment not in SENTIMENT_LABELS:
+            sentiment = "neutral"
+
+        bucket["mention_count"] += 1
+        bucket["sources"][source_key(mention.get("source"))] += 1
+        bucket["sentiment"][sentiment] += 1
+        bucket["first_mention_at"] = min(bucket["first_mention_at"], created_at)
+        bucket["last_mention_at"] = max(bucket["last_mention_at"], created_at)
+
+    return buckets
+
+
+def _increment_operations(
+    buckets: Dict[Tuple[str, datetime, Optional[int]], Dict[str, Any]],
+    sign: int = 1,
+) -> List[UpdateOne]:
+    """Build upsert operations that apply (or revert, with sign=-1) bucket increments."""
+    operations = []
+    for (entity, hour, relevance_tier), bucket in buckets.items():
+        increments = {"mention_count": sign * bucket["mention_count"]}
+        for source, count in bucket["sources"].items():
+            increments[f"sources.{source}"] = sign * count
+        for sentiment, count in bucket["sentiment"].items():
+            increments[f"sentiment.{sentiment}"] = sign * count
+
+        update: Dict[str, Any] = {"$inc": increments}
+        if sign > 0:
+            update["$set"] = {"entity_type": bucket["entity_type"]}
+            update["$min"] = {"first_mention_at": bucket["first_mention_at"]}
+            update["$max"] = {"last_mention_at": bucket["last_mention_at"]}
+
+        operations.append(
+            UpdateOne(
+                {"entity": entity, "hour": hour, "relevance_tier": relevance_tier},
+                update,
+                upsert=sign > 0,
+            )
+        )
+    return operations
+
+
+async def apply_mention_rollups(mentions: List[Dict[str, Any]], sign: int = 1) -> int:
+    """
+    Incrementally add (or remove, with sign=-1) mentions to the hourly rollups.
+
+    Args:
+        mentions: Entity mention documents
+        sign: 1 when mentions were created, -1 when they were removed
+
+    Returns:
+        Number of bucket documents touched
+    """
+    buckets = build_rollup_increments(mentions)
+    operations = _increment_operations(buckets, sign)
+    if not operations:
+        return 0
+
+    db = await mongo_manager.get_async_database()
+    collection = db.entity_mention_rollups
+    await collection.bulk_write(operations, ordered=False)
+
+    if sign < 0:
+        # Drop buckets that no longer hold any mentions
+        touched_hours = list({hour for _, hour, _ in buckets})
+        await collection.delete_many(
+            {"hour": {"$in": touched_hours}, "mention_count": {"$lte": 0}}
+        )
+
+    return len(operations)
+
+
+async def get_entity_rollup_totals(
+    start: datetime,
+    split_at: Optional[datetime] = None,
+    relevance_filter: Optional[Dict[str, Any]] = None,
+    entity_type: Optional[str] = None,
+    entities: Optional[List[str]] = None,
+    min_current_mentions: int = 0,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Sum hourly rollups per entity since ``start``.
+
+    Bucket boundaries are hour-aligned: ``start`` and ``split_at`` are
+    truncated to the hour before comparing.
+
+    Args:
+        start: Beginning of the window
+        split_at: Optional boundary; mentions at/after it count as "current",
+            earlier ones as "previous"
+        relevance_filter: Optional filter on the bucket's relevance_tier
+        entity_type: Optional filter by entity type
+        entities: Optional list of entities to restrict to
+        min_current_mentions: Drop entities with fewer current mentions
+        limit: If set, return only the top entities by current mentions
+
+    Returns:
+        List of dicts with entity (_id), entity_type, total_mentions,
+        current_mentions, previous_mentions, sources, sentiment,
+        first_seen and latest_mention
+    """
+    db = await mongo_manager.get_async_database()
+
+    match: Dict[str, Any] = {"hour": {"$gte": hour_bucket(start)}}
+    if relevance_filter:
+        match.update(relevance_filter)
+    if entity_type:
+        match["entity_type"] = entity_type
+    if entities is not None:
+        match["entity"] = {"$in": entities}
+
+    split_hour = hour_bucket(split_at) if split_at else hour_bucket(start)
+
+    pipeline = [
+        {"$match": match},
+        {
+            "$group": {
+                "_id": "$entity",
+                "entity_type": {"$last": "$entity_type"},
+                "total_mentions": {"$sum": "$mention_count"},
+                "current_mentions": {
+                    "$sum": {"$cond": [{"$gte": ["$hour", split_hour]}, "$mention_count", 0]}
+                },
+                "previous_mentions": {
+                    "$sum": {"$cond": [{"$lt": ["$hour", split_hour]}, "$mention_count", 0]}
+                },
+                # Reverted mentions leave zero counts behind; only sources
+                # with mentions left count towards diversity
+                "source_lists": {
+                    "$push": {
+                        "$map": {
+                            "input": {
+                                "$filter": {
+                                    "input": {"$objectToArray": "$sources"},
+                                    "cond": {"$gt": ["$$this.v", 0]},
+                                }
+                            },
+                            "in": "$$this.k",
+                        }
+                    }
+                },
+                "positive": {"$sum": {"$ifNull": ["$sentiment.positive", 0]}},
+                "neutral": {"$sum": {"$ifNull": ["$sentiment.neutral", 0]}},
+                "negative": {"$sum": {"$ifNull": ["$sentiment.negative", 0]}},
+                "first_seen": {"$min": "$first_mention_at"},
+                "latest_mention": {"$max": "$last_mention_at"},
+            }
+        },
+        {
+            "$project": {
+                "entity_type": 1,
+                "total_mentions": 1,
+                "current_mentions": 1,
+                "previous_mentions": 1,
+                "sources": {
+                    "$reduce": {
+                        "input": "$source_lists",
+                        "initialValue": [],
+                        "in": {"$setUnion": ["$$value", "$$this"]},
+                    }
+                },
+                "sentiment": {
+                    "positive": "$positive",
+                    "neutral": "$neutral",
+                    "negative": "$negative",
+                },
+                "first_seen": 1,
+                "latest_mention": 1,
+            }
+        },
+    ]
+    if min_current_mentions:
+        pipeline.append({"$match": {"current_mentions": {"$gte": min_current_mentions}}})
+    if limit:
+        pipeline.extend([{"$sort": {"current_mentions": -1}}, {"$limit": limit}])
+
+    return await db.entity_mention_rollups.aggregate(pipeline).to_list(length=limit)
+
+
+async def get_entity_rollup_history(
+    entities: List[str],
+    before: datetime,
+    since: Dict[Any, datetime],
+    relevance_filter: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Sum hourly rollups per entity for buckets before ``before``.
+
+    Used to score long windows: the raw mentions after ``before`` are
+    counted exactly, the history before it comes from the rollups. Bucket
+    boundaries are hour-aligned, as in ``get_entity_rollup_totals``.
+
+    Args:
+        entities: Entities to sum
+        before: End of the history (truncated to the hour, exclusive)
+        since: Window starts keyed by any label; each yields the mention
+            count from that start up to ``before``
+        relevance_filter: Optional filter on the bucket's relevance_tier
+            (first_seen ignores it)
+
+    Returns:
+        Dict keyed by entity with ``counts`` (label -> mentions), ``sources``
+        (source keys with mentions left), ``sentiment`` (label -> mentions)
+        and ``first_seen`` (earliest mention of any tier)
+    """
+    db = await mongo_manager.get_async_database()
+
+    end = hour_bucket(before)
+    starts = {f"since_{i}": (label, hour_bucket(start)) for i, (label, start) in enumerate(since.items())}
+
+    group_stage: Dict[str, Any] = {
+        "_id": "$entity",
+        "source_lists": {
+            "$push": {
+                "$map": {
+                    "input": {
+                        "$filter": {
+                            "input": {"$objectToArray": "$sources"},
+                            "cond": {"$gt": ["$$this.v", 0]},
+                        }
+                    },
+                    "in": "$$this.k",
+                }
+            }
+        },
+    }
+    for label in SENTIMENT_LABELS:
+        group_stage[label] = {"$sum": {"$ifNull": [f"$sentiment.{label}", 0]}}
+    for field, (_, start) in starts.items():
+        group_stage[field] = {
+            "$sum": {"$cond": [{"$gte": ["$hour", start]}, "$mention_count", 0]}
+        }
+
+    pipeline = [
+        {"$match": {"entity": {"$in": entities}, "hour": {"$lt": end}}},
+        {
+            "$facet": {
+                "metrics": [{"$match": relevance_filter or {}}, {"$group": group_stage}],
+                "first_seen": [
+                    {"$group": {"_id": "$entity", "first_seen": {"$min": "$first_mention_at"}}},
+                ],
+            }
+        },
+    ]
+    facets = await db.entity_mention_rollups.aggregate(pipeline).to_list(length=1)
+    facets = facets[0] if facets else {"metrics": [], "first_seen": []}
+
+    history: Dict[str, Dict[str, Any]] = {}
+    for doc in facets["metrics"]:
+        history[doc["_id"]] = {
+            "counts": {label: doc[field] for field, (label, _) in starts.items()},
+            "sources": sorted({source for sources in doc["source_lists"] for source in sources}),
+            "sentiment": {label: doc[label] for label in SENTIMENT_LABELS},
+            "first_seen": None,
+        }
+    for doc in facets["first_seen"]:
+        entry = history.setdefault(
+            doc["_id"],
+            {
+                "counts": {label: 0 for label, _ in starts.values()},
+                "sources": [],
+                "sentiment": {label: 0 for label in SENTIMENT_LABELS},
+                "first_seen": None,
+            },
+        )
+        entry["first_seen"] = doc["first_seen"]
+    return history
+
+
+async def rebuild_rollups(
+    start: datetime,
+    end: Optional[datetime] = None,
+    chunk_hours: int = 24,
+) -> Dict[str, int]:
+    """
+    Rebuild rollups from the raw entity_mentions collection.
+
+    Works through the range one chunk at a time: the chunk's buckets are
+    deleted and recomputed from raw mentions, so the rebuild is idempotent and
+    can be re-run for any range.
+
+    Args:
+        start: Beginning of the range to rebuild (truncated to the hour)
+        end: End of the range (defaults to now)
+        chunk_hours: Hours of mentions processed per chunk
+
+    Returns:
+        Dict with mentions_scanned and buckets_written counts
+    """
+    db = await mongo_manager.get_async_database()
+    mentions_col = db.entity_mentions
+    rollups_col = db.entity_mention_rollups
+
+    chunk_start = hour_bucket(start)
+    end = hour_bucket(end or datetime.now(timezone.utc)) + timedelta(hours=1)
+
+    mentions_scanned = 0
+    buckets_written = 0
+
+    while chunk_start < end:
+        chunk_end = min(chunk_start + timedelta(hours=chunk_hours), end)
+
+        cursor = mentions_col.find(
+            {"is_primary": True, "created_at": {"$gte": chunk_start, "$lt": chunk_end}},
+            {
+                "entity": 1,
+                "entity_type": 1,
+                "is_primary": 1,
+                "relevance_tier": 1,
+                "source": 1,
+                "sentiment": 1,
+                "created_at": 1,
+            },
+        )
+        mentions = await cursor.to_list(length=None)
+        buckets = build_rollup_increments(mentions)
+
+        await rollups_col.delete_many({"hour": {"$gte": chunk_start, "$lt": chunk_end}})
+        if buckets:
+            documents = [
+                InsertOne({
+                    "entity": entity,
+                    "hour": hour,
+                    "relevance_tier": relevance_tier,
+                    "entity_type": bucket["entity_type"],
+                    "mention_count": bucket["mention_count"],
+                    "sources": dict(bucket["sources"]),
+                    "sentiment": dict(bucket["sentiment"]),
+                    "first_mention_at": bucket["first_mention_at"],
+                    "last_mention_at": bucket["last_mention_at"],
+                })
+                for (entity, hour, relevance_tier), bucket in buckets.items()
+            ]
+            await rollups_col.bulk_write(documents, ordered=False)
+
+        mentions_scanned += len(mentions)
+        buckets_written += len(buckets)
+        logger.info(
+            f"Rebuilt rollups {chunk_start.isoformat()} - {chunk_end.isoformat()}: "
+            f"{len(mentions)} mentions -> {len(buckets)} buckets"
+        )
+        chunk_start = chunk_end
+
+    return {"mentions_scanned": mentions_scanned, "buckets_written": buckets_written}
+
+
+async def check_rollup_consistency(
+    start: datetime,
+    end: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Compare rollup counts against the raw entity_mentions collection.
+
+    Args:
+        start: Beginning of the range to check (truncated to the hour)
+        end: End of the range (defaults to now)
+
+    Returns:
+        List of mismatches, each with entity, hour, relevance_tier,
+        raw_count and rollup_count. An empty list means the rollups agree.
+    """
+    db = await mongo_manager.get_async_database()
+
+    start = hour_bucket(start)
+    end = hour_bucket(end or datetime.now(timezone.utc)) + timedelta(hours=1)
+
+    raw_pipeline = [
+        {"$match": {"is_primary": True, "created_at": {"$gte": start, "$lt": end}}},
+        {
+            "$group": {
+                "_id": {
+                    "entity": "$entity",
+                    "hour": {"$dateTrunc": {"date": "$created_at", "unit": "hour"}},
+                    "relevance_tier": {"$ifNull": ["$relevance_tier", None]},
+                },
+                "count": {"$sum": 1},
+            }
+        },
+    ]
+    raw_counts = {}
+    async for doc in db.entity_mentions.aggregate(raw_pipeline):
+        key = (doc["_id"]["entity"], doc["_id"]["hour"], doc["_id"]["relevance_tier"])
+        raw_counts[key] = doc["count"]
+
+    rollup_counts = {}
+    cursor = db.entity_mention_rollups.find(
+        {"hour": {"$gte": start, "$lt": end}},
+        {"entity": 1, "hour": 1, "relevance_tier": 1, "mention_count": 1},
+    )
+    async for doc in cursor:
+        key = (doc["entity"], doc["hour"], doc.get("relevance_tier"))
+        rollup_counts[key] = doc["mention_count"]
+
+    mismatches = []
+    for key in sorted(set(raw_counts) | set(rollup_counts), key=lambda k: (k[1], k[0], k[2] or 0)):
+        raw_count = raw_counts.get(key, 0)
+        rollup_count = rollup_counts.get(key, 0)
+        if raw_count != rollup_count:
+            entity, hour, relevance_tier = key
+            mismatches.append({
+                "entity": entity,
+                "hour": hour,
+                "relevance_tier": relevance_tier,
+                "raw_count": raw_count,
+                "rollup_count": rollup_count,
+            })
+
+    return mismatches
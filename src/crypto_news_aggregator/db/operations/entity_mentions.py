@@ -1,7 +1,23 @@
-from typing import List, Dict, Any
+import logging
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 from crypto_news_aggregator.db.mongodb import mongo_manager
 from crypto_news_aggregator.db.models import EntityType
+from crypto_news_aggregator.db.operations.entity_mention_rollups import apply_mention_rollups
+
+logger = logging.getLogger(__name__)
+
+
+async def _update_rollups(mentions: List[Dict[str, Any]], sign: int = 1) -> None:
+    """Apply mentions to the hourly rollups without failing the caller.
+
+    Rollup drift is detectable with check_rollup_consistency and repairable
+    with rebuild_rollups, so a failed increment is logged rather than raised.
+    """
+    try:
+        await apply_mention_rollups(mentions, sign=sign)
+    except Exception as exc:
+        logger.error(f"Failed to update entity mention rollups: {exc}")
 
 
 async def create_entity_mention(
@@ -13,6 +29,8 @@ async def create_entity_mention(
     is_primary: bool = None,
     source: str = None,
     metadata: Dict[str, Any] = None,
+    relevance_tier: Optional[int] = None,
+    published_at: Optional[datetime] = None,
 ) -> str:
     """
     Creates a new entity mention record in the database.
@@ -26,6 +44,8 @@ async def create_entity_mention(
         is_primary: Whether this is a primary entity (auto-determined if None)
         source: Source of the article (e.g., "CoinDesk", "Cointelegraph")
         metadata: Additional metadata about the mention
+        relevance_tier: Relevance tier of the article (denormalized for signal queries)
+        published_at: Publication time of the article (denormalized for signal queries)
 
     Returns:
         The ID of the created entity mention
@@ -48,9 +68,12 @@ async def create_entity_mention(
         "timestamp": datetime.now(timezone.utc),
         "created_at": datetime.now(timezone.utc),
         "metadata": metadata or {},
+        "relevance_tier": relevance_tier,
+        "published_at": published_at,
     }
 
     result = await collection.insert_one(mention_data)
+    await _update_rollups([mention_data])
     return str(result.inserted_id)
 
 
@@ -59,7 +82,11 @@ async def create_entity_mentions_batch(mentions: List[Dict[str, Any]]) -> List[s
     Creates multiple entity mention records in a single batch operation.
 
     Args:
-        mentions: List of mention dicts with keys: entity, entity_type, article_id, sentiment, confidence, source (optional), is_primary (optional)
+        mentions: List of mention dicts with keys: entity, entity_type, article_id, sentiment, confidence, source (optional), is_primary (optional),
+            relevance_tier (optional), published_at (optional)
+
+    relevance_tier and published_at are copied from the article so signal
+    queries can filter mentions by tier without joining articles.
 
     Returns:
         List of created mention IDs
@@ -88,15 +115,61 @@ async def create_entity_mentions_batch(mentions: List[Dict[str, Any]]) -> List[s
             "timestamp": now,
             "created_at": now,
             "metadata": mention.get("metadata", {}),
+            "relevance_tier": mention.get("relevance_tier"),
+            "published_at": mention.get("published_at"),
         }
         mention_docs.append(mention_doc)
 
     if mention_docs:
         result = await collection.insert_many(mention_docs)
+        await _update_rollups(mention_docs)
         return [str(id) for id in result.inserted_ids]
     return []
 
 
+async def update_mentions_relevance(
+    article_id: str,
+    relevance_tier: Optional[int],
+    published_at: Optional[datetime] = None,
+) -> int:
+    """
+    Sync the denormalized relevance fields on all mentions of an article.
+
+    Must be called whenever an article's relevance_tier changes so that
+    tier-filtered signal queries stay consistent with the articles collection.
+
+    Args:
+        article_id: ID of the article whose mentions should be updated
+        relevance_tier: The article's current relevance tier
+        published_at: The article's publication time (optional)
+
+    Returns:
+        Number of entity mentions modified
+    """
+    db = await mongo_manager.get_async_database()
+    collection = db.entity_mentions
+
+    update_fields: Dict[str, Any] = {"relevance_tier": relevance_tier}
+    if published_at is not None:
+        update_fields["published_at"] = published_at
+
+    # Primary mentions changing tier move between rollup buckets
+    moved = await collection.find(
+        {"article_id": article_id, "is_primary": True, "relevance_tier": {"$ne": relevance_tier}}
+    ).to_list(length=None)
+
+    result = await collection.update_many(
+        {"article_id": article_id},
+        {"$set": update_fields},
+    )
+
+    if moved:
+        await _update_rollups(moved, sign=-1)
+        await _update_rollups([{**mention, "relevance_tier": relevance_tier} for mention in moved])
+
+    return result.modified_count
+
+
 async def get_entity_mentions(
     entity: str = None,
     entity_type: str = None,
@@ -198,7 +271,10 @@ async def delete_entity_mentions_for_article(article_id: str) -> int:
     db = await mongo_manager.get_async_database()
     collection = db.entity_mentions
     
+    removed = await collection.find({"article_id": article_id, "is_primary": True}).to_list(length=None)
     result = await collection.delete_many({"article_id": article_id})
+    if removed:
+        await _update_rollups(removed, sign=-1)
     return result.deleted_count
 
 
@@ -217,5 +293,10 @@ async def delete_entity_mentions_for_articles(article_ids: List[str]) -> int:
     db = await mongo_manager.get_async_database()
     collection = db.entity_mentions
     
+    removed = await collection.find(
+        {"article_id": {"$in": article_ids}, "is_primary": True}
+    ).to_list(length=None)
     result = await collection.delete_many({"article_id": {"$in": article_ids}})
+    if removed:
+        await _update_rollups(removed, sign=-1)
     return result.deleted_count
@@ -0,0 +1,72 @@
+"""
+Database operations for per-feed HTTP validators.
+
+One document per RSS source, keyed by the source name:
+
+    {
+        "_id": "coindesk",
+        "url": "https://www.coindesk.com/arc/outboundfeeds/rss/",
+        "etag": "\\"abc123\\"",                        # from the ETag header
+        "last_modified": "Wed, 01 Jan 2025 12:00:00 GMT",
+        "entry_ids": ["https://...", ...],            # GUIDs seen in the last body
+        "last_status": 304,
+        "last_fetched_at": datetime(...),
+        "last_changed_at": datetime(...),
+    }
+
+The RSS fetcher sends the validators back as If-None-Match/If-Modified-Since
+so unchanged feeds answer 304 with no body, and skips entries whose GUID was
+already in the previous body.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List
+
+from pymongo import UpdateOne
+
+from crypto_news_aggregator.db.mongodb import mongo_manager
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_FEED_STATE = "feed_state"
+
+# Enough to cover every entry a feed returns in one body
+MAX_STORED_ENTRY_IDS = 200
+
+
+async def get_feed_states(sources: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the stored validators for the given sources.
+
+    Returns:
+        Dict of source name -> state document (sources never fetched are absent)
+    """
+    db = await mongo_manager.get_async_database()
+    cursor = db[COLLECTION_FEED_STATE].find({"_id": {"$in": list(sources)}})
+    return {doc["_id"]: doc async for doc in cursor}
+
+
+async def save_feed_states(states: List[Dict[str, Any]]) -> int:
+    """
+    Upsert feed state documents in one bulk write.
+
+    Args:
+        states: State documents, each with ``_id`` set to the source name
+
+    Returns:
+        Number of documents written
+    """
+    if not states:
+        return 0
+
+    operations = []
+    for state in states:
+        fields = {key: value for key, value in state.items() if key != "_id"}
+        if "entry_ids" in fields:
+            fields["entry_ids"] = list(fields["entry_ids"])[:MAX_STORED_ENTRY_IDS]
+        operations.append(UpdateOne({"_id": state["_id"]}, {"$set": fields}, upsert=True))
+
+    db = await mongo_manager.get_async_database()
+    await db[COLLECTION_FEED_STATE].bulk_write(operations, ordered=False)
+    logger.debug(f"Saved feed state for {len(operations)} feeds")
+    return len(operations)
@@ -0,0 +1,106 @@
+"""
+Database operations for job leases (leader election).
+
+One document per lease, keyed by the job name:
+
+    {
+        "_id": "narratives",
+        "holder": "web-1:4213:9f2c01ab",   # process holding the lease (None once released)
+        "token": 17,                        # fencing token, incremented on every acquisition
+        "expires_at": datetime(...),
+        "acquired_at": datetime(...),
+        "renewed_at": datetime(...),
+    }
+
+A lease can be taken when it has expired (or was released), or by its own
+holder. Acquisition is a single conditional upsert: when another process
+holds a live lease the filter doesn't match, the upsert collides with the
+existing ``_id`` and the caller gets None.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from crypto_news_aggregator.db.mongodb import mongo_manager
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_LEASES = "leases"
+
+
+class StaleLeaseError(Exception):
+    """A write was fenced off because a newer lease holder has written since."""
+
+
+async def acquire_lease(name: str, holder: str, ttl_seconds: float) -> Optional[int]:
+    """
+    Take the lease if it is free, expired or already ours.
+
+    Returns:
+        The new fencing token, or None if another holder has a live lease
+    """
+    now = datetime.now(timezone.utc)
+    db = await mongo_manager.get_async_database()
+    try:
+        lease = await db[COLLECTION_LEASES].find_one_and_update(
+            {
+                "_id": name,
+                "$or": [{"expires_at": {"$lte": now}}, {"holder": holder}],
+            },
+            {
+                "$set": {
+                    "holder": holder,
+                    "expires_at": now + timedelta(seconds=ttl_seconds),
+                    "acquired_at": now,
+                    "renewed_at": now,
+                },
+                "$inc": {"token": 1},
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+    except DuplicateKeyError:
+        return None
+    return lease["token"]
+
+
+async def renew_lease(name: str, holder: str, token: int, ttl_seconds: float) -> bool:
+    """
+    Extend a lease we hold.
+
+    Returns:
+        False if the lease was lost (taken over after expiring)
+    """
+    now = datetime.now(timezone.utc)
+    db = await mongo_manager.get_async_database()
+    result = await db[COLLECTION_LEASES].update_one(
+        {"_id": name, "holder": holder, "token": token},
+        {"$set": {"expires_at": now + timedelta(seconds=ttl_seconds), "renewed_at": now}},
+    )
+    return result.matched_count == 1
+
+
+async def release_lease(name: str, holder: str, token: int) -> None:
+    """Expire a lease we hold so a standby can take it over immediately."""
+    db = await mongo_manager.get_async_database()
+    await db[COLLECTION_LEASES].update_one(
+        {"_id": name, "holder": holder, "token": token},
+        {"$set": {"holder": None, "expires_at": datetime.now(timezone.utc)}},
+    )
+
+
+async def get_leases() -> List[Dict[str, Any]]:
+    """All lease documents, with ``held`` set for the ones that haven't expired."""
+    now = datetime.now(timezone.utc)
+    db = await mongo_manager.get_async_database()
+    leases = await db[COLLECTION_LEASES].find({}).sort("_id", 1).to_list(length=None)
+    for lease in leases:
+        expires_at = lease.get("expires_at")
+        if expires_at is not None and expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        lease["held"] = bool(lease.get("holder")) and expires_at is not None and expires_at > now
+    return leases
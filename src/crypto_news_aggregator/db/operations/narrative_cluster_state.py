@@ -0,0 +1,153 @@
+"""
+Database operations for incremental narrative clustering state.
+
+One state document per detection mode:
+
+    {
+        "_id": "salience",
+        "window_hours": 48,
+        "watermark": datetime(...),    # articles created/extracted before this were assigned
+        "built_at": datetime(...),     # last full rebuild
+        "fencing_token": 17,           # lease token of the last writer
+    }
+
+and one member document per clustered article, keyed by the article id:
+
+    {
+        "_id": ObjectId(...),
+        "cluster": "65f0c...",         # stable cluster key (founding article id)
+        "seq": 1234,                   # assignment order
+        "nucleus_entity": "SEC",
+        "actors": [...], "actor_salience": {...}, "tensions": [...],
+        "published_at": datetime(...),
+        "fencing_token": 17,           # lease token of the writer
+    }
+
+A cycle writes only the members it assigned and deletes the ones that
+expired; a full rebuild replaces all members. Writes made under a job lease
+are fenced: once a newer lease holder has saved, older tokens are rejected.
+The state and the members are both fenced. The first save under a new token
+stamps that token on every member, and member writes only match documents
+stamped with the caller's token or an older one. A paused leader that
+resumes after it was replaced can no longer delete or overwrite members.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from pymongo import ReplaceOne, ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from crypto_news_aggregator.db.mongodb import mongo_manager
+from crypto_news_aggregator.db.operations.leases import StaleLeaseError
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_CLUSTER_STATE = "narrative_cluster_state"
+COLLECTION_CLUSTER_MEMBERS = "narrative_cluster_members"
+
+STATE_ID = "salience"
+
+
+async def load_cluster_state() -> Optional[Dict[str, Any]]:
+    """
+    Load the stored clustering state.
+
+    Returns:
+        The state document with its member docs under ``members``, or None
+        if no state has been saved yet
+    """
+    db = await mongo_manager.get_async_database()
+    state = await db[COLLECTION_CLUSTER_STATE].find_one({"_id": STATE_ID})
+    if not state:
+        return None
+    state["members"] = await db[COLLECTION_CLUSTER_MEMBERS].find({}).to_list(length=None)
+    return state
+
+
+async def save_cluster_state(
+    state: Dict[str, Any],
+    added: List[Dict[str, Any]],
+    expired_ids: List[Any],
+    replace: bool = False,
+    fencing_token: Optional[int] = None,
+) -> None:
+    """
+    Persist the result of a detection cycle.
+
+    Args:
+        state: State fields (window_hours, watermark, built_at)
+        added: Member docs assigned this cycle (all members if ``replace``)
+        expired_ids: Article IDs that left the window
+        replace: Drop all stored members first (after a full rebuild)
+        fencing_token: Lease token of the caller, if it runs under a lease
+
+    Raises:
+        StaleLeaseError: A newer lease holder has already saved state
+    """
+    db = await mongo_manager.get_async_database()
+    members = db[COLLECTION_CLUSTER_MEMBERS]
+    stale = StaleLeaseError(f"Narrative cluster state was saved under a newer lease than {fencing_token}")
+
+    fenced: Dict[str, Any] = {}
+    if fencing_token is not None:
+        fenced = {"$or": [
+            {"fencing_token": {"$exists": False}},
+            {"fencing_token": {"$lte": fencing_token}},
+        ]}
+        # Claim the state for this token before touching members
+        try:
+            previous = await db[COLLECTION_CLUSTER_STATE].find_one_and_update(
+                {"_id": STATE_ID, **fenced},
+                {"$set": {"fencing_token": fencing_token}},
+                upsert=True,
+                return_document=ReturnDocument.BEFORE,
+            )
+        except DuplicateKeyError:
+            raise stale
+        if previous is None or previous.get("fencing_token") != fencing_token:
+            # New lease holder: claim the members too, so writes under older tokens miss them
+            await members.update_many(fenced, {"$set": {"fencing_token": fencing_token}})
+        added = [{**member, "fencing_token": fencing_token} for member in added]
+
+    if replace:
+        await members.delete_many(fenced)
+    elif expired_ids:
+        await members.delete_many({"_id": {"$in": list(expired_ids)}, **fenced})
+
+    if added:
+        try:
+            await members.bulk_write(
+                [ReplaceOne({"_id": member["_id"], **fenced}, member, upsert=True) for member in added],
+                ordered=False,
+            )
+        except BulkWriteError as e:
+            if fencing_token is None or any(error["code"] != 11000 for error in e.details["writeErrors"]):
+                raise
+            # A member was claimed by a newer lease holder
+            await _discard_members(members, added, fencing_token)
+            raise stale
+
+    if fencing_token is None:
+        await db[COLLECTION_CLUSTER_STATE].update_one(
+            {"_id": STATE_ID}, {"$set": state}, upsert=True
+        )
+    else:
+        result = await db[COLLECTION_CLUSTER_STATE].update_one(
+            {"_id": STATE_ID, "fencing_token": fencing_token}, {"$set": state}
+        )
+        if not result.matched_count:
+            await _discard_members(members, added, fencing_token)
+            raise stale
+
+    logger.debug(
+        f"Saved narrative cluster state: {len(added)} members written, "
+        f"{len(expired_ids)} expired{' (full rebuild)' if replace else ''}"
+    )
+
+
+async def _discard_members(members, added: List[Dict[str, Any]], fencing_token: int) -> None:
+    """Remove members a stale writer inserted after a newer lease holder claimed the state."""
+    await members.delete_many(
+        {"_id": {"$in": [member["_id"] for member in added]}, "fencing_token": fencing_token}
+    )
@@ -0,0 +1,291 @@
+"""
+Database operations for price samples and their OHLC rollups.
+
+Raw samples are stored in a time-series collection with the coin as metaField:
+
+    {
+        "symbol": "bitcoin",                 # CoinGecko coin id
+        "timestamp": datetime(...),
+        "price": 67250.12,
+        "change_24h": -1.2,                  # optional
+        "volume": 3.1e10,                    # optional
+    }
+
+and every batch of samples is folded into one rollup document per coin,
+resolution and bucket:
+
+    {
+        "symbol": "bitcoin",
+        "resolution": "1h",                  # "1m", "1h" or "1d"
+        "bucket": datetime(2025, 1, 1, 13),  # naive UTC, truncated to the resolution
+        "open": ..., "high": ..., "low": ..., "close": ...,
+        "open_at": datetime(...), "close_at": datetime(...),
+        "sample_count": 12,
+        "expires_at": datetime(...),         # absent for resolutions kept forever
+    }
+
+Rollup upserts are order-independent (open/close compare sample times), so
+late batches still produce the right OHLC. They are not idempotent, though:
+the high/low/open/close merge is, but sample_count adds up. Raw samples and
+rollups are therefore written as separate steps. A failed rollup step is
+retried on its own, so a retry never inserts samples twice. Time-series
+collections don't enforce unique ``_id``s, so a deterministic id would not
+deduplicate them. Charts, analytics and briefings read aligned rollup series
+instead of raw points or CoinGecko.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from crypto_news_aggregator.db.mongodb import (
+    COLLECTION_PRICE_ROLLUPS,
+    COLLECTION_PRICE_SAMPLES,
+    mongo_manager,
+)
+
+logger = logging.getLogger(__name__)
+
+RESOLUTIONS: Dict[str, timedelta] = {
+    "1m": timedelta(minutes=1),
+    "1h": timedelta(hours=1),
+    "1d": timedelta(days=1),
+}
+
+# How long rollups of each resolution are kept (None keeps them forever)
+ROLLUP_RETENTION: Dict[str, Optional[timedelta]] = {
+    "1m": timedelta(days=7),
+    "1h": timedelta(days=365),
+    "1d": None,
+}
+
+
+def _naive_utc(timestamp: datetime) -> datetime:
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+
+def bucket_start(timestamp: datetime, resolution: str) -> datetime:
+    """Truncate a timestamp to the start of its bucket (naive UTC)."""
+    timestamp = _naive_utc(timestamp)
+    if resolution == "1m":
+        return timestamp.replace(second=0, microsecond=0)
+    if resolution == "1h":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    if resolution == "1d":
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"Unknown resolution '{resolution}' (expected one of {', '.join(RESOLUTIONS)})")
+
+
+def build_price_rollups(
+    samples: Iterable[Dict[str, Any]], resolution: str
+) -> Dict[Tuple[str, datetime], Dict[str, Any]]:
+    """
+    Aggregate samples into OHLC buckets.
+
+    Args:
+        samples: Price sample documents
+        resolution: "1m", "1h" or "1d"
+
+    Returns:
+        Dict keyed by (symbol, bucket) with open/high/low/close,
+        open_at/close_at and sample_count
+    """
+    buckets: Dict[Tuple[str, datetime], Dict[str, Any]] = {}
+    for sample in samples:
+        price = sample.get("price")
+        if price is None:
+            continue
+        at = _naive_utc(sample["timestamp"])
+        key = (sample["symbol"], bucket_start(at, resolution))
+        bucket = buckets.get(key)
+        if bucket is None:
+            buckets[key] = {
+                "open": price, "high": price, "low": price, "close": price,
+                "open_at": at, "close_at": at, "sample_count": 1,
+            }
+            continue
+        bucket["high"] = max(bucket["high"], price)
+        bucket["low"] = min(bucket["low"], price)
+        if at < bucket["open_at"]:
+            bucket["open"], bucket["open_at"] = price, at
+        if at >= bucket["close_at"]:
+            bucket["close"], bucket["close_at"] = price, at
+        bucket["sample_count"] += 1
+    return buckets
+
+
+def _rollup_operations(
+    buckets: Dict[Tuple[str, datetime], Dict[str, Any]], resolution: str
+) -> List[UpdateOne]:
+    """Upserts merging bucket aggregates into stored rollups (update pipelines)."""
+    retention = ROLLUP_RETENTION[resolution]
+    operations = []
+    for (symbol, bucket), agg in buckets.items():
+        merged: Dict[str, Any] = {
+            # Stages see the document as it was before this update
+            "open": {"$cond": [
+                {"$or": [{"$not": ["$open_at"]}, {"$lt": [agg["open_at"], "$open_at"]}]},
+                agg["open"], "$open",
+            ]},
+            "close": {"$cond": [
+                {"$or": [{"$not": ["$close_at"]}, {"$gte": [agg["close_at"], "$close_at"]}]},
+                agg["close"], "$close",
+            ]},
+            "open_at": {"$min": ["$open_at", agg["open_at"]]},
+            "close_at": {"$max": ["$close_at", agg["close_at"]]},
+            "high": {"$max": ["$high", agg["high"]]},
+            "low": {"$min": ["$low", agg["low"]]},
+            "sample_count": {"$add": [{"$ifNull": ["$sample_count", 0]}, agg["sample_count"]]},
+        }
+        if retention is not None:
+            merged["expires_at"] = bucket + RESOLUTIONS[resolution] + retention
+        operations.append(
+            UpdateOne(
+                {"symbol": symbol, "resolution": resolution, "bucket": bucket},
+                [{"$set": merged}],
+                upsert=True,
+            )
+        )
+    return operations
+
+
+def price_rollup_operations(samples: Iterable[Dict[str, Any]]) -> List[UpdateOne]:
+    """Upserts folding ``samples`` into every rollup resolution."""
+    samples = list(samples)
+    operations = []
+    for resolution in RESOLUTIONS:
+        operations.extend(_rollup_operations(build_price_rollups(samples, resolution), resolution))
+    return operations
+
+
+async def insert_price_samples(samples: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Store a batch of raw samples (rollups are updated by ``update_price_rollups``).
+
+    Returns:
+        The samples stored; samples the server rejected are logged and left out
+    """
+    if not samples:
+        return []
+    db = await mongo_manager.get_async_database()
+    try:
+        await db[COLLECTION_PRICE_SAMPLES].insert_many([dict(sample) for sample in samples], ordered=False)
+    except BulkWriteError as e:
+        rejected = {error["index"] for error in e.details["writeErrors"]}
+        logger.error(
+            f"{len(rejected)} of {len(samples)} price samples were rejected: "
+            f"{e.details['writeErrors'][0].get('errmsg')}"
+        )
+        return [sample for i, sample in enumerate(samples) if i not in rejected]
+    return samples
+
+
+async def update_price_rollups(operations: List[UpdateOne]) -> List[UpdateOne]:
+    """
+    Apply rollup upserts from ``price_rollup_operations``.
+
+    Returns:
+        The operations that failed. They can be retried on their own,
+        since re-applying the ones that succeeded would count their samples twice.
+    """
+    if not operations:
+        return []
+    db = await mongo_manager.get_async_database()
+    try:
+        await db[COLLECTION_PRICE_ROLLUPS].bulk_write(operations, ordered=False)
+    except BulkWriteError as e:
+        failed = [operations[error["index"]] for error in e.details["writeErrors"]]
+        logger.warning(f"{len(failed)} of {len(operations)} price rollup updates failed")
+        return failed
+    logger.debug(f"Updated {len(operations)} price rollup buckets")
+    return []
+
+
+async def get_latest_sample(symbol: str) -> Optional[Dict[str, Any]]:
+    """The most recent raw sample for a coin."""
+    db = await mongo_manager.get_async_database()
+    return await db[COLLECTION_PRICE_SAMPLES].find_one(
+        {"symbol": symbol}, sort=[("timestamp", -1)]
+    )
+
+
+async def get_price_samples(
+    symbol: str, start: datetime, limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Raw samples for a coin since ``start``, newest first."""
+    db = await mongo_manager.get_async_database()
+    cursor = db[COLLECTION_PRICE_SAMPLES].find(
+        {"symbol": symbol, "timestamp": {"$gte": start}}
+    ).sort("timestamp", -1)
+    if limit:
+        cursor = cursor.limit(limit)
+    return await cursor.to_list(length=limit)
+
+
+async def get_price_rollups(
+    symbols: Sequence[str],
+    start: datetime,
+    end: Optional[datetime] = None,
+    resolution: str = "1h",
+) -> List[Dict[str, Any]]:
+    """Rollup documents for ``symbols`` between ``start`` and ``end``, oldest first."""
+    bucket_range: Dict[str, Any] = {"$gte": bucket_start(start, resolution)}
+    if end is not None:
+        bucket_range["$lte"] = bucket_start(end, resolution)
+    db = await mongo_manager.get_async_database()
+    cursor = db[COLLECTION_PRICE_ROLLUPS].find(
+        {"symbol": {"$in": list(symbols)}, "resolution": resolution, "bucket": bucket_range},
+        {"_id": 0, "expires_at": 0},
+    ).sort("bucket", 1)
+    return await cursor.to_list(length=None)
+
+
+def align_rollups(
+    rollups: Iterable[Dict[str, Any]],
+    symbols: Sequence[str],
+    start: datetime,
+    end: datetime,
+    resolution: str,
+    field: str = "close",
+) -> Dict[str, Any]:
+    """
+    Lay rollups out on a regular bucket grid.
+
+    Returns:
+        Dict with ``timestamps`` (every bucket from start to end) and
+        ``series`` mapping each symbol to one value per timestamp (None where
+        the coin has no rollup)
+    """
+    step = RESOLUTIONS[resolution]
+    first, last = bucket_start(start, resolution), bucket_start(end, resolution)
+    count = int((last - first) / step) + 1 if last >= first else 0
+    timestamps = [first + i * step for i in range(count)]
+    series: Dict[str, List[Optional[float]]] = {symbol: [None] * count for symbol in symbols}
+    for rollup in rollups:
+        values = series.get(rollup["symbol"])
+        position = int((rollup["bucket"] - first) / step)
+        if values is not None and 0 <= position < count:
+            values[position] = rollup.get(field)
+    return {"resolution": resolution, "timestamps": timestamps, "series": series}
+
+
+async def get_aligned_series(
+    symbols: Sequence[str],
+    start: datetime,
+    end: Optional[datetime] = None,
+    resolution: str = "1h",
+    field: str = "close",
+) -> Dict[str, Any]:
+    """
+    Aligned ``field`` series (close by default) for several coins.
+
+    See ``align_rollups`` for the result shape.
+    """
+    end = end or datetime.now(timezone.utc)
+    rollups = await get_price_rollups(symbols, start, end, resolution)
+    return align_rollups(rollups, symbols, start, end, resolution, field)
@@ -1,21 +1,39 @@
 import os
+import re
 import json
 import logging
-from typing import List, Dict, Any
+import threading
+from typing import List, Dict, Any, Optional
 import httpx
 from .base import LLMProvider
+from .http_client import API_URL, ANTHROPIC_VERSION, get_anthropic_http_client
 from .tracking import track_usage
 from ..services.entity_normalization import normalize_entity_name
 
 logger = logging.getLogger(__name__)
 
+# Blocking callers share one keep-alive pool instead of opening a client per request
+_sync_client: Optional[httpx.Client] = None
+_sync_client_lock = threading.Lock()
+
+
+def _get_sync_client() -> httpx.Client:
+    global _sync_client
+    with _sync_client_lock:
+        if _sync_client is None or _sync_client.is_closed:
+            _sync_client = httpx.Client(
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+            )
+        return _sync_client
+
 
 class AnthropicProvider(LLMProvider):
     """
     LLM provider for Anthropic's Claude models, using direct httpx calls to bypass client issues.
-    """
 
-    API_URL = "https://api.anthropic.com/v1/messages"
+    The ``*_async`` methods go through the shared pooled client in
+    ``llm.http_client`` and should be preferred inside coroutines.
+    """
 
     def __init__(
         self, api_key: str, model_name: str = "claude-3-haiku-20240307"
@@ -25,86 +43,122 @@ class AnthropicProvider(LLMProvider):
         self.api_key = api_key
         self.model_name = model_name
 
-    def _get_completion(self, prompt: str) -> str:
-        """
-        Get completion from Claude with automatic fallback on 403 errors.
-        Tries multiple models in order until one succeeds.
-        """
-        # Try multiple models in fallback order
+    def _completion_models(self) -> List[str]:
+        """Models to try in order, without duplicates."""
         models_to_try = [
             self.model_name,  # Primary model from config
             "claude-3-5-sonnet-20241022",  # Sonnet 3.5 (Oct 2024)
             "claude-3-5-sonnet-20240620",  # Sonnet 3.5 (June 2024)
             "claude-3-haiku-20240307",  # Haiku 3.0 (fallback)
         ]
-        
+
         # Remove duplicates while preserving order
         seen = set()
-        models_to_try = [m for m in models_to_try if not (m in seen or seen.add(m))]
-        
+        return [m for m in models_to_try if not (m in seen or seen.add(m))]
+
+    def _completion_payload(self, model: str, prompt: str) -> Dict[str, Any]:
+        return {
+            "model": model,
+            "max_tokens": 2048,  # Increased for narrative JSON responses
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    def _completion_text(self, model: str, data: Dict[str, Any]) -> str:
+        # Log which model was used if not the primary
+        if model != self.model_name:
+            logger.info(f"Using fallback model: {model}")
+        return data.get("content", [{}])[0].get("text", "")
+
+    def _should_try_next_model(self, model: str, e: httpx.HTTPStatusError) -> bool:
+        """Log a failed completion; returns True if the next fallback model should be tried."""
+        # If 403 Forbidden, try next model
+        if e.response.status_code == 403:
+            logger.warning(
+                f"403 Forbidden for model {model}, trying next fallback..."
+            )
+            try:
+                error_json = e.response.json()
+                error_msg = error_json.get("error", {}).get("message", "")
+                logger.debug(f"Error details: {error_msg}")
+            except:
+                pass
+            return True
+
+        # For non-403 errors, log and return empty
+        logger.error(
+            f"Anthropic API request failed with status {e.response.status_code}: {e.response.text}"
+        )
+        return False
+
+    def _get_completion(self, prompt: str) -> str:
+        """
+        Get completion from Claude with automatic fallback on 403 errors.
+        Tries multiple models in order until one succeeds.
+
+        Blocking; coroutines should use :meth:`_get_completion_async`.
+        """
         last_error = None
-        
-        for model in models_to_try:
+
+        for model in self._completion_models():
             headers = {
                 "x-api-key": self.api_key,
-                "anthropic-version": "2023-06-01",
+                "anthropic-version": ANTHROPIC_VERSION,
                 "content-type": "application/json",
             }
-            payload = {
-                "model": model,
-                "max_tokens": 2048,  # Increased for narrative JSON responses
-                "messages": [{"role": "user", "content": prompt}],
-            }
             try:
-                with httpx.Client() as client:
-                    response = client.post(
-                        self.API_URL, headers=headers, json=payload, timeout=30
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    # Log which model was used if not the primary
-                    if model != self.model_name:
-                        logger.info(f"Using fallback model: {model}")
-                    
-                    return data.get("content", [{}])[0].get("text", "")
+                response = _get_sync_client().post(
+                    API_URL,
+                    headers=headers,
+                    json=self._completion_payload(model, prompt),
+                    timeout=30,
+                )
+                response.raise_for_status()
+                return self._completion_text(model, response.json())
             except httpx.HTTPStatusError as e:
                 last_error = e
-                # If 403 Forbidden, try next model
-                if e.response.status_code == 403:
-                    logger.warning(
-                        f"403 Forbidden for model {model}, trying next fallback..."
-                    )
-                    try:
-                        error_json = e.response.json()
-                        error_msg = error_json.get("error", {}).get("message", "")
-                        logger.debug(f"Error details: {error_msg}")
-                    except:
-                        pass
+                if self._should_try_next_model(model, e):
                     continue
-                else:
-                    # For non-403 errors, log and return empty
-                    logger.error(
-                        f"Anthropic API request failed with status {e.response.status_code}: {e.response.text}"
-                    )
-                    return ""
+                return ""
             except Exception as e:
                 last_error = e
                 logger.error(f"An unexpected error occurred: {e}")
                 return ""
-        
+
         # All models failed
         logger.error(f"All models failed. Last error: {last_error}")
         return ""
 
-    @track_usage
-    def analyze_sentiment(self, text: str) -> float:
-        prompt = f"Analyze the sentiment of this crypto text. Return ONLY a single number from -1.0 (very bearish) to 1.0 (very bullish). Do not include any explanation or additional text. Just the number:\n\n{text}"
-        response = self._get_completion(prompt)
+    async def _get_completion_async(self, prompt: str) -> str:
+        """
+        Async version of :meth:`_get_completion` using the shared pooled client.
+        """
+        client = get_anthropic_http_client()
+        last_error = None
+
+        for model in self._completion_models():
+            try:
+                data = await client.create_message(
+                    self.api_key, self._completion_payload(model, prompt), timeout=30
+                )
+                return self._completion_text(model, data)
+            except httpx.HTTPStatusError as e:
+                last_error = e
+                if self._should_try_next_model(model, e):
+                    continue
+                return ""
+            except Exception as e:
+                last_error = e
+                logger.error(f"An unexpected error occurred: {e}")
+                return ""
+
+        # All models failed
+        logger.error(f"All models failed. Last error: {last_error}")
+        return ""
+
+    @staticmethod
+    def _parse_score(response: str) -> float:
         try:
             # Extract the first number from the response (in case there's extra text)
-            import re
-
             numbers = re.findall(r"[-+]?\d*\.\d+|\d+", response.strip())
             if numbers:
                 return float(numbers[0])
@@ -112,44 +166,64 @@ class AnthropicProvider(LLMProvider):
         except (ValueError, TypeError):
             return 0.0
 
-    @track_usage
-    def extract_themes(self, texts: List[str]) -> List[str]:
-        combined_texts = "\n".join(texts)
-        prompt = f"Extract the key crypto themes from the following texts. Respond with ONLY a comma-separated list of keywords (e.g., 'Bitcoin, DeFi, Regulation'). Do not include any preamble.\n\nTexts:\n{combined_texts}"
-        response = self._get_completion(prompt)
+    @staticmethod
+    def _parse_themes(response: str) -> List[str]:
         if response:
             return [theme.strip() for theme in response.split(",")]
         return []
 
-    @track_usage
-    def generate_insight(self, data: Dict[str, Any]) -> str:
+    @staticmethod
+    def _sentiment_prompt(text: str) -> str:
+        return f"Analyze the sentiment of this crypto text. Return ONLY a single number from -1.0 (very bearish) to 1.0 (very bullish). Do not include any explanation or additional text. Just the number:\n\n{text}"
+
+    @staticmethod
+    def _themes_prompt(texts: List[str]) -> str:
+        combined_texts = "\n".join(texts)
+        return f"Extract the key crypto themes from the following texts. Respond with ONLY a comma-separated list of keywords (e.g., 'Bitcoin, DeFi, Regulation'). Do not include any preamble.\n\nTexts:\n{combined_texts}"
+
+    @staticmethod
+    def _insight_prompt(data: Dict[str, Any]) -> str:
         sentiment_score = data.get("sentiment_score", 0.0)
         themes = data.get("themes", [])
-        prompt = f"Given a sentiment score of {sentiment_score} and the themes {', '.join(themes)}, generate a concise market insight for cryptocurrency traders. The response must be a maximum of 2-3 sentences."
-        return self._get_completion(prompt)
+        return f"Given a sentiment score of {sentiment_score} and the themes {', '.join(themes)}, generate a concise market insight for cryptocurrency traders. The response must be a maximum of 2-3 sentences."
+
+    @staticmethod
+    def _relevance_prompt(text: str) -> str:
+        return f"On a scale from 0.0 to 1.0, how relevant is this text to cryptocurrency market movements? Return ONLY a single floating-point number with no explanation:\n\n{text}"
 
     @track_usage
-    def score_relevance(self, text: str) -> float:
-        prompt = f"On a scale from 0.0 to 1.0, how relevant is this text to cryptocurrency market movements? Return ONLY a single floating-point number with no explanation:\n\n{text}"
-        response = self._get_completion(prompt)
-        try:
-            # Extract the first number from the response (in case there's extra text)
-            import re
+    def analyze_sentiment(self, text: str) -> float:
+        return self._parse_score(self._get_completion(self._sentiment_prompt(text)))
 
-            numbers = re.findall(r"[-+]?\d*\.\d+|\d+", response.strip())
-            if numbers:
-                return float(numbers[0])
-            return float(response.strip())
-        except (ValueError, TypeError):
-            return 0.0
+    @track_usage
+    async def analyze_sentiment_async(self, text: str) -> float:
+        return self._parse_score(await self._get_completion_async(self._sentiment_prompt(text)))
 
-    def extract_entities_batch(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """
-        Extracts entities from a batch of articles using Claude Haiku with fallback to Sonnet.
-        Returns structured data with entities for each article and usage metrics.
-        """
-        from ..core.config import settings
+    @track_usage
+    def extract_themes(self, texts: List[str]) -> List[str]:
+        return self._parse_themes(self._get_completion(self._themes_prompt(texts)))
+
+    @track_usage
+    async def extract_themes_async(self, texts: List[str]) -> List[str]:
+        return self._parse_themes(await self._get_completion_async(self._themes_prompt(texts)))
+
+    @track_usage
+    def generate_insight(self, data: Dict[str, Any]) -> str:
+        return self._get_completion(self._insight_prompt(data))
 
+    @track_usage
+    async def generate_insight_async(self, data: Dict[str, Any]) -> str:
+        return await self._get_completion_async(self._insight_prompt(data))
+
+    @track_usage
+    def score_relevance(self, text: str) -> float:
+        return self._parse_score(self._get_completion(self._relevance_prompt(text)))
+
+    @track_usage
+    async def score_relevance_async(self, text: str) -> float:
+        return self._parse_score(await self._get_completion_async(self._relevance_prompt(text)))
+
+    def _build_entity_batch_prompt(self, articles: List[Dict[str, Any]]) -> str:
         # Build the batch prompt
         articles_text = []
         for idx, article in enumerate(articles):
@@ -162,7 +236,7 @@ class AnthropicProvider(LLMProvider):
 
         combined_articles = "\n---\n".join(articles_text)
 
-        prompt = f"""Extract entities from these {len(articles)} crypto news articles. Return ONLY valid JSON with no markdown.
+        return f"""Extract entities from these {len(articles)} crypto news articles. Return ONLY valid JSON with no markdown.
 
 PRIMARY entities (trackable/investable):
 - cryptocurrency: Bitcoin, Ethereum, Litecoin, Solana (include ticker like $BTC if mentioned)
@@ -203,140 +277,218 @@ Articles:
 
 Return ONLY the JSON array, no other text."""
 
+    @staticmethod
+    def _entity_models():
+        from ..core.config import settings
+
         # Try with Haiku 3.5 first, fallback to Sonnet if unavailable
-        models_to_try = [
+        return [
             (settings.ANTHROPIC_ENTITY_MODEL, "Haiku 3.5"),
             (settings.ANTHROPIC_ENTITY_FALLBACK_MODEL, "Sonnet 3.5 (Fallback)"),
             ("claude-3-5-sonnet-20240620", "Sonnet 3.5 (June)"),
         ]
 
+    @staticmethod
+    def _entity_payload(entity_model: str, prompt: str) -> Dict[str, Any]:
+        return {
+            "model": entity_model,
+            "max_tokens": 4096,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    def _parse_entity_batch_response(
+        self, data: Dict[str, Any], entity_model: str, model_label: str
+    ) -> Dict[str, Any]:
+        """Parse, normalize and cost a batch extraction response."""
+        from ..core.config import settings
+
+        # Extract response text
+        response_text = data.get("content", [{}])[0].get("text", "")
+
+        # Log raw response for debugging
+        logger.info(f"Raw Anthropic response (first 500 chars): {response_text[:500]}")
+
+        # Extract usage metrics
+        usage = data.get("usage", {})
+        input_tokens = usage.get("input_tokens", 0)
+        output_tokens = usage.get("output_tokens", 0)
+
+        # Calculate costs (use Haiku pricing as baseline)
+        input_cost = (
+            input_tokens / 1000
+        ) * settings.ANTHROPIC_ENTITY_INPUT_COST_PER_1K_TOKENS
+        output_cost = (
+            output_tokens / 1000
+        ) * settings.ANTHROPIC_ENTITY_OUTPUT_COST_PER_1K_TOKENS
+        total_cost = input_cost + output_cost
+
+        # Try to extract JSON array from response
+        json_match = re.search(r"\[.*\]", response_text, re.DOTALL)
+        if json_match:
+            results = json.loads(json_match.group(0))
+        else:
+            results = json.loads(response_text)
+
+        # Apply entity normalization to all extracted entities
+        for article_result in results:
+            # Normalize primary entities
+            for entity in article_result.get("primary_entities", []):
+                original_name = entity.get("name")
+                if original_name:
+                    normalized_name = normalize_entity_name(original_name)
+                    entity["name"] = normalized_name
+                    # Also normalize ticker if present
+                    ticker = entity.get("ticker")
+                    if ticker:
+                        entity["ticker"] = normalize_entity_name(ticker)
+
+            # Normalize context entities (only if they're cryptocurrency-related)
+            for entity in article_result.get("context_entities", []):
+                original_name = entity.get("name")
+                if original_name and entity.get("type") in ["cryptocurrency", "blockchain"]:
+                    normalized_name = normalize_entity_name(original_name)
+                    entity["name"] = normalized_name
+
+        # Log parsed results for debugging
+        logger.info(f"Parsed {len(results)} article results from LLM")
+        if results:
+            # Log first result structure
+            first_result = results[0]
+            primary_count = len(first_result.get("primary_entities", []))
+            context_count = len(first_result.get("context_entities", []))
+            logger.info(f"Sample result structure - primary_entities: {primary_count}, context_entities: {context_count}")
+            if primary_count > 0:
+                logger.info(f"Sample primary entities (normalized): {first_result.get('primary_entities', [])[:3]}")
+            if context_count > 0:
+                logger.info(f"Sample context entities: {first_result.get('context_entities', [])[:3]}")
+
+        logger.info(f"Successfully extracted entities using {model_label}")
+        return {
+            "results": results,
+            "usage": {
+                "model": entity_model,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+                "input_cost": input_cost,
+                "output_cost": output_cost,
+                "total_cost": total_cost,
+            },
+        }
+
+    @staticmethod
+    def _entity_http_error(
+        e: httpx.HTTPStatusError, entity_model: str, model_label: str
+    ) -> Dict[str, Any]:
+        """Log a failed extraction request and return its error detail."""
+        # Log detailed error information
+        logger.error(
+            f"Anthropic API request failed for {model_label} ({entity_model}): "
+            f"Status {e.response.status_code}, Response: {e.response.text}"
+        )
+
+        # Parse error response for more details
+        try:
+            error_json = e.response.json()
+            error_type = error_json.get("error", {}).get("type", "unknown")
+            error_message = error_json.get("error", {}).get(
+                "message", "unknown"
+            )
+            logger.error(f"Error type: {error_type}, Message: {error_message}")
+        except:
+            pass
+
+        return {
+            "status_code": e.response.status_code,
+            "response_text": e.response.text,
+            "model": entity_model,
+            "model_label": model_label,
+        }
+
+    def extract_entities_batch(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Extracts entities from a batch of articles using Claude Haiku with fallback to Sonnet.
+        Returns structured data with entities for each article and usage metrics.
+
+        Blocking; coroutines should use :meth:`extract_entities_batch_async`.
+        """
+        prompt = self._build_entity_batch_prompt(articles)
         last_error = None
 
-        for entity_model, model_label in models_to_try:
+        for entity_model, model_label in self._entity_models():
             headers = {
                 "x-api-key": self.api_key,
-                "anthropic-version": "2023-06-01",
+                "anthropic-version": ANTHROPIC_VERSION,
                 "content-type": "application/json",
             }
-            payload = {
-                "model": entity_model,
-                "max_tokens": 4096,
-                "messages": [{"role": "user", "content": prompt}],
-            }
 
             try:
                 logger.info(
                     f"Attempting entity extraction with {model_label} ({entity_model})"
                 )
-                with httpx.Client() as client:
-                    response = client.post(
-                        self.API_URL, headers=headers, json=payload, timeout=60
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-
-                    # Extract response text
-                    response_text = data.get("content", [{}])[0].get("text", "")
-                    
-                    # Log raw response for debugging
-                    logger.info(f"Raw Anthropic response (first 500 chars): {response_text[:500]}")
-
-                    # Extract usage metrics
-                    usage = data.get("usage", {})
-                    input_tokens = usage.get("input_tokens", 0)
-                    output_tokens = usage.get("output_tokens", 0)
-
-                    # Calculate costs (use Haiku pricing as baseline)
-                    input_cost = (
-                        input_tokens / 1000
-                    ) * settings.ANTHROPIC_ENTITY_INPUT_COST_PER_1K_TOKENS
-                    output_cost = (
-                        output_tokens / 1000
-                    ) * settings.ANTHROPIC_ENTITY_OUTPUT_COST_PER_1K_TOKENS
-                    total_cost = input_cost + output_cost
-
-                    # Parse JSON response
-                    import re
-
-                    # Try to extract JSON array from response
-                    json_match = re.search(r"\[.*\]", response_text, re.DOTALL)
-                    if json_match:
-                        results = json.loads(json_match.group(0))
-                    else:
-                        results = json.loads(response_text)
-                    
-                    # Apply entity normalization to all extracted entities
-                    for article_result in results:
-                        # Normalize primary entities
-                        for entity in article_result.get("primary_entities", []):
-                            original_name = entity.get("name")
-                            if original_name:
-                                normalized_name = normalize_entity_name(original_name)
-                                entity["name"] = normalized_name
-                                # Also normalize ticker if present
-                                ticker = entity.get("ticker")
-                                if ticker:
-                                    entity["ticker"] = normalize_entity_name(ticker)
-                        
-                        # Normalize context entities (only if they're cryptocurrency-related)
-                        for entity in article_result.get("context_entities", []):
-                            original_name = entity.get("name")
-                            if original_name and entity.get("type") in ["cryptocurrency", "blockchain"]:
-                                normalized_name = normalize_entity_name(original_name)
-                                entity["name"] = normalized_name
-                    
-                    # Log parsed results for debugging
-                    logger.info(f"Parsed {len(results)} article results from LLM")
-                    if results:
-                        # Log first result structure
-                        first_result = results[0]
-                        primary_count = len(first_result.get("primary_entities", []))
-                        context_count = len(first_result.get("context_entities", []))
-                        logger.info(f"Sample result structure - primary_entities: {primary_count}, context_entities: {context_count}")
-                        if primary_count > 0:
-                            logger.info(f"Sample primary entities (normalized): {first_result.get('primary_entities', [])[:3]}")
-                        if context_count > 0:
-                            logger.info(f"Sample context entities: {first_result.get('context_entities', [])[:3]}")
-
-                    logger.info(f"Successfully extracted entities using {model_label}")
-                    return {
-                        "results": results,
-                        "usage": {
-                            "model": entity_model,
-                            "input_tokens": input_tokens,
-                            "output_tokens": output_tokens,
-                            "total_tokens": input_tokens + output_tokens,
-                            "input_cost": input_cost,
-                            "output_cost": output_cost,
-                            "total_cost": total_cost,
-                        },
-                    }
+                response = _get_sync_client().post(
+                    API_URL,
+                    headers=headers,
+                    json=self._entity_payload(entity_model, prompt),
+                    timeout=60,
+                )
+                response.raise_for_status()
+                return self._parse_entity_batch_response(
+                    response.json(), entity_model, model_label
+                )
             except httpx.HTTPStatusError as e:
-                error_detail = {
-                    "status_code": e.response.status_code,
-                    "response_text": e.response.text,
+                last_error = self._entity_http_error(e, entity_model, model_label)
+
+                # If 403, try next model in fallback list
+                if e.response.status_code == 403:
+                    logger.warning(
+                        f"403 Forbidden for {model_label}, trying fallback model..."
+                    )
+                    continue
+                else:
+                    # For other HTTP errors, don't try fallback
+                    break
+
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse JSON response from {model_label}: {e}")
+                last_error = {
+                    "error": "json_decode",
+                    "message": str(e),
+                    "model": entity_model,
+                }
+                break
+            except Exception as e:
+                logger.error(f"Entity extraction failed for {model_label}: {e}")
+                last_error = {
+                    "error": "exception",
+                    "message": str(e),
                     "model": entity_model,
-                    "model_label": model_label,
                 }
+                break
 
-                # Log detailed error information
-                logger.error(
-                    f"Anthropic API request failed for {model_label} ({entity_model}): "
-                    f"Status {e.response.status_code}, Response: {e.response.text}"
-                )
+        # All models failed
+        logger.error(f"All entity extraction models failed. Last error: {last_error}")
+        return {"results": [], "usage": {}}
 
-                # Parse error response for more details
-                try:
-                    error_json = e.response.json()
-                    error_type = error_json.get("error", {}).get("type", "unknown")
-                    error_message = error_json.get("error", {}).get(
-                        "message", "unknown"
-                    )
-                    logger.error(f"Error type: {error_type}, Message: {error_message}")
-                except:
-                    pass
+    async def extract_entities_batch_async(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Async version of :meth:`extract_entities_batch` using the shared pooled client.
+        """
+        prompt = self._build_entity_batch_prompt(articles)
+        client = get_anthropic_http_client()
+        last_error = None
 
-                last_error = error_detail
+        for entity_model, model_label in self._entity_models():
+            try:
+                logger.info(
+                    f"Attempting entity extraction with {model_label} ({entity_model})"
+                )
+                data = await client.create_message(
+                    self.api_key, self._entity_payload(entity_model, prompt), timeout=60
+                )
+                return self._parse_entity_batch_response(data, entity_model, model_label)
+            except httpx.HTTPStatusError as e:
+                last_error = self._entity_http_error(e, entity_model, model_label)
 
                 # If 403, try next model in fallback list
                 if e.response.status_code == 403:
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
 
@@ -5,6 +6,10 @@ from typing import List, Dict, Any
 class LLMProvider(ABC):
     """
     Abstract base class for Large Language Model providers.
+
+    Every method has an ``*_async`` counterpart for use inside coroutines. The
+    defaults run the blocking implementation in a worker thread; providers
+    backed by an async HTTP client override them with native coroutines.
     """
 
     @abstractmethod
@@ -56,3 +61,23 @@ class LLMProvider(ABC):
         :return: Dict with 'results' (list of entity extractions per article) and 'usage' (token counts).
         """
         raise NotImplementedError
+
+    async def analyze_sentiment_async(self, text: str) -> float:
+        """Async version of :meth:`analyze_sentiment`."""
+        return await asyncio.to_thread(self.analyze_sentiment, text)
+
+    async def extract_themes_async(self, texts: List[str]) -> List[str]:
+        """Async version of :meth:`extract_themes`."""
+        return await asyncio.to_thread(self.extract_themes, texts)
+
+    async def generate_insight_async(self, data: Dict[str, Any]) -> str:
+        """Async version of :meth:`generate_insight`."""
+        return await asyncio.to_thread(self.generate_insight, data)
+
+    async def score_relevance_async(self, text: str) -> float:
+        """Async version of :meth:`score_relevance`."""
+        return await asyncio.to_thread(self.score_relevance, text)
+
+    async def extract_entities_batch_async(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Async version of :meth:`extract_entities_batch`."""
+        return await asyncio.to_thread(self.extract_entities_batch, articles)
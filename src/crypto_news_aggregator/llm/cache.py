@@ -1,33 +1,129 @@
 """
 LLM Response Cache and Cost Tracking
 Caches LLM API responses to avoid duplicate calls and reduce costs.
+
+Responses are cached in two tiers:
+1. A bounded in-process LRU shared by every LLMResponseCache in the process,
+   so hits don't pay a MongoDB round-trip
+2. The ``llm_cache`` MongoDB collection, shared across processes
 """
 
+import asyncio
 import hashlib
 import json
-from typing import Optional, Dict, Any
+import logging
+import time
+from collections import Counter, OrderedDict
+from typing import Awaitable, Callable, Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Counters kept per operation
+STAT_FIELDS = ("memory_hits", "mongo_hits", "misses", "coalesced")
+
+
+class MemoryLRUCache:
+    """
+    Bounded in-process LRU cache with per-entry expiry.
+
+    Values are stored serialized, which bounds memory by actual size and
+    hands every reader its own copy. Entries are evicted least recently used
+    first once either ``max_entries`` or ``max_bytes`` is exceeded.
+    """
+
+    def __init__(self, max_entries: int = 5000, max_bytes: int = 50_000_000, ttl_seconds: float = 3600):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self.size_bytes = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        payload, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return json.loads(payload)
+
+    def set(self, key: str, value: Dict[str, Any], ttl_seconds: Optional[float] = None) -> None:
+        payload = json.dumps(value, default=str)
+        if len(payload) > self.max_bytes:
+            return
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        self._remove(key)
+        self._entries[key] = (payload, time.monotonic() + ttl)
+        self.size_bytes += len(payload)
+        while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= len(entry[0])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size_bytes = 0
+
+
+_memory_cache: Optional[MemoryLRUCache] = None
+
+# In-flight computations by cache key, for request coalescing
+_inflight: Dict[str, "asyncio.Future"] = {}
+
+# Per-operation counters not yet flushed to MongoDB
+_pending_stats: Counter = Counter()
+
+
+def get_memory_cache() -> MemoryLRUCache:
+    """Get the process-wide in-memory response cache."""
+    global _memory_cache
+    if _memory_cache is None:
+        _memory_cache = MemoryLRUCache(
+            max_entries=settings.LLM_CACHE_MEMORY_MAX_ENTRIES,
+            max_bytes=settings.LLM_CACHE_MEMORY_MAX_BYTES,
+            ttl_seconds=settings.LLM_CACHE_MEMORY_TTL_SECONDS,
+        )
+    return _memory_cache
 
 
 class LLMResponseCache:
     """Cache LLM responses to avoid duplicate API calls"""
     
-    def __init__(self, db: AsyncIOMotorDatabase, ttl_hours: int = 168):
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        ttl_hours: int = 168,
+        memory_cache: Optional[MemoryLRUCache] = None,
+    ):
         """
         Initialize cache with MongoDB database connection
         
         Args:
             db: MongoDB database instance
             ttl_hours: Time to live for cached responses (default: 1 week)
+            memory_cache: In-process tier (defaults to the shared process-wide LRU)
         """
         self.db = db
         self.ttl = timedelta(hours=ttl_hours)
         self.collection = db.llm_cache
-        
-        # Stats tracking
-        self.hits = 0
-        self.misses = 0
+        self.stats_collection = db.llm_cache_stats
+        self.memory = memory_cache if memory_cache is not None else get_memory_cache()
     
     def _get_cache_key(self, prompt: str, model: str) -> str:
         """
@@ -42,31 +138,68 @@ class LLMResponseCache:
         """
         content = f"{model}:{prompt}"
         return hashlib.sha256(content.encode()).hexdigest()
+
+    @staticmethod
+    def _record(operation: str, stat: str, count: int = 1) -> None:
+        if count:
+            _pending_stats[(operation, stat)] += count
+
+    def _remember(self, cache_key: str, response: Dict[str, Any], expires_at: datetime) -> None:
+        """Populate the memory tier without outliving the MongoDB entry."""
+        remaining = (expires_at - datetime.utcnow()).total_seconds()
+        if remaining > 0:
+            self.memory.set(cache_key, response, ttl_seconds=remaining)
     
-    async def get(self, prompt: str, model: str) -> Optional[Dict[str, Any]]:
+    async def get(self, prompt: str, model: str, operation: str = "unknown") -> Optional[Dict[str, Any]]:
         """
         Retrieve cached response if exists and not expired
         
         Args:
             prompt: The prompt text
             model: The model name
+            operation: Operation name used for hit-rate stats
         
         Returns:
             Cached response dict or None if not found/expired
         """
-        cache_key = self._get_cache_key(prompt, model)
-        
-        cached = await self.collection.find_one({
-            "cache_key": cache_key,
-            "expires_at": {"$gt": datetime.utcnow()}
-        })
-        
-        if cached:
-            self.hits += 1
-            return cached["response"]
-        
-        self.misses += 1
-        return None
+        return (await self.get_many([prompt], model, operation))[0]
+
+    async def get_many(
+        self,
+        prompts: List[str],
+        model: str,
+        operation: str = "unknown",
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Retrieve cached responses for several prompts.
+
+        Memory misses are looked up with a single MongoDB query.
+
+        Returns:
+            Cached response (or None) for each prompt, in order
+        """
+        keys = [self._get_cache_key(prompt, model) for prompt in prompts]
+        results: List[Optional[Dict[str, Any]]] = [self.memory.get(key) for key in keys]
+        self._record(operation, "memory_hits", sum(1 for result in results if result is not None))
+
+        missing = {key for key, result in zip(keys, results) if result is None}
+        if missing:
+            found = {}
+            cursor = self.collection.find({
+                "cache_key": {"$in": list(missing)},
+                "expires_at": {"$gt": datetime.utcnow()}
+            })
+            for cached in await cursor.to_list(None):
+                found[cached["cache_key"]] = cached["response"]
+                self._remember(cached["cache_key"], cached["response"], cached["expires_at"])
+
+            for index, key in enumerate(keys):
+                if results[index] is None and key in found:
+                    results[index] = found[key]
+            self._record(operation, "mongo_hits", sum(1 for key in keys if key in found))
+            self._record(operation, "misses", sum(1 for result in results if result is None))
+
+        return results
     
     async def set(self, prompt: str, model: str, response: Dict[str, Any]) -> None:
         """
@@ -77,21 +210,92 @@ class LLMResponseCache:
             model: The model name
             response: The API response to cache
         """
+        await self.set_many([(prompt, response)], model)
+
+    async def set_many(self, entries: List[Tuple[str, Dict[str, Any]]], model: str) -> None:
+        """
+        Store several responses with a single bulk write.
+
+        Args:
+            entries: (prompt, response) pairs
+            model: The model name
+        """
+        if not entries:
+            return
+        now = datetime.utcnow()
+        expires_at = now + self.ttl
+        operations = []
+        for prompt, response in entries:
+            cache_key = self._get_cache_key(prompt, model)
+            self._remember(cache_key, response, expires_at)
+            operations.append(UpdateOne(
+                {"cache_key": cache_key},
+                {
+                    "$set": {
+                        "cache_key": cache_key,
+                        "model": model,
+                        "response": response,
+                        "created_at": now,
+                        "expires_at": expires_at
+                    }
+                },
+                upsert=True
+            ))
+        await self.collection.bulk_write(operations, ordered=False)
+
+    async def coalesce(
+        self,
+        prompt: str,
+        model: str,
+        compute: Callable[[], Awaitable[Any]],
+        operation: str = "unknown",
+    ) -> Any:
+        """
+        Run ``compute`` once for concurrent identical requests.
+
+        Callers that arrive while a computation for the same prompt and model
+        is in flight await its result instead of making their own API call.
+
+        Args:
+            prompt: The prompt text
+            model: The model name
+            compute: Coroutine function producing the response
+            operation: Operation name used for stats
+
+        Returns:
+            The result of ``compute``
+        """
         cache_key = self._get_cache_key(prompt, model)
-        
-        await self.collection.update_one(
-            {"cache_key": cache_key},
-            {
-                "$set": {
-                    "cache_key": cache_key,
-                    "model": model,
-                    "response": response,
-                    "created_at": datetime.utcnow(),
-                    "expires_at": datetime.utcnow() + self.ttl
-                }
-            },
-            upsert=True
-        )
+        loop = asyncio.get_running_loop()
+
+        inflight = _inflight.get(cache_key)
+        if inflight is not None and inflight.get_loop() is loop:
+            self._record(operation, "coalesced")
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The original caller was cancelled; compute it ourselves
+
+        future = loop.create_future()
+        _inflight[cache_key] = future
+        try:
+            result = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Nobody may be waiting; don't log "exception was never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if _inflight.get(cache_key) is future:
+                del _inflight[cache_key]
     
     async def clear_expired(self) -> int:
         """
@@ -104,29 +308,84 @@ class LLMResponseCache:
             "expires_at": {"$lt": datetime.utcnow()}
         })
         return result.deleted_count
+
+    async def flush_stats(self) -> None:
+        """Add counters accumulated in this process to the persistent daily stats."""
+        if not _pending_stats:
+            return
+        pending = dict(_pending_stats)
+        _pending_stats.clear()
+
+        increments: Dict[str, Dict[str, int]] = {}
+        for (operation, stat), count in pending.items():
+            increments.setdefault(operation, {})[stat] = count
+
+        date = datetime.utcnow().strftime("%Y-%m-%d")
+        try:
+            await self.stats_collection.bulk_write([
+                UpdateOne(
+                    {"operation": operation, "date": date},
+                    {"$inc": counts, "$set": {"updated_at": datetime.utcnow()}},
+                    upsert=True
+                )
+                for operation, counts in increments.items()
+            ], ordered=False)
+        except Exception as e:
+            # Put the counts back so they are retried on the next flush
+            _pending_stats.update(pending)
+            logger.error(f"Failed to flush LLM cache stats: {e}")
     
-    async def get_stats(self) -> Dict[str, Any]:
+    async def get_stats(self, days: int = 30) -> Dict[str, Any]:
         """
         Get cache statistics
         
+        Hit rates are read from the persistent per-operation counters, so
+        they cover every process and survive restarts.
+
+        Args:
+            days: Number of days of counters to include
+
         Returns:
-            Dict with hit rate, total entries, etc.
+            Dict with hit rate, total entries, per-operation breakdown, etc.
         """
+        await self.flush_stats()
+
         total_entries = await self.collection.count_documents({})
         active_entries = await self.collection.count_documents({
             "expires_at": {"$gt": datetime.utcnow()}
         })
-        
-        total_requests = self.hits + self.misses
-        hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
-        
+
+        start_date = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
+        rows = await self.stats_collection.aggregate([
+            {"$match": {"date": {"$gte": start_date}}},
+            {"$group": {
+                "_id": "$operation",
+                **{stat: {"$sum": f"${stat}"} for stat in STAT_FIELDS}
+            }}
+        ]).to_list(None)
+
+        by_operation = {}
+        for row in rows:
+            counts = {stat: row.get(stat, 0) for stat in STAT_FIELDS}
+            by_operation[row["_id"]] = {**counts, **_hit_rate(counts)}
+
+        totals = {stat: sum(op[stat] for op in by_operation.values()) for stat in STAT_FIELDS}
+        rates = _hit_rate(totals)
+
         return {
             "total_entries": total_entries,
             "active_entries": active_entries,
-            "cache_hits": self.hits,
-            "cache_misses": self.misses,
-            "hit_rate_percent": round(hit_rate, 2),
-            "total_requests": total_requests
+            "cache_hits": totals["memory_hits"] + totals["mongo_hits"],
+            "cache_misses": totals["misses"],
+            "hit_rate_percent": rates["hit_rate_percent"],
+            "total_requests": rates["total_requests"],
+            "coalesced_requests": totals["coalesced"],
+            "by_operation": by_operation,
+            "memory": {
+                "entries": len(self.memory),
+                "size_bytes": self.memory.size_bytes,
+                "evictions": self.memory.evictions,
+            },
         }
     
     async def initialize_indexes(self) -> None:
@@ -143,6 +402,18 @@ class LLMResponseCache:
             expireAfterSeconds=0
         )
 
+        await self.stats_collection.create_index(
+            [("operation", 1), ("date", 1)],
+            unique=True
+        )
+
+
+def _hit_rate(counts: Dict[str, int]) -> Dict[str, Any]:
+    hits = counts["memory_hits"] + counts["mongo_hits"]
+    total_requests = hits + counts["misses"]
+    hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
+    return {"total_requests": total_requests, "hit_rate_percent": round(hit_rate, 2)}
+
 
 class CostTracker:
     """Track API costs for monitoring and budgeting"""
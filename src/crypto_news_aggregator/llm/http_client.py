@@ -0,0 +1,290 @@
+"""
+Shared async HTTP client for the Anthropic Messages API.
+
+All Anthropic calls go through one pooled ``httpx.AsyncClient`` per event loop:
+- Keep-alive connection pooling (and HTTP/2 when ``h2`` is installed), so TLS
+  handshakes are paid once instead of on every request
+- A semaphore bounding the number of in-flight requests
+- Token buckets for requests and tokens that are resynced from the
+  ``anthropic-ratelimit-*`` response headers, so callers slow down before the
+  API starts returning 429s
+"""
+
+import asyncio
+import json
+import logging
+import time
+import weakref
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import httpx
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+API_URL = "https://api.anthropic.com/v1/messages"
+ANTHROPIC_VERSION = "2023-06-01"
+
+# Anthropic rate limits are expressed per minute
+RATE_LIMIT_WINDOW_SECONDS = 60.0
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on installed extras
+    HTTP2_AVAILABLE = False
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    """Convert an RFC 3339 reset timestamp into seconds from now."""
+    if not value:
+        return None
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    """Parse a numeric header value, ignoring malformed values."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def estimate_tokens(payload: Dict[str, Any]) -> int:
+    """
+    Roughly estimate the tokens a request will consume.
+
+    Uses ~4 characters per token for the prompt plus the requested
+    max_tokens, which is what the API reserves against the token limit.
+    """
+    prompt_chars = len(json.dumps(payload.get("messages", []))) + len(str(payload.get("system", "")))
+    return prompt_chars // 4 + int(payload.get("max_tokens", 0))
+
+
+class TokenBucket:
+    """
+    Token bucket limiter whose state is corrected by server-reported limits.
+
+    Until the first ``update`` the bucket does not know its capacity and lets
+    every request through. Afterwards it refills continuously at
+    ``capacity / 60`` per second and trusts the server's ``remaining`` count
+    over its own bookkeeping.
+    """
+
+    def __init__(self, capacity: Optional[float] = None, window_seconds: float = RATE_LIMIT_WINDOW_SECONDS):
+        self.capacity = capacity
+        self.window_seconds = window_seconds
+        self.tokens = capacity or 0.0
+        self.blocked_until = 0.0
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def refill_rate(self) -> float:
+        return (self.capacity or 0.0) / self.window_seconds
+
+    def _refill(self, now: float) -> None:
+        if self.capacity is not None:
+            elapsed = now - self._updated_at
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self._updated_at = now
+
+    def wait_time(self, amount: float, now: Optional[float] = None) -> float:
+        """Seconds until ``amount`` tokens are available (0 if available now)."""
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        wait = max(0.0, self.blocked_until - now)
+        if self.capacity is None:
+            return wait
+        # A single request larger than the bucket can never be satisfied;
+        # let it through once the bucket is full instead of waiting forever.
+        amount = min(amount, self.capacity)
+        if self.tokens < amount and self.refill_rate > 0:
+            wait = max(wait, (amount - self.tokens) / self.refill_rate)
+        return wait
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """
+        Wait until ``amount`` tokens are available and consume them.
+
+        Returns:
+            Total seconds spent waiting
+        """
+        waited = 0.0
+        async with self._lock:
+            while True:
+                wait = self.wait_time(amount)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+                waited += wait
+            if self.capacity is not None:
+                self.tokens -= min(amount, self.capacity)
+        return waited
+
+    def update(
+        self,
+        limit: Optional[float] = None,
+        remaining: Optional[float] = None,
+        reset_in: Optional[float] = None,
+    ) -> None:
+        """Resync the bucket with the limits reported by the API."""
+        now = time.monotonic()
+        self._refill(now)
+        if limit:
+            self.capacity = limit
+        if remaining is not None and self.capacity is not None:
+            self.tokens = min(self.capacity, remaining)
+            if remaining <= 0 and reset_in:
+                self.blocked_until = max(self.blocked_until, now + reset_in)
+
+    def block_for(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` (e.g. after a 429 retry-after)."""
+        now = time.monotonic()
+        self.blocked_until = max(self.blocked_until, now + seconds)
+        self.tokens = 0.0
+        self._updated_at = now
+
+
+class AnthropicHTTPClient:
+    """
+    Pooled async client for the Anthropic Messages API.
+
+    Instances are bound to the event loop they were created on; use
+    ``get_anthropic_http_client()`` to get the shared instance for the
+    current loop.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        max_connections: int = 20,
+        timeout: float = 60.0,
+        http2: Optional[bool] = None,
+    ):
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self._client = httpx.AsyncClient(
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=httpx.Timeout(timeout, connect=10.0),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.request_bucket = TokenBucket()
+        self.token_bucket = TokenBucket()
+        self.stats = {"requests": 0, "rate_limited": 0, "throttle_wait_seconds": 0.0}
+
+    @property
+    def is_closed(self) -> bool:
+        return self._client.is_closed
+
+    def _update_rate_limits(self, response: httpx.Response) -> None:
+        headers = response.headers
+        self.request_bucket.update(
+            limit=_parse_number(headers.get("anthropic-ratelimit-requests-limit")),
+            remaining=_parse_number(headers.get("anthropic-ratelimit-requests-remaining")),
+            reset_in=_parse_reset(headers.get("anthropic-ratelimit-requests-reset")),
+        )
+        self.token_bucket.update(
+            limit=_parse_number(headers.get("anthropic-ratelimit-tokens-limit")),
+            remaining=_parse_number(headers.get("anthropic-ratelimit-tokens-remaining")),
+            reset_in=_parse_reset(headers.get("anthropic-ratelimit-tokens-reset")),
+        )
+
+        if response.status_code == 429:
+            self.stats["rate_limited"] += 1
+            retry_after = _parse_number(headers.get("retry-after"))
+            if retry_after:
+                logger.warning(f"Anthropic rate limit hit, pausing requests for {retry_after:.0f}s")
+                self.request_bucket.block_for(retry_after)
+
+    async def create_message(
+        self,
+        api_key: str,
+        payload: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        POST a Messages API request.
+
+        Args:
+            api_key: Anthropic API key
+            payload: Request body (model, max_tokens, messages, ...)
+            timeout: Optional per-request timeout override in seconds
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            httpx.HTTPStatusError: For non-2xx responses
+        """
+        headers = {
+            "x-api-key": api_key,
+            "anthropic-version": ANTHROPIC_VERSION,
+            "content-type": "application/json",
+        }
+
+        async with self._semaphore:
+            waited = await self.request_bucket.acquire(1)
+            waited += await self.token_bucket.acquire(estimate_tokens(payload))
+            self.stats["throttle_wait_seconds"] += waited
+
+            request_kwargs = {"headers": headers, "json": payload}
+            if timeout is not None:
+                request_kwargs["timeout"] = timeout
+            response = await self._client.post(API_URL, **request_kwargs)
+
+        self.stats["requests"] += 1
+        self._update_rate_limits(response)
+        response.raise_for_status()
+        return response.json()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AnthropicHTTPClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_anthropic_http_client() -> AnthropicHTTPClient:
+    """
+    Get the shared Anthropic client for the running event loop.
+
+    Connections and semaphores cannot be shared across event loops, so
+    Celery tasks that each call ``asyncio.run`` get their own client.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = AnthropicHTTPClient(
+            max_concurrency=settings.ANTHROPIC_MAX_CONCURRENT_REQUESTS,
+            max_connections=settings.ANTHROPIC_MAX_CONNECTIONS,
+        )
+        _clients[loop] = client
+        logger.info(
+            f"Created Anthropic HTTP client (http2={client.http2}, "
+            f"max_concurrency={settings.ANTHROPIC_MAX_CONCURRENT_REQUESTS})"
+        )
+    return client
+
+
+async def close_anthropic_http_client() -> None:
+    """Close the shared Anthropic client for the running event loop, if any."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
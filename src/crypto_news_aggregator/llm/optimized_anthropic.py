@@ -4,6 +4,7 @@ Optimized Anthropic LLM Client with Cost Reduction Features:
 2. Uses Haiku for simple tasks (entity extraction) - 12x cheaper
 3. Uses Sonnet for complex tasks (narrative summaries)
 4. Tracks costs for monitoring
+5. Packs several articles into one entity extraction request
 """
 
 import asyncio
@@ -12,6 +13,7 @@ import logging
 from typing import List, Dict, Any, Optional
 import httpx
 from .cache import LLMResponseCache
+from .http_client import get_anthropic_http_client
 from ..db.mongodb import mongo_manager
 
 logger = logging.getLogger(__name__)
@@ -28,7 +30,11 @@ class OptimizedAnthropicLLM:
     # Model selection
     HAIKU_MODEL = "claude-haiku-4-5-20251001"  # 4-5x faster, better quality
     SONNET_MODEL = "claude-sonnet-4-5-20250929"  # For complex reasoning
-    API_URL = "https://api.anthropic.com/v1/messages"
+
+    # Batched entity extraction
+    ENTITY_BATCH_MAX_ARTICLES = 10
+    ENTITY_BATCH_MAX_OUTPUT_TOKENS = 4096
+    ENTITY_OUTPUT_TOKENS_PER_ARTICLE = 250  # Initial estimate, refined from usage
     
     def __init__(self, db, api_key: Optional[str] = None):
         """Initialize the optimized LLM client"""
@@ -38,6 +44,7 @@ class OptimizedAnthropicLLM:
         self.db = db
         self.cache = LLMResponseCache(db, ttl_hours=168)  # 1 week cache
         self.cost_tracker = None  # Lazy initialization
+        self._entity_output_tokens_per_article = float(self.ENTITY_OUTPUT_TOKENS_PER_ARTICLE)
     
     async def _get_cost_tracker(self):
         """Get or initialize cost tracker."""
@@ -53,38 +60,30 @@ class OptimizedAnthropicLLM:
         # Note: New cost_tracker service doesn't have initialize_indexes yet,
         # but indexes will be created on first insert
     
-    def _make_api_call(self, prompt: str, model: str, max_tokens: int = 1000, temperature: float = 0.3) -> Dict[str, Any]:
+    async def _make_api_call(self, prompt: str, model: str, max_tokens: int = 1000, temperature: float = 0.3) -> Dict[str, Any]:
         """
-        Make synchronous API call to Anthropic
-        
+        Make an API call to Anthropic through the shared pooled async client
+
         Returns:
             Dict with 'content' (text response), 'input_tokens', and 'output_tokens'
         """
-        headers = {
-            "x-api-key": self.api_key,
-            "anthropic-version": "2023-06-01",
-            "content-type": "application/json",
-        }
         payload = {
             "model": model,
             "max_tokens": max_tokens,
             "temperature": temperature,
             "messages": [{"role": "user", "content": prompt}],
         }
-        
+
         try:
-            with httpx.Client() as client:
-                response = client.post(
-                    self.API_URL, headers=headers, json=payload, timeout=30
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                return {
-                    "content": data.get("content", [{}])[0].get("text", ""),
-                    "input_tokens": data.get("usage", {}).get("input_tokens", 0),
-                    "output_tokens": data.get("usage", {}).get("output_tokens", 0),
-                }
+            data = await get_anthropic_http_client().create_message(
+                self.api_key, payload, timeout=30
+            )
+            return {
+                "content": data.get("content", [{}])[0].get("text", ""),
+                "input_tokens": data.get("usage", {}).get("input_tokens", 0),
+                "output_tokens": data.get("usage", {}).get("output_tokens", 0),
+                "stop_reason": data.get("stop_reason"),
+            }
         except httpx.HTTPStatusError as e:
             logger.error(
                 f"Anthropic API request failed with status {e.response.status_code}: {e.response.text}"
@@ -93,7 +92,49 @@ class OptimizedAnthropicLLM:
         except Exception as e:
             logger.error(f"An unexpected error occurred: {e}")
             raise
-    
+
+    async def _track_call(
+        self,
+        operation: str,
+        model: str,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cached: bool = False,
+    ) -> None:
+        """Track an API call (async, non-blocking)"""
+        try:
+            tracker = await self._get_cost_tracker()
+            asyncio.create_task(
+                tracker.track_call(
+                    operation=operation,
+                    model=model,
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
+                    cached=cached
+                )
+            )
+        except Exception as e:
+            logger.error(f"Cost tracking failed: {e}")
+
+    def _entity_batch_size(self) -> int:
+        """
+        Number of articles to pack into one extraction request.
+
+        Sized so the expected output (with 25% headroom) stays under the
+        output token limit, based on the observed output tokens per article.
+        """
+        fits = int(self.ENTITY_BATCH_MAX_OUTPUT_TOKENS / (self._entity_output_tokens_per_article * 1.25))
+        return max(1, min(self.ENTITY_BATCH_MAX_ARTICLES, fits))
+
+    def _observe_entity_output(self, output_tokens: int, article_count: int) -> None:
+        """Update the per-article output token estimate (exponential moving average)"""
+        if article_count <= 0 or output_tokens <= 0:
+            return
+        observed = output_tokens / article_count
+        self._entity_output_tokens_per_article = max(
+            50.0, 0.7 * self._entity_output_tokens_per_article + 0.3 * observed
+        )
+
     async def extract_entities_batch(
         self,
         articles: List[Dict],
@@ -101,75 +142,146 @@ class OptimizedAnthropicLLM:
     ) -> List[Dict]:
         """
         Extract entities from articles using Haiku (cheap & fast)
-        
+
+        Cached articles are answered from the cache; the remaining misses are
+        packed several per request (see ``_entity_batch_size``). Articles whose
+        entry is missing or malformed in a packed response are re-requested
+        individually.
+
         Args:
             articles: List of article dictionaries
             use_cache: Whether to use cached responses
-        
+
         Returns:
-            List of entity extraction results
+            List of entity extraction results, in the same order as ``articles``
         """
-        results = []
-        
-        for article in articles:
-            # Build prompt
-            prompt = self._build_entity_extraction_prompt(article)
-            
-            # Check cache first
-            if use_cache:
-                cached_response = await self.cache.get(prompt, self.HAIKU_MODEL)
-                if cached_response:
-                    # Track as cached call (async, non-blocking)
-                    try:
-                        tracker = await self._get_cost_tracker()
-                        asyncio.create_task(
-                            tracker.track_call(
-                                operation="entity_extraction",
-                                model=self.HAIKU_MODEL,
-                                input_tokens=0,
-                                output_tokens=0,
-                                cached=True
-                            )
-                        )
-                    except Exception as e:
-                        logger.error(f"Cost tracking failed: {e}")
-                    results.append(cached_response)
-                    continue
-
-            # Make API call with Haiku
-            api_response = self._make_api_call(
-                prompt=prompt,
-                model=self.HAIKU_MODEL,
-                max_tokens=1000,
-                temperature=0.3
-            )
+        results: List[Optional[Dict]] = [None] * len(articles)
+        prompts = [self._build_entity_extraction_prompt(article) for article in articles]
+
+        # Check cache first (one lookup for the whole batch), so only misses
+        # are sent to the API
+        cached_responses = (
+            await self.cache.get_many(prompts, self.HAIKU_MODEL, "entity_extraction")
+            if use_cache else [None] * len(prompts)
+        )
+        misses = []
+        for index, cached_response in enumerate(cached_responses):
+            if cached_response:
+                # Track as cached call
+                await self._track_call("entity_extraction", self.HAIKU_MODEL, cached=True)
+                results[index] = cached_response
+            else:
+                misses.append(index)
 
-            # Parse response
-            result = self._parse_text_response(api_response["content"])
+        position = 0
+        while position < len(misses):
+            chunk = misses[position:position + self._entity_batch_size()]
+            position += len(chunk)
 
-            # Cache the result
-            if use_cache:
-                await self.cache.set(prompt, self.HAIKU_MODEL, result)
+            parsed: Dict[int, Dict] = {}
+            if len(chunk) > 1:
+                try:
+                    parsed = await self._extract_entities_packed([articles[i] for i in chunk])
+                except Exception as e:
+                    logger.warning(f"Batched entity extraction failed for {len(chunk)} articles: {e}")
 
-            # Track cost (async, non-blocking)
-            try:
-                tracker = await self._get_cost_tracker()
-                asyncio.create_task(
-                    tracker.track_call(
-                        operation="entity_extraction",
-                        model=self.HAIKU_MODEL,
-                        input_tokens=api_response["input_tokens"],
-                        output_tokens=api_response["output_tokens"],
-                        cached=False
-                    )
+            if use_cache and parsed:
+                await self.cache.set_many(
+                    [(prompts[chunk[offset]], result) for offset, result in parsed.items()],
+                    self.HAIKU_MODEL,
                 )
-            except Exception as e:
-                logger.error(f"Cost tracking failed: {e}")
-            
-            results.append(result)
-        
+
+            for offset, index in enumerate(chunk):
+                if offset in parsed:
+                    results[index] = parsed[offset]
+                else:
+                    # Fall back to a single-article request
+                    results[index] = await self._extract_entities_single(prompts[index], use_cache)
+
         return results
-    
+
+    async def _extract_entities_single(self, prompt: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Extract entities for one article prompt with a dedicated API call"""
+        return await self.cache.coalesce(
+            prompt,
+            self.HAIKU_MODEL,
+            lambda: self._request_entities_single(prompt, use_cache),
+            "entity_extraction",
+        )
+
+    async def _request_entities_single(self, prompt: str, use_cache: bool) -> Dict[str, Any]:
+        api_response = await self._make_api_call(
+            prompt=prompt,
+            model=self.HAIKU_MODEL,
+            max_tokens=1000,
+            temperature=0.3
+        )
+
+        # Parse response
+        result = self._parse_text_response(api_response["content"])
+
+        # Cache the result
+        if use_cache:
+            await self.cache.set(prompt, self.HAIKU_MODEL, result)
+
+        await self._track_call(
+            "entity_extraction",
+            self.HAIKU_MODEL,
+            input_tokens=api_response["input_tokens"],
+            output_tokens=api_response["output_tokens"],
+        )
+        self._observe_entity_output(api_response["output_tokens"], 1)
+        return result
+
+    async def _extract_entities_packed(self, articles: List[Dict]) -> Dict[int, Dict]:
+        """
+        Extract entities for several articles with one API call.
+
+        Returns:
+            Dict mapping the position of each successfully parsed article in
+            ``articles`` to its result. Positions missing from the dict need
+            to be retried individually.
+        """
+        api_response = await self._make_api_call(
+            prompt=self._build_packed_entity_extraction_prompt(articles),
+            model=self.HAIKU_MODEL,
+            max_tokens=self.ENTITY_BATCH_MAX_OUTPUT_TOKENS,
+            temperature=0.3
+        )
+        await self._track_call(
+            "entity_extraction",
+            self.HAIKU_MODEL,
+            input_tokens=api_response["input_tokens"],
+            output_tokens=api_response["output_tokens"],
+        )
+
+        if api_response.get("stop_reason") == "max_tokens":
+            # Output was truncated: assume articles need more room than estimated
+            self._entity_output_tokens_per_article = max(
+                self._entity_output_tokens_per_article,
+                1.5 * self.ENTITY_BATCH_MAX_OUTPUT_TOKENS / len(articles),
+            )
+            logger.warning(
+                f"Batched entity extraction truncated at {len(articles)} articles, "
+                f"reducing batch size to {self._entity_batch_size()}"
+            )
+        else:
+            self._observe_entity_output(api_response["output_tokens"], len(articles))
+
+        keyed = self._parse_keyed_response(api_response["content"])
+        parsed = {}
+        for position in range(len(articles)):
+            entry = keyed.get(f"a{position}")
+            if isinstance(entry, dict) and isinstance(entry.get("entities"), list):
+                parsed[position] = {"entities": entry["entities"]}
+
+        if len(parsed) < len(articles):
+            logger.info(
+                f"Batched entity extraction parsed {len(parsed)}/{len(articles)} articles, "
+                f"retrying the rest individually"
+            )
+        return parsed
+
     def _build_entity_extraction_prompt(self, article: Dict) -> str:
         """
         Build optimized prompt for entity extraction
@@ -198,6 +310,53 @@ Return a JSON object with this structure:
 Entity types: cryptocurrency, protocol, company, person, event, regulation
 Only include entities mentioned in the text. Normalize crypto names (BTC → Bitcoin)."""
     
+    def _build_packed_entity_extraction_prompt(self, articles: List[Dict]) -> str:
+        """
+        Build one entity extraction prompt covering several articles.
+        Each article is tagged with an ID (a0, a1, ...) that keys the response.
+        """
+        articles_text = "\n\n".join(
+            f"<article id=\"a{i}\">\nTitle: {article['title']}\nText: {article.get('text', '')[:2000]}\n</article>"
+            for i, article in enumerate(articles)
+        )
+
+        return f"""Extract cryptocurrency-related entities from each of these {len(articles)} articles.
+
+{articles_text}
+
+Return ONLY a JSON object keyed by article id, with one entry per article:
+{{
+  "a0": {{
+    "entities": [
+      {{
+        "name": "Bitcoin",
+        "type": "cryptocurrency",
+        "confidence": 0.95,
+        "is_primary": true
+      }}
+    ]
+  }},
+  "a1": {{"entities": []}}
+}}
+
+Entity types: cryptocurrency, protocol, company, person, event, regulation
+Only include entities mentioned in that article's text. Normalize crypto names (BTC → Bitcoin)."""
+
+    def _parse_keyed_response(self, content: str) -> Dict[str, Any]:
+        """Parse a JSON object keyed by article id; returns {} if unparseable"""
+        try:
+            parsed = self._parse_text_response(content)
+        except (json.JSONDecodeError, IndexError):
+            parsed = None
+        if not isinstance(parsed, dict) or "a0" not in parsed:
+            # Fallback: take the outermost JSON object from surrounding text
+            start, end = content.find("{"), content.rfind("}")
+            try:
+                parsed = json.loads(content[start:end + 1]) if 0 <= start < end else None
+            except json.JSONDecodeError:
+                parsed = None
+        return parsed if isinstance(parsed, dict) else {}
+
     def _parse_text_response(self, content: str) -> Dict[str, Any]:
         """Parse text response from Claude into JSON"""
         
@@ -236,7 +395,7 @@ Only include entities mentioned in the text. Normalize crypto names (BTC → Bit
         
         # Check cache
         if use_cache:
-            cached_response = await self.cache.get(prompt, self.HAIKU_MODEL)
+            cached_response = await self.cache.get(prompt, self.HAIKU_MODEL, "narrative_extraction")
             if cached_response:
                 # Track as cached call (async, non-blocking)
                 try:
@@ -254,8 +413,16 @@ Only include entities mentioned in the text. Normalize crypto names (BTC → Bit
                     logger.error(f"Cost tracking failed: {e}")
                 return cached_response
 
+        return await self.cache.coalesce(
+            prompt,
+            self.HAIKU_MODEL,
+            lambda: self._request_narrative_elements(prompt, use_cache),
+            "narrative_extraction",
+        )
+
+    async def _request_narrative_elements(self, prompt: str, use_cache: bool) -> Dict[str, Any]:
         # Make API call with Haiku
-        api_response = self._make_api_call(
+        api_response = await self._make_api_call(
             prompt=prompt,
             model=self.HAIKU_MODEL,
             max_tokens=800,
@@ -331,7 +498,7 @@ Actions: Key events or verbs"""
         
         # Check cache
         if use_cache:
-            cached_response = await self.cache.get(prompt, self.SONNET_MODEL)
+            cached_response = await self.cache.get(prompt, self.SONNET_MODEL, "narrative_summary")
             if cached_response:
                 # Track as cached call (async, non-blocking)
                 try:
@@ -349,8 +516,16 @@ Actions: Key events or verbs"""
                     logger.error(f"Cost tracking failed: {e}")
                 return cached_response.get("summary", "")
 
+        return await self.cache.coalesce(
+            prompt,
+            self.SONNET_MODEL,
+            lambda: self._request_narrative_summary(prompt, use_cache),
+            "narrative_summary",
+        )
+
+    async def _request_narrative_summary(self, prompt: str, use_cache: bool) -> str:
         # Make API call with Sonnet (complex task)
-        api_response = self._make_api_call(
+        api_response = await self._make_api_call(
             prompt=prompt,
             model=self.SONNET_MODEL,
             max_tokens=500,
@@ -1,4 +1,5 @@
 import functools
+import inspect
 from collections import Counter
 
 # A simple in-memory store for usage tracking.
@@ -11,6 +12,15 @@ def track_usage(func):
     A decorator to track the usage of LLM provider methods.
     """
 
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            USAGE_COUNTER[f"{self.__class__.__name__}.{func.__name__}"] += 1
+            return await func(self, *args, **kwargs)
+
+        return async_wrapper
+
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         provider_name = self.__class__.__name__
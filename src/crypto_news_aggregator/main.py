@@ -66,8 +66,12 @@ from .api import admin as admin_api
 from .core.monitoring import setup_performance_monitoring
 from .core.config import get_settings
 from .core.auth import API_KEY_NAME
+from .core.leases import run_as_leader
 from .db.mongodb import initialize_mongodb, mongo_manager
+from .core.async_redis import close_redis_client
+from .llm.http_client import close_anthropic_http_client
 from .services.price_service import price_service
+from .services.price_history import price_history_service
 
 logger.info("Attempting to load application settings...")
 try:
@@ -104,14 +108,28 @@ async def lifespan(app: FastAPI):
         # Lazy import to avoid triggering tasks/__init__.py which imports celery
         from .tasks.price_monitor import get_price_monitor
         
-        # Create background tasks with immediate execution for data availability
+        # Create background tasks with immediate execution for data availability.
+        # Each loop runs under a lease so only one process (across gunicorn
+        # workers and worker.py) runs it at a time; the others stand by.
         price_monitor = get_price_monitor()
         background_tasks.extend([
-            asyncio.create_task(price_monitor.start(), name="price_monitor"),
-            asyncio.create_task(schedule_rss_fetch(1800, run_immediately=True), name="rss_fetcher"),
-            asyncio.create_task(update_signal_scores(run_immediately=True), name="signal_scores"),
-            asyncio.create_task(schedule_narrative_updates(600, run_immediately=True), name="narratives"),
-            asyncio.create_task(schedule_alert_checks(120, run_immediately=True), name="alerts")
+            asyncio.create_task(run_as_leader("price_monitor", price_monitor.start), name="price_monitor"),
+            asyncio.create_task(
+                run_as_leader("rss_fetcher", lambda: schedule_rss_fetch(1800, run_immediately=True)),
+                name="rss_fetcher",
+            ),
+            asyncio.create_task(
+                run_as_leader("signal_scores", lambda: update_signal_scores(run_immediately=True)),
+                name="signal_scores",
+            ),
+            asyncio.create_task(
+                run_as_leader("narratives", lambda: schedule_narrative_updates(600, run_immediately=True)),
+                name="narratives",
+            ),
+            asyncio.create_task(
+                run_as_leader("alerts", lambda: schedule_alert_checks(120, run_immediately=True)),
+                name="alerts",
+            ),
         ])
         logger.info(f"Started {len(background_tasks)} background worker tasks with immediate data fetch")
     
@@ -128,8 +146,13 @@ async def lifespan(app: FastAPI):
         await asyncio.gather(*background_tasks, return_exceptions=True)
         logger.info("Background tasks cancelled")
     
+    await price_history_service.flush()
     await mongo_manager.aclose()
     logger.info("Web server MongoDB connections closed.")
+    await close_anthropic_http_client()
+    logger.info("Anthropic HTTP client closed.")
+    await close_redis_client()
+    logger.info("Redis client closed.")
     await price_service.close()
     logger.info("Price service client session closed.")
 
@@ -94,6 +94,9 @@ class ArticleBase(BaseModel):
     narrative_hash: Optional[str] = None  # Content hash for caching
     narrative_extracted_at: Optional[datetime] = None
 
+    # MinHash signature for near-duplicate detection (see services.near_duplicates)
+    minhash: Optional[List[int]] = None
+
 
 class ArticleCreate(ArticleBase):
     """Model for creating a new article document."""
@@ -0,0 +1,285 @@
+"""
+In-process index of active price alerts for evaluation on each price tick.
+
+Every alert condition reduces to a trigger price on one side of the market:
+"above" and "percent_up" alerts fire once the price reaches a level at or
+over their trigger price, "below" and "percent_down" alerts once it falls to
+or under it (percent alerts measure from the price they last fired at). For
+each symbol ``PriceAlertIndex`` keeps the trigger prices of both sides in
+sorted arrays, so the alerts crossed by a price are a prefix (up side) and a
+suffix (down side) found with two binary searches. A tick costs
+O(log n + triggered) no matter how many alerts are stored.
+
+Cooldowns and in-flight notifications are tracked in memory, so an alert
+that is being sent, or was sent within the cooldown, is not returned again.
+
+The process-wide index is built from the alerts collection on first use and
+kept warm across ticks: AlertService updates it as alerts are created,
+updated and deleted in this process, and each check syncs the alerts other
+processes changed since the last sync (see ``PriceAlertIndex.sync``).
+Deletes leave nothing to sync, so triggered alerts are re-checked against
+the collection before they are sent. The index is rebuilt every
+ALERT_INDEX_REFRESH_MINUTES as a backstop.
+"""
+
+import logging
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..core.config import settings
+from ..models.alert import AlertCondition, AlertInDB, AlertStatus
+
+logger = logging.getLogger(__name__)
+
+UP = "up"
+DOWN = "down"
+
+
+def _aware(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def trigger_level(alert: AlertInDB) -> Optional[Tuple[str, float]]:
+    """
+    Side and price at which an alert fires.
+
+    Returns:
+        (UP or DOWN, trigger price), or None for percent alerts without a
+        baseline price to measure from
+    """
+    condition = AlertCondition(alert.condition)
+    if condition == AlertCondition.ABOVE:
+        return UP, alert.threshold
+    if condition == AlertCondition.BELOW:
+        return DOWN, alert.threshold
+    baseline = alert.last_triggered_price
+    if not baseline:
+        return None
+    if condition == AlertCondition.PERCENT_UP:
+        return UP, baseline * (1 + alert.threshold_percent / 100)
+    return DOWN, baseline * (1 - alert.threshold_percent / 100)
+
+
+@dataclass
+class TriggeredAlert:
+    """An alert crossed by a price tick."""
+
+    alert: AlertInDB
+    price: float
+    change_percent: float
+
+
+@dataclass
+class _Entry:
+    alert: AlertInDB
+    symbol: str
+    side: str
+    trigger_price: float
+
+
+class _SymbolBook:
+    """Trigger prices for one symbol, sorted per side (ids kept in step)."""
+
+    def __init__(self):
+        self.prices: Dict[str, List[float]] = {UP: [], DOWN: []}
+        self.ids: Dict[str, List[str]] = {UP: [], DOWN: []}
+
+    def __len__(self) -> int:
+        return len(self.ids[UP]) + len(self.ids[DOWN])
+
+    def insert(self, side: str, price: float, alert_id: str) -> None:
+        position = bisect_right(self.prices[side], price)
+        self.prices[side].insert(position, price)
+        self.ids[side].insert(position, alert_id)
+
+    def remove(self, side: str, price: float, alert_id: str) -> None:
+        prices, ids = self.prices[side], self.ids[side]
+        position = bisect_left(prices, price)
+        while position < len(prices) and prices[position] == price:
+            if ids[position] == alert_id:
+                del prices[position]
+                del ids[position]
+                return
+            position += 1
+
+    def crossed(self, price: float) -> List[str]:
+        """Alerts whose trigger price the given price has reached."""
+        up = self.ids[UP][:bisect_right(self.prices[UP], price)]
+        down = self.ids[DOWN][bisect_left(self.prices[DOWN], price):]
+        return up + down
+
+
+class PriceAlertIndex:
+    """Active price alerts bucketed by symbol and sorted by trigger price."""
+
+    def __init__(self, cooldown: timedelta = timedelta(minutes=15)):
+        self.cooldown = cooldown
+        self.built_at = datetime.now(timezone.utc)
+        self.synced_at = self.built_at
+        self._alerts: Dict[str, AlertInDB] = {}
+        self._entries: Dict[str, _Entry] = {}
+        self._books: Dict[str, _SymbolBook] = {}
+        self._in_flight: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def __contains__(self, alert_id: str) -> bool:
+        return str(alert_id) in self._alerts
+
+    def symbols(self) -> List[str]:
+        """Symbols with at least one indexed trigger price."""
+        return sorted(symbol for symbol, book in self._books.items() if len(book))
+
+    def add(self, alert: AlertInDB) -> None:
+        """Index an alert (re-adding replaces it), or drop it if it is no longer active."""
+        alert_id = str(alert.id)
+        self.remove(alert_id)
+        if not alert.is_active or AlertStatus(alert.status) != AlertStatus.ACTIVE:
+            return
+        self._alerts[alert_id] = alert
+        level = trigger_level(alert)
+        if level is None:
+            # Percent alerts wait for a baseline price
+            return
+        side, price = level
+        symbol = alert.crypto_id.lower()
+        self._entries[alert_id] = _Entry(alert, symbol, side, price)
+        self._books.setdefault(symbol, _SymbolBook()).insert(side, price, alert_id)
+
+    def remove(self, alert_id: str) -> None:
+        alert_id = str(alert_id)
+        self._alerts.pop(alert_id, None)
+        self._in_flight.discard(alert_id)
+        entry = self._entries.pop(alert_id, None)
+        if entry is None:
+            return
+        book = self._books.get(entry.symbol)
+        if book is not None:
+            book.remove(entry.side, entry.trigger_price, alert_id)
+            if not len(book):
+                del self._books[entry.symbol]
+
+    def sync(self, alerts: Iterable[AlertInDB], synced_at: datetime) -> None:
+        """
+        Apply alerts changed elsewhere (``synced_at`` is when they were read).
+
+        Unlike ``add``, alerts whose notification is in flight stay in flight.
+        """
+        for alert in alerts:
+            alert_id = str(alert.id)
+            in_flight = alert_id in self._in_flight
+            self.add(alert)
+            if in_flight and alert_id in self:
+                self._in_flight.add(alert_id)
+        self.synced_at = synced_at
+
+    def evaluate(
+        self, symbol: str, price: float, now: Optional[datetime] = None
+    ) -> List[TriggeredAlert]:
+        """
+        Alerts for ``symbol`` that fire at ``price``.
+
+        Returned alerts are held as in flight until ``mark_triggered`` or
+        ``release`` is called for them, so overlapping ticks don't notify
+        twice.
+        """
+        book = self._books.get(symbol.lower())
+        if book is None:
+            return []
+        now = now or datetime.now(timezone.utc)
+        triggered = []
+        for alert_id in book.crossed(price):
+            if alert_id in self._in_flight:
+                continue
+            alert = self._entries[alert_id].alert
+            last_triggered = _aware(alert.last_triggered)
+            if last_triggered and now - last_triggered < self.cooldown:
+                continue
+            baseline = alert.last_triggered_price
+            change_percent = (price - baseline) / baseline * 100 if baseline else 0.0
+            self._in_flight.add(alert_id)
+            triggered.append(TriggeredAlert(alert, price, change_percent))
+        return triggered
+
+    def mark_triggered(
+        self, alert_id: str, price: float, when: Optional[datetime] = None
+    ) -> None:
+        """Record a sent notification: start the cooldown and move the percent baseline."""
+        alert_id = str(alert_id)
+        self._in_flight.discard(alert_id)
+        alert = self._alerts.get(alert_id)
+        if alert is None:
+            return
+        self.add(
+            alert.model_copy(
+                update={
+                    "last_triggered": when or datetime.now(timezone.utc),
+                    "last_triggered_price": price,
+                }
+            )
+        )
+
+    def release(self, alert_id: str) -> None:
+        """Make an alert whose notification failed eligible again on the next tick."""
+        self._in_flight.discard(str(alert_id))
+
+
+_index: Optional[PriceAlertIndex] = None
+
+
+def get_alert_index() -> Optional[PriceAlertIndex]:
+    """
+    The warm process-wide index, or None if it has to be (re)built.
+
+    Returns None before the first build and once the index is older than
+    ALERT_INDEX_REFRESH_MINUTES.
+    """
+    if _index is None:
+        return None
+    age = datetime.now(timezone.utc) - _index.built_at
+    if age > timedelta(minutes=settings.ALERT_INDEX_REFRESH_MINUTES):
+        return None
+    return _index
+
+
+def build_alert_index(
+    alerts: Iterable[AlertInDB],
+    cooldown: timedelta = timedelta(minutes=15),
+    synced_at: Optional[datetime] = None,
+) -> PriceAlertIndex:
+    """Replace the process-wide index with one over ``alerts`` (read at ``synced_at``)."""
+    global _index
+    index = PriceAlertIndex(cooldown=cooldown)
+    for alert in alerts:
+        index.add(alert)
+    if synced_at is not None:
+        index.synced_at = synced_at
+    if _index is not None:
+        # Notifications still being sent stay deduplicated across the rebuild
+        index._in_flight = {alert_id for alert_id in _index._in_flight if alert_id in index}
+    logger.info(f"Built price alert index with {len(index)} alerts over {len(index.symbols())} symbols")
+    _index = index
+    return index
+
+
+def index_alert(alert: AlertInDB) -> None:
+    """Record an alert write in the process-wide index, if it is built."""
+    if _index is not None:
+        _index.add(alert)
+
+
+def unindex_alert(alert_id: str) -> None:
+    """Drop an alert from the process-wide index, if it is built."""
+    if _index is not None:
+        _index.remove(alert_id)
+
+
+def reset_alert_index() -> None:
+    """Drop the process-wide index so the next tick rebuilds it."""
+    global _index
+    _index = None
@@ -11,10 +11,18 @@ from ..models.alert import AlertInDB, AlertStatus, AlertUpdate
 from ..services.price_service import get_price_service
 from ..services.alert_service import AlertService, get_alert_service
 from ..services.email_service import get_email_service
+from ..services.alert_index import (
+    PriceAlertIndex,
+    TriggeredAlert,
+    build_alert_index,
+    get_alert_index,
+)
 from ..core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+ALERT_SYNC_OVERLAP = timedelta(seconds=5)
+
 
 class AlertNotificationService:
     """Service for managing and sending price alert notifications."""
@@ -23,193 +31,127 @@ class AlertNotificationService:
         self.price_service = get_price_service()
         self.alert_service = alert_service
         settings = get_settings()
+        self.base_url = settings.BASE_URL
         self.min_alert_interval = timedelta(
             minutes=getattr(settings, "MIN_ALERT_INTERVAL_MINUTES", 15)
         )
 
-    async def check_and_send_alerts(self) -> Tuple[int, int]:
+    async def _get_index(self) -> PriceAlertIndex:
+        """
+        The process-wide alert index, loading active alerts if it is cold or
+        stale and otherwise syncing the alerts changed since the last check.
+        """
+        # Read times lag a little so writes committed during a read aren't missed
+        read_at = datetime.now(timezone.utc) - ALERT_SYNC_OVERLAP
+        index = get_alert_index()
+        if index is None:
+            active_alerts = await self.alert_service.get_active_alerts()
+            return build_alert_index(
+                active_alerts, cooldown=self.min_alert_interval, synced_at=read_at
+            )
+        changed = await self.alert_service.get_alerts_updated_since(index.synced_at)
+        if changed:
+            logger.info(f"[PIPELINE] Syncing {len(changed)} changed alerts into the index")
+        index.sync(changed, synced_at=read_at)
+        return index
+
+    async def _drop_inactive(
+        self, index: PriceAlertIndex, triggered: List[Tuple[TriggeredAlert, float]]
+    ) -> List[Tuple[TriggeredAlert, float]]:
+        """Drop triggered alerts that were deleted or deactivated since the last sync."""
+        if not triggered:
+            return triggered
+        active_ids = await self.alert_service.get_active_alert_ids(
+            [str(hit.alert.id) for hit, _ in triggered]
+        )
+        kept = []
+        for hit, change_24h in triggered:
+            if str(hit.alert.id) in active_ids:
+                kept.append((hit, change_24h))
+            else:
+                logger.info(f"[PIPELINE] Alert {hit.alert.id} is no longer active; not sending")
+                index.remove(hit.alert.id)
+        return kept
+
+    async def check_and_send_alerts(
+        self, prices: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Tuple[int, int]:
         """
         Check all active alerts and send notifications for triggered ones.
 
+        Prices for every symbol with alerts are fetched in one request, and
+        the alert index finds the alerts each price crosses.
+
+        Args:
+            prices: Price data by symbol from a price tick; only symbols with
+                alerts that it doesn't cover are fetched
+
         Returns:
             Tuple[int, int]: Number of alerts processed, number of notifications sent
         """
         try:
-            # Get all active alerts
-            active_alerts = await self.alert_service.get_active_alerts()
+            index = await self._get_index()
+            symbols = index.symbols()
             logger.info(
-                f"[PIPELINE] Found {len(active_alerts)} active alerts to process"
+                f"[PIPELINE] Evaluating {len(index)} active alerts across {len(symbols)} symbols"
             )
+            if not symbols:
+                return len(index), 0
+
+            prices = dict(prices or {})
+            missing = [symbol for symbol in symbols if symbol not in prices]
+            if missing:
+                prices.update(await self.price_service.get_prices(missing))
+            now = datetime.now(timezone.utc)
+
+            triggered: List[Tuple[TriggeredAlert, float]] = []
+            for symbol in symbols:
+                price_data = prices.get(symbol) or {}
+                if price_data.get("price") is None:
+                    logger.error(f"[PIPELINE] Failed to get current price data for {symbol}")
+                    continue
+                for hit in index.evaluate(symbol, price_data["price"], now):
+                    triggered.append((hit, price_data.get("change_24h", 0)))
+            triggered = await self._drop_inactive(index, triggered)
+            logger.info(f"[PIPELINE] {len(triggered)} alerts triggered")
 
             sent_count = 0
-            processed_count = 0
-
-            for alert in active_alerts:
+            for hit, change_24h in triggered:
+                alert = hit.alert
                 try:
-                    logger.info(f"[PIPELINE] Processing alert: {alert}")
-                    processed_count += 1
-
-                    # Check if alert is ready to be sent (respecting cooldown)
-                    if not self._is_alert_ready(alert):
-                        logger.info(
-                            f"[PIPELINE] Alert {alert.id} not ready due to cooldown."
-                        )
-                        continue
-
-                    # Get current price data
-                    price_data = await self.price_service.get_bitcoin_price()
-                    logger.info(f"[PIPELINE] Current price data: {price_data}")
-                    if not price_data or "price" not in price_data:
-                        logger.error("[PIPELINE] Failed to get current price data")
-                        continue
-
-                    current_price = price_data["price"]
-                    change_24h = price_data.get("change_24h", 0)
-
-                    # Check if alert condition is met
-                    logger.info(
-                        f"[PIPELINE] Checking alert condition for alert {alert.id} at price {current_price}"
-                    )
-                    should_alert, change_percent = await self._check_alert_condition(
-                        alert, current_price
-                    )
-                    logger.info(
-                        f"[PIPELINE] Alert condition for alert {alert.id}: should_alert={should_alert}, change_percent={change_percent}"
+                    # Get relevant news articles based on the price change
+                    news_articles = await self._get_relevant_news(
+                        price_change_percent=hit.change_percent
                     )
 
-                    if should_alert:
-                        # Get relevant news articles based on the price change
-                        news_articles = await self._get_relevant_news(
-                            price_change_percent=change_percent
-                        )
-                        logger.info(
-                            f"[PIPELINE] News articles for alert {alert.id}: {news_articles}"
-                        )
-
-                        # Send notification with the relevant news
-                        logger.info(
-                            f"[PIPELINE] Sending notification for alert {alert.id}"
-                        )
-                        email_service = get_email_service()
-                        success, _ = await email_service.send_price_alert(
-                            to=alert.user_email,
-                            user_name=alert.user_name or "there",
-                            crypto_name="Bitcoin",
-                            crypto_symbol="BTC",
-                            condition=f"Price moved {'up' if change_percent > 0 else 'down'} by {abs(change_percent):.2f}%",
-                            threshold=alert.threshold_percent,
-                            current_price=current_price,
-                            price_change_24h=change_24h,
-                            news_articles=news_articles,
-                            dashboard_url=f"{settings.BASE_URL}/dashboard",
-                            settings_url=f"{settings.BASE_URL}/settings/alerts",
-                        )
-                        logger.info(
-                            f"[PIPELINE] Notification send result for alert {alert.id}: {success}"
-                        )
-
-                        if success:
-                            sent_count += 1
-                            # Update alert with last triggered time
-                            await self._update_alert_after_notification(
-                                alert, current_price
-                            )
+                    # Send notification with the relevant news
+                    success = await self._send_alert_notification(
+                        alert, hit.price, hit.change_percent, change_24h, news_articles
+                    )
+                    if success:
+                        sent_count += 1
+                        # Update alert with last triggered time
+                        await self._update_alert_after_notification(alert, hit.price)
+                        index.mark_triggered(alert.id, hit.price, now)
+                    else:
+                        index.release(alert.id)
 
                 except Exception as e:
+                    index.release(alert.id)
                     logger.error(
                         f"[PIPELINE] Error processing alert {alert.id}: {e}",
                         exc_info=True,
                     )
 
             logger.info(
-                f"[PIPELINE] Processed {processed_count} alerts, sent {sent_count} notifications"
+                f"[PIPELINE] Processed {len(index)} alerts, sent {sent_count} notifications"
             )
-            return processed_count, sent_count
+            return len(index), sent_count
 
         except Exception as e:
             logger.error(f"Error in check_and_send_alerts: {e}", exc_info=True)
             return 0, 0
 
-    def _is_alert_ready(self, alert: AlertInDB) -> bool:
-        """Check if an alert is ready to be sent (respecting cooldown)."""
-        if not alert.last_triggered:
-            return True
-
-        time_since_last = datetime.now(timezone.utc) - alert.last_triggered
-        return time_since_last >= self.min_alert_interval
-
-    async def _check_alert_condition(
-        self, alert: AlertInDB, current_price: float
-    ) -> Tuple[bool, float]:
-        """
-        Check if an alert's condition is met.
-
-        Returns:
-            Tuple[bool, float]: (should_alert, change_percent)
-        """
-        logger.info(f"[DEBUG] Checking alert {alert.id}")
-        logger.info(
-            f"[DEBUG] Alert details: condition={alert.condition}, threshold={alert.threshold}%, threshold_percent={alert.threshold_percent}%"
-        )
-        logger.info(
-            f"[DEBUG] Price data: last_triggered_price={alert.last_triggered_price}, current_price={current_price}"
-        )
-
-        if not alert.last_triggered_price:
-            # First time checking this alert, set baseline price
-            logger.info(
-                f"[DEBUG] No last_triggered_price for alert {alert.id}, setting baseline"
-            )
-            return False, 0.0
-
-        # Calculate price change since last alert
-        change_amount = current_price - alert.last_triggered_price
-        change_percent = (change_amount / alert.last_triggered_price) * 100
-
-        # Log detailed calculation
-        logger.info(
-            f"[DEBUG] Change calculation: {current_price} - {alert.last_triggered_price} = {change_amount} ({change_percent:.2f}%)"
-        )
-
-        # Check if the change meets the threshold based on alert condition
-        threshold = alert.threshold_percent
-        logger.info(
-            f"[DEBUG] Checking condition: {alert.condition}, change={change_percent:.2f}% vs threshold={threshold}%"
-        )
-
-        should_trigger = False
-
-        # Check the specific alert condition
-        if alert.condition == "percent_up" and change_percent >= threshold:
-            should_trigger = True
-            logger.info(
-                f"[DEBUG] Condition met: Price increased by {change_percent:.2f}% >= {threshold}%"
-            )
-        elif alert.condition == "percent_down" and change_percent <= -threshold:
-            should_trigger = True
-            logger.info(
-                f"[DEBUG] Condition met: Price decreased by {abs(change_percent):.2f}% >= {threshold}%"
-            )
-        elif alert.condition == "above" and current_price >= alert.threshold:
-            should_trigger = True
-            logger.info(
-                f"[DEBUG] Condition met: Price {current_price} >= {alert.threshold}"
-            )
-        elif alert.condition == "below" and current_price <= alert.threshold:
-            should_trigger = True
-            logger.info(
-                f"[DEBUG] Condition met: Price {current_price} <= {alert.threshold}"
-            )
-
-        if should_trigger:
-            logger.info(
-                f"[ALERT] Alert {alert.id} TRIGGERED: {alert.condition} condition met with {change_percent:.2f}% change"
-            )
-            return True, change_percent
-
-        logger.info(f"[DEBUG] Alert {alert.id} NOT TRIGGERED: Condition not met")
-        return False, change_percent
-
     async def _get_relevant_news(
         self, price_change_percent: float, limit: int = 3
     ) -> List[Dict[str, Any]]:
@@ -254,34 +196,20 @@ class AlertNotificationService:
             direction = "up" if change_percent > 0 else "down"
             condition = f"Price moved {direction} by {abs(change_percent):.2f}%"
 
-            # Prepare template context
-            context = {
-                "user_name": alert.user_name or "there",
-                "crypto_name": "Bitcoin",
-                "crypto_symbol": "BTC",
-                "condition": condition,
-                "threshold": alert.threshold_percent,
-                "current_price": current_price,
-                "price_change_24h": change_24h,
-                "news_articles": news_articles,
-                "dashboard_url": f"{settings.BASE_URL}/dashboard",
-                "settings_url": f"{settings.BASE_URL}/settings/alerts",
-            }
-
             # Send the email
             email_service = get_email_service()
             success, _ = await email_service.send_price_alert(
                 to=alert.user_email,
                 user_name=alert.user_name or "there",
-                crypto_name="Bitcoin",
-                crypto_symbol="BTC",
+                crypto_name=alert.crypto_name,
+                crypto_symbol=alert.crypto_symbol,
                 condition=condition,
                 threshold=alert.threshold_percent,
                 current_price=current_price,
                 price_change_24h=change_24h,
                 news_articles=news_articles,
-                dashboard_url=f"{settings.BASE_URL}/dashboard",
-                settings_url=f"{settings.BASE_URL}/settings/alerts",
+                dashboard_url=f"{self.base_url}/dashboard",
+                settings_url=f"{self.base_url}/settings/alerts",
             )
 
             if success:
@@ -300,13 +228,8 @@ class AlertNotificationService:
     ) -> None:
         """Update alert after sending a notification."""
         try:
-            # Update the alert using the service with direct parameters
-            await self.alert_service.update_alert(
-                alert_id=str(alert.id),
-                user_id=alert.user_id,
-                last_triggered=datetime.now(timezone.utc),
-                last_triggered_price=current_price,
-                status=AlertStatus.ACTIVE,
+            await self.alert_service.mark_alert_triggered(
+                str(alert.id), price=current_price
             )
         except Exception as e:
             logger.error(f"Error updating alert {alert.id}: {e}", exc_info=True)
@@ -4,13 +4,14 @@ Alert service for handling alert-related operations.
 
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Set, Union
 from functools import lru_cache
 from bson import ObjectId
 
 from ..models.alert import AlertInDB, AlertCreate, AlertUpdate, AlertStatus
 from ..db.mongodb import mongo_manager, COLLECTION_ALERTS
 from ..core.config import get_settings
+from .alert_index import index_alert, unindex_alert
 
 logger = logging.getLogger(__name__)
 
@@ -73,7 +74,9 @@ class AlertService:
         if created_alert and "_id" in created_alert:
             created_alert["_id"] = str(created_alert["_id"])
 
-        return AlertInDB(**created_alert)
+        alert_in_db = AlertInDB(**created_alert)
+        index_alert(alert_in_db)
+        return alert_in_db
 
     async def get_active_alerts(self) -> List[AlertInDB]:
         """
@@ -83,12 +86,11 @@ class AlertService:
             List[AlertInDB]: List of active alerts
         """
         collection = await self._get_collection()
-        logger.info("[GET_ACTIVE_ALERTS] Querying for alerts with is_active=True")
+        logger.debug("[GET_ACTIVE_ALERTS] Querying for alerts with is_active=True")
         cursor = collection.find({"is_active": True})
 
         alerts = []
         async for doc in cursor:
-            logger.info(f"[GET_ACTIVE_ALERTS] Retrieved alert doc: {doc}")
             # Convert ObjectId to string for Pydantic model
             if "_id" in doc:
                 doc["id"] = str(doc["_id"])
@@ -97,6 +99,46 @@ class AlertService:
         logger.info(f"[GET_ACTIVE_ALERTS] Returning {len(alerts)} active alerts")
         return alerts
 
+    async def get_alerts_updated_since(self, since: datetime) -> List[AlertInDB]:
+        """
+        Get alerts created or updated after ``since``, active or not.
+
+        Args:
+            since: Only alerts with a later updated_at are returned
+
+        Returns:
+            List[AlertInDB]: The changed alerts
+        """
+        collection = await self._get_collection()
+        cursor = collection.find({"updated_at": {"$gt": since}})
+
+        alerts = []
+        async for doc in cursor:
+            if "_id" in doc:
+                doc["id"] = str(doc["_id"])
+                del doc["_id"]
+            alerts.append(AlertInDB(**doc))
+        return alerts
+
+    async def get_active_alert_ids(self, alert_ids: List[str]) -> Set[str]:
+        """
+        Which of the given alerts still exist and are active.
+
+        Args:
+            alert_ids: IDs of the alerts to check
+
+        Returns:
+            Set[str]: IDs of the alerts that are still active
+        """
+        if not alert_ids:
+            return set()
+        collection = await self._get_collection()
+        cursor = collection.find(
+            {"_id": {"$in": [ObjectId(alert_id) for alert_id in alert_ids]}, "is_active": True},
+            {"_id": 1},
+        )
+        return {str(doc["_id"]) async for doc in cursor}
+
     async def update_alert(
         self, alert_id: str, update_data: Union[AlertUpdate, Dict[str, Any]], **kwargs
     ) -> Optional[AlertInDB]:
@@ -241,7 +283,12 @@ class AlertService:
             return None
 
         updated_alert = await collection.find_one({"_id": ObjectId(alert_id)})
-        return AlertInDB(**updated_alert) if updated_alert else None
+        if not updated_alert:
+            unindex_alert(alert_id)
+            return None
+        alert_in_db = AlertInDB(**updated_alert)
+        index_alert(alert_in_db)
+        return alert_in_db
 
     async def delete_alert(self, alert_id: str, user_id: str) -> bool:
         """
@@ -258,6 +305,8 @@ class AlertService:
         result = await collection.delete_one(
             {"_id": ObjectId(alert_id), "user_id": user_id}
         )
+        if result.deleted_count > 0:
+            unindex_alert(alert_id)
         return result.deleted_count > 0
 
     async def get_active_alerts_for_crypto(self, crypto_id: str) -> List[AlertInDB]:
@@ -275,17 +324,28 @@ class AlertService:
         cursor = collection.find(query)
         return [AlertInDB(**alert) async for alert in cursor]
 
-    async def mark_alert_triggered(self, alert_id: str) -> None:
+    async def mark_alert_triggered(
+        self,
+        alert_id: str,
+        price: Optional[float] = None,
+        triggered_at: Optional[datetime] = None,
+    ) -> None:
         """
-        Update the last_triggered timestamp for an alert.
+        Update the last_triggered timestamp (and price) for an alert.
 
         Args:
             alert_id: The ID of the alert that was triggered
+            price: Price the alert fired at (baseline for percent alerts)
+            triggered_at: When the alert fired (default: now)
         """
         collection = await self._get_collection()
-        await collection.update_one(
-            {"_id": ObjectId(alert_id)}, {"$set": {"last_triggered": datetime.utcnow()}}
-        )
+        update: Dict[str, Any] = {
+            "last_triggered": triggered_at or datetime.now(timezone.utc),
+            "status": AlertStatus.ACTIVE.value,
+        }
+        if price is not None:
+            update["last_triggered_price"] = price
+        await collection.update_one({"_id": ObjectId(alert_id)}, {"$set": update})
 
 
 # Factory function for dependency injection
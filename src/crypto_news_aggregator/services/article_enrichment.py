@@ -0,0 +1,301 @@
+"""
+Combined single-call article enrichment.
+
+Instead of separate LLM round-trips for relevance, sentiment, themes, entity
+extraction and narrative elements (each resending the article text), one
+Haiku request returns all of them in a single JSON document:
+
+    {
+      "relevance_score": 0.8,
+      "sentiment_score": 0.4,
+      "themes": ["ETF", "institutional adoption"],
+      "entities": [{"name": "Bitcoin", "type": "cryptocurrency", "confidence": 0.95, "is_primary": true}],
+      "actors": [...], "actor_salience": {...}, "nucleus_entity": "...",
+      "narrative_focus": "...", "actions": [...], "tensions": [...],
+      "implications": "...", "narrative_summary": "..."
+    }
+
+Fields are validated in groups. When a group is missing or invalid, only
+that group is re-requested, and the merged result is cached under one key.
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from .narrative_themes import (
+    clean_json_response,
+    narrative_content_hash,
+    validate_entity_in_text,
+    validate_narrative_json,
+)
+
+logger = logging.getLogger(__name__)
+
+# Field groups that are validated (and re-requested) together
+FIELD_GROUPS: Dict[str, Tuple[str, ...]] = {
+    "scores": ("relevance_score", "sentiment_score"),
+    "themes": ("themes",),
+    "entities": ("entities",),
+    "narrative": (
+        "actors",
+        "actor_salience",
+        "nucleus_entity",
+        "narrative_focus",
+        "actions",
+        "tensions",
+        "implications",
+        "narrative_summary",
+    ),
+}
+
+ENTITY_TYPES = ("cryptocurrency", "protocol", "company", "person", "event", "regulation", "organization")
+
+# Operation name for cost tracking and cache stats
+ENRICHMENT_OPERATION = "article_enrichment"
+
+ENRICHMENT_MAX_TOKENS = 1500
+MAX_THEMES = 10
+
+_GROUP_INSTRUCTIONS = {
+    "scores": """- "relevance_score": 0.0-1.0, how relevant the article is to cryptocurrency market movements
+- "sentiment_score": -1.0 (very bearish) to 1.0 (very bullish)""",
+    "themes": """- "themes": up to 10 short keywords for the key crypto themes (e.g. "DeFi", "regulation")""",
+    "entities": f"""- "entities": crypto-related entities mentioned in the text, each
+  {{"name": "Bitcoin", "type": "cryptocurrency", "confidence": 0.95, "is_primary": true}}
+  Types: {", ".join(ENTITY_TYPES)}. is_primary marks trackable entities
+  (cryptocurrencies, protocols, companies, organizations). Normalize crypto names (BTC → Bitcoin).""",
+    "narrative": """- "actors": people, organizations, protocols, assets or regulators with salience >= 2
+- "actor_salience": {"Actor": 1-5} (5 = the article is about it, 4 = key participant,
+  3 = secondary, 2 = context). Reserve 5 for 1-2 entities.
+- "nucleus_entity": the ONE entity the article is primarily about; must appear in the text
+- "narrative_focus": 2-5 verb-driven words for what is happening (e.g. "regulatory enforcement action")
+- "actions": key events
+- "tensions": forces at play (e.g. "Regulation vs Innovation")
+- "implications": why it matters
+- "narrative_summary": 2-3 sentences on the broader narrative""",
+}
+
+_GROUP_EXAMPLES = {
+    "scores": '"relevance_score": 0.9, "sentiment_score": -0.4',
+    "themes": '"themes": ["regulation", "exchanges"]',
+    "entities": (
+        '"entities": [{"name": "SEC", "type": "organization", "confidence": 0.95, "is_primary": true}, '
+        '{"name": "Binance", "type": "company", "confidence": 0.95, "is_primary": true}]'
+    ),
+    "narrative": (
+        '"actors": ["SEC", "Binance"], "actor_salience": {"SEC": 5, "Binance": 4}, '
+        '"nucleus_entity": "SEC", "narrative_focus": "regulatory enforcement action", '
+        '"actions": ["SEC filed lawsuit against Binance"], "tensions": ["Regulation vs Innovation"], '
+        '"implications": "Signals escalation in regulatory enforcement", '
+        '"narrative_summary": "Regulators are intensifying enforcement against major exchanges as the SEC targets Binance."'
+    ),
+}
+
+
+def _article_text(article: Dict[str, Any]) -> str:
+    return article.get("text") or article.get("content") or article.get("description") or ""
+
+
+def build_enrichment_prompt(article: Dict[str, Any], groups: Optional[List[str]] = None) -> str:
+    """
+    Build the enrichment prompt for all field groups, or only ``groups``.
+
+    Args:
+        article: Article dict with title and text/content/description
+        groups: Field groups to request (defaults to all of FIELD_GROUPS)
+
+    Returns:
+        Prompt text
+    """
+    groups = groups or list(FIELD_GROUPS)
+    instructions = "\n".join(_GROUP_INSTRUCTIONS[group] for group in groups)
+    example = ", ".join(_GROUP_EXAMPLES[group] for group in groups)
+
+    return f"""Analyze this crypto news article and return these fields:
+
+{instructions}
+
+Rules:
+- ONLY use information explicitly stated in the article; do not add titles or roles
+- Use short canonical names ("SEC" not "U.S. Securities and Exchange Commission",
+  "Ethereum" not "Ethereum Foundation", "Bitcoin" not "BTC")
+
+Title: {article.get('title', '')}
+Text: {_article_text(article)[:2000]}
+
+Respond with ONLY a JSON object, no markdown. Example for "SEC sues Binance":
+{{{example}}}"""
+
+
+def _is_number_in_range(value: Any, low: float, high: float) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and low <= value <= high
+
+
+def _validate_group(group: str, data: Dict[str, Any], article: Dict[str, Any]) -> Optional[str]:
+    """Validate (and normalize in place) one field group; returns an error or None."""
+    if group == "scores":
+        if not _is_number_in_range(data.get("relevance_score"), 0.0, 1.0):
+            return "relevance_score must be a number between 0 and 1"
+        if not _is_number_in_range(data.get("sentiment_score"), -1.0, 1.0):
+            return "sentiment_score must be a number between -1 and 1"
+        data["relevance_score"] = float(data["relevance_score"])
+        data["sentiment_score"] = float(data["sentiment_score"])
+        return None
+
+    if group == "themes":
+        themes = data.get("themes")
+        if not isinstance(themes, list):
+            return "themes must be a list"
+        data["themes"] = [str(theme).strip() for theme in themes if str(theme).strip()][:MAX_THEMES]
+        return None
+
+    if group == "entities":
+        entities = data.get("entities")
+        if not isinstance(entities, list):
+            return "entities must be a list"
+        data["entities"] = [
+            entity
+            for entity in entities
+            if isinstance(entity, dict)
+            and isinstance(entity.get("name"), str)
+            and entity["name"].strip()
+            and isinstance(entity.get("type"), str)
+        ]
+        return None
+
+    # Narrative elements use the same rules as discover_narrative_from_article
+    is_valid, error = validate_narrative_json(data)
+    if not is_valid:
+        return error
+    if not validate_entity_in_text(data["nucleus_entity"], article.get("title", ""), _article_text(article)):
+        return f"nucleus_entity '{data['nucleus_entity']}' not found in article text"
+    return None
+
+
+def validate_enrichment_json(
+    data: Dict[str, Any],
+    article: Dict[str, Any],
+    groups: Optional[List[str]] = None,
+) -> Dict[str, str]:
+    """
+    Validate an enrichment response group by group.
+
+    Valid groups are normalized in place.
+
+    Args:
+        data: Parsed LLM response
+        article: The source article (for nucleus entity validation)
+        groups: Groups to check (defaults to all of FIELD_GROUPS)
+
+    Returns:
+        Dict mapping each invalid group to its error; empty if all are valid
+    """
+    errors = {}
+    for group in groups or FIELD_GROUPS:
+        error = _validate_group(group, data, article)
+        if error:
+            errors[group] = error
+    return errors
+
+
+def _parse_response(content: str) -> Dict[str, Any]:
+    try:
+        parsed = json.loads(clean_json_response(content))
+    except json.JSONDecodeError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+async def enrich_article(
+    article: Dict[str, Any],
+    llm,
+    use_cache: bool = True,
+    max_repairs: int = 1,
+) -> Optional[Dict[str, Any]]:
+    """
+    Enrich one article with a single combined LLM call.
+
+    Args:
+        article: Article dict with title and text/content/description
+        llm: OptimizedAnthropicLLM instance (provides the API call, cache and cost tracking)
+        use_cache: Whether to use cached responses
+        max_repairs: Follow-up requests allowed for groups that failed validation
+
+    Returns:
+        Dict with the fields of every valid group plus ``narrative_hash`` when
+        the narrative group is valid, or None if the core fields (scores and
+        entities) could not be obtained. Groups that stay invalid are omitted.
+    """
+    prompt = build_enrichment_prompt(article)
+    model = llm.HAIKU_MODEL
+
+    if use_cache:
+        cached_response = await llm.cache.get(prompt, model, ENRICHMENT_OPERATION)
+        if cached_response:
+            await llm._track_call(ENRICHMENT_OPERATION, model, cached=True)
+            return cached_response
+
+    # Concurrent requests for the same article share one set of API calls
+    return await llm.cache.coalesce(
+        prompt,
+        model,
+        lambda: _request_enrichment(article, llm, prompt, use_cache, max_repairs),
+        ENRICHMENT_OPERATION,
+    )
+
+
+async def _request_enrichment(
+    article: Dict[str, Any],
+    llm,
+    prompt: str,
+    use_cache: bool,
+    max_repairs: int,
+) -> Optional[Dict[str, Any]]:
+    model = llm.HAIKU_MODEL
+    result: Dict[str, Any] = {}
+    pending = list(FIELD_GROUPS)
+
+    for attempt in range(max_repairs + 1):
+        request_prompt = prompt if attempt == 0 else build_enrichment_prompt(article, pending)
+        api_response = await llm._make_api_call(
+            prompt=request_prompt,
+            model=model,
+            max_tokens=ENRICHMENT_MAX_TOKENS,
+            temperature=0.3
+        )
+        await llm._track_call(
+            ENRICHMENT_OPERATION,
+            model,
+            input_tokens=api_response["input_tokens"],
+            output_tokens=api_response["output_tokens"],
+        )
+
+        data = _parse_response(api_response["content"])
+        errors = validate_enrichment_json(data, article, pending)
+        for group in pending:
+            if group not in errors:
+                result.update({field: data.get(field) for field in FIELD_GROUPS[group]})
+
+        if not errors:
+            pending = []
+            break
+        logger.info(
+            f"Enrichment for {article.get('_id', 'article')} invalid groups "
+            f"{sorted(errors)} (attempt {attempt + 1}/{max_repairs + 1}): {errors}"
+        )
+        pending = [group for group in pending if group in errors]
+
+    if "scores" in pending or "entities" in pending:
+        logger.warning(f"Combined enrichment failed for {article.get('_id', 'article')}: missing {pending}")
+        return None
+
+    if "narrative" not in pending:
+        result["narrative_hash"] = narrative_content_hash(article)
+
+    # Only complete results are cached, so a cache hit never lacks fields.
+    # Stored under the full first-attempt prompt that enrich_article looks up.
+    if use_cache and not pending:
+        await llm.cache.set(prompt, model, result)
+
+    return result
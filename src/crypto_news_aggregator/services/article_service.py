@@ -19,11 +19,16 @@ from ..models.article import (
 from ..models.sentiment import SentimentAnalysis
 from ..db.mongodb import PyObjectId
 from ..db.mongodb import mongo_manager, COLLECTION_ARTICLES
+from .near_duplicates import article_signature
 from ..core.config import get_settings
 from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
 # from ..core.sentiment_analyzer import SentimentAnalyzer  # DISABLED: Causes Railway deployment crash
 
 logger = logging.getLogger(__name__)
+
+# Near-duplicates stay stored (with duplicate_of) but are hidden from readers,
+# who see their canonical article instead
+NOT_DUPLICATE = {"is_duplicate": {"$ne": True}}
 # settings = get_settings()  # Removed top-level settings; use lazy initialization in methods as needed.
 
 
@@ -169,6 +174,8 @@ class ArticleService:
 
         # Add fingerprint and timestamps
         article_data["fingerprint"] = fingerprint
+        # Near-duplicate signature, checked before enrichment (see services.near_duplicates)
+        article_data["minhash"] = article_signature(article_data)
         article_data["created_at"] = datetime.now(timezone.utc)
         article_data["updated_at"] = datetime.now(timezone.utc)
 
@@ -188,9 +195,9 @@ class ArticleService:
         result = await collection.insert_one(article_data)
 
         if result.inserted_id:
-            # Return the created article
-            created = await collection.find_one({"_id": result.inserted_id})
-            return ArticleInDB(**created)
+            # Build the result from what was written instead of re-reading it
+            article_data["_id"] = result.inserted_id
+            return ArticleInDB(**article_data)
 
         return None
 
@@ -263,7 +270,7 @@ class ArticleService:
         Returns:
             Tuple of (list of articles, total count)
         """
-        query = {}
+        query = {**NOT_DUPLICATE}
 
         # Apply filters
         if source_id:
@@ -335,7 +342,7 @@ class ArticleService:
         text_search = {"$text": {"$search": query, "$caseSensitive": False}}
 
         # Build the filter query
-        filter_query = {}
+        filter_query = {**NOT_DUPLICATE}
         if source_id:
             filter_query["source.id"] = source_id
 
@@ -347,11 +354,7 @@ class ArticleService:
                 filter_query["published_at"]["$lte"] = end_date
 
         # Combine text search with filters
-        query = {"$and": [text_search]}
-        if filter_query:
-            query["$and"].append(filter_query)
-        else:
-            query = text_search
+        query = {"$and": [text_search, filter_query]}
 
         collection = await self._get_collection()
 
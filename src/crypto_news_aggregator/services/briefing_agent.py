@@ -3,7 +3,7 @@ Briefing Agent Service for generating daily crypto briefings.
 
 This is the main orchestration service that:
 - Loads memory context (feedback, history, patterns)
-- Gathers current signals and narratives
+- Gathers current signals, narratives and price moves
 - Detects patterns in market data
 - Uses LLM to generate narrative briefings
 - Implements the self-refine pattern for quality
@@ -14,13 +14,15 @@ Architecture: Memory-Augmented ReAct + Self-Refine (single agent)
 import asyncio
 import json
 import logging
+import time
 import httpx
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Any, List, Optional
+from dataclasses import dataclass, field
 
 from crypto_news_aggregator.core.config import get_settings
 from crypto_news_aggregator.db.mongodb import mongo_manager
+from crypto_news_aggregator.llm.http_client import get_anthropic_http_client
 from crypto_news_aggregator.db.operations.briefing import (
     insert_briefing,
     insert_pattern,
@@ -38,17 +40,28 @@ from crypto_news_aggregator.services.pattern_detector import (
 from crypto_news_aggregator.services.market_event_detector import (
     get_market_event_detector,
 )
+from crypto_news_aggregator.services.price_history import price_history_service
+from crypto_news_aggregator.services.price_service import COIN_ID_TO_SYMBOL
 
 logger = logging.getLogger(__name__)
 
 # LLM Configuration
-ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
 DEFAULT_MODEL = "claude-sonnet-4-5-20250929"  # Sonnet 4.5 - best instruction following
 FALLBACK_MODELS = [
     "claude-3-5-haiku-20241022",  # Newer Haiku as fallback
     "claude-3-haiku-20240307",    # Old Haiku as last resort
 ]
 
+# Marks the end of a prompt prefix the API may cache and reuse across calls
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# How long a model that returned 403 is skipped before it is tried again
+UNAVAILABLE_MODEL_TTL_SECONDS = 30 * 60
+
+
+class BriefingInputError(Exception):
+    """A required briefing input is missing, so no briefing should be published."""
+
 
 @dataclass
 class BriefingInput:
@@ -60,6 +73,10 @@ class BriefingInput:
     patterns: PatternSummary
     memory: MemoryContext
     generated_at: datetime
+    timings: Dict[str, float] = field(default_factory=dict)  # ms per input source
+    failed_sources: List[str] = field(default_factory=list)  # sources that errored or timed out
+    llm_usage: Dict[str, Any] = field(default_factory=dict)  # token counts summed over the run's LLM calls
+    prices: List[Dict[str, Any]] = field(default_factory=list)  # 24h moves of tracked coins, largest first
 
 
 @dataclass
@@ -99,6 +116,8 @@ class BriefingAgent:
         self.memory_manager = get_memory_manager()
         self.pattern_detector = get_pattern_detector()
         self.cost_tracker = None  # Lazy initialization
+        # Models that returned 403 -> monotonic time until which they are skipped
+        self._unavailable_models: Dict[str, float] = {}
 
     async def _get_cost_tracker(self):
         """Get or initialize cost tracker."""
@@ -137,10 +156,13 @@ class BriefingAgent:
                 return None
 
         logger.info(f"Starting {briefing_type} briefing generation")
+        started = time.perf_counter()
 
         try:
             # Step 1: Gather inputs
             briefing_input = await self._gather_inputs(briefing_type, now)
+            if not briefing_input.narratives:
+                raise BriefingInputError("no active narratives")
 
             # Step 2: Generate initial briefing
             generated = await self._generate_with_llm(briefing_input)
@@ -149,16 +171,30 @@ class BriefingAgent:
             refined = await self._self_refine(generated, briefing_input, max_iterations=2)
 
             # Step 4: Save briefing to database
+            latency_ms = round((time.perf_counter() - started) * 1000, 1)
             briefing_doc = await self._save_briefing(
-                briefing_type, briefing_input, refined, is_smoke=is_smoke, task_id=task_id
+                briefing_type,
+                briefing_input,
+                refined,
+                is_smoke=is_smoke,
+                task_id=task_id,
+                latency_ms=latency_ms,
             )
 
             # Step 5: Save detected patterns
             await self._save_patterns(briefing_doc["_id"], briefing_input.patterns)
 
-            logger.info(f"Successfully generated {briefing_type} briefing")
+            usage = briefing_input.llm_usage
+            logger.info(
+                f"Successfully generated {briefing_type} briefing in {latency_ms / 1000:.1f}s "
+                f"({usage.get('calls', 0)} LLM calls, {usage.get('input_tokens', 0)} input tokens, "
+                f"{usage.get('cache_read_input_tokens', 0)} read from cache)"
+            )
             return briefing_doc
 
+        except BriefingInputError as e:
+            logger.warning(f"Skipping {briefing_type} briefing: {e}")
+            return None
         except Exception as e:
             logger.exception(f"Failed to generate {briefing_type} briefing: {e}")
             return None
@@ -166,45 +202,50 @@ class BriefingAgent:
     async def _gather_inputs(
         self, briefing_type: str, now: datetime
     ) -> BriefingInput:
-        """Gather all inputs needed for briefing generation."""
-        # Load memory context
-        memory = await self.memory_manager.load_memory(history_days=7)
+        """
+        Gather all inputs needed for briefing generation.
+
+        Memory, trending signals, price moves and narratives (after market
+        events are folded in) are loaded concurrently; patterns are detected once they
+        are all in. Each source has its own time budget. Narratives are
+        required: if they fail or time out, BriefingInputError is raised.
+        Any other source that fails or times out contributes an empty result
+        instead. Per-source timings end up in the briefing metadata.
+        """
+        timings: Dict[str, float] = {}
+        failed: List[str] = []
+
+        memory, signals, prices, narratives = await asyncio.gather(
+            self._gather_source(
+                "memory",
+                lambda: self.memory_manager.load_memory(history_days=7),
+                MemoryContext(feedback="", history=[], patterns=[], manual_inputs=[]),
+                timings,
+                failed,
+            ),
+            self._gather_source("signals", self._get_trending_signals, [], timings, failed),
+            self._gather_source("prices", self._get_price_moves, [], timings, failed),
+            self._get_narratives_with_market_events(timings, failed),
+        )
         logger.info(
             f"Loaded memory: {len(memory.history)} history items, "
             f"{len(memory.patterns)} patterns, {len(memory.manual_inputs)} manual inputs"
         )
-
-        # Get current signals
-        signals = await self._get_trending_signals()
         logger.info(f"Retrieved {len(signals)} trending signals")
-
-        # Get current narratives
-        narratives = await self._get_active_narratives()
+        logger.info(f"Retrieved 24h price moves for {len(prices)} coins")
         logger.info(f"Retrieved {len(narratives)} active narratives")
 
-        # Detect and include market shock events
-        detector = get_market_event_detector()
-        market_events = await detector.detect_market_events()
-
-        if market_events:
-            logger.info(f"Detected {len(market_events)} market shock events")
-
-            # Create/update narratives for each market event
-            for event in market_events:
-                await detector.create_or_update_market_event_narrative(event)
-
-            # Refresh narratives to include newly created market event narratives
-            narratives = await self._get_active_narratives()
-
-            # Boost market events in the narrative ranking
-            narratives = await detector.boost_market_event_in_briefing(narratives)
-            logger.info(f"Market events prioritized in narrative ranking")
-
         # Detect patterns
-        patterns = await self.pattern_detector.detect_all_patterns(
-            current_signals=signals,
-            current_narratives=narratives,
-            history=memory.history,
+        patterns = await self._gather_source(
+            "patterns",
+            lambda: self.pattern_detector.detect_all_patterns(
+                current_signals=signals,
+                current_narratives=narratives,
+                history=memory.history,
+            ),
+            PatternSummary(entity_surges=[], sentiment_shifts=[], expected_events=[], narrative_emergences=[]),
+            timings,
+            failed,
         )
         logger.info(
             f"Detected patterns: {len(patterns.entity_surges)} surges, "
@@ -212,6 +253,10 @@ class BriefingAgent:
             f"{len(patterns.expected_events)} expected events, "
             f"{len(patterns.narrative_emergences)} emergences"
         )
+        logger.info(
+            "Input timings (ms): "
+            + ", ".join(f"{source}={elapsed:.0f}" for source, elapsed in timings.items())
+        )
 
         return BriefingInput(
             briefing_type=briefing_type,
@@ -220,8 +265,68 @@ class BriefingAgent:
             patterns=patterns,
             memory=memory,
             generated_at=now,
+            timings=timings,
+            failed_sources=failed,
+            prices=prices,
         )
 
+    async def _gather_source(
+        self,
+        name: str,
+        load: Callable[[], Awaitable[Any]],
+        default: Any,
+        timings: Dict[str, float],
+        failed: List[str],
+        required: bool = False,
+    ) -> Any:
+        """
+        Run one input source under its time budget, falling back to ``default``.
+
+        A ``required`` source raises BriefingInputError instead of falling back.
+        """
+        timeout = get_settings().BRIEFING_SOURCE_TIMEOUT_SECONDS
+        started = time.perf_counter()
+        try:
+            return await asyncio.wait_for(load(), timeout=timeout)
+        except asyncio.TimeoutError as e:
+            logger.warning(f"Briefing input '{name}' timed out after {timeout:g}s")
+            failed.append(name)
+            if required:
+                raise BriefingInputError(f"'{name}' timed out") from e
+        except Exception as e:
+            logger.exception(f"Briefing input '{name}' failed: {e}")
+            failed.append(name)
+            if required:
+                raise BriefingInputError(f"'{name}' failed: {e}") from e
+        finally:
+            timings[name] = round((time.perf_counter() - started) * 1000, 1)
+        return default
+
+    async def _get_narratives_with_market_events(
+        self, timings: Dict[str, float], failed: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Active narratives, with market shock narratives created and boosted first."""
+        detector = get_market_event_detector()
+
+        async def detect() -> List[Dict[str, Any]]:
+            events = await detector.detect_market_events()
+            # Create/update narratives for each market event before narratives are read
+            for event in events:
+                await detector.create_or_update_market_event_narrative(event)
+            return events
+
+        market_events = await self._gather_source("market_events", detect, [], timings, failed)
+        narratives = await self._gather_source(
+            "narratives", self._get_active_narratives, [], timings, failed, required=True
+        )
+
+        if market_events:
+            logger.info(f"Detected {len(market_events)} market shock events")
+            # Boost market events in the narrative ranking
+            narratives = await detector.boost_market_event_in_briefing(narratives)
+            logger.info(f"Market events prioritized in narrative ranking")
+        return narratives
+
     async def _get_trending_signals(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Get top trending signals from the database."""
         db = await mongo_manager.get_async_database()
@@ -238,6 +343,21 @@ class BriefingAgent:
         signals = await cursor.to_list(length=limit)
         return signals
 
+    async def _get_price_moves(self, hours: int = 24) -> List[Dict[str, Any]]:
+        """Price moves of the tracked coins over ``hours``, read from the hourly price rollups."""
+        series = await price_history_service.get_series(list(COIN_ID_TO_SYMBOL), hours=hours, resolution="1h")
+        moves = []
+        for coin, closes in series["series"].items():
+            closes = [close for close in closes if close is not None]
+            if len(closes) < 2 or not closes[0]:
+                continue
+            moves.append({
+                "symbol": COIN_ID_TO_SYMBOL[coin],
+                "price": closes[-1],
+                "change_pct": (closes[-1] / closes[0] - 1) * 100,
+            })
+        return sorted(moves, key=lambda move: abs(move["change_pct"]), reverse=True)
+
     async def _get_active_narratives(self, limit: int = 15, max_age_days: int = 7) -> List[Dict[str, Any]]:
         """Get active narratives from the database with fresh recency calculation.
 
@@ -261,28 +381,29 @@ class BriefingAgent:
 
         narratives = await cursor.to_list(length=limit * 3)
 
-        # Calculate fresh recency for each narrative based on newest article
-        now = datetime.now(timezone.utc)
-        cutoff = now - timedelta(days=max_age_days)
-        fresh_narratives = []
-
-        for narrative in narratives:
-            article_ids = narrative.get("article_ids", [])
-            if not article_ids:
-                continue
-
-            # Get newest article date
-            object_ids = [ObjectId(aid) if isinstance(aid, str) else aid for aid in article_ids[:10]]
+        # Publish dates for the first 10 articles of every narrative, in one query
+        narrative_article_ids = [
+            [ObjectId(aid) if isinstance(aid, str) else aid for aid in narrative.get("article_ids", [])[:10]]
+            for narrative in narratives
+        ]
+        all_ids = list({aid for ids in narrative_article_ids for aid in ids})
+        published: Dict[Any, datetime] = {}
+        if all_ids:
             article_cursor = articles_collection.find(
-                {"_id": {"$in": object_ids}},
+                {"_id": {"$in": all_ids}},
                 {"published_at": 1}
             )
-            articles = await article_cursor.to_list(length=10)
+            async for article in article_cursor:
+                if article.get("published_at"):
+                    published[article["_id"]] = article["published_at"]
 
-            if not articles:
-                continue
+        # Calculate fresh recency for each narrative based on newest article
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=max_age_days)
+        fresh_narratives = []
 
-            dates = [a.get("published_at") for a in articles if a.get("published_at")]
+        for narrative, object_ids in zip(narratives, narrative_article_ids):
+            dates = [published[aid] for aid in object_ids if aid in published]
             if not dates:
                 continue
 
@@ -316,12 +437,12 @@ class BriefingAgent:
         self, briefing_input: BriefingInput
     ) -> GeneratedBriefing:
         """Generate briefing content using LLM."""
-        prompt = self._build_generation_prompt(briefing_input)
-
         response_text = await self._call_llm(
-            prompt,
+            self._build_generation_instructions(),
             system_prompt=self._get_system_prompt(briefing_input.briefing_type),
             max_tokens=4096,
+            context=self._build_context(briefing_input),
+            usage=briefing_input.llm_usage,
         )
 
         return self._parse_briefing_response(response_text)
@@ -351,15 +472,22 @@ class BriefingAgent:
             Refined briefing (may still have issues if max iterations hit)
         """
         current = generated
+        # Every pass shares the generation call's cached system prompt and context
+        system_prompt = self._get_system_prompt(briefing_input.briefing_type)
+        context = self._build_context(briefing_input)
+        single_call = get_settings().BRIEFING_SINGLE_CALL_REFINE
 
         for iteration in range(max_iterations):
-            # Build critique prompt
-            critique_prompt = self._build_critique_prompt(current, briefing_input)
+            # Build critique prompt (asking for the revision in the same call if enabled)
+            critique_prompt = self._build_critique_prompt(current, briefing_input, revise=single_call)
 
             critique_response = await self._call_llm(
                 critique_prompt,
-                system_prompt="You are a crypto market analyst reviewing a briefing for quality.",
-                max_tokens=1024,
+                system_prompt=system_prompt,
+                max_tokens=4096 if single_call else 1024,
+                context=context,
+                usage=briefing_input.llm_usage,
+                operation="briefing_refinement",
             )
 
             # Check if refinement is needed
@@ -374,6 +502,11 @@ class BriefingAgent:
             logger.info(f"Briefing needs refinement (iteration {iteration + 1}/{max_iterations})")
             logger.debug(f"Critique: {critique_response[:200]}...")
 
+            revised = self._extract_revised_briefing(critique_response) if single_call else None
+            if revised is not None:
+                current = revised
+                continue
+
             # Build refinement prompt
             refinement_prompt = self._build_refinement_prompt(
                 current, critique_response, briefing_input
@@ -381,8 +514,11 @@ class BriefingAgent:
 
             refined_response = await self._call_llm(
                 refinement_prompt,
-                system_prompt=self._get_system_prompt(briefing_input.briefing_type),
+                system_prompt=system_prompt,
                 max_tokens=4096,
+                context=context,
+                usage=briefing_input.llm_usage,
+                operation="briefing_refinement",
             )
 
             current = self._parse_briefing_response(refined_response)
@@ -499,6 +635,15 @@ Return valid JSON:
 
     def _build_generation_prompt(self, briefing_input: BriefingInput) -> str:
         """Build the main generation prompt."""
+        return self._build_context(briefing_input) + self._build_generation_instructions()
+
+    def _build_context(self, briefing_input: BriefingInput) -> str:
+        """
+        Build the briefing data (memory, signals, prices, narratives, patterns).
+
+        It is identical for every call of a run, so it is sent as a cached
+        prefix ahead of the per-call instructions.
+        """
         parts = []
 
         # Time context
@@ -519,6 +664,12 @@ Return valid JSON:
                 velocity = signal.get("metrics", {}).get("velocity_24h", 0)
                 parts.append(f"- {entity}: score={score:.1f}, velocity={velocity:.0f}%\n")
 
+        # Price moves
+        if briefing_input.prices:
+            parts.append("\n## Price Moves (24h)\n")
+            for move in briefing_input.prices[:6]:
+                parts.append(f"- {move['symbol']}: ${move['price']:,.2f} ({move['change_pct']:+.1f}%)\n")
+
         # Current narratives - include summaries for detail
         if briefing_input.narratives:
             # Build explicit list of allowed narratives
@@ -557,9 +708,14 @@ Return valid JSON:
                 content = inp.get("content", "")[:200]
                 parts.append(f"### {title}\n{content}...\n\n")
 
+        return "".join(parts)
+
+    def _build_generation_instructions(self) -> str:
+        """Build the instructions that follow the context in the generation call."""
+        parts = []
         parts.append("\n---\n")
         parts.append("Generate the briefing now. REMEMBER:\n")
-        parts.append("- ONLY use facts from the narratives and signals above\n")
+        parts.append("- ONLY use facts from the narratives, signals and price moves above\n")
         parts.append("- Include specific details from the narrative summaries\n")
         parts.append("- If a narrative lacks details, either skip it or acknowledge the limitation\n")
         parts.append("- No generic openings or closings\n")
@@ -569,9 +725,14 @@ Return valid JSON:
         return "".join(parts)
 
     def _build_critique_prompt(
-        self, generated: GeneratedBriefing, briefing_input: BriefingInput
+        self, generated: GeneratedBriefing, briefing_input: BriefingInput, revise: bool = False
     ) -> str:
-        """Build enhanced prompt for self-critique."""
+        """
+        Build enhanced prompt for self-critique.
+
+        With ``revise`` the model also returns the corrected briefing when it
+        finds issues, so critique and refinement take one call.
+        """
         # Build list of narrative titles for grounding check
         narrative_titles = [n.get("title", "") for n in briefing_input.narratives[:8]]
 
@@ -582,6 +743,25 @@ Return valid JSON:
             if entities:
                 narrative_entities.update(entities[:5])  # Top 5 entities per narrative
 
+        if revise:
+            respond = """Respond with:
+{
+    "needs_refinement": true/false,
+    "issues": ["issue1", "issue2"],
+    "suggestions": ["suggestion1", "suggestion2"],
+    "revised_briefing": null
+}
+
+If needs_refinement is true, set "revised_briefing" to the complete improved briefing
+(same JSON format as the original briefing) with every issue addressed."""
+        else:
+            respond = """Respond with:
+{
+    "needs_refinement": true/false,
+    "issues": ["issue1", "issue2"],
+    "suggestions": ["suggestion1", "suggestion2"]
+}"""
+
         return f"""Review this crypto briefing for quality issues:
 
 BRIEFING NARRATIVE:
@@ -612,22 +792,14 @@ Check for these issues:
 
 7. ABRUPT TRANSITIONS: Does it switch topics mid-paragraph without logical connection?
 
-Respond with:
-{{
-    "needs_refinement": true/false,
-    "issues": ["issue1", "issue2"],
-    "suggestions": ["suggestion1", "suggestion2"]
-}}"""
+{respond}"""
 
     def _check_needs_refinement(self, critique_response: str) -> bool:
         """Check if the critique indicates refinement is needed."""
         try:
             # Try to parse JSON response
-            import re
-            json_match = re.search(r"\{.*\}", critique_response, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group(0))
-                return data.get("needs_refinement", False)
+            data = self._load_response_json(critique_response)
+            return data.get("needs_refinement", False)
         except (json.JSONDecodeError, AttributeError):
             pass
 
@@ -636,6 +808,16 @@ Respond with:
         refinement_keywords = ["needs refinement", "should be improved", "issues found", "missing"]
         return any(kw in lower_response for kw in refinement_keywords)
 
+    def _extract_revised_briefing(self, critique_response: str) -> Optional[GeneratedBriefing]:
+        """The revised briefing from a combined critique response, if it has one."""
+        try:
+            revised = self._load_response_json(critique_response).get("revised_briefing")
+        except (json.JSONDecodeError, AttributeError):
+            return None
+        if not isinstance(revised, dict) or not revised.get("narrative"):
+            return None
+        return self._briefing_from_data(revised)
+
     def _build_refinement_prompt(
         self,
         generated: GeneratedBriefing,
@@ -702,52 +884,63 @@ Return ONLY valid JSON in the same format as before."""
 
         return matched_recommendations
 
+    def _load_response_json(self, response_text: str) -> Any:
+        """
+        Decode the JSON object in an LLM response.
+
+        Raises:
+            json.JSONDecodeError: If the response holds no valid JSON
+        """
+        # Try to extract JSON from response
+        import re
+        json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
+        if json_match:
+            json_str = json_match.group(0)
+        else:
+            json_str = response_text
+
+        # Clean up the JSON string - replace literal newlines in string values
+        # This handles cases where the LLM outputs multi-line strings
+        # Replace actual newlines with escaped newlines for valid JSON
+        cleaned_json = ""
+        in_string = False
+        escape_next = False
+        for char in json_str:
+            if escape_next:
+                cleaned_json += char
+                escape_next = False
+            elif char == '\\':
+                cleaned_json += char
+                escape_next = True
+            elif char == '"':
+                cleaned_json += char
+                in_string = not in_string
+            elif in_string and char == '\n':
+                cleaned_json += '\\n'
+            elif in_string and char == '\r':
+                cleaned_json += '\\r'
+            elif in_string and char == '\t':
+                cleaned_json += '\\t'
+            else:
+                cleaned_json += char
+
+        return json.loads(cleaned_json)
+
+    def _briefing_from_data(self, data: Dict[str, Any]) -> GeneratedBriefing:
+        """Build a GeneratedBriefing from decoded briefing JSON."""
+        return GeneratedBriefing(
+            narrative=data.get("narrative", ""),
+            key_insights=data.get("key_insights", []),
+            entities_mentioned=data.get("entities_mentioned", []),
+            detected_patterns=data.get("detected_patterns", []),
+            recommendations=data.get("recommendations", []),
+            confidence_score=data.get("confidence_score", 0.7),
+        )
+
     def _parse_briefing_response(self, response_text: str) -> GeneratedBriefing:
         """Parse LLM response into GeneratedBriefing."""
         try:
-            # Try to extract JSON from response
-            import re
-            json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(0)
-            else:
-                json_str = response_text
-
-            # Clean up the JSON string - replace literal newlines in string values
-            # This handles cases where the LLM outputs multi-line strings
-            # Replace actual newlines with escaped newlines for valid JSON
-            cleaned_json = ""
-            in_string = False
-            escape_next = False
-            for char in json_str:
-                if escape_next:
-                    cleaned_json += char
-                    escape_next = False
-                elif char == '\\':
-                    cleaned_json += char
-                    escape_next = True
-                elif char == '"':
-                    cleaned_json += char
-                    in_string = not in_string
-                elif in_string and char == '\n':
-                    cleaned_json += '\\n'
-                elif in_string and char == '\r':
-                    cleaned_json += '\\r'
-                elif in_string and char == '\t':
-                    cleaned_json += '\\t'
-                else:
-                    cleaned_json += char
-
-            data = json.loads(cleaned_json)
-
-            return GeneratedBriefing(
-                narrative=data.get("narrative", ""),
-                key_insights=data.get("key_insights", []),
-                entities_mentioned=data.get("entities_mentioned", []),
-                detected_patterns=data.get("detected_patterns", []),
-                recommendations=data.get("recommendations", []),
-                confidence_score=data.get("confidence_score", 0.7),
-            )
+            return self._briefing_from_data(self._load_response_json(response_text))
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM response: {e}")
@@ -768,62 +961,106 @@ Return ONLY valid JSON in the same format as before."""
         prompt: str,
         system_prompt: str,
         max_tokens: int = 2048,
+        context: Optional[str] = None,
+        usage: Optional[Dict[str, Any]] = None,
+        operation: str = "briefing_generation",
     ) -> str:
-        """Call the LLM API with fallback models."""
-        models_to_try = [DEFAULT_MODEL] + FALLBACK_MODELS
+        """
+        Call the LLM API with fallback models.
+
+        Requests go through the shared pooled Anthropic client. The system
+        prompt and ``context`` are marked as cacheable prefixes, so calls
+        that repeat them (generation, then each refinement pass) only pay
+        full price for ``prompt``.
+
+        Args:
+            prompt: Per-call instructions, sent after the context
+            system_prompt: System prompt
+            max_tokens: Output token limit
+            context: Briefing data shared by every call of a run
+            usage: Dict the call's token counts are added to
+            operation: Operation name for cost tracking
+        """
+        caching = get_settings().BRIEFING_PROMPT_CACHING
+        system: Any = system_prompt
+        content: Any = prompt
+        if caching:
+            system = [{"type": "text", "text": system_prompt, "cache_control": CACHE_CONTROL}]
+        if context:
+            context_block: Dict[str, Any] = {"type": "text", "text": context}
+            if caching:
+                context_block["cache_control"] = CACHE_CONTROL
+            content = [context_block, {"type": "text", "text": prompt}]
+
+        now = time.monotonic()
+        models = [DEFAULT_MODEL] + FALLBACK_MODELS
+        models_to_try = [
+            model for model in models
+            if self._unavailable_models.get(model, 0.0) <= now
+        ]
+        if not models_to_try:
+            # Every model was refused recently; a 403 can be transient, so try them all again
+            models_to_try = models
 
         for model in models_to_try:
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        ANTHROPIC_API_URL,
-                        headers={
-                            "x-api-key": self.api_key,
-                            "anthropic-version": "2023-06-01",
-                            "content-type": "application/json",
-                        },
-                        json={
-                            "model": model,
-                            "max_tokens": max_tokens,
-                            "system": system_prompt,
-                            "messages": [{"role": "user", "content": prompt}],
-                        },
-                        timeout=120,
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-
-                    if model != DEFAULT_MODEL:
-                        logger.info(f"Using fallback model: {model}")
-
-                    # Extract response text
-                    text = data.get("content", [{}])[0].get("text", "")
-
-                    # Track cost (async, non-blocking)
-                    try:
-                        usage = data.get("usage", {})
-                        input_tokens = usage.get("input_tokens", 0)
-                        output_tokens = usage.get("output_tokens", 0)
-
-                        if input_tokens > 0 or output_tokens > 0:
-                            tracker = await self._get_cost_tracker()
-                            asyncio.create_task(
-                                tracker.track_call(
-                                    operation="briefing_generation",
-                                    model=model,
-                                    input_tokens=input_tokens,
-                                    output_tokens=output_tokens,
-                                    cached=False
-                                )
+                data = await get_anthropic_http_client().create_message(
+                    self.api_key,
+                    {
+                        "model": model,
+                        "max_tokens": max_tokens,
+                        "system": system,
+                        "messages": [{"role": "user", "content": content}],
+                    },
+                    timeout=120,
+                )
+
+                if model != DEFAULT_MODEL:
+                    logger.info(f"Using fallback model: {model}")
+
+                # Extract response text
+                text = data.get("content", [{}])[0].get("text", "")
+
+                call_usage = data.get("usage", {})
+                input_tokens = call_usage.get("input_tokens", 0)
+                output_tokens = call_usage.get("output_tokens", 0)
+                cache_read = call_usage.get("cache_read_input_tokens") or 0
+                cache_write = call_usage.get("cache_creation_input_tokens") or 0
+                if usage is not None:
+                    usage["calls"] = usage.get("calls", 0) + 1
+                    usage["model"] = model
+                    for key, value in (
+                        ("input_tokens", input_tokens),
+                        ("output_tokens", output_tokens),
+                        ("cache_read_input_tokens", cache_read),
+                        ("cache_creation_input_tokens", cache_write),
+                    ):
+                        usage[key] = usage.get(key, 0) + value
+
+                # Track cost (async, non-blocking)
+                try:
+                    # Cache writes bill at 1.25x and reads at 0.1x of regular input tokens
+                    billed_input = input_tokens + round(cache_write * 1.25) + round(cache_read * 0.1)
+                    if billed_input > 0 or output_tokens > 0:
+                        tracker = await self._get_cost_tracker()
+                        asyncio.create_task(
+                            tracker.track_call(
+                                operation=operation,
+                                model=model,
+                                input_tokens=billed_input,
+                                output_tokens=output_tokens,
+                                cached=False
                             )
-                    except Exception as e:
-                        logger.error(f"Cost tracking failed: {e}")
+                        )
+                except Exception as e:
+                    logger.error(f"Cost tracking failed: {e}")
 
-                    return text
+                return text
 
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 403:
                     logger.warning(f"403 Forbidden for model {model}, trying fallback...")
+                    self._unavailable_models[model] = time.monotonic() + UNAVAILABLE_MODEL_TTL_SECONDS
                     continue
                 logger.error(f"LLM API error: {e.response.status_code}")
                 raise
@@ -840,6 +1077,7 @@ Return ONLY valid JSON in the same format as before."""
         generated: GeneratedBriefing,
         is_smoke: bool = False,
         task_id: str | None = None,
+        latency_ms: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Save the generated briefing to the database."""
         from bson import ObjectId
@@ -876,11 +1114,16 @@ Return ONLY valid JSON in the same format as before."""
             "metadata": {
                 "confidence_score": generated.confidence_score,
                 "signal_count": len(briefing_input.signals),
+                "price_count": len(briefing_input.prices),
                 "narrative_count": len(briefing_input.narratives),
                 "pattern_count": len(briefing_input.patterns.all_patterns()),
                 "manual_input_count": len(briefing_input.memory.manual_inputs),
-                "model": DEFAULT_MODEL,
+                "model": briefing_input.llm_usage.get("model", DEFAULT_MODEL),
                 "refinement_iterations": iteration_count,  # NEW: Track iterations
+                "input_timings_ms": briefing_input.timings,
+                "failed_inputs": briefing_input.failed_sources,
+                "latency_ms": latency_ms,
+                "llm_usage": briefing_input.llm_usage,
             },
             "is_smoke": is_smoke,
             "published": not is_smoke,  # Don't publish smoke tests
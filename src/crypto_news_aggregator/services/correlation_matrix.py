@@ -0,0 +1,191 @@
+"""
+Vectorized correlation over aligned price series.
+
+Prices for all symbols are laid out as one (time x symbol) matrix with NaN
+for missing buckets and turned into log returns. Correlations use
+pairwise-complete observations (each pair only over the buckets where both
+symbols have a return), computed for every pair at once from a handful of
+matrix products:
+
+    n   = M_a' M_b               common observations per pair
+    sa  = X_a' M_b, sb = M_a' X_b
+    saa = (X_a^2)' M_b, sbb = M_a' (X_b^2)
+    sab = X_a' X_b
+
+where X holds the returns with NaN replaced by 0 and M is the validity mask.
+The same routine gives lagged correlations (A = returns[:-lag],
+B = returns[lag:]); rolling correlations against one base symbol use
+cumulative sums over time.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Pairs with fewer common returns than this get no correlation
+DEFAULT_MIN_PERIODS = 5
+
+
+def log_returns(prices: np.ndarray) -> np.ndarray:
+    """Log returns between consecutive rows (NaN where either price is missing or non-positive)."""
+    prices = np.asarray(prices, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        logs = np.log(np.where(prices > 0, prices, np.nan))
+    return np.diff(logs, axis=0)
+
+
+def _pairwise_correlation(
+    a: np.ndarray, b: np.ndarray, min_periods: int = DEFAULT_MIN_PERIODS
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Correlation of every column of ``a`` with every column of ``b`` over the
+    rows where both are present.
+
+    Returns:
+        (correlations, counts), both shaped (a columns, b columns)
+    """
+    mask_a, mask_b = ~np.isnan(a), ~np.isnan(b)
+    x_a, x_b = np.where(mask_a, a, 0.0), np.where(mask_b, b, 0.0)
+    m_a, m_b = mask_a.astype(float), mask_b.astype(float)
+
+    n = m_a.T @ m_b
+    sum_a, sum_b = x_a.T @ m_b, m_a.T @ x_b
+    sum_aa, sum_bb = (x_a * x_a).T @ m_b, m_a.T @ (x_b * x_b)
+    sum_ab = x_a.T @ x_b
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sum_ab - sum_a * sum_b / n
+        var_a = sum_aa - sum_a * sum_a / n
+        var_b = sum_bb - sum_b * sum_b / n
+        corr = cov / np.sqrt(var_a * var_b)
+    corr[(n < min_periods) | ~np.isfinite(corr)] = np.nan
+    return np.clip(corr, -1.0, 1.0), n.astype(int)
+
+
+def correlation_matrix(
+    returns: np.ndarray, min_periods: int = DEFAULT_MIN_PERIODS
+) -> Tuple[np.ndarray, np.ndarray]:
+    """All-pairs correlation of the return columns; returns (correlations, counts)."""
+    corr, counts = _pairwise_correlation(returns, returns, min_periods)
+    # Every series with enough returns is perfectly correlated with itself
+    diagonal = np.diag(counts) >= min_periods
+    np.fill_diagonal(corr, np.where(diagonal, 1.0, np.nan))
+    return corr, counts
+
+
+def lagged_correlation_matrix(
+    returns: np.ndarray, lag: int, min_periods: int = DEFAULT_MIN_PERIODS
+) -> np.ndarray:
+    """
+    Correlation of column i at t with column j at t + ``lag``.
+
+    Entry [i, j] with lag > 0 measures how well i's moves lead j's.
+    """
+    if lag == 0:
+        return correlation_matrix(returns, min_periods)[0]
+    if lag < 0:
+        return lagged_correlation_matrix(returns, -lag, min_periods).T
+    if lag >= len(returns):
+        return np.full((returns.shape[1], returns.shape[1]), np.nan)
+    return _pairwise_correlation(returns[:-lag], returns[lag:], min_periods)[0]
+
+
+def rolling_correlation(
+    returns: np.ndarray, base: int, window: int, min_periods: Optional[int] = None
+) -> np.ndarray:
+    """
+    Rolling correlation of every column with column ``base``.
+
+    Returns:
+        Array shaped like ``returns``; row t covers returns (t - window, t]
+        and is NaN until a window holds ``min_periods`` common returns
+    """
+    min_periods = min_periods or min(window, DEFAULT_MIN_PERIODS)
+    mask = ~np.isnan(returns) & ~np.isnan(returns[:, [base]])
+    x = np.where(mask, returns, 0.0)
+    y = np.where(mask, returns[:, [base]], 0.0)
+    m = mask.astype(float)
+
+    def windowed(values: np.ndarray) -> np.ndarray:
+        totals = np.cumsum(np.vstack([np.zeros((1, values.shape[1])), values]), axis=0)
+        return totals[1:] - totals[np.maximum(np.arange(1, len(values) + 1) - window, 0)]
+
+    n, sx, sy = windowed(m), windowed(x), windowed(y)
+    sxx, syy, sxy = windowed(x * x), windowed(y * y), windowed(x * y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sxy - sx * sy / n
+        corr = cov / np.sqrt((sxx - sx * sx / n) * (syy - sy * sy / n))
+    corr[(n < min_periods) | ~np.isfinite(corr)] = np.nan
+    return np.clip(corr, -1.0, 1.0)
+
+
+def _value(number: float) -> Optional[float]:
+    return None if np.isnan(number) else float(number)
+
+
+@dataclass
+class CorrelationMatrix:
+    """Aligned returns for a set of symbols and their all-pairs correlations."""
+
+    symbols: List[str]
+    timestamps: List[datetime]
+    returns: np.ndarray
+    min_periods: int = DEFAULT_MIN_PERIODS
+    correlations: np.ndarray = field(init=False)
+    counts: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        self._positions: Dict[str, int] = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.correlations, self.counts = correlation_matrix(self.returns, self.min_periods)
+
+    @classmethod
+    def from_prices(
+        cls,
+        symbols: Sequence[str],
+        timestamps: Sequence[datetime],
+        prices: np.ndarray,
+        min_periods: int = DEFAULT_MIN_PERIODS,
+    ) -> "CorrelationMatrix":
+        """Build from a (time x symbol) price matrix with NaN for gaps."""
+        return cls(list(symbols), list(timestamps)[1:], log_returns(prices), min_periods)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._positions
+
+    def pair(self, a: str, b: str) -> Optional[float]:
+        """Correlation of two symbols, or None without enough common data."""
+        if a not in self._positions or b not in self._positions:
+            return None
+        return _value(self.correlations[self._positions[a], self._positions[b]])
+
+    def row(self, symbol: str, targets: Optional[Sequence[str]] = None) -> Dict[str, Optional[float]]:
+        """Correlations of ``symbol`` with ``targets`` (default: every other symbol)."""
+        targets = targets if targets is not None else [s for s in self.symbols if s != symbol]
+        return {target: self.pair(symbol, target) for target in targets}
+
+    def top_k(self, symbol: str, k: int = 5, absolute: bool = False) -> List[Tuple[str, float]]:
+        """The ``k`` symbols most correlated with ``symbol`` (by |r| with ``absolute``)."""
+        if symbol not in self._positions:
+            return []
+        position = self._positions[symbol]
+        row = self.correlations[position].copy()
+        row[position] = np.nan
+        keys = np.abs(row) if absolute else row
+        keys = np.where(np.isnan(keys), -np.inf, keys)
+        order = np.argsort(-keys, kind="stable")[:k]
+        return [(self.symbols[i], float(row[i])) for i in order if not np.isnan(row[i])]
+
+    def lagged(self, lag: int) -> np.ndarray:
+        """Lagged correlation matrix (see ``lagged_correlation_matrix``)."""
+        return lagged_correlation_matrix(self.returns, lag, self.min_periods)
+
+    def rolling(self, symbol: str, window: int) -> Dict[str, List[Optional[float]]]:
+        """Rolling correlation of every symbol with ``symbol`` over ``window`` returns."""
+        values = rolling_correlation(self.returns, self._positions[symbol], window)
+        return {
+            other: [_value(v) for v in values[:, i]]
+            for i, other in enumerate(self.symbols)
+            if other != symbol
+        }
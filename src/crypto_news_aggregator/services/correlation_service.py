@@ -1,17 +1,30 @@
 """
 Service for calculating price correlations between cryptocurrencies.
+
+Correlations come from one aligned returns matrix over all tracked coins
+(plus any coins a request asks about), built from the daily price rollups
+and cached for a few minutes. Coins without enough local history are
+filled in from CoinGecko's daily market chart.
 """
 
 import logging
-from typing import Optional, Dict, List, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, List, Sequence, Tuple
 from functools import lru_cache
 import numpy as np
 import asyncio
 
-from .price_service import get_price_service
+from ..core.response_cache import ResponseCache
+from ..db.operations.price_series import align_rollups
+from .correlation_matrix import DEFAULT_MIN_PERIODS, CorrelationMatrix
+from .price_history import price_history_service
+from .price_service import COIN_ID_TO_SYMBOL, get_price_service
 
 logger = logging.getLogger(__name__)
 
+# Matrices are rebuilt at most every 5 minutes (daily closes barely move in between)
+matrix_cache = ResponseCache("correlation", ttl_seconds=300, stale_ttl_seconds=300, max_entries=16)
+
 
 class CorrelationService:
     """Service to calculate price correlations."""
@@ -19,11 +32,65 @@ class CorrelationService:
     def __init__(self):
         self.price_service = get_price_service()
 
+    async def _daily_prices(self, coin_ids: List[str], days: int) -> Tuple[List[datetime], np.ndarray]:
+        """Daily closes for ``coin_ids`` on one date grid, as a (day x coin) matrix."""
+        try:
+            history = await price_history_service.get_series(coin_ids, hours=days * 24, resolution="1d")
+        except Exception as e:
+            # Without the rollups every coin comes from CoinGecko
+            logger.warning(f"Could not read price rollups: {e}")
+            end = datetime.now(timezone.utc)
+            history = align_rollups([], coin_ids, end - timedelta(days=days), end, "1d")
+        timestamps = history["timestamps"]
+        prices = np.array(
+            [[np.nan if p is None else p for p in history["series"][coin_id]] for coin_id in coin_ids],
+            dtype=float,
+        ).T
+
+        # Fill coins the rollups don't cover yet from CoinGecko
+        missing = [
+            i for i, coin_id in enumerate(coin_ids)
+            if np.count_nonzero(~np.isnan(prices[:, i])) <= DEFAULT_MIN_PERIODS
+        ]
+        if missing:
+            fetched = await asyncio.gather(
+                *(self.price_service.get_historical_prices(coin_ids[i], days) for i in missing)
+            )
+            positions = {timestamp.date(): row for row, timestamp in enumerate(timestamps)}
+            for i, data in zip(missing, fetched):
+                if not data:
+                    logger.warning(f"Could not retrieve historical data for {coin_ids[i]}.")
+                    continue
+                for timestamp, price in data.get("prices", []):
+                    row = positions.get(timestamp.date())
+                    if row is not None:
+                        prices[row, i] = price
+        return timestamps, prices
+
+    async def get_matrix(self, coin_ids: Optional[Sequence[str]] = None, days: int = 90) -> CorrelationMatrix:
+        """
+        Correlation matrix over daily returns for the tracked coins plus ``coin_ids``.
+
+        Args:
+            coin_ids: Extra CoinGecko IDs to include
+            days: The number of days of history to use
+
+        Returns:
+            CorrelationMatrix (cached per coin set and window)
+        """
+        symbols = sorted(set(COIN_ID_TO_SYMBOL) | set(coin_ids or ()))
+
+        async def build() -> CorrelationMatrix:
+            timestamps, prices = await self._daily_prices(symbols, days)
+            return CorrelationMatrix.from_prices(symbols, timestamps, prices)
+
+        return await matrix_cache.get_or_compute(f"{days}d:{','.join(symbols)}", build)
+
     async def calculate_correlation(
         self, base_coin_id: str, target_coin_ids: List[str], days: int = 90
     ) -> Dict[str, Optional[float]]:
         """
-        Calculate the Pearson correlation between a base coin and a list of target coins.
+        Calculate the Pearson correlation of daily returns between a base coin and a list of target coins.
 
         Args:
             base_coin_id: The CoinGecko ID of the base coin (e.g., 'bitcoin').
@@ -33,66 +100,19 @@ class CorrelationService:
         Returns:
             A dictionary mapping each target coin ID to its correlation coefficient with the base coin.
         """
-        # Fetch all required historical data concurrently
-        all_coin_ids = [base_coin_id] + target_coin_ids
-        price_tasks = [
-            self.price_service.get_historical_prices(coin_id, days)
-            for coin_id in all_coin_ids
-        ]
-        all_price_data = await asyncio.gather(*price_tasks)
-
-        historical_prices = {
-            coin_id: data for coin_id, data in zip(all_coin_ids, all_price_data)
-        }
-
-        base_prices_raw = historical_prices.get(base_coin_id)
-        if not base_prices_raw:
-            logger.warning(
-                f"Could not retrieve historical data for base coin {base_coin_id}."
-            )
+        try:
+            matrix = await self.get_matrix([base_coin_id, *target_coin_ids], days)
+        except Exception as e:
+            logger.error(f"Could not build correlation matrix for {base_coin_id}: {e}")
             return {target_id: None for target_id in target_coin_ids}
-
-        # Create a dictionary of dates to prices for the base coin for easy lookup
-        base_price_map = {ts.date(): price for ts, price in base_prices_raw}
-
-        correlations = {}
-        for target_id in target_coin_ids:
-            target_prices_raw = historical_prices.get(target_id)
-            if not target_prices_raw:
-                correlations[target_id] = None
-                continue
-
-            # Align data by date
-            aligned_base_prices = []
-            aligned_target_prices = []
-
-            for ts, price in target_prices_raw:
-                if ts.date() in base_price_map:
-                    aligned_base_prices.append(base_price_map[ts.date()])
-                    aligned_target_prices.append(price)
-
-            # Ensure we have enough overlapping data points to calculate correlation
-            if len(aligned_base_prices) < 2:
-                correlations[target_id] = None
-                continue
-
-            # Calculate Pearson correlation
-            try:
-                correlation_matrix = np.corrcoef(
-                    aligned_base_prices, aligned_target_prices
-                )
-                # The correlation coefficient is at [0, 1] (or [1, 0]) in the matrix
-                correlation = correlation_matrix[0, 1]
-                correlations[target_id] = (
-                    correlation if np.isfinite(correlation) else None
-                )
-            except Exception as e:
-                logger.error(
-                    f"Could not calculate correlation between {base_coin_id} and {target_id}: {e}"
-                )
-                correlations[target_id] = None
-
-        return correlations
+        return matrix.row(base_coin_id, target_coin_ids)
+
+    async def top_correlated(
+        self, coin_id: str, k: int = 5, days: int = 90, absolute: bool = False
+    ) -> List[Tuple[str, float]]:
+        """The ``k`` coins whose daily returns are most correlated with ``coin_id``."""
+        matrix = await self.get_matrix([coin_id], days)
+        return matrix.top_k(coin_id, k, absolute=absolute)
 
 
 # Factory function for dependency injection
@@ -0,0 +1,122 @@
+"""
+Single-pass multi-pattern entity matching.
+
+``EntityMatcher`` compiles a canonical-name -> variants mapping into a trie
+over word tokens. Matching tokenizes the text once and walks the trie from
+each token, so the cost per article depends on the text length (and the
+longest variant, a few tokens) rather than on how many entities are tracked.
+
+Matching is case-insensitive and respects word boundaries the same way
+``\\b(variant)\\b`` would: "btc" matches in "$BTC" and "BTC," but not in
+"btc2". Overlapping variants resolve to the longest match starting at the
+leftmost position ("Shiba Inu" wins over a variant "inu").
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional
+
+# Word tokens with an optional ticker "$" prefix
+_TOKEN_RE = re.compile(r"\$?\w+")
+
+# Key under which a trie node stores the canonical name of the variant ending there
+_END = ""
+
+
+@dataclass(frozen=True)
+class EntityMatch:
+    """One entity mention: its canonical name and character span in the text."""
+
+    canonical: str
+    start: int
+    end: int
+    text: str
+
+
+class EntityMatcher:
+    """Trie-based matcher for a fixed entity dictionary."""
+
+    def __init__(self, mapping: Mapping[str, Iterable[str]]):
+        """
+        Args:
+            mapping: Canonical name -> variants (canonical names are matched too)
+        """
+        self._root: Dict[str, dict] = {}
+        self._size = 0
+        for canonical, variants in mapping.items():
+            for variant in (canonical, *variants):
+                self._add(variant, canonical)
+
+    def __len__(self) -> int:
+        """Number of distinct variants in the dictionary."""
+        return self._size
+
+    def _add(self, variant: str, canonical: str) -> None:
+        tokens = _TOKEN_RE.findall(variant.lower())
+        if not tokens:
+            return
+        node = self._root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        if _END not in node:
+            self._size += 1
+            # First mapping wins, like a dict lookup built in the same order
+            node[_END] = canonical
+
+    def _child(self, node: dict, token: str) -> Optional[dict]:
+        child = node.get(token)
+        if child is None and token.startswith("$"):
+            # "$btc" also matches the plain variant "btc"
+            child = node.get(token[1:])
+        return child
+
+    def find_all(self, text: str) -> List[EntityMatch]:
+        """
+        All non-overlapping entity mentions in ``text``, in order of position.
+        """
+        if not text:
+            return []
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # A few characters lowercase to several; keep offsets aligned with ``text``
+            lowered = "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+        tokens = list(_TOKEN_RE.finditer(lowered))
+        matches: List[EntityMatch] = []
+        i = 0
+        while i < len(tokens):
+            node = self._root
+            best_end = None
+            best_canonical = None
+            j = i
+            while j < len(tokens):
+                # Multi-token variants only continue across whitespace
+                if j > i and not text[tokens[j - 1].end():tokens[j].start()].isspace():
+                    break
+                node = self._child(node, tokens[j].group())
+                if node is None:
+                    break
+                if _END in node:
+                    best_end, best_canonical = j, node[_END]
+                j += 1
+            if best_canonical is None:
+                i += 1
+                continue
+            start, end = tokens[i].start(), tokens[best_end].end()
+            matches.append(EntityMatch(best_canonical, start, end, text[start:end]))
+            i = best_end + 1
+        return matches
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """Mentions per canonical entity, ordered by first mention."""
+        counts: Dict[str, int] = {}
+        for match in self.find_all(text):
+            counts[match.canonical] = counts.get(match.canonical, 0) + 1
+        return counts
+
+    def lookup(self, name: str) -> Optional[str]:
+        """Canonical name if the whole of ``name`` is a known variant."""
+        name = (name or "").strip()
+        matches = self.find_all(name)
+        if len(matches) == 1 and matches[0].start == 0 and matches[0].end == len(name):
+            return matches[0].canonical
+        return None
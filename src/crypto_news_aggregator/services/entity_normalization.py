@@ -8,7 +8,9 @@ This service ensures consistent entity naming across the system by:
 """
 
 import logging
-from typing import Optional
+from typing import Dict, List, Optional
+
+from .entity_matcher import EntityMatch, EntityMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +76,10 @@ for canonical, variants in ENTITY_MAPPING.items():
         _VARIANT_TO_CANONICAL[variant] = canonical
         _VARIANT_TO_CANONICAL[variant.lower()] = canonical
 
+# Finds every variant in free text in one pass. Matching is case-insensitive,
+# so this covers the same variants as _VARIANT_TO_CANONICAL.
+_ENTITY_MATCHER = EntityMatcher(ENTITY_MAPPING)
+
 
 def normalize_entity_name(entity_name: str) -> str:
     """
@@ -112,11 +118,41 @@ def normalize_entity_name(entity_name: str) -> str:
         logger.debug(f"Normalized '{entity_name}' -> '{canonical}' (case-insensitive)")
         return canonical
     
+    # Tolerate extra whitespace and "$" prefixes on names (e.g. "Shiba  Inu", "$Sui")
+    canonical = _ENTITY_MATCHER.lookup(entity_name)
+    if canonical is not None:
+        logger.debug(f"Normalized '{entity_name}' -> '{canonical}' (matcher)")
+        return canonical
+
     # Return original if no mapping found
     logger.debug(f"No normalization mapping found for '{entity_name}'")
     return entity_name
 
 
+def find_entities(text: str) -> List[EntityMatch]:
+    """
+    Find every known entity mentioned in free text.
+
+    Args:
+        text: Text to scan (e.g. an article title and body)
+
+    Returns:
+        Non-overlapping matches with canonical names and character offsets,
+        in order of position
+    """
+    return _ENTITY_MATCHER.find_all(text)
+
+
+def count_entities(text: str) -> Dict[str, int]:
+    """
+    Count mentions of each known entity in free text.
+
+    Returns:
+        Dict of canonical name -> mention count, ordered by first mention
+    """
+    return _ENTITY_MATCHER.counts(text)
+
+
 def get_canonical_names() -> list[str]:
     """
     Returns list of all canonical entity names.
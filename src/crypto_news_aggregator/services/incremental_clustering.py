@@ -0,0 +1,181 @@
+"""
+Salience clustering state carried across narrative detection cycles.
+
+A full detection pass re-clusters every article in the window, although
+between two cycles almost all of them are unchanged. ``ClusterState`` keeps
+the SalienceClusterIndex from the previous cycle together with a stable key
+per cluster, the article -> cluster assignments and a watermark, so that a
+cycle only has to:
+
+- expire articles that have left the window (recomputing the aggregates
+  of only the clusters they leave),
+- assign the articles that are new since the watermark, and
+- re-save the narratives of the clusters that gained or lost articles.
+
+Members are kept as small feature documents (the fields clustering reads)
+rather than whole articles. The state is held in process and persisted
+through db.operations.narrative_cluster_state, so a restarted worker
+resumes from the stored state.
+
+Incremental assignment drifts from a full pass over time (an article never
+moves to a cluster created after it), so the state is rebuilt from a full
+pass every NARRATIVE_FULL_REBUILD_HOURS.
+"""
+
+import heapq
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .narrative_themes import SalienceClusterIndex
+
+# Article fields salience clustering reads, plus published_at for expiry
+CLUSTER_FIELDS = ('nucleus_entity', 'actors', 'actor_salience', 'tensions', 'published_at')
+
+
+def _aware(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def can_cluster(article: Dict[str, Any]) -> bool:
+    """Whether an article has the nucleus and actors clustering needs."""
+    return bool(article.get('nucleus_entity') and article.get('actors'))
+
+
+class ClusterState:
+    """Salience clusters over the detection window, updated one article at a time."""
+
+    def __init__(
+        self,
+        window_hours: int,
+        built_at: Optional[datetime] = None,
+        watermark: Optional[datetime] = None,
+    ):
+        self.window_hours = window_hours
+        self.built_at = _aware(built_at) or datetime.now(timezone.utc)
+        self.watermark = _aware(watermark)
+        self.index = SalienceClusterIndex()
+        self.keys: List[str] = []  # cluster id -> stable cluster key
+        self._positions: Dict[str, int] = {}  # cluster key -> cluster id
+        self._members: Dict[str, Dict[str, Any]] = {}  # article id -> member doc
+        self._expiry: List[Tuple[datetime, int, str]] = []  # heap of (published_at, seq, article id)
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, article_id: Any) -> bool:
+        return str(article_id) in self._members
+
+    @classmethod
+    def from_members(
+        cls,
+        window_hours: int,
+        members: Iterable[Dict[str, Any]],
+        built_at: Optional[datetime] = None,
+        watermark: Optional[datetime] = None,
+    ) -> "ClusterState":
+        """Rebuild state from stored member documents."""
+        state = cls(window_hours, built_at=built_at, watermark=watermark)
+        state._load(members)
+        return state
+
+    def _load(self, members: Iterable[Dict[str, Any]]) -> None:
+        """Re-create the index from member docs, keeping their cluster keys."""
+        self.index = SalienceClusterIndex()
+        self.keys = []
+        self._positions = {}
+        self._members = {}
+        self._expiry = []
+        for member in sorted(members, key=lambda m: m['seq']):
+            member['published_at'] = _aware(member.get('published_at'))
+            key = member['cluster']
+            if key in self._positions:
+                self.index.add_to_cluster(self._positions[key], member)
+            else:
+                self._positions[key] = self.index.new_cluster(member)
+                self.keys.append(key)
+            self._members[str(member['_id'])] = member
+            if member['published_at'] is not None:
+                self._expiry.append((member['published_at'], member['seq'], str(member['_id'])))
+            self._next_seq = max(self._next_seq, member['seq'] + 1)
+        heapq.heapify(self._expiry)
+
+    def assign(self, article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Assign an article to its best cluster, or start a new one.
+
+        Returns:
+            The stored member doc (with ``cluster`` key and ``seq``), or None
+            if the article can't be clustered
+        """
+        if not can_cluster(article):
+            return None
+        member = {'_id': article['_id'], **{field: article.get(field) for field in CLUSTER_FIELDS}}
+        member['published_at'] = _aware(member['published_at'])
+        member['seq'] = self._next_seq
+        self._next_seq += 1
+
+        cluster_id, _ = self.index.assign(member)
+        if cluster_id == len(self.keys):
+            # Clusters are keyed by their founding article
+            key = str(article['_id'])
+            self.keys.append(key)
+            self._positions[key] = cluster_id
+        member['cluster'] = self.keys[cluster_id]
+        self._members[str(article['_id'])] = member
+        if member['published_at'] is not None:
+            heapq.heappush(self._expiry, (member['published_at'], member['seq'], str(article['_id'])))
+        return member
+
+    def expire(self, cutoff: datetime) -> List[Dict[str, Any]]:
+        """
+        Drop members published before ``cutoff``.
+
+        Only the clusters that lose members are touched. A cluster left empty
+        is dropped, but its key stays in ``keys`` so cluster ids stay stable.
+
+        Returns:
+            Member docs of the dropped articles (their ``cluster`` keys are
+            the clusters that shrank)
+        """
+        cutoff = _aware(cutoff)
+        expired = []
+        by_cluster: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        while self._expiry and self._expiry[0][0] < cutoff:
+            _, _, article_id = heapq.heappop(self._expiry)
+            member = self._members.pop(article_id)
+            expired.append(member)
+            by_cluster[member['cluster']].append(member)
+
+        for key, members in by_cluster.items():
+            position = self._positions[key]
+            self.index.remove_from_cluster(position, members)
+            if not self.index.clusters[position]:
+                del self._positions[key]
+        return expired
+
+    def members(self) -> List[Dict[str, Any]]:
+        """All member docs."""
+        return list(self._members.values())
+
+    def cluster(self, key: str) -> List[Dict[str, Any]]:
+        """Member docs of a cluster, in assignment order."""
+        position = self._positions.get(key)
+        return list(self.index.clusters[position]) if position is not None else []
+
+
+_state: Optional[ClusterState] = None
+
+
+def get_cluster_state() -> Optional[ClusterState]:
+    """The in-process state from the previous cycle, if any."""
+    return _state
+
+
+def set_cluster_state(state: Optional[ClusterState]) -> None:
+    """Keep ``state`` in process for the next cycle (None drops it)."""
+    global _state
+    _state = state
@@ -11,7 +11,7 @@ from typing import Dict, Any, List, Optional
 from math import exp
 
 from crypto_news_aggregator.db.mongodb import mongo_manager
-from crypto_news_aggregator.db.operations.narratives import upsert_narrative
+from crypto_news_aggregator.services.narrative_service import save_narrative
 
 logger = logging.getLogger(__name__)
 
@@ -306,7 +306,7 @@ class MarketEventDetector:
             )
 
         # Market shock narratives start in "hot" state for immediate prominence
-        narrative_id = await upsert_narrative(
+        narrative_id = await save_narrative(
             theme=theme,
             title=title,
             summary=summary,
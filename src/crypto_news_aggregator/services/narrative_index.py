@@ -0,0 +1,246 @@
+"""
+In-process fingerprint index for narrative matching and consolidation.
+
+calculate_fingerprint_similarity returns 0.0 unless two fingerprints share a
+nucleus entity or a narrative focus (its hard gate), so the only narratives
+worth scoring for a cluster are the ones in those two buckets.
+``NarrativeFingerprintIndex`` keeps narratives bucketed by nucleus entity and
+by focus, ranks a bucket by nucleus and focus-token agreement plus a MinHash
+estimate of how much the actors, actions and focus tokens overlap, and hands
+back only the top k for exact scoring. The
+work per cluster depends on the size of its buckets and on k, not on how
+many narratives are stored.
+
+The process-wide index is built from the narratives collection on first use
+and kept warm across detection cycles: save_narrative, _merge_narratives
+and _reactivate_narrative update it as they write. It is rebuilt every
+NARRATIVE_INDEX_REFRESH_MINUTES to pick up changes made by other processes.
+"""
+
+import heapq
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set
+
+from ..core.config import settings
+from .near_duplicates import estimate_similarity, minhash
+
+logger = logging.getLogger(__name__)
+
+# Narrative states that can absorb a new cluster
+ACTIVE_STATES = ['emerging', 'rising', 'hot', 'cooling', 'dormant', 'echo', 'reactivated']
+
+
+def active_narratives_query(cutoff: datetime) -> Dict[str, Any]:
+    """Query for narratives updated since ``cutoff`` that are still active."""
+    return {
+        'last_updated': {'$gte': cutoff},
+        '$or': [
+            {'status': {'$in': ACTIVE_STATES}},
+            {'lifecycle_state': {'$in': ACTIVE_STATES}}
+        ]
+    }
+
+
+def narrative_fingerprint(narrative: Dict[str, Any]) -> Dict[str, Any]:
+    """Stored fingerprint of a narrative, or one built from its legacy fields."""
+    fingerprint = narrative.get('fingerprint')
+    if fingerprint:
+        return fingerprint
+    return {
+        'nucleus_entity': narrative.get('theme', ''),
+        'top_actors': narrative.get('entities', []),
+        'key_actions': []  # Legacy narratives may not have actions
+    }
+
+
+def fingerprint_signature(fingerprint: Dict[str, Any]) -> Optional[List[int]]:
+    """MinHash signature over a fingerprint's actors, actions and focus tokens."""
+    features = {f"actor:{actor.lower()}" for actor in fingerprint.get('top_actors') or [] if actor}
+    features.update(f"action:{action.lower()}" for action in fingerprint.get('key_actions') or [] if action)
+    features.update(f"focus:{token}" for token in (fingerprint.get('narrative_focus') or '').lower().split())
+    return minhash(features)
+
+
+def _key(value: Optional[str]) -> str:
+    return (value or '').strip().lower()
+
+
+def _aware(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+@dataclass
+class _Entry:
+    narrative_id: Any
+    nucleus: str
+    focus: str
+    focus_tokens: FrozenSet[str]
+    signature: Optional[List[int]]
+    last_updated: Optional[datetime]
+
+
+class NarrativeFingerprintIndex:
+    """Narratives bucketed by nucleus entity and focus, ranked by MinHash."""
+
+    def __init__(self, window_days: int = 30):
+        self.window_days = window_days
+        self.built_at = datetime.now(timezone.utc)
+        self._entries: Dict[str, _Entry] = {}
+        self._by_nucleus: Dict[str, Set[str]] = {}
+        self._by_focus: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, narrative_id: Any) -> bool:
+        return str(narrative_id) in self._entries
+
+    def add(
+        self,
+        narrative_id: Any,
+        fingerprint: Dict[str, Any],
+        last_updated: Optional[datetime] = None,
+    ) -> None:
+        """Index a narrative (re-adding replaces its previous fingerprint)."""
+        key = str(narrative_id)
+        self.remove(key)
+        entry = _Entry(
+            narrative_id=narrative_id,
+            nucleus=_key(fingerprint.get('nucleus_entity')),
+            focus=_key(fingerprint.get('narrative_focus')),
+            focus_tokens=frozenset(_key(fingerprint.get('narrative_focus')).split()),
+            signature=fingerprint_signature(fingerprint),
+            last_updated=_aware(last_updated),
+        )
+        self._entries[key] = entry
+        if entry.nucleus:
+            self._by_nucleus.setdefault(entry.nucleus, set()).add(key)
+        if entry.focus:
+            self._by_focus.setdefault(entry.focus, set()).add(key)
+
+    def add_narrative(self, narrative: Dict[str, Any]) -> None:
+        """Index a narrative document, or drop it if it is no longer active."""
+        if (
+            narrative.get('status') not in ACTIVE_STATES
+            and narrative.get('lifecycle_state') not in ACTIVE_STATES
+        ):
+            self.remove(narrative['_id'])
+            return
+        self.add(narrative['_id'], narrative_fingerprint(narrative), narrative.get('last_updated'))
+
+    def remove(self, narrative_id: Any) -> None:
+        entry = self._entries.pop(str(narrative_id), None)
+        if entry is None:
+            return
+        for buckets, value in ((self._by_nucleus, entry.nucleus), (self._by_focus, entry.focus)):
+            bucket = buckets.get(value)
+            if bucket is not None:
+                bucket.discard(str(narrative_id))
+                if not bucket:
+                    del buckets[value]
+
+    def candidates(
+        self,
+        fingerprint: Dict[str, Any],
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        exclude: Iterable[Any] = (),
+    ) -> List[Any]:
+        """
+        Narratives that can pass the similarity hard gate for ``fingerprint``.
+
+        Args:
+            fingerprint: Fingerprint to match
+            since: Skip narratives last updated before this
+            limit: Return at most this many, most similar first
+            exclude: Narrative IDs to leave out
+
+        Returns:
+            Narrative IDs (as indexed), best MinHash estimate first
+        """
+        keys = set(self._by_nucleus.get(_key(fingerprint.get('nucleus_entity')), ()))
+        keys |= self._by_focus.get(_key(fingerprint.get('narrative_focus')), set())
+        keys.difference_update(str(narrative_id) for narrative_id in exclude)
+
+        since = _aware(since)
+        entries = [
+            self._entries[key] for key in keys
+            if since is None or (self._entries[key].last_updated or since) >= since
+        ]
+
+        nucleus = _key(fingerprint.get('nucleus_entity'))
+        focus_tokens = set(_key(fingerprint.get('narrative_focus')).split())
+        signature = fingerprint_signature(fingerprint)
+
+        def rank(entry: _Entry):
+            # Mirror calculate_fingerprint_similarity's weights: nucleus and
+            # focus agreement dominate, the MinHash estimate stands in for
+            # actor/action overlap
+            if not focus_tokens or not entry.focus_tokens:
+                focus_score = 0.5
+            else:
+                focus_score = len(focus_tokens & entry.focus_tokens) / len(focus_tokens | entry.focus_tokens)
+            estimate = estimate_similarity(signature, entry.signature) if signature and entry.signature else 0.0
+            score = 0.5 * focus_score + 0.3 * (nucleus == entry.nucleus) + 0.2 * estimate
+            updated = entry.last_updated.timestamp() if entry.last_updated else 0.0
+            return score, updated
+
+        if limit is not None and len(entries) > limit:
+            entries = heapq.nlargest(limit, entries, key=rank)
+        else:
+            entries.sort(key=rank, reverse=True)
+        return [entry.narrative_id for entry in entries]
+
+
+_index: Optional[NarrativeFingerprintIndex] = None
+
+
+def get_narrative_index(window_days: int = 0) -> Optional[NarrativeFingerprintIndex]:
+    """
+    The warm process-wide index, or None if it has to be (re)built.
+
+    Returns None before the first build, once the index is older than
+    NARRATIVE_INDEX_REFRESH_MINUTES, or when it covers fewer than
+    ``window_days`` days.
+    """
+    if _index is None or window_days > _index.window_days:
+        return None
+    age = datetime.now(timezone.utc) - _index.built_at
+    if age > timedelta(minutes=settings.NARRATIVE_INDEX_REFRESH_MINUTES):
+        return None
+    return _index
+
+
+def build_narrative_index(
+    narratives: Iterable[Dict[str, Any]], window_days: int
+) -> NarrativeFingerprintIndex:
+    """Replace the process-wide index with one over ``narratives``."""
+    global _index
+    index = NarrativeFingerprintIndex(window_days=window_days)
+    for narrative in narratives:
+        index.add_narrative(narrative)
+    logger.info(f"Built narrative fingerprint index with {len(index)} narratives ({window_days} days)")
+    _index = index
+    return index
+
+
+def index_narrative(narrative: Dict[str, Any]) -> None:
+    """Record a narrative write in the process-wide index, if it is built."""
+    if _index is not None:
+        _index.add_narrative(narrative)
+
+
+def unindex_narrative(narrative_id: Any) -> None:
+    """Drop a narrative from the process-wide index, if it is built."""
+    if _index is not None:
+        _index.remove(narrative_id)
+
+
+def reset_narrative_index() -> None:
+    """Drop the process-wide index so the next match rebuilds it."""
+    global _index
+    _index = None
@@ -20,15 +20,17 @@ prevent noise from polluting narratives.
 import json
 import logging
 import re
-from typing import List, Dict, Any, Optional
+from typing import Container, List, Dict, Any, Optional
 from datetime import datetime, timezone, timedelta
 from math import exp
-from itertools import combinations
 from collections import defaultdict, Counter
 
+from ..core.config import settings
+from ..core.leases import current_lease
 from ..db.mongodb import mongo_manager
 from ..llm.factory import get_llm_provider
 from ..db.operations.narratives import upsert_narrative
+from ..db.operations.narrative_cluster_state import load_cluster_state, save_cluster_state
 from .narrative_themes import (
     backfill_themes_for_recent_articles,
     get_articles_by_theme,
@@ -41,6 +43,16 @@ from .narrative_themes import (
     compute_narrative_fingerprint,
     THEME_CATEGORIES
 )
+from .incremental_clustering import ClusterState, get_cluster_state, set_cluster_state
+from .narrative_index import (
+    NarrativeFingerprintIndex,
+    active_narratives_query,
+    build_narrative_index,
+    get_narrative_index,
+    index_narrative,
+    narrative_fingerprint,
+    unindex_narrative,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -447,6 +459,48 @@ def determine_lifecycle_stage(
     return lifecycle
 
 
+async def save_narrative(existing: Optional[Dict[str, Any]] = None, **fields: Any) -> str:
+    """
+    Upsert a narrative and bring the process-wide narrative index up to date.
+
+    Args:
+        existing: The stored narrative being updated, if any (fields not
+            passed, such as its fingerprint and status, stay indexed)
+        **fields: ``upsert_narrative`` arguments
+
+    Returns:
+        The ID of the upserted narrative
+    """
+    from bson import ObjectId
+
+    narrative_id = await upsert_narrative(**fields)
+    if get_narrative_index() is not None:
+        index_narrative({
+            **(existing or {}),
+            **fields,
+            '_id': existing['_id'] if existing else ObjectId(narrative_id),
+            'last_updated': datetime.now(timezone.utc),
+        })
+    return narrative_id
+
+
+async def load_narrative_index() -> None:
+    """
+    Build the narrative fingerprint index over NARRATIVE_INDEX_WINDOW_DAYS
+    unless a live one already covers it.
+
+    Detection cycles call this before matching their clusters, so every
+    grace period up to the index window is served from one load.
+    """
+    window_days = settings.NARRATIVE_INDEX_WINDOW_DAYS
+    if get_narrative_index(window_days) is not None:
+        return
+    db = await mongo_manager.get_async_database()
+    cutoff = datetime.now(timezone.utc) - timedelta(days=window_days)
+    narratives = await db.narratives.find(active_narratives_query(cutoff)).to_list(length=None)
+    build_narrative_index(narratives, window_days)
+
+
 async def find_matching_narrative(
     fingerprint: Dict[str, Any],
     within_days: int = 14,
@@ -459,7 +513,15 @@ async def find_matching_narrative(
     using fingerprint comparison. Uses adaptive thresholds based on narrative
     recency to allow easier continuation of recent stories while maintaining
     strict matching for older narratives.
-    
+
+    Candidates come from the narrative fingerprint index: only narratives
+    sharing the nucleus entity or narrative focus are considered, and only
+    the NARRATIVE_MATCH_TOP_K closest by MinHash estimate are fetched and
+    scored. Detection cycles build the index over NARRATIVE_INDEX_WINDOW_DAYS
+    up front (``load_narrative_index``); a call that finds it cold indexes
+    its own window. The index is reused across calls until it expires, and
+    candidates are always limited to the caller's window.
+
     Adaptive Threshold Strategy:
     - Recent narratives (updated within 48h): 0.5 threshold
       Allows near-term continuations to merge more easily, accounting for
@@ -499,19 +561,32 @@ async def find_matching_narrative(
         
         # Calculate time window
         cutoff_time = datetime.now(timezone.utc) - timedelta(days=within_days)
+        top_k = settings.NARRATIVE_MATCH_TOP_K
         
-        # Query for active narratives within time window
-        active_statuses = ['emerging', 'rising', 'hot', 'cooling', 'dormant', 'echo', 'reactivated']
-        query = {
-            'last_updated': {'$gte': cutoff_time},
-            '$or': [
-                {'status': {'$in': active_statuses}},
-                {'lifecycle_state': {'$in': active_statuses}}
+        index = get_narrative_index(within_days)
+        if index is None:
+            # Cold (or expired) index: load the narratives of this call's
+            # window, index them for later clusters, and score this
+            # cluster's candidates (detection cycles load the full index
+            # window up front, see load_narrative_index)
+            cursor = narratives_collection.find(active_narratives_query(cutoff_time))
+            narratives = await cursor.to_list(length=None)
+            index = build_narrative_index(narratives, within_days)
+            by_id = {str(narrative['_id']): narrative for narrative in narratives}
+            candidates = [
+                by_id[str(narrative_id)]
+                for narrative_id in index.candidates(fingerprint, since=cutoff_time, limit=top_k)
             ]
-        }
-        
-        cursor = narratives_collection.find(query)
-        candidates = await cursor.to_list(length=None)
+        else:
+            # Warm index: fetch only the top-k candidates, re-checking the
+            # window and status against the stored documents
+            candidate_ids = index.candidates(fingerprint, since=cutoff_time, limit=top_k)
+            candidates = []
+            if candidate_ids:
+                query = active_narratives_query(cutoff_time)
+                query['_id'] = {'$in': candidate_ids}
+                cursor = narratives_collection.find(query)
+                candidates = await cursor.to_list(length=None)
         
         if not candidates:
             logger.debug(f"No candidate narratives found within {within_days} days")
@@ -529,15 +604,8 @@ async def find_matching_narrative(
         recent_cutoff = now - timedelta(hours=48)
         
         for candidate in candidates:
-            # Extract fingerprint from candidate narrative
-            candidate_fingerprint = candidate.get('fingerprint')
-            if not candidate_fingerprint:
-                # Try to construct fingerprint from legacy fields
-                candidate_fingerprint = {
-                    'nucleus_entity': candidate.get('theme', ''),
-                    'top_actors': candidate.get('entities', []),
-                    'key_actions': []  # Legacy narratives may not have actions
-                }
+            # Extract fingerprint from candidate narrative (or its legacy fields)
+            candidate_fingerprint = narrative_fingerprint(candidate)
             
             # Calculate similarity
             similarity = calculate_fingerprint_similarity(fingerprint, candidate_fingerprint)
@@ -815,6 +883,7 @@ async def _reactivate_narrative(
             }
         }
     )
+    index_narrative({**dormant_narrative, "lifecycle_state": lifecycle_state, "last_updated": now})
 
     logger.info(
         f"REACTIVATED narrative {narrative_id}: "
@@ -862,234 +931,489 @@ async def extract_entities_from_articles(articles: List[Dict[str, Any]]) -> List
     return list(entities)
 
 
-async def detect_narratives(
-    hours: int = 48,
-    min_articles: int = 3,
-    use_salience_clustering: bool = True
+# Articles written this long before the incremental watermark are read again,
+# so ones stored while the previous cycle was querying aren't missed
+INCREMENTAL_WATERMARK_OVERLAP = timedelta(minutes=5)
+
+
+def _narrative_articles_query(cutoff_time: datetime) -> Dict[str, Any]:
+    """Query for articles with narrative data published since ``cutoff_time``."""
+    # Filter for high-signal articles only (tier 1 & 2)
+    # Include articles with no tier yet (unclassified) for backward compatibility
+    return {
+        "published_at": {"$gte": cutoff_time},
+        "narrative_summary": {"$exists": True},  # Has narrative data
+        "$or": [
+            {"relevance_tier": {"$lte": MAX_RELEVANCE_TIER}},
+            {"relevance_tier": {"$exists": False}},
+            {"relevance_tier": None},
+        ]
+    }
+
+
+async def _load_articles(article_ids: List[Any], query: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Articles with the given IDs (string or ObjectId) that also match ``query``."""
+    from bson import ObjectId
+
+    object_ids = [
+        ObjectId(aid) if isinstance(aid, str) and ObjectId.is_valid(aid) else aid
+        for aid in article_ids
+    ]
+    db = await mongo_manager.get_async_database()
+    cursor = db.articles.find({**query, "_id": {"$in": object_ids}})
+    return await cursor.to_list(length=None)
+
+
+async def _save_narrative_clusters(
+    clusters: List[List[Dict[str, Any]]],
+    articles: List[Dict[str, Any]],
+    hours: int,
+    article_query: Optional[Dict[str, Any]] = None,
+    merge_only: Container[int] = ()
 ) -> List[Dict[str, Any]]:
     """
-    Detect narratives using salience-aware clustering.
-    
+    Merge each cluster into its matching narrative, reactivate a dormant one,
+    or create a new narrative.
+
     Args:
-        hours: Lookback window for articles
-        min_articles: Minimum articles per narrative cluster
-        use_salience_clustering: Use new salience-based system (vs old theme-based)
-    
+        clusters: Article clusters from salience clustering
+        articles: Articles to take publish dates and text from (at least the
+            clustered ones)
+        hours: Detection window the clusters were built over
+        article_query: If set, ``articles`` only holds the clustered articles,
+            and a matched narrative's other articles are loaded with this query
+        merge_only: Positions in ``clusters`` that only refresh a matching
+            narrative and never reactivate or create one
+
     Returns:
-        List of narrative dicts with full structure including lifecycle tracking
+        List of saved narrative dicts
     """
-    try:
-        if use_salience_clustering:
-            # NEW: Use salience-aware clustering
-            logger.info(f"Using salience-based narrative detection for last {hours} hours")
-            
-            # Backfill narrative data for recent articles if needed
-            backfilled_count = await backfill_narratives_for_recent_articles(hours=hours)
-            logger.info(f"Backfilled narrative data for {backfilled_count} articles")
-            
-            # Get recent articles with narrative data
-            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
-            db = await mongo_manager.get_async_database()
-            articles_collection = db.articles
-            
-            # Filter for high-signal articles only (tier 1 & 2)
-            # Include articles with no tier yet (unclassified) for backward compatibility
-            cursor = articles_collection.find({
-                "published_at": {"$gte": cutoff_time},
-                "narrative_summary": {"$exists": True},  # Has narrative data
-                "$or": [
-                    {"relevance_tier": {"$lte": MAX_RELEVANCE_TIER}},
-                    {"relevance_tier": {"$exists": False}},
-                    {"relevance_tier": None},
-                ]
-            })
-            
-            articles = await cursor.to_list(length=None)
-            logger.info(f"Found {len(articles)} articles with narrative data in last {hours}h")
-            
-            if not articles:
-                logger.warning("No articles with narrative data found")
-                return []
-            
-            # Cluster articles by nucleus entity and weighted overlap
-            clusters = await cluster_by_narrative_salience(
-                articles,
-                min_cluster_size=min_articles
+    if clusters:
+        try:
+            await load_narrative_index()
+        except Exception as e:
+            # Matching falls back to loading each call's window
+            logger.warning(f"Could not load the narrative index: {e}")
+
+    # Process each cluster: compute fingerprint, check for matches, merge or create
+    saved_narratives = []
+    matched_count = 0
+    created_count = 0
+
+    for position, cluster in enumerate(clusters):
+        # Build cluster data dict for fingerprint computation
+        # Aggregate nucleus entities, narrative focuses, actors, and actions from cluster articles
+        nucleus_entities = []
+        narrative_focuses = []
+        all_actors = {}
+        all_actions = []
+
+        for article in cluster:
+            # Skip if article is not a dict (defensive programming)
+            if not isinstance(article, dict):
+                logger.warning(f"Skipping non-dict article in cluster: {type(article)}")
+                continue
+
+            nucleus = article.get('nucleus_entity')
+            if nucleus:
+                nucleus_entities.append(nucleus)
+
+            # Aggregate narrative focus
+            focus = article.get('narrative_focus')
+            if focus:
+                narrative_focuses.append(focus.lower().strip())
+
+            # Aggregate actors with salience
+            actors = article.get('actors', [])
+            actor_salience = article.get('actor_salience', {})
+
+            # Handle actors as list or dict
+            if isinstance(actors, list):
+                for actor in actors:
+                    salience = actor_salience.get(actor, 3) if isinstance(actor_salience, dict) else 3
+                    all_actors[actor] = max(all_actors.get(actor, 0), salience)
+
+            # Aggregate actions
+            narrative_summary = article.get('narrative_summary', {})
+            if isinstance(narrative_summary, dict):
+                actions = narrative_summary.get('actions', [])
+                if isinstance(actions, list):
+                    all_actions.extend(actions)
+
+        # Determine primary nucleus (most common)
+        nucleus_counts = Counter(nucleus_entities)
+        primary_nucleus = nucleus_counts.most_common(1)[0][0] if nucleus_counts else ''
+
+        # Determine primary focus (most common)
+        focus_counts = Counter(narrative_focuses)
+        primary_focus = focus_counts.most_common(1)[0][0] if focus_counts else ''
+
+        # Build cluster dict for fingerprint
+        cluster_data = {
+            'nucleus_entity': primary_nucleus,
+            'narrative_focus': primary_focus,
+            'actors': all_actors,
+            'actions': list(set(all_actions))[:5]  # Unique actions, top 5
+        }
+
+        # Compute fingerprint from cluster data
+        fingerprint = compute_narrative_fingerprint(cluster_data)
+        logger.debug(f"Computed fingerprint for cluster with nucleus_entity: {fingerprint.get('nucleus_entity')}")
+
+        # Check if nucleus_entity is blacklisted (advertising/promotional content)
+        nucleus_entity = fingerprint.get('nucleus_entity', '')
+        if nucleus_entity in BLACKLIST_ENTITIES:
+            logger.info(f"Skipping blacklisted nucleus_entity: {nucleus_entity}")
+            continue
+
+        # Calculate cluster velocity for adaptive grace period
+        cluster_article_count = len(cluster)
+        # Use the detection window (hours) to estimate velocity
+        cluster_time_span_days = hours / 24.0
+        cluster_velocity = cluster_article_count / cluster_time_span_days if cluster_time_span_days > 0 else 0
+
+        # Check for matching existing narrative with adaptive grace period
+        matching_narrative = await find_matching_narrative(
+            fingerprint,
+            cluster_velocity=cluster_velocity
+        )
+
+        if matching_narrative:
+            # Update existing narrative by appending new articles
+            matched_count += 1
+            narrative_id = str(matching_narrative['_id'])
+            logger.debug(
+                f"Match found for cluster with nucleus '{primary_nucleus}': "
+                f"merging into narrative '{matching_narrative.get('title')}' (ID: {narrative_id})"
             )
-            
-            logger.info(f"Created {len(clusters)} narrative clusters")
 
-            # Process each cluster: compute fingerprint, check for matches, merge or create
-            saved_narratives = []
-            matched_count = 0
-            created_count = 0
-            
-            for cluster in clusters:
-                # Build cluster data dict for fingerprint computation
-                # Aggregate nucleus entities, narrative focuses, actors, and actions from cluster articles
-                nucleus_entities = []
-                narrative_focuses = []
-                all_actors = {}
-                all_actions = []
-
-                for article in cluster:
-                    # Skip if article is not a dict (defensive programming)
-                    if not isinstance(article, dict):
-                        logger.warning(f"Skipping non-dict article in cluster: {type(article)}")
-                        continue
+            # Get existing article_ids and append new ones from cluster
+            existing_article_ids = set(matching_narrative.get('article_ids', []))
+            # Extract article_ids from cluster articles
+            new_article_ids = set(str(article.get('_id')) for article in cluster if isinstance(article, dict))
+            combined_article_ids = list(existing_article_ids | new_article_ids)
+
+            if article_query is not None:
+                # Incremental cycles only load the changed clusters; pull in the
+                # narrative's other in-window articles as a full pass would have
+                known_ids = {str(article.get('_id')) for article in articles}
+                missing_ids = [aid for aid in combined_article_ids if str(aid) not in known_ids]
+                if missing_ids:
+                    articles = articles + await _load_articles(missing_ids, article_query)
+
+            # Calculate updated metrics for lifecycle_state
+            updated_article_count = len(combined_article_ids)
+            first_seen = matching_narrative.get('first_seen', datetime.now(timezone.utc))
+            # Ensure first_seen is timezone-aware
+            if first_seen.tzinfo is None:
+                first_seen = first_seen.replace(tzinfo=timezone.utc)
+            last_updated = datetime.now(timezone.utc)
+
+            # Calculate mention velocity based on recent activity (last 7 days)
+            # Fetch article dates for velocity calculation
+            article_dates = []
+            for article in articles:
+                if str(article.get('_id')) in combined_article_ids:
+                    pub_date = article.get('published_at')
+                    if pub_date:
+                        # Ensure timezone-aware
+                        if pub_date.tzinfo is None:
+                            pub_date = pub_date.replace(tzinfo=timezone.utc)
+                        article_dates.append(pub_date)
+
+            # Use recent velocity calculation (last 7 days) for more accurate current activity
+            mention_velocity = calculate_recent_velocity(article_dates, lookback_days=7)
+
+            # Get previous state from lifecycle_history
+            lifecycle_history_existing = matching_narrative.get('lifecycle_history', [])
+            previous_state = lifecycle_history_existing[-1].get('state') if lifecycle_history_existing else None
+
+            # Calculate lifecycle_state for updated narrative
+            lifecycle_state, dormant_since = determine_lifecycle_state(
+                updated_article_count, mention_velocity, first_seen, last_updated, previous_state
+            )
 
-                    nucleus = article.get('nucleus_entity')
-                    if nucleus:
-                        nucleus_entities.append(nucleus)
-
-                    # Aggregate narrative focus
-                    focus = article.get('narrative_focus')
-                    if focus:
-                        narrative_focuses.append(focus.lower().strip())
-
-                    # Aggregate actors with salience
-                    actors = article.get('actors', [])
-                    actor_salience = article.get('actor_salience', {})
-
-                    # Handle actors as list or dict
-                    if isinstance(actors, list):
-                        for actor in actors:
-                            salience = actor_salience.get(actor, 3) if isinstance(actor_salience, dict) else 3
-                            all_actors[actor] = max(all_actors.get(actor, 0), salience)
-
-                    # Aggregate actions
-                    narrative_summary = article.get('narrative_summary', {})
-                    if isinstance(narrative_summary, dict):
-                        actions = narrative_summary.get('actions', [])
-                        if isinstance(actions, list):
-                            all_actions.extend(actions)
-
-                # Determine primary nucleus (most common)
-                nucleus_counts = Counter(nucleus_entities)
-                primary_nucleus = nucleus_counts.most_common(1)[0][0] if nucleus_counts else ''
-
-                # Determine primary focus (most common)
-                focus_counts = Counter(narrative_focuses)
-                primary_focus = focus_counts.most_common(1)[0][0] if focus_counts else ''
-
-                # Build cluster dict for fingerprint
-                cluster_data = {
-                    'nucleus_entity': primary_nucleus,
-                    'narrative_focus': primary_focus,
-                    'actors': all_actors,
-                    'actions': list(set(all_actions))[:5]  # Unique actions, top 5
-                }
-                
-                # Compute fingerprint from cluster data
-                fingerprint = compute_narrative_fingerprint(cluster_data)
-                logger.debug(f"Computed fingerprint for cluster with nucleus_entity: {fingerprint.get('nucleus_entity')}")
-                
-                # Check if nucleus_entity is blacklisted (advertising/promotional content)
-                nucleus_entity = fingerprint.get('nucleus_entity', '')
-                if nucleus_entity in BLACKLIST_ENTITIES:
-                    logger.info(f"Skipping blacklisted nucleus_entity: {nucleus_entity}")
-                    continue
-                
-                # Calculate cluster velocity for adaptive grace period
-                cluster_article_count = len(cluster)
-                # Use the detection window (hours) to estimate velocity
-                cluster_time_span_days = hours / 24.0
-                cluster_velocity = cluster_article_count / cluster_time_span_days if cluster_time_span_days > 0 else 0
-                
-                # Check for matching existing narrative with adaptive grace period
-                matching_narrative = await find_matching_narrative(
-                    fingerprint,
-                    cluster_velocity=cluster_velocity
-                )
-                
-                if matching_narrative:
-                    # Update existing narrative by appending new articles
-                    matched_count += 1
-                    narrative_id = str(matching_narrative['_id'])
-                    logger.debug(
-                        f"Match found for cluster with nucleus '{primary_nucleus}': "
-                        f"merging into narrative '{matching_narrative.get('title')}' (ID: {narrative_id})"
+            # Update lifecycle history and get resurrection fields
+            lifecycle_history, resurrection_fields = update_lifecycle_history(
+                matching_narrative,
+                lifecycle_state,
+                updated_article_count,
+                mention_velocity
+            )
+
+            # Use upsert_narrative to ensure timestamp validation
+            # Get theme from existing narrative or fingerprint
+            theme = matching_narrative.get('theme') or fingerprint.get('nucleus_entity', 'unknown')
+            title = matching_narrative.get('title', 'Unknown')
+            summary = matching_narrative.get('summary', '')
+
+            # DEBUG: Log all article dates and timestamp calculation
+            logger.info(f"[MERGE NARRATIVE DEBUG] ========== MERGE UPSERT START ==========")
+            logger.info(f"[MERGE NARRATIVE DEBUG] Theme: {theme}")
+            logger.info(f"[MERGE NARRATIVE DEBUG] Title: {title}")
+            logger.info(f"[MERGE NARRATIVE DEBUG] Combined article IDs: {combined_article_ids}")
+            logger.info(f"[MERGE NARRATIVE DEBUG] Article dates collected: {len(article_dates)}")
+            if article_dates:
+                logger.info(f"[MERGE NARRATIVE DEBUG] Article dates (sorted):")
+                for i, date in enumerate(sorted(article_dates)):
+                    logger.info(f"[MERGE NARRATIVE DEBUG]   [{i+1}] {date}")
+                logger.info(f"[MERGE NARRATIVE DEBUG] Earliest article: {min(article_dates)}")
+                logger.info(f"[MERGE NARRATIVE DEBUG] Latest article: {max(article_dates)}")
+            logger.info(f"[MERGE NARRATIVE DEBUG] Existing narrative first_seen: {matching_narrative.get('first_seen')}")
+            logger.info(f"[MERGE NARRATIVE DEBUG] Calculated first_seen (from existing or now): {first_seen}")
+            logger.info(f"[MERGE NARRATIVE DEBUG] Calculated last_updated (now): {last_updated}")
+            logger.info(f"[MERGE NARRATIVE DEBUG] Is first_seen > last_updated? {first_seen > last_updated}")
+            logger.info(f"[MERGE NARRATIVE DEBUG] Timestamp sources: first_seen from existing narrative, last_updated from now()")
+            logger.info(f"[MERGE NARRATIVE DEBUG] ========== MERGE UPSERT END ==========")
+
+            # Post-clustering validation: Ensure articles mention nucleus_entity
+            nucleus_entity = fingerprint.get('nucleus_entity', '')
+            if nucleus_entity and combined_article_ids:
+                # Filter article_ids to only include articles mentioning nucleus_entity
+                validated_article_ids = []
+                rejected_articles = []
+
+                for article_id in combined_article_ids:
+                    # Find the article in the original articles list
+                    article = next((a for a in articles if str(a.get("_id")) == str(article_id)), None)
+
+                    if article and validate_article_mentions_entity(article, nucleus_entity):
+                        validated_article_ids.append(article_id)
+                    else:
+                        rejected_articles.append({
+                            "article_id": article_id,
+                            "title": article.get("title", "") if article else "unknown"
+                        })
+
+                # Log rejected articles
+                if rejected_articles:
+                    logger.info(
+                        f"Post-cluster validation: {len(rejected_articles)} articles rejected from "
+                        f"'{nucleus_entity}' narrative",
+                        extra={
+                            "narrative_nucleus": nucleus_entity,
+                            "total_clustered": len(combined_article_ids),
+                            "validated": len(validated_article_ids),
+                            "rejected": len(rejected_articles)
+                        }
                     )
-                    
-                    # Get existing article_ids and append new ones from cluster
-                    existing_article_ids = set(matching_narrative.get('article_ids', []))
-                    # Extract article_ids from cluster articles
-                    new_article_ids = set(str(article.get('_id')) for article in cluster if isinstance(article, dict))
-                    combined_article_ids = list(existing_article_ids | new_article_ids)
-                    
-                    # Calculate updated metrics for lifecycle_state
-                    updated_article_count = len(combined_article_ids)
-                    first_seen = matching_narrative.get('first_seen', datetime.now(timezone.utc))
-                    # Ensure first_seen is timezone-aware
-                    if first_seen.tzinfo is None:
-                        first_seen = first_seen.replace(tzinfo=timezone.utc)
+                    for rejected in rejected_articles:
+                        logger.warning(
+                            f"Post-cluster validation rejected article from narrative",
+                            extra={
+                                "narrative_nucleus": nucleus_entity,
+                                "article_title": rejected["title"][:100],
+                                "article_id": str(rejected["article_id"]),
+                                "reason": "nucleus_entity_not_in_text"
+                            }
+                        )
+
+                # Update with validated articles
+                combined_article_ids = validated_article_ids
+                updated_article_count = len(validated_article_ids)
+
+            try:
+                narrative_id = await save_narrative(
+                    existing=matching_narrative,
+                    theme=theme,
+                    title=title,
+                    summary=summary,
+                    entities=matching_narrative.get('entities', []),
+                    article_ids=combined_article_ids,
+                    article_count=updated_article_count,
+                    mention_velocity=round(mention_velocity, 2),
+                    lifecycle=matching_narrative.get('lifecycle', 'unknown'),
+                    momentum=matching_narrative.get('momentum', 'unknown'),
+                    recency_score=matching_narrative.get('recency_score', 0.0),
+                    entity_relationships=matching_narrative.get('entity_relationships', []),
+                    first_seen=first_seen,
+                    lifecycle_state=lifecycle_state,
+                    lifecycle_history=lifecycle_history,
+                    reawakening_count=resurrection_fields.get('reawakening_count') if resurrection_fields else None,
+                    reawakened_from=resurrection_fields.get('reawakened_from') if resurrection_fields else None,
+                    resurrection_velocity=resurrection_fields.get('resurrection_velocity') if resurrection_fields else None,
+                    dormant_since=dormant_since
+                )
+
+                logger.info(
+                    f"Merged {len(new_article_ids)} new articles into existing narrative: "
+                    f"'{title}' (ID: {narrative_id})"
+                )
+
+                # Fetch updated narrative for return value
+                db = await mongo_manager.get_async_database()
+                updated_narrative = await db.narratives.find_one({'_id': matching_narrative['_id']})
+                if updated_narrative:
+                    saved_narratives.append(updated_narrative)
+            except Exception as e:
+                logger.exception(f"Failed to update narrative '{theme}': {e}")
+                # Still add to saved narratives with local data
+                matching_narrative['article_ids'] = combined_article_ids
+                matching_narrative['article_count'] = updated_article_count
+                matching_narrative['last_updated'] = last_updated
+                matching_narrative['mention_velocity'] = round(mention_velocity, 2)
+                matching_narrative['lifecycle_state'] = lifecycle_state
+                matching_narrative['lifecycle_history'] = lifecycle_history
+                saved_narratives.append(matching_narrative)
+
+        elif position in merge_only:
+            logger.debug(f"No narrative to refresh for cluster with nucleus '{primary_nucleus}'")
+        else:
+            # No match found - check for reactivation before creating new
+            reactivation_decision, reactivated_candidate = await should_reactivate_or_create_new(
+                fingerprint, nucleus_entity=primary_nucleus
+            )
+
+            if reactivation_decision == "reactivate" and reactivated_candidate:
+                # Reactivate dormant narrative instead of creating new
+                logger.info(
+                    f"Reactivating dormant narrative '{reactivated_candidate.get('title')}' "
+                    f"for nucleus entity '{primary_nucleus}'"
+                )
+                narrative_id = await _reactivate_narrative(
+                    reactivated_candidate,
+                    [str(article.get("_id")) for article in cluster if isinstance(article, dict)],
+                    cluster,
+                    fingerprint
+                )
+
+                # Fetch and return the updated narrative
+                db = await mongo_manager.get_async_database()
+                updated_narrative = await db.narratives.find_one({"_id": reactivated_candidate["_id"]})
+                if updated_narrative:
+                    saved_narratives.append(updated_narrative)
+            else:
+                # Create new narrative
+                created_count += 1
+                narrative = await generate_narrative_from_cluster(cluster)
+
+                if not narrative:
+                    logger.warning(f"Failed to generate narrative for cluster with nucleus: {cluster.get('nucleus_entity')}")
+                    continue
+
+                # Add fingerprint to narrative data
+                narrative['fingerprint'] = fingerprint
+                narrative['needs_summary_update'] = False  # Fresh summary, no update needed
+
+                narrative_data = narrative
+                # Calculate mention velocity (articles per day) based on recent activity
+                article_count = narrative_data.get("article_count", 0)
+
+                # Get articles for this narrative to extract dates
+                article_ids = narrative_data.get("article_ids", [])
+                article_dates = []
+                articles_found = 0
+                for article in articles:
+                    if str(article.get("_id")) in article_ids:
+                        articles_found += 1
+                        pub_date = article.get("published_at")
+                        if pub_date:
+                            # Ensure timezone-aware
+                            if pub_date.tzinfo is None:
+                                pub_date = pub_date.replace(tzinfo=timezone.utc)
+                            article_dates.append(pub_date)
+
+                # DEBUG: Log if we're missing articles
+                if articles_found != len(article_ids):
+                    logger.warning(f"[CREATE NARRATIVE] Only found {articles_found}/{len(article_ids)} articles in articles list!")
+
+                # Use recent velocity calculation (last 7 days) for more accurate current activity
+                mention_velocity = calculate_recent_velocity(article_dates, lookback_days=7)
+
+                # Calculate momentum from article dates
+
+                # Sort dates and calculate momentum
+                article_dates.sort()
+                momentum = calculate_momentum(article_dates)
+
+                # Calculate recency score (0-1, higher = more recent)
+                newest_article = article_dates[-1] if article_dates else None
+                if newest_article:
+                    # Ensure newest_article is timezone-aware
+                    if newest_article.tzinfo is None:
+                        newest_article = newest_article.replace(tzinfo=timezone.utc)
+                    hours_since_last_update = (datetime.now(timezone.utc) - newest_article).total_seconds() / 3600
+                    recency_score = exp(-hours_since_last_update / 24)  # 24h half-life
+                else:
+                    recency_score = 0.0
+
+                # Determine lifecycle stage with momentum awareness (legacy)
+                lifecycle = determine_lifecycle_stage(article_count, mention_velocity, momentum)
+
+                # Determine lifecycle state (new approach)
+                # Use article dates for first_seen and last_updated, not now()
+                if article_dates:
+                    first_seen = min(article_dates)
+                    last_updated = max(article_dates)
+                    logger.info(f"[CREATE NARRATIVE] Using article dates: first_seen={first_seen}, last_updated={last_updated}, article_count={len(article_dates)}")
+                else:
+                    # Fallback to now() if no article dates available
+                    first_seen = datetime.now(timezone.utc)
                     last_updated = datetime.now(timezone.utc)
-                    
-                    # Calculate mention velocity based on recent activity (last 7 days)
-                    # Fetch article dates for velocity calculation
-                    article_dates = []
-                    for article in articles:
-                        if str(article.get('_id')) in combined_article_ids:
-                            pub_date = article.get('published_at')
-                            if pub_date:
-                                # Ensure timezone-aware
-                                if pub_date.tzinfo is None:
-                                    pub_date = pub_date.replace(tzinfo=timezone.utc)
-                                article_dates.append(pub_date)
-                    
-                    # Use recent velocity calculation (last 7 days) for more accurate current activity
-                    mention_velocity = calculate_recent_velocity(article_dates, lookback_days=7)
-                    
-                    # Get previous state from lifecycle_history
-                    lifecycle_history_existing = matching_narrative.get('lifecycle_history', [])
-                    previous_state = lifecycle_history_existing[-1].get('state') if lifecycle_history_existing else None
-                    
-                    # Calculate lifecycle_state for updated narrative
-                    lifecycle_state, dormant_since = determine_lifecycle_state(
-                        updated_article_count, mention_velocity, first_seen, last_updated, previous_state
-                    )
+                    logger.warning(f"[CREATE NARRATIVE] NO ARTICLE DATES! Using now(): first_seen={first_seen}, last_updated={last_updated}")
+                # No previous state for new narratives
+                lifecycle_state, dormant_since = determine_lifecycle_state(
+                    article_count, mention_velocity, first_seen, last_updated, previous_state=None
+                )
 
-                    # Update lifecycle history and get resurrection fields
-                    lifecycle_history, resurrection_fields = update_lifecycle_history(
-                        matching_narrative,
-                        lifecycle_state,
-                        updated_article_count,
-                        mention_velocity
-                    )
-                    
-                    # Use upsert_narrative to ensure timestamp validation
-                    # Get theme from existing narrative or fingerprint
-                    theme = matching_narrative.get('theme') or fingerprint.get('nucleus_entity', 'unknown')
-                    title = matching_narrative.get('title', 'Unknown')
-                    summary = matching_narrative.get('summary', '')
-                    
-                    # DEBUG: Log all article dates and timestamp calculation
-                    logger.info(f"[MERGE NARRATIVE DEBUG] ========== MERGE UPSERT START ==========")
-                    logger.info(f"[MERGE NARRATIVE DEBUG] Theme: {theme}")
-                    logger.info(f"[MERGE NARRATIVE DEBUG] Title: {title}")
-                    logger.info(f"[MERGE NARRATIVE DEBUG] Combined article IDs: {combined_article_ids}")
-                    logger.info(f"[MERGE NARRATIVE DEBUG] Article dates collected: {len(article_dates)}")
-                    if article_dates:
-                        logger.info(f"[MERGE NARRATIVE DEBUG] Article dates (sorted):")
-                        for i, date in enumerate(sorted(article_dates)):
-                            logger.info(f"[MERGE NARRATIVE DEBUG]   [{i+1}] {date}")
-                        logger.info(f"[MERGE NARRATIVE DEBUG] Earliest article: {min(article_dates)}")
-                        logger.info(f"[MERGE NARRATIVE DEBUG] Latest article: {max(article_dates)}")
-                    logger.info(f"[MERGE NARRATIVE DEBUG] Existing narrative first_seen: {matching_narrative.get('first_seen')}")
-                    logger.info(f"[MERGE NARRATIVE DEBUG] Calculated first_seen (from existing or now): {first_seen}")
-                    logger.info(f"[MERGE NARRATIVE DEBUG] Calculated last_updated (now): {last_updated}")
-                    logger.info(f"[MERGE NARRATIVE DEBUG] Is first_seen > last_updated? {first_seen > last_updated}")
-                    logger.info(f"[MERGE NARRATIVE DEBUG] Timestamp sources: first_seen from existing narrative, last_updated from now()")
-                    logger.info(f"[MERGE NARRATIVE DEBUG] ========== MERGE UPSERT END ==========")
+                # Initialize lifecycle history for new narrative
+                lifecycle_history, resurrection_fields = update_lifecycle_history(
+                    {},  # Empty dict for new narrative
+                    lifecycle_state,
+                    article_count,
+                    mention_velocity
+                )
+
+                # Use nucleus_entity as theme for database compatibility
+                theme = narrative_data.get("nucleus_entity", "unknown")
+
+                # Enrich narrative_data with computed fields for return value
+                narrative_data["theme"] = theme
+                narrative_data["entities"] = narrative_data.get("actors", [])[:10]
+                narrative_data["mention_velocity"] = round(mention_velocity, 2)
+                narrative_data["lifecycle"] = lifecycle
+                narrative_data["lifecycle_state"] = lifecycle_state
+                narrative_data["lifecycle_history"] = lifecycle_history
+                narrative_data["momentum"] = momentum
+                narrative_data["recency_score"] = round(recency_score, 3)
+
+                # DEBUG: Log all article dates and timestamp calculation for new narrative
+                logger.info(f"[CREATE NARRATIVE DEBUG] ========== CREATE UPSERT START ==========")
+                logger.info(f"[CREATE NARRATIVE DEBUG] Theme: {theme}")
+                logger.info(f"[CREATE NARRATIVE DEBUG] Title: {narrative_data.get('title')}")
+                logger.info(f"[CREATE NARRATIVE DEBUG] Article IDs: {narrative_data['article_ids']}")
+                logger.info(f"[CREATE NARRATIVE DEBUG] Article dates collected: {len(article_dates)}")
+                if article_dates:
+                    logger.info(f"[CREATE NARRATIVE DEBUG] Article dates (sorted):")
+                    for i, date in enumerate(sorted(article_dates)):
+                        logger.info(f"[CREATE NARRATIVE DEBUG]   [{i+1}] {date}")
+                    logger.info(f"[CREATE NARRATIVE DEBUG] Earliest article: {min(article_dates)}")
+                    logger.info(f"[CREATE NARRATIVE DEBUG] Latest article: {max(article_dates)}")
+                else:
+                    logger.warning(f"[CREATE NARRATIVE DEBUG] NO ARTICLE DATES FOUND!")
+                logger.info(f"[CREATE NARRATIVE DEBUG] Calculated first_seen (now): {first_seen}")
+                logger.info(f"[CREATE NARRATIVE DEBUG] Calculated last_updated (now): {last_updated}")
+                logger.info(f"[CREATE NARRATIVE DEBUG] Is first_seen > last_updated? {first_seen > last_updated}")
+                logger.info(f"[CREATE NARRATIVE DEBUG] Timestamp sources: BOTH from now() - THIS IS THE BUG!")
+                logger.info(f"[CREATE NARRATIVE DEBUG] Should use: first_seen = min(article_dates), last_updated = max(article_dates)")
+                logger.info(f"[CREATE NARRATIVE DEBUG] ========== CREATE UPSERT END ==========")
+
+                try:
+                    # Validate fingerprint before creation
+                    if not fingerprint or not fingerprint.get('nucleus_entity'):
+                        logger.error(f"Cannot create narrative - invalid fingerprint: {fingerprint}")
+                        raise ValueError("Narrative fingerprint must have a valid nucleus_entity")
 
                     # Post-clustering validation: Ensure articles mention nucleus_entity
-                    nucleus_entity = fingerprint.get('nucleus_entity', '')
-                    if nucleus_entity and combined_article_ids:
+                    nucleus_entity = narrative_data.get("nucleus_entity", "")
+                    article_ids = narrative_data.get("article_ids", [])
+
+                    if nucleus_entity and article_ids:
                         # Filter article_ids to only include articles mentioning nucleus_entity
                         validated_article_ids = []
                         rejected_articles = []
 
-                        for article_id in combined_article_ids:
+                        for article_id in article_ids:
                             # Find the article in the original articles list
                             article = next((a for a in articles if str(a.get("_id")) == str(article_id)), None)
 
@@ -1108,7 +1432,7 @@ async def detect_narratives(
                                 f"'{nucleus_entity}' narrative",
                                 extra={
                                     "narrative_nucleus": nucleus_entity,
-                                    "total_clustered": len(combined_article_ids),
+                                    "total_clustered": len(article_ids),
                                     "validated": len(validated_article_ids),
                                     "rejected": len(rejected_articles)
                                 }
@@ -1124,277 +1448,223 @@ async def detect_narratives(
                                     }
                                 )
 
-                        # Update with validated articles
-                        combined_article_ids = validated_article_ids
-                        updated_article_count = len(validated_article_ids)
-
-                    try:
-                        narrative_id = await upsert_narrative(
-                            theme=theme,
-                            title=title,
-                            summary=summary,
-                            entities=matching_narrative.get('entities', []),
-                            article_ids=combined_article_ids,
-                            article_count=updated_article_count,
-                            mention_velocity=round(mention_velocity, 2),
-                            lifecycle=matching_narrative.get('lifecycle', 'unknown'),
-                            momentum=matching_narrative.get('momentum', 'unknown'),
-                            recency_score=matching_narrative.get('recency_score', 0.0),
-                            entity_relationships=matching_narrative.get('entity_relationships', []),
-                            first_seen=first_seen,
-                            lifecycle_state=lifecycle_state,
-                            lifecycle_history=lifecycle_history,
-                            reawakening_count=resurrection_fields.get('reawakening_count') if resurrection_fields else None,
-                            reawakened_from=resurrection_fields.get('reawakened_from') if resurrection_fields else None,
-                            resurrection_velocity=resurrection_fields.get('resurrection_velocity') if resurrection_fields else None,
-                            dormant_since=dormant_since
-                        )
-                        
-                        logger.info(
-                            f"Merged {len(new_article_ids)} new articles into existing narrative: "
-                            f"'{title}' (ID: {narrative_id})"
-                        )
-                        
-                        # Fetch updated narrative for return value
-                        db = await mongo_manager.get_async_database()
-                        updated_narrative = await db.narratives.find_one({'_id': matching_narrative['_id']})
-                        if updated_narrative:
-                            saved_narratives.append(updated_narrative)
-                    except Exception as e:
-                        logger.exception(f"Failed to update narrative '{theme}': {e}")
-                        # Still add to saved narratives with local data
-                        matching_narrative['article_ids'] = combined_article_ids
-                        matching_narrative['article_count'] = updated_article_count
-                        matching_narrative['last_updated'] = last_updated
-                        matching_narrative['mention_velocity'] = round(mention_velocity, 2)
-                        matching_narrative['lifecycle_state'] = lifecycle_state
-                        matching_narrative['lifecycle_history'] = lifecycle_history
-                        saved_narratives.append(matching_narrative)
-                    
-                else:
-                    # No match found - check for reactivation before creating new
-                    reactivation_decision, reactivated_candidate = await should_reactivate_or_create_new(
-                        fingerprint, nucleus_entity=primary_nucleus
+                        # Update narrative with validated articles
+                        narrative_data["article_ids"] = validated_article_ids
+                        narrative_data["article_count"] = len(validated_article_ids)
+                        article_count = len(validated_article_ids)
+
+                    # Use upsert_narrative to ensure timestamp validation
+                    narrative_id = await save_narrative(
+                        theme=theme,
+                        title=narrative_data["title"],
+                        summary=narrative_data["summary"],
+                        entities=narrative_data.get("actors", [])[:10],
+                        article_ids=narrative_data["article_ids"],
+                        article_count=article_count,
+                        mention_velocity=round(mention_velocity, 2),
+                        lifecycle=lifecycle,
+                        momentum=momentum,
+                        recency_score=round(recency_score, 3),
+                        entity_relationships=narrative_data.get("entity_relationships", []),
+                        first_seen=first_seen,
+                        lifecycle_state=lifecycle_state,
+                        lifecycle_history=lifecycle_history,
+                        dormant_since=dormant_since
                     )
 
-                    if reactivation_decision == "reactivate" and reactivated_candidate:
-                        # Reactivate dormant narrative instead of creating new
-                        logger.info(
-                            f"Reactivating dormant narrative '{reactivated_candidate.get('title')}' "
-                            f"for nucleus entity '{primary_nucleus}'"
-                        )
-                        narrative_id = await _reactivate_narrative(
-                            reactivated_candidate,
-                            [str(article.get("_id")) for article in cluster if isinstance(article, dict)],
-                            cluster,
-                            fingerprint
-                        )
+                    logger.info(f"Created new narrative {narrative_id}: {narrative_data['title']}")
+                    saved_narratives.append(narrative_data)
+                except Exception as e:
+                    logger.exception(f"Failed to save narrative '{narrative_data.get('title')}': {e}")
 
-                        # Fetch and return the updated narrative
-                        db = await mongo_manager.get_async_database()
-                        updated_narrative = await db.narratives.find_one({"_id": reactivated_candidate["_id"]})
-                        if updated_narrative:
-                            saved_narratives.append(updated_narrative)
-                    else:
-                        # Create new narrative
-                        created_count += 1
-                        narrative = await generate_narrative_from_cluster(cluster)
-
-                        if not narrative:
-                            logger.warning(f"Failed to generate narrative for cluster with nucleus: {cluster.get('nucleus_entity')}")
-                            continue
-
-                        # Add fingerprint to narrative data
-                        narrative['fingerprint'] = fingerprint
-                        narrative['needs_summary_update'] = False  # Fresh summary, no update needed
-
-                        narrative_data = narrative
-                        # Calculate mention velocity (articles per day) based on recent activity
-                        article_count = narrative_data.get("article_count", 0)
-
-                        # Get articles for this narrative to extract dates
-                        article_ids = narrative_data.get("article_ids", [])
-                        article_dates = []
-                        articles_found = 0
-                        for article in articles:
-                            if str(article.get("_id")) in article_ids:
-                                articles_found += 1
-                                pub_date = article.get("published_at")
-                                if pub_date:
-                                    # Ensure timezone-aware
-                                    if pub_date.tzinfo is None:
-                                        pub_date = pub_date.replace(tzinfo=timezone.utc)
-                                    article_dates.append(pub_date)
-
-                        # DEBUG: Log if we're missing articles
-                        if articles_found != len(article_ids):
-                            logger.warning(f"[CREATE NARRATIVE] Only found {articles_found}/{len(article_ids)} articles in articles list!")
-
-                        # Use recent velocity calculation (last 7 days) for more accurate current activity
-                        mention_velocity = calculate_recent_velocity(article_dates, lookback_days=7)
-
-                        # Calculate momentum from article dates
-
-                        # Sort dates and calculate momentum
-                        article_dates.sort()
-                        momentum = calculate_momentum(article_dates)
-
-                        # Calculate recency score (0-1, higher = more recent)
-                        newest_article = article_dates[-1] if article_dates else None
-                        if newest_article:
-                            # Ensure newest_article is timezone-aware
-                            if newest_article.tzinfo is None:
-                                newest_article = newest_article.replace(tzinfo=timezone.utc)
-                            hours_since_last_update = (datetime.now(timezone.utc) - newest_article).total_seconds() / 3600
-                            recency_score = exp(-hours_since_last_update / 24)  # 24h half-life
-                        else:
-                            recency_score = 0.0
-
-                        # Determine lifecycle stage with momentum awareness (legacy)
-                        lifecycle = determine_lifecycle_stage(article_count, mention_velocity, momentum)
-
-                        # Determine lifecycle state (new approach)
-                        # Use article dates for first_seen and last_updated, not now()
-                        if article_dates:
-                            first_seen = min(article_dates)
-                            last_updated = max(article_dates)
-                            logger.info(f"[CREATE NARRATIVE] Using article dates: first_seen={first_seen}, last_updated={last_updated}, article_count={len(article_dates)}")
-                        else:
-                            # Fallback to now() if no article dates available
-                            first_seen = datetime.now(timezone.utc)
-                            last_updated = datetime.now(timezone.utc)
-                            logger.warning(f"[CREATE NARRATIVE] NO ARTICLE DATES! Using now(): first_seen={first_seen}, last_updated={last_updated}")
-                        # No previous state for new narratives
-                        lifecycle_state, dormant_since = determine_lifecycle_state(
-                            article_count, mention_velocity, first_seen, last_updated, previous_state=None
-                        )
+    logger.info(
+        f"Narrative detection complete: {matched_count} merged into existing, "
+        f"{created_count} newly created, {len(saved_narratives)} total"
+    )
+    return saved_narratives
 
-                        # Initialize lifecycle history for new narrative
-                        lifecycle_history, resurrection_fields = update_lifecycle_history(
-                            {},  # Empty dict for new narrative
-                            lifecycle_state,
-                            article_count,
-                            mention_velocity
-                        )
 
-                        # Use nucleus_entity as theme for database compatibility
-                        theme = narrative_data.get("nucleus_entity", "unknown")
-
-                        # Enrich narrative_data with computed fields for return value
-                        narrative_data["theme"] = theme
-                        narrative_data["entities"] = narrative_data.get("actors", [])[:10]
-                        narrative_data["mention_velocity"] = round(mention_velocity, 2)
-                        narrative_data["lifecycle"] = lifecycle
-                        narrative_data["lifecycle_state"] = lifecycle_state
-                        narrative_data["lifecycle_history"] = lifecycle_history
-                        narrative_data["momentum"] = momentum
-                        narrative_data["recency_score"] = round(recency_score, 3)
-
-                        # DEBUG: Log all article dates and timestamp calculation for new narrative
-                        logger.info(f"[CREATE NARRATIVE DEBUG] ========== CREATE UPSERT START ==========")
-                        logger.info(f"[CREATE NARRATIVE DEBUG] Theme: {theme}")
-                        logger.info(f"[CREATE NARRATIVE DEBUG] Title: {narrative_data.get('title')}")
-                        logger.info(f"[CREATE NARRATIVE DEBUG] Article IDs: {narrative_data['article_ids']}")
-                        logger.info(f"[CREATE NARRATIVE DEBUG] Article dates collected: {len(article_dates)}")
-                        if article_dates:
-                            logger.info(f"[CREATE NARRATIVE DEBUG] Article dates (sorted):")
-                            for i, date in enumerate(sorted(article_dates)):
-                                logger.info(f"[CREATE NARRATIVE DEBUG]   [{i+1}] {date}")
-                            logger.info(f"[CREATE NARRATIVE DEBUG] Earliest article: {min(article_dates)}")
-                            logger.info(f"[CREATE NARRATIVE DEBUG] Latest article: {max(article_dates)}")
-                        else:
-                            logger.warning(f"[CREATE NARRATIVE DEBUG] NO ARTICLE DATES FOUND!")
-                        logger.info(f"[CREATE NARRATIVE DEBUG] Calculated first_seen (now): {first_seen}")
-                        logger.info(f"[CREATE NARRATIVE DEBUG] Calculated last_updated (now): {last_updated}")
-                        logger.info(f"[CREATE NARRATIVE DEBUG] Is first_seen > last_updated? {first_seen > last_updated}")
-                        logger.info(f"[CREATE NARRATIVE DEBUG] Timestamp sources: BOTH from now() - THIS IS THE BUG!")
-                        logger.info(f"[CREATE NARRATIVE DEBUG] Should use: first_seen = min(article_dates), last_updated = max(article_dates)")
-                        logger.info(f"[CREATE NARRATIVE DEBUG] ========== CREATE UPSERT END ==========")
-
-                        try:
-                            # Validate fingerprint before creation
-                            if not fingerprint or not fingerprint.get('nucleus_entity'):
-                                logger.error(f"Cannot create narrative - invalid fingerprint: {fingerprint}")
-                                raise ValueError("Narrative fingerprint must have a valid nucleus_entity")
-
-                            # Post-clustering validation: Ensure articles mention nucleus_entity
-                            nucleus_entity = narrative_data.get("nucleus_entity", "")
-                            article_ids = narrative_data.get("article_ids", [])
-
-                            if nucleus_entity and article_ids:
-                                # Filter article_ids to only include articles mentioning nucleus_entity
-                                validated_article_ids = []
-                                rejected_articles = []
-
-                                for article_id in article_ids:
-                                    # Find the article in the original articles list
-                                    article = next((a for a in articles if str(a.get("_id")) == str(article_id)), None)
-
-                                    if article and validate_article_mentions_entity(article, nucleus_entity):
-                                        validated_article_ids.append(article_id)
-                                    else:
-                                        rejected_articles.append({
-                                            "article_id": article_id,
-                                            "title": article.get("title", "") if article else "unknown"
-                                        })
-
-                                # Log rejected articles
-                                if rejected_articles:
-                                    logger.info(
-                                        f"Post-cluster validation: {len(rejected_articles)} articles rejected from "
-                                        f"'{nucleus_entity}' narrative",
-                                        extra={
-                                            "narrative_nucleus": nucleus_entity,
-                                            "total_clustered": len(article_ids),
-                                            "validated": len(validated_article_ids),
-                                            "rejected": len(rejected_articles)
-                                        }
-                                    )
-                                    for rejected in rejected_articles:
-                                        logger.warning(
-                                            f"Post-cluster validation rejected article from narrative",
-                                            extra={
-                                                "narrative_nucleus": nucleus_entity,
-                                                "article_title": rejected["title"][:100],
-                                                "article_id": str(rejected["article_id"]),
-                                                "reason": "nucleus_entity_not_in_text"
-                                            }
-                                        )
-
-                                # Update narrative with validated articles
-                                narrative_data["article_ids"] = validated_article_ids
-                                narrative_data["article_count"] = len(validated_article_ids)
-                                article_count = len(validated_article_ids)
-
-                            # Use upsert_narrative to ensure timestamp validation
-                            narrative_id = await upsert_narrative(
-                                theme=theme,
-                                title=narrative_data["title"],
-                                summary=narrative_data["summary"],
-                                entities=narrative_data.get("actors", [])[:10],
-                                article_ids=narrative_data["article_ids"],
-                                article_count=article_count,
-                                mention_velocity=round(mention_velocity, 2),
-                                lifecycle=lifecycle,
-                                momentum=momentum,
-                                recency_score=round(recency_score, 3),
-                                entity_relationships=narrative_data.get("entity_relationships", []),
-                                first_seen=first_seen,
-                                lifecycle_state=lifecycle_state,
-                                lifecycle_history=lifecycle_history,
-                                dormant_since=dormant_since
-                            )
+async def _detect_narratives_incremental(hours: int, min_articles: int) -> List[Dict[str, Any]]:
+    """
+    Salience-based detection that only processes articles new since the last cycle.
+
+    Reuses the clustering state of the previous cycle (in process, or loaded
+    from the database after a restart): articles that left the window are
+    expired, articles created or extracted since the watermark are assigned
+    to existing or new clusters, and only clusters that gained or lost
+    articles are merged/created as narratives. A cluster that expiry took
+    below ``min_articles`` only refreshes its existing narrative. The state
+    is rebuilt from a full pass when none is stored or it is older than
+    NARRATIVE_FULL_REBUILD_HOURS.
+
+    Args:
+        hours: Lookback window for articles
+        min_articles: Minimum articles per narrative cluster
+
+    Returns:
+        List of narrative dicts saved this cycle
+    """
+    now = datetime.now(timezone.utc)
+    cutoff_time = now - timedelta(hours=hours)
+    article_query = _narrative_articles_query(cutoff_time)
+
+    state = get_cluster_state()
+    if state is None or state.window_hours != hours:
+        stored = await load_cluster_state()
+        state = None
+        if stored and stored.get("window_hours") == hours:
+            state = ClusterState.from_members(
+                hours, stored["members"], built_at=stored.get("built_at"), watermark=stored.get("watermark")
+            )
+    rebuild = (
+        state is None
+        or state.watermark is None
+        or now - state.built_at >= timedelta(hours=settings.NARRATIVE_FULL_REBUILD_HOURS)
+    )
+
+    # Backfill narrative data for recent articles if needed
+    backfilled_count = await backfill_narratives_for_recent_articles(hours=hours)
+    logger.info(f"Backfilled narrative data for {backfilled_count} articles")
 
-                            logger.info(f"Created new narrative {narrative_id}: {narrative_data['title']}")
-                            saved_narratives.append(narrative_data)
-                        except Exception as e:
-                            logger.exception(f"Failed to save narrative '{narrative_data.get('title')}': {e}")
+    db = await mongo_manager.get_async_database()
+    lease = current_lease()
+    expired = []
+    expired_ids = []
+    try:
+        if rebuild:
+            logger.info(f"Rebuilding narrative clusters from all articles in the last {hours}h")
+            articles = await db.articles.find(article_query).to_list(length=None)
+            state = ClusterState(hours, built_at=now, watermark=now)
+            added = [member for member in map(state.assign, articles) if member]
+            changed = set(state.keys)
+        else:
+            since = state.watermark - INCREMENTAL_WATERMARK_OVERLAP
+            query = {
+                **article_query,
+                "$and": [{"$or": [
+                    {"created_at": {"$gt": since}},
+                    {"narrative_extracted_at": {"$gt": since}},
+                ]}],
+            }
+            articles = [
+                article for article in await db.articles.find(query).to_list(length=None)
+                if article["_id"] not in state
+            ]
+            expired = state.expire(cutoff_time)
+            expired_ids = [member["_id"] for member in expired]
+            added = [member for member in map(state.assign, articles) if member]
+            # Clusters that lost articles need their counts and lifecycle refreshed too
+            changed = {member["cluster"] for member in added + expired}
+            state.watermark = now
+
+        # Clusters that expiry took below min_articles still have the
+        # narrative saved when they were larger: refresh it, don't create one
+        added_counts = Counter(member["cluster"] for member in added)
+        expired_counts = Counter(member["cluster"] for member in expired)
+        member_clusters = []
+        shrunk = set()
+        for key in state.keys:
+            if key not in changed:
+                continue
+            members = state.cluster(key)
+            if len(members) < min_articles:
+                if not members or len(members) - added_counts[key] + expired_counts[key] < min_articles:
+                    continue
+                shrunk.add(len(member_clusters))
+            member_clusters.append(members)
+
+        # Members are stored as clustering features; load the full articles
+        # of changed clusters that weren't part of this cycle's query
+        by_id = {article["_id"]: article for article in articles}
+        missing_ids = [m["_id"] for members in member_clusters for m in members if m["_id"] not in by_id]
+        if missing_ids:
+            for article in await _load_articles(missing_ids, article_query):
+                by_id[article["_id"]] = article
+        clusters = [
+            [by_id[m["_id"]] for m in members if m["_id"] in by_id]
+            for members in member_clusters
+        ]
+
+        logger.info(
+            f"Incremental narrative detection: {len(added)} articles assigned, "
+            f"{len(expired_ids)} expired, {len(clusters)} of {len(state.keys)} clusters changed"
+        )
+
+        saved_narratives = await _save_narrative_clusters(
+            clusters, list(by_id.values()), hours,
+            article_query=None if rebuild else article_query, merge_only=shrunk
+        )
+
+        await save_cluster_state(
+            {"window_hours": hours, "watermark": state.watermark, "built_at": state.built_at},
+            state.members() if rebuild else added,
+            expired_ids,
+            replace=rebuild,
+            fencing_token=lease.token if lease else None,
+        )
+    except Exception:
+        # Fall back to the last persisted state next cycle
+        set_cluster_state(None)
+        raise
+
+    set_cluster_state(state)
+    return saved_narratives
+
+
+async def detect_narratives(
+    hours: int = 48,
+    min_articles: int = 3,
+    use_salience_clustering: bool = True,
+    incremental: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Detect narratives using salience-aware clustering.
+    
+    Args:
+        hours: Lookback window for articles
+        min_articles: Minimum articles per narrative cluster
+        use_salience_clustering: Use new salience-based system (vs old theme-based)
+        incremental: Carry clustering state over from the previous cycle and
+            only process new articles (see _detect_narratives_incremental)
+    
+    Returns:
+        List of narrative dicts with full structure including lifecycle tracking
+    """
+    try:
+        if use_salience_clustering and incremental:
+            return await _detect_narratives_incremental(hours, min_articles)
+
+        if use_salience_clustering:
+            # NEW: Use salience-aware clustering
+            logger.info(f"Using salience-based narrative detection for last {hours} hours")
             
-            logger.info(
-                f"Narrative detection complete: {matched_count} merged into existing, "
-                f"{created_count} newly created, {len(saved_narratives)} total"
+            # Backfill narrative data for recent articles if needed
+            backfilled_count = await backfill_narratives_for_recent_articles(hours=hours)
+            logger.info(f"Backfilled narrative data for {backfilled_count} articles")
+            
+            # Get recent articles with narrative data
+            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+            db = await mongo_manager.get_async_database()
+            articles_collection = db.articles
+            
+            cursor = articles_collection.find(_narrative_articles_query(cutoff_time))
+            
+            articles = await cursor.to_list(length=None)
+            logger.info(f"Found {len(articles)} articles with narrative data in last {hours}h")
+            
+            if not articles:
+                logger.warning("No articles with narrative data found")
+                return []
+            
+            # Cluster articles by nucleus entity and weighted overlap
+            clusters = await cluster_by_narrative_salience(
+                articles,
+                min_cluster_size=min_articles
             )
-            return saved_narratives
+            
+            logger.info(f"Created {len(clusters)} narrative clusters")
+
+            return await _save_narrative_clusters(clusters, articles, hours)
         
         else:
             # OLD: Use theme-based clustering (fallback)
@@ -1532,7 +1802,7 @@ async def detect_narratives(
                         if "resurrection_velocity" in resurrection_fields:
                             upsert_args["resurrection_velocity"] = resurrection_fields["resurrection_velocity"]
 
-                    narrative_id = await upsert_narrative(**upsert_args)
+                    narrative_id = await save_narrative(**upsert_args)
                     logger.info(f"Saved narrative {narrative_id} to database")
                 except Exception as e:
                     logger.exception(f"Failed to save narrative for theme '{theme}': {e}")
@@ -1580,6 +1850,7 @@ async def consolidate_duplicate_narratives() -> Dict[str, Any]:
     merge_count = 0
     merged_pairs = []
     errors = []
+    top_k = settings.NARRATIVE_MATCH_TOP_K
 
     for entity, entity_narratives in narratives_by_entity.items():
         if len(entity_narratives) < 2:
@@ -1587,42 +1858,64 @@ async def consolidate_duplicate_narratives() -> Dict[str, Any]:
 
         logger.info(f"Checking {len(entity_narratives)} narratives for {entity}")
 
-        # Check all pairs
-        for n1, n2 in combinations(entity_narratives, 2):
-            try:
-                # Compute similarity using existing fingerprint method
-                fp1 = n1.get("fingerprint", {})
-                fp2 = n2.get("fingerprint", {})
-
-                # IMPORTANT: Requires narrative_focus in fingerprint
-                if not fp1.get("narrative_focus") or not fp2.get("narrative_focus"):
-                    logger.warning(f"Skipping merge check - missing narrative_focus: {n1['_id']} or {n2['_id']}")
-                    continue
+        # IMPORTANT: Requires narrative_focus in fingerprint
+        comparable = []
+        for narrative in entity_narratives:
+            if narrative.get("fingerprint", {}).get("narrative_focus"):
+                comparable.append(narrative)
+            else:
+                logger.warning(f"Skipping merge check - missing narrative_focus: {narrative['_id']}")
+
+        # Index the group so each narrative is only scored against its top-k
+        # candidates instead of every other narrative in the group
+        index = NarrativeFingerprintIndex()
+        by_id = {}
+        for narrative in comparable:
+            index.add(narrative["_id"], narrative["fingerprint"], narrative.get("last_updated"))
+            by_id[str(narrative["_id"])] = narrative
+
+        for n1 in comparable:
+            if n1["_id"] not in index:
+                continue  # Already merged into another narrative
+            # Drop n1 first so every pair is checked once
+            index.remove(n1["_id"])
+            fp1 = n1["fingerprint"]
+
+            for candidate_id in index.candidates(fp1, limit=top_k):
+                n2 = by_id[str(candidate_id)]
+                try:
+                    # Compute similarity using existing fingerprint method
+                    similarity = calculate_fingerprint_similarity(fp1, n2["fingerprint"])
 
-                similarity = calculate_fingerprint_similarity(fp1, fp2)
+                    if similarity < 0.9:
+                        continue
 
-                if similarity >= 0.9:
                     logger.info(f"High similarity ({similarity:.3f}) between {n1['_id']} and {n2['_id']}")
 
-                    # Merge n2 into n1 (keep larger narrative)
+                    # Merge the smaller narrative into the larger one
+                    survivor, merged = n1, n2
                     if n2.get("article_count", 0) > n1.get("article_count", 0):
-                        n1, n2 = n2, n1  # Swap so n1 is larger
+                        survivor, merged = n2, n1
 
-                    await _merge_narratives(n1, n2, similarity, db)
+                    await _merge_narratives(survivor, merged, similarity, db)
+                    index.remove(merged["_id"])
                     merge_count += 1
                     merged_pairs.append({
-                        "survivor": str(n1["_id"]),
-                        "merged": str(n2["_id"]),
+                        "survivor": str(survivor["_id"]),
+                        "merged": str(merged["_id"]),
                         "similarity": similarity
                     })
 
-            except Exception as e:
-                logger.error(f"Error merging {n1['_id']} and {n2['_id']}: {e}")
-                errors.append({
-                    "n1": str(n1["_id"]),
-                    "n2": str(n2["_id"]),
-                    "error": str(e)
-                })
+                    if merged is n1:
+                        break
+
+                except Exception as e:
+                    logger.error(f"Error merging {n1['_id']} and {n2['_id']}: {e}")
+                    errors.append({
+                        "n1": str(n1["_id"]),
+                        "n2": str(n2["_id"]),
+                        "error": str(e)
+                    })
 
     logger.info(f"Consolidation complete: {merge_count} merges, {len(errors)} errors")
 
@@ -1742,6 +2035,7 @@ async def _merge_narratives(survivor: Dict, merged: Dict, similarity: float, db)
         combined_state = survivor_state
 
     # 5. Update survivor narrative
+    now = datetime.now(timezone.utc)
     await narratives_collection.update_one(
         {"_id": survivor_id},
         {
@@ -1751,10 +2045,11 @@ async def _merge_narratives(survivor: Dict, merged: Dict, similarity: float, db)
                 "avg_sentiment": combined_sentiment,
                 "timeline_data": combined_timeline,
                 "lifecycle_state": combined_state,
-                "last_updated": datetime.now(timezone.utc)
+                "last_updated": now
             }
         }
     )
+    index_narrative({**survivor, "lifecycle_state": combined_state, "last_updated": now})
 
     # 6. Mark merged narrative
     await narratives_collection.update_one(
@@ -1763,10 +2058,11 @@ async def _merge_narratives(survivor: Dict, merged: Dict, similarity: float, db)
             "$set": {
                 "merged_into": survivor_id,
                 "lifecycle_state": "merged",
-                "last_updated": datetime.now(timezone.utc)
+                "last_updated": now
             }
         }
     )
+    unindex_narrative(merged_id)
 
     # 7. Update article references
     await articles_collection.update_many(
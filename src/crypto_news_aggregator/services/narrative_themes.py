@@ -10,7 +10,7 @@ import hashlib
 import json
 import logging
 import re
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime, timezone
 from itertools import combinations
 from collections import defaultdict, Counter
@@ -373,6 +373,17 @@ def calculate_fingerprint_similarity(
     return similarity
 
 
+def narrative_content_hash(article: Dict) -> str:
+    """
+    Hash the article content that narrative extraction depends on.
+
+    Stored as ``narrative_hash`` so unchanged articles are not re-extracted.
+    """
+    title = article.get('title', '')
+    summary = article.get('description', '') or article.get('text', '') or article.get('content', '')
+    return hashlib.sha1(f"{title}:{summary}".encode()).hexdigest()
+
+
 def clean_json_response(response: str) -> str:
     """
     Clean JSON response from LLM to handle control characters and newlines.
@@ -612,11 +623,11 @@ async def discover_narrative_from_article(
     """
     article_id = str(article.get('_id', 'unknown'))
     
-    # Generate content hash for caching
     title = article.get('title', '')
     summary = article.get('description', '') or article.get('text', '') or article.get('content', '')
-    content_for_hash = f"{title}:{summary}"
-    content_hash = hashlib.sha1(content_for_hash.encode()).hexdigest()
+
+    # Generate content hash for caching
+    content_hash = narrative_content_hash(article)
     
     # Check if we already have current narrative data
     existing_hash = article.get('narrative_hash')
@@ -964,6 +975,178 @@ Return valid JSON with no newlines in string values: {{"title": "...", "summary"
         return None
 
 
+# Minimum actor salience for an actor to count as a "core" actor in clustering
+CORE_ACTOR_SALIENCE = 4.5
+
+# Minimum link strength for an article to join an existing cluster
+CLUSTER_LINK_THRESHOLD = 0.8
+
+
+class SalienceClusterIndex:
+    """
+    Incremental state for salience-based clustering.
+
+    Keeps per-cluster aggregates (founding nucleus, core actors, tensions)
+    up to date as articles are added, plus inverted indexes from nucleus
+    entity, core actor and tension to cluster ids. Assigning an article only
+    scores the clusters that share at least one key with it; every other
+    cluster would have link strength 0 and could never be the best match.
+    """
+
+    def __init__(self):
+        self.clusters: List[List[Dict]] = []
+        self.cluster_nucleus: List[str] = []
+        self.cluster_core_actors: List[Set[str]] = []
+        self.cluster_tensions: List[Set[str]] = []
+        self.nucleus_index: Dict[str, Set[int]] = defaultdict(set)
+        self.core_actor_index: Dict[str, Set[int]] = defaultdict(set)
+        self.tension_index: Dict[str, Set[int]] = defaultdict(set)
+
+    @staticmethod
+    def core_actors_of(article: Dict) -> List[str]:
+        """High-salience actors of an article (the key players, not background mentions)."""
+        actors = article.get('actors') or []
+        actor_salience = article.get('actor_salience') or {}
+        return [a for a in actors if actor_salience.get(a, 0) >= CORE_ACTOR_SALIENCE]
+
+    def link_strength(
+        self,
+        cluster_id: int,
+        nucleus: str,
+        core_actors: Set[str],
+        tensions: Set[str],
+    ) -> float:
+        """
+        Weighted link strength between an article and a cluster.
+
+        - Same nucleus entity: +1.0 (strongest signal)
+        - 2+ shared high-salience actors: +0.7
+        - 1 shared high-salience actor: +0.4
+        - 1+ shared tensions: +0.3
+        """
+        strength = 0.0
+        if nucleus and nucleus == self.cluster_nucleus[cluster_id]:
+            strength += 1.0
+
+        shared_core = len(core_actors & self.cluster_core_actors[cluster_id])
+        if shared_core >= 2:
+            strength += 0.7
+        elif shared_core >= 1:
+            strength += 0.4
+
+        if tensions & self.cluster_tensions[cluster_id]:
+            strength += 0.3
+
+        return strength
+
+    def candidate_clusters(
+        self,
+        nucleus: str,
+        core_actors: Set[str],
+        tensions: Set[str],
+    ) -> List[int]:
+        """Ids of clusters sharing at least one key with the article, in creation order."""
+        candidates = set(self.nucleus_index.get(nucleus, ()))
+        for actor in core_actors:
+            candidates.update(self.core_actor_index.get(actor, ()))
+        for tension in tensions:
+            candidates.update(self.tension_index.get(tension, ()))
+        return sorted(candidates)
+
+    def best_match(self, article: Dict) -> Tuple[Optional[int], float]:
+        """
+        Find the best matching cluster for an article.
+
+        Ties go to the earliest created cluster.
+
+        Returns:
+            Tuple of (cluster id or None, link strength)
+        """
+        nucleus = article.get('nucleus_entity')
+        core_actors = set(self.core_actors_of(article))
+        tensions = set(article.get('tensions') or [])
+
+        best_cluster = None
+        best_strength = 0.0
+        for cluster_id in self.candidate_clusters(nucleus, core_actors, tensions):
+            strength = self.link_strength(cluster_id, nucleus, core_actors, tensions)
+            if strength > best_strength:
+                best_strength = strength
+                best_cluster = cluster_id
+        return best_cluster, best_strength
+
+    def add_to_cluster(self, cluster_id: int, article: Dict) -> None:
+        """Append an article to a cluster and update aggregates and indexes."""
+        self.clusters[cluster_id].append(article)
+        for actor in self.core_actors_of(article):
+            if actor not in self.cluster_core_actors[cluster_id]:
+                self.cluster_core_actors[cluster_id].add(actor)
+                self.core_actor_index[actor].add(cluster_id)
+        for tension in article.get('tensions') or []:
+            if tension not in self.cluster_tensions[cluster_id]:
+                self.cluster_tensions[cluster_id].add(tension)
+                self.tension_index[tension].add(cluster_id)
+
+    def remove_from_cluster(self, cluster_id: int, articles: List[Dict]) -> None:
+        """
+        Drop articles from a cluster and recompute its aggregates from the rest.
+
+        A cluster whose founding article is dropped is refounded on its oldest
+        remaining member. An emptied cluster keeps its id but leaves every
+        index, so it is never a candidate again.
+        """
+        dropped = {str(article['_id']) for article in articles}
+        members = [a for a in self.clusters[cluster_id] if str(a['_id']) not in dropped]
+        nucleus = members[0].get('nucleus_entity') if members else None
+        core_actors = {actor for a in members for actor in self.core_actors_of(a)}
+        tensions = {tension for a in members for tension in a.get('tensions') or []}
+
+        old_nucleus = self.cluster_nucleus[cluster_id]
+        self._reindex(self.nucleus_index, cluster_id, {old_nucleus}, {nucleus} if members else set())
+        self._reindex(self.core_actor_index, cluster_id, self.cluster_core_actors[cluster_id], core_actors)
+        self._reindex(self.tension_index, cluster_id, self.cluster_tensions[cluster_id], tensions)
+
+        self.clusters[cluster_id] = members
+        self.cluster_nucleus[cluster_id] = nucleus
+        self.cluster_core_actors[cluster_id] = core_actors
+        self.cluster_tensions[cluster_id] = tensions
+
+    @staticmethod
+    def _reindex(index: Dict[str, Set[int]], cluster_id: int, old: Set[str], new: Set[str]) -> None:
+        """Move a cluster's entries in an inverted index from ``old`` keys to ``new`` ones."""
+        for key in old - new:
+            index[key].discard(cluster_id)
+            if not index[key]:
+                del index[key]
+        for key in new - old:
+            index[key].add(cluster_id)
+
+    def new_cluster(self, article: Dict) -> int:
+        """Start a new cluster founded by an article."""
+        cluster_id = len(self.clusters)
+        nucleus = article.get('nucleus_entity')
+        self.clusters.append([])
+        self.cluster_nucleus.append(nucleus)
+        self.cluster_core_actors.append(set())
+        self.cluster_tensions.append(set())
+        self.nucleus_index[nucleus].add(cluster_id)
+        self.add_to_cluster(cluster_id, article)
+        return cluster_id
+
+    def assign(self, article: Dict) -> Tuple[int, float]:
+        """
+        Assign an article to its best cluster, or start a new one.
+
+        Returns:
+            Tuple of (cluster id, link strength of the best match)
+        """
+        cluster_id, strength = self.best_match(article)
+        if cluster_id is not None and strength >= CLUSTER_LINK_THRESHOLD:
+            self.add_to_cluster(cluster_id, article)
+            return cluster_id, strength
+        return self.new_cluster(article), strength
+
+
 async def cluster_by_narrative_salience(
     articles: List[Dict],
     min_cluster_size: int = 3
@@ -973,12 +1156,15 @@ async def cluster_by_narrative_salience(
     
     Clustering logic uses weighted link strength:
     - Same nucleus entity: +1.0 (strongest signal)
-    - 2+ shared high-salience actors (≥4): +0.7
+    - 2+ shared high-salience actors (≥4.5): +0.7
     - 1 shared high-salience actor: +0.4
     - 1+ shared tensions: +0.3
     
     Articles cluster together if link_strength >= 0.8
     
+    Candidate clusters come from inverted indexes (see SalienceClusterIndex),
+    so each article is only scored against clusters it shares a key with.
+    
     Args:
         articles: List of article dicts with actors, actor_salience, nucleus_entity, tensions
         min_cluster_size: Minimum articles required to form a cluster
@@ -986,93 +1172,23 @@ async def cluster_by_narrative_salience(
     Returns:
         List of article clusters (each cluster is a list of articles)
     """
-    clusters = []
+    index = SalienceClusterIndex()
     
     logger.info(f"Starting clustering for {len(articles)} articles")
     
     for idx, article in enumerate(articles, 1):
-        nucleus = article.get('nucleus_entity')
-        actors = article.get('actors') or []
-        actor_salience = article.get('actor_salience') or {}
-        tensions = article.get('tensions') or []
-        article_title = article.get('title', 'Unknown')[:50]
-        
         # Skip articles with missing critical data
-        if not nucleus or not actors:
+        if not article.get('nucleus_entity') or not article.get('actors'):
             logger.warning(f"Skipping article {idx} - missing nucleus or actors")
             continue
         
-        # Get high-salience actors only (salience >= 4.5)
-        # These are the key players, not background mentions
-        core_actors = [a for a in actors if actor_salience.get(a, 0) >= 4.5]
-        
-        logger.info(f"Article {idx}/{len(articles)}: {article_title}")
-        logger.info(f"  Nucleus: {nucleus}, Core actors: {core_actors}")
-        logger.info(f"  All actors: {actors}, Tensions: {tensions}")
-        
-        # Try to match with existing cluster
-        matched = False
-        best_cluster = None
-        best_strength = 0.0
-        
-        for cluster in clusters:
-            # Get cluster properties from first article (representative)
-            cluster_nucleus = cluster[0].get('nucleus_entity')
-            
-            # Aggregate cluster properties
-            cluster_actors = set()
-            cluster_core_actors = set()
-            cluster_tensions = set()
-            
-            for cluster_article in cluster:
-                cluster_actors.update(cluster_article.get('actors') or [])
-                cluster_tensions.update(cluster_article.get('tensions') or [])
-                c_salience = cluster_article.get('actor_salience') or {}
-                c_actors = cluster_article.get('actors') or []
-                cluster_core_actors.update(
-                    a for a in c_actors
-                    if c_salience.get(a, 0) >= 4.5
-                )
-            
-            # Calculate weighted link strength
-            link_strength = 0.0
-            
-            # Strongest signal: Same nucleus entity
-            # e.g., Both articles are fundamentally about "SEC"
-            if nucleus and nucleus == cluster_nucleus:
-                link_strength += 1.0
-            
-            # Medium signal: High-salience actors overlap
-            # e.g., Both feature "Binance" and "Coinbase" as key players
-            shared_core = len(set(core_actors) & cluster_core_actors)
-            if shared_core >= 2:
-                link_strength += 0.7
-            elif shared_core >= 1:
-                link_strength += 0.4
-            
-            # Weaker signal: Shared tensions/themes
-            # e.g., Both involve "Regulation vs Innovation"
-            shared_tensions = len(set(tensions) & cluster_tensions)
-            if shared_tensions >= 1:
-                link_strength += 0.3
-            
-            # Track best matching cluster
-            if link_strength > best_strength:
-                best_strength = link_strength
-                best_cluster = cluster
-        
-        # Cluster if link strength is strong enough (threshold: 0.8)
-        logger.info(f"  Best cluster match: strength={best_strength:.2f}, threshold=0.8")
-        
-        if best_strength >= 0.8 and best_cluster is not None:
-            best_cluster.append(article)
-            matched = True
-            logger.info(f"  ✓ Matched to existing cluster (now {len(best_cluster)} articles)")
-        
-        # Create new cluster if no good match
-        if not matched:
-            clusters.append([article])
-            logger.info(f"  ✗ Created new cluster (total clusters: {len(clusters)})")
+        cluster_id, strength = index.assign(article)
+        logger.debug(
+            f"Article {idx}/{len(articles)}: {article.get('title', 'Unknown')[:50]} "
+            f"-> cluster {cluster_id} (best strength={strength:.2f}, size={len(index.clusters[cluster_id])})"
+        )
+    
+    clusters = index.clusters
     
     # Filter out small clusters (below minimum size)
     substantial_clusters = [c for c in clusters if len(c) >= min_cluster_size]
@@ -0,0 +1,245 @@
+"""
+Near-duplicate article detection with MinHash signatures and an LSH band index.
+
+Syndicated rewrites of the same story (CoinDesk, Decrypt, Cointelegraph, ...)
+rarely share an exact fingerprint, but they share most of their word
+shingles. Each article gets a MinHash signature over its 3-word shingles;
+the fraction of equal signature slots estimates the Jaccard similarity of
+two articles' shingle sets.
+
+``NearDuplicateIndex`` splits signatures into bands and buckets articles by
+band hash, so finding candidates for a new article is a handful of dict
+lookups instead of a scan over stored articles. Candidates are then checked
+against the full signature and the configured similarity threshold.
+"""
+
+import hashlib
+import logging
+import operator
+import re
+import struct
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from unidecode import unidecode
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+NUM_PERMUTATIONS = 64
+BANDS = 32
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+SHINGLE_SIZE = 3
+
+# Mersenne prime for the universal hash family; signature values stay below
+# 2**61 so they fit in a MongoDB int64
+_PRIME = (1 << 61) - 1
+
+
+def _permutation_params() -> List[Tuple[int, int]]:
+    # Derived from fixed seeds so signatures stored in Mongo stay comparable
+    # across processes and restarts
+    params = []
+    for i in range(NUM_PERMUTATIONS):
+        digest = hashlib.blake2b(f"minhash-{i}".encode(), digest_size=16).digest()
+        a, b = struct.unpack("<QQ", digest)
+        params.append((a % (_PRIME - 1) + 1, b % _PRIME))
+    return params
+
+
+_PERMUTATIONS = _permutation_params()
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Normalized word shingles of ``text`` (URLs and punctuation removed)."""
+    text = re.sub(r"http\S+", " ", text or "")
+    words = re.sub(r"[^\w\s]", " ", unidecode(text).lower()).split()
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash(features: Iterable[str]) -> Optional[List[int]]:
+    """
+    MinHash signature of a set of string features.
+
+    Returns:
+        NUM_PERMUTATIONS ints, or None when there are no features
+    """
+    hashes = [
+        int.from_bytes(hashlib.blake2b(f.encode("utf-8"), digest_size=8).digest(), "little")
+        for f in set(features)
+    ]
+    if not hashes:
+        return None
+    return [
+        min((a * h + b) % _PRIME for h in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def minhash_signature(text: str) -> Optional[List[int]]:
+    """
+    MinHash signature of an article's text.
+
+    Returns:
+        NUM_PERMUTATIONS ints, or None when the text has no words
+    """
+    return minhash(shingles(text))
+
+
+def article_signature(article: Dict) -> Optional[List[int]]:
+    """Signature over an article's title and body."""
+    return minhash_signature(f"{article.get('title') or ''} {article.get('text') or ''}")
+
+
+def estimate_similarity(first: Sequence[int], second: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of the feature sets behind two signatures."""
+    if not first or not second or len(first) != len(second):
+        return 0.0
+    return sum(map(operator.eq, first, second)) / len(first)
+
+
+def _band_keys(signature: Sequence[int]) -> List[Tuple[int, int]]:
+    return [
+        (band, hash(tuple(signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND])))
+        for band in range(BANDS)
+    ]
+
+
+class NearDuplicateIndex:
+    """
+    In-process LSH index over article signatures.
+
+    Bounded to ``max_entries`` articles; the oldest additions are evicted first.
+    """
+
+    def __init__(self, threshold: float = 0.5, max_entries: int = 20000):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._signatures: "OrderedDict[str, List[int]]" = OrderedDict()
+        self._buckets: Dict[Tuple[int, int], Set[str]] = defaultdict(set)
+        # Insertion sequence numbers, for deterministic tie-breaking
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, article_id: str) -> bool:
+        return article_id in self._signatures
+
+    def add(self, article_id: str, signature: Sequence[int]) -> None:
+        """Index an article (re-adding replaces its previous signature)."""
+        self.remove(article_id)
+        self._signatures[article_id] = list(signature)
+        self._order[article_id] = self._next_order
+        self._next_order += 1
+        for key in _band_keys(signature):
+            self._buckets[key].add(article_id)
+        while len(self._signatures) > self.max_entries:
+            self.remove(next(iter(self._signatures)))
+
+    def remove(self, article_id: str) -> None:
+        signature = self._signatures.pop(article_id, None)
+        if signature is None:
+            return
+        del self._order[article_id]
+        for key in _band_keys(signature):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(article_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def candidates(self, signature: Sequence[int]) -> Set[str]:
+        """Articles sharing at least one band with ``signature``."""
+        found: Set[str] = set()
+        for key in _band_keys(signature):
+            found.update(self._buckets.get(key, ()))
+        return found
+
+    def find_duplicate(
+        self, signature: Sequence[int], article_id: Optional[str] = None
+    ) -> Optional[Tuple[str, float]]:
+        """
+        Best indexed match at or above the similarity threshold.
+
+        If ``article_id`` is already indexed, only articles indexed before it
+        are considered, so of two copies the earlier one stays canonical.
+        Ties go to the article that was indexed first.
+
+        Returns:
+            (article_id, similarity) or None
+        """
+        limit = self._order.get(article_id) if article_id is not None else None
+        best: Optional[Tuple[str, float]] = None
+        for candidate in self.candidates(signature):
+            if candidate == article_id or (limit is not None and self._order[candidate] > limit):
+                continue
+            similarity = estimate_similarity(signature, self._signatures[candidate])
+            if similarity < self.threshold:
+                continue
+            if (
+                best is None
+                or similarity > best[1]
+                or (similarity == best[1] and self._order[candidate] < self._order[best[0]])
+            ):
+                best = (candidate, similarity)
+        return best
+
+    def check(self, article_id: str, signature: Sequence[int]) -> Optional[Tuple[str, float]]:
+        """
+        Match an article against the index and record the outcome.
+
+        Duplicates are removed from the index; originals are added to it.
+
+        Returns:
+            (canonical article_id, similarity) if the article is a near-duplicate
+        """
+        match = self.find_duplicate(signature, article_id)
+        if match is not None:
+            self.remove(article_id)
+        elif article_id not in self:
+            self.add(article_id, signature)
+        return match
+
+
+_index: Optional[NearDuplicateIndex] = None
+
+
+async def get_near_duplicate_index(db) -> NearDuplicateIndex:
+    """
+    Get the process-wide index, building it from recent articles on first use.
+
+    Articles published within NEAR_DUPLICATE_WINDOW_DAYS are indexed, using
+    their stored ``minhash`` signature (computed on the fly for older
+    articles that predate it). Known duplicates are not indexed, so matches
+    always point at a canonical article.
+    """
+    global _index
+    if _index is None:
+        index = NearDuplicateIndex(
+            threshold=settings.NEAR_DUPLICATE_THRESHOLD,
+            max_entries=settings.NEAR_DUPLICATE_INDEX_MAX_ENTRIES,
+        )
+        cutoff = datetime.now(timezone.utc) - timedelta(days=settings.NEAR_DUPLICATE_WINDOW_DAYS)
+        cursor = db.articles.find(
+            {"published_at": {"$gte": cutoff}, "is_duplicate": {"$ne": True}},
+            {"title": 1, "text": 1, "minhash": 1},
+        ).sort("published_at", 1)
+        async for article in cursor:
+            signature = article.get("minhash") or article_signature(article)
+            if signature:
+                index.add(str(article["_id"]), signature)
+        logger.info(f"Built near-duplicate index with {len(index)} articles")
+        _index = index
+    return _index
+
+
+def reset_near_duplicate_index() -> None:
+    """Drop the process-wide index so the next use rebuilds it."""
+    global _index
+    _index = None
@@ -1,109 +1,221 @@
 """
 Service for storing and retrieving historical price data.
+
+Samples are buffered in process and written in batches to the price_samples
+time-series collection, then folded into the 1m/1h/1d OHLC rollups (see
+db.operations.price_series). Once a batch is stored, its rollup updates are
+kept until they are applied, so a failed rollup write is retried without
+storing the samples again. Reads for charts, analytics and briefings go to
+the rollups through ``get_series``.
 """
 
 import logging
+import time
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any
-from bson import ObjectId
-
-from ..db.mongodb import mongo_manager, COLLECTION_PRICE_HISTORY
+from typing import Dict, List, Optional, Any, Sequence
+
+from ..db.operations.price_series import (
+    RESOLUTIONS,
+    get_aligned_series,
+    get_latest_sample,
+    get_price_samples,
+    insert_price_samples,
+    price_rollup_operations,
+    update_price_rollups,
+)
 from ..core.config import get_settings
 
 logger = logging.getLogger(__name__)
 # settings = get_settings()  # Removed top-level settings; use lazy initialization in methods as needed.
 
+# Samples kept in the buffer while the database is unavailable
+MAX_BUFFERED_BATCHES = 10
 
-class PriceHistoryService:
-    """Service for managing cryptocurrency price history."""
 
-    def __init__(self):
-        self.collection_name = COLLECTION_PRICE_HISTORY
+def resolution_for_window(hours: float) -> str:
+    """Coarsest rollup that still gives a chart of a window enough points."""
+    if hours <= 48:
+        return "1m"
+    if hours <= 24 * 90:
+        return "1h"
+    return "1d"
 
-    async def _get_collection(self) -> Any:
-        """Get the MongoDB collection for price history."""
-        if not hasattr(self, "_collection"):
-            self._collection = await mongo_manager.get_async_collection(
-                self.collection_name
-            )
-        return self._collection
 
-    async def store_price(
-        self, cryptocurrency: str, price: float, change_24h: float
-    ) -> str:
+class PriceHistoryService:
+    """Service for managing cryptocurrency price history."""
+
+    def __init__(self, batch_size: Optional[int] = None, flush_seconds: Optional[float] = None):
+        self._batch_size = batch_size
+        self._flush_seconds = flush_seconds
+        self._buffer: List[Dict[str, Any]] = []
+        self._buffered_since: Optional[float] = None
+        # Rollup upserts of stored samples that still have to be applied
+        self._pending_rollups: List[Any] = []
+        self._last_recorded: Dict[str, datetime] = {}
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size or get_settings().PRICE_HISTORY_BATCH_SIZE
+
+    @property
+    def flush_seconds(self) -> float:
+        if self._flush_seconds is not None:
+            return self._flush_seconds
+        return get_settings().PRICE_HISTORY_FLUSH_SECONDS
+
+    @property
+    def pending(self) -> int:
+        """Samples recorded but not yet written."""
+        return len(self._buffer)
+
+    async def record_price(
+        self,
+        symbol: str,
+        price: float,
+        change_24h: Optional[float] = None,
+        volume: Optional[float] = None,
+        timestamp: Optional[datetime] = None,
+    ) -> bool:
         """
-        Store a new price data point.
+        Buffer a price sample; the buffer is written once it holds
+        ``batch_size`` samples or its oldest sample is ``flush_seconds`` old.
 
         Args:
-            cryptocurrency: Cryptocurrency symbol (e.g., 'bitcoin')
-            price: Current price in USD
+            symbol: CoinGecko coin id (e.g. 'bitcoin')
+            price: Price in USD
             change_24h: 24-hour price change percentage
+            volume: 24-hour volume in USD
+            timestamp: When the price was observed (default: now)
 
         Returns:
-            str: ID of the inserted document
+            bool: False if the sample repeats the last one recorded for the coin
         """
-        collection = await self._get_collection()
-        price_doc = {
-            "cryptocurrency": cryptocurrency.lower(),
-            "price_usd": price,
-            "change_24h_percent": change_24h,
-            "timestamp": datetime.now(timezone.utc),
-        }
+        symbol = symbol.lower()
+        timestamp = timestamp or datetime.now(timezone.utc)
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        # Cached quotes are re-read between refreshes; store each quote once
+        if self._last_recorded.get(symbol) == timestamp:
+            return False
+        self._last_recorded[symbol] = timestamp
+
+        sample: Dict[str, Any] = {"symbol": symbol, "timestamp": timestamp, "price": float(price)}
+        if change_24h is not None:
+            sample["change_24h"] = float(change_24h)
+        if volume is not None:
+            sample["volume"] = float(volume)
+        self._buffer.append(sample)
+        if self._buffered_since is None:
+            self._buffered_since = time.monotonic()
+
+        if (
+            len(self._buffer) >= self.batch_size
+            or time.monotonic() - self._buffered_since >= self.flush_seconds
+        ):
+            await self.flush()
+        return True
+
+    async def flush(self) -> int:
+        """
+        Write buffered samples and apply their rollup updates.
 
-        result = await collection.insert_one(price_doc)
-        return str(result.inserted_id)
+        Returns:
+            int: Number of samples written
+        """
+        written = 0
+        if self._buffer:
+            batch, self._buffer = self._buffer, []
+            self._buffered_since = None
+            try:
+                stored = await insert_price_samples(batch)
+            except Exception as e:
+                # Keep the samples for the next flush, bounded so an outage can't grow memory forever
+                self._buffer = (batch + self._buffer)[-self.batch_size * MAX_BUFFERED_BATCHES:]
+                self._buffered_since = time.monotonic()
+                logger.error(f"Failed to write {len(batch)} price samples: {e}")
+                return 0
+            written = len(stored)
+            self._pending_rollups.extend(price_rollup_operations(stored))
+
+        if self._pending_rollups:
+            operations, self._pending_rollups = self._pending_rollups, []
+            try:
+                failed = await update_price_rollups(operations)
+            except Exception as e:
+                failed = operations
+                logger.error(f"Failed to update price rollups: {e}")
+            # Retried alone on the next flush; the samples are already stored
+            limit = self.batch_size * MAX_BUFFERED_BATCHES * len(RESOLUTIONS)
+            self._pending_rollups = (failed + self._pending_rollups)[-limit:]
+        return written
 
     async def get_latest_price(self, cryptocurrency: str = "bitcoin") -> Optional[Dict]:
         """
-        Get the most recent price record for a cryptocurrency.
+        Get the most recent price sample for a cryptocurrency.
 
         Args:
-            cryptocurrency: Cryptocurrency symbol (default: 'bitcoin')
+            cryptocurrency: CoinGecko coin id (default: 'bitcoin')
 
         Returns:
-            Optional[Dict]: Latest price data or None if not found
+            Optional[Dict]: Latest sample or None if not found
         """
-        collection = await self._get_collection()
-        latest = await collection.find_one(
-            {"cryptocurrency": cryptocurrency.lower()}, sort=[("timestamp", -1)]
-        )
-
+        symbol = cryptocurrency.lower()
+        for sample in reversed(self._buffer):
+            if sample["symbol"] == symbol:
+                return dict(sample)
+        latest = await get_latest_sample(symbol)
         if latest and "_id" in latest:
             latest["id"] = str(latest.pop("_id"))
-            return latest
-        return None
+        return latest
 
     async def get_price_history(
         self, cryptocurrency: str = "bitcoin", hours: int = 24, limit: int = 100
     ) -> List[Dict]:
         """
-        Get historical price data for a cryptocurrency.
+        Get raw price samples for a cryptocurrency, newest first.
 
         Args:
-            cryptocurrency: Cryptocurrency symbol (default: 'bitcoin')
+            cryptocurrency: CoinGecko coin id (default: 'bitcoin')
             hours: Number of hours of history to retrieve (default: 24)
             limit: Maximum number of records to return (default: 100)
 
         Returns:
-            List[Dict]: List of price records
+            List[Dict]: List of price samples
         """
-        collection = await self._get_collection()
         since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        history = await get_price_samples(cryptocurrency.lower(), since, limit=limit)
+        for doc in history:
+            doc["id"] = str(doc.pop("_id"))
+        return history
 
-        cursor = (
-            collection.find(
-                {"cryptocurrency": cryptocurrency.lower(), "timestamp": {"$gte": since}}
-            )
-            .sort("timestamp", -1)
-            .limit(limit)
-        )
+    async def get_series(
+        self,
+        symbols: Sequence[str],
+        hours: float = 24,
+        resolution: Optional[str] = None,
+        end: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get aligned close-price series for several coins from the rollups.
 
-        history = []
-        async for doc in cursor:
-            doc["id"] = str(doc.pop("_id"))
-            history.append(doc)
+        Args:
+            symbols: CoinGecko coin ids
+            hours: Length of the window ending at ``end`` (default: now)
+            resolution: "1m", "1h" or "1d" (default: picked from ``hours``)
+            end: End of the window
 
-        return history
+        Returns:
+            Dict with ``resolution``, ``timestamps`` and ``series`` (one list of
+            closes per coin, None for buckets without samples)
+        """
+        await self.flush()
+        end = end or datetime.now(timezone.utc)
+        return await get_aligned_series(
+            [symbol.lower() for symbol in symbols],
+            end - timedelta(hours=hours),
+            end,
+            resolution or resolution_for_window(hours),
+        )
 
     async def get_price_change(
         self, cryptocurrency: str = "bitcoin", hours: int = 24
@@ -112,31 +224,18 @@ class PriceHistoryService:
         Calculate price change over a specified time period.
 
         Args:
-            cryptocurrency: Cryptocurrency symbol (default: 'bitcoin')
+            cryptocurrency: CoinGecko coin id (default: 'bitcoin')
             hours: Time period in hours (default: 24)
 
         Returns:
             Dict with price change information
         """
-        collection = await self._get_collection()
-        since = datetime.now(timezone.utc) - timedelta(hours=hours)
-
-        # Get oldest price in the period
-        oldest_cursor = collection.find(
-            {"cryptocurrency": cryptocurrency.lower(), "timestamp": {"$gte": since}},
-            sort=[("timestamp", 1)],
-            limit=1,
-        )
-
-        # Get latest price
-        latest = await collection.find_one(
-            {"cryptocurrency": cryptocurrency.lower()}, sort=[("timestamp", -1)]
-        )
-
-        oldest = await oldest_cursor.to_list(length=1)
-        oldest = oldest[0] if oldest else None
-
-        if not latest or not oldest:
+        closes = [
+            close
+            for close in (await self.get_series([cryptocurrency], hours=hours))["series"][cryptocurrency.lower()]
+            if close is not None
+        ]
+        if not closes:
             return {
                 "change_percent": 0.0,
                 "start_price": 0.0,
@@ -144,8 +243,7 @@ class PriceHistoryService:
                 "hours": hours,
             }
 
-        start_price = oldest.get("price_usd", 0)
-        end_price = latest.get("price_usd", 0)
+        start_price, end_price = closes[0], closes[-1]
         change_percent = (
             ((end_price - start_price) / start_price * 100) if start_price > 0 else 0
         )
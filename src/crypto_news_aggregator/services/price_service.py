@@ -12,6 +12,7 @@ from functools import lru_cache
 from aiocache import caches, cached
 from ..core.config import get_settings
 from ..services.article_service import article_service
+from ..services.price_history import price_history_service
 import random
 import numpy as np
 
@@ -117,7 +118,6 @@ class CoinGeckoPriceService:
         self.settings = get_settings()
         self._configure_endpoints()
         self.session = None
-        self.price_history: Dict[str, List[Dict]] = {}
         self.market_data: Dict[str, Any] = {}
 
     def _configure_endpoints(self):
@@ -210,6 +210,22 @@ class CoinGeckoPriceService:
         Returns:
             A dictionary mapping each coin ID to its price data.
         """
+        return await self.fetch_prices(coin_ids)
+
+    async def fetch_prices(self, coin_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch current prices for a list of cryptocurrencies in one request, uncached.
+
+        Used by the price tick stream, which polls more often than the
+        get_prices cache lives.
+
+        Args:
+            coin_ids: A list of CoinGecko coin IDs (e.g., ['bitcoin', 'ethereum']).
+
+        Returns:
+            A dictionary mapping each coin ID to its price, 24h change, 24h
+            volume and timestamp (an empty dict for coins that failed).
+        """
         if not coin_ids:
             return {}
 
@@ -220,7 +236,10 @@ class CoinGeckoPriceService:
         increment_api_call_counter()
         session = await self.get_session()
         ids_str = ",".join(coin_ids)
-        base_url = f"{self.BASE_URL}/simple/price?ids={ids_str}&vs_currencies=usd&include_24hr_change=true"
+        base_url = (
+            f"{self.BASE_URL}/simple/price?ids={ids_str}&vs_currencies=usd"
+            "&include_24hr_change=true&include_24hr_vol=true"
+        )
         url = self._get_url_with_api_key(base_url)
 
         try:
@@ -232,11 +251,15 @@ class CoinGeckoPriceService:
                 for coin_id, price_data in data.items():
                     price = price_data.get("usd")
                     change_24h = price_data.get("usd_24h_change", 0)
+                    volume_24h = price_data.get("usd_24h_vol")
                     result[coin_id] = {
                         "price": float(price) if price is not None else None,
                         "change_24h": (
                             float(change_24h) if change_24h is not None else 0.0
                         ),
+                        "volume_24h": (
+                            float(volume_24h) if volume_24h is not None else None
+                        ),
                         "timestamp": datetime.now(timezone.utc),
                     }
                 return result
@@ -247,7 +270,7 @@ class CoinGeckoPriceService:
                 coin_id: {} for coin_id in coin_ids
             }  # Return empty dicts for failed coins
         except Exception as e:
-            logger.error(f"Unexpected error in get_prices: {e}")
+            logger.error(f"Unexpected error in fetch_prices: {e}")
             return {coin_id: {} for coin_id in coin_ids}
 
     @cached(ttl=300)  # Cache for 5 minutes
@@ -460,41 +483,27 @@ class CoinGeckoPriceService:
             return {}
 
     async def _update_price_history(self, price: float, change_24h: float) -> None:
-        """Update the price history with the latest price data."""
-        timestamp = datetime.utcnow()
-        price_entry = {
-            "price": price,
-            "timestamp": timestamp,
-            "price_change_percentage_24h": change_24h,
-        }
-
-        if "bitcoin" not in self.price_history:
-            self.price_history["bitcoin"] = []
-
-        self.price_history["bitcoin"].append(price_entry)
-
-        # Keep only the last 1000 price points to prevent memory issues
-        if len(self.price_history["bitcoin"]) > 1000:
-            self.price_history["bitcoin"] = self.price_history["bitcoin"][-1000:]
+        """Record the latest Bitcoin price in the shared price history."""
+        await price_history_service.record_price("bitcoin", price, change_24h)
 
-    def get_recent_price_history(self, hours: int = 24) -> List[Dict]:
+    async def get_recent_price_history(self, hours: int = 24) -> List[Dict]:
         """
-        Get recent price history for Bitcoin.
+        Get recent price history for Bitcoin from the stored rollups.
 
         Args:
             hours: Number of hours of history to return (max 168 hours/7 days)
 
         Returns:
-            List of price points with timestamp and price
+            List of price points with timestamp (bucket start, naive UTC) and close price
         """
-        if "bitcoin" not in self.price_history or not self.price_history["bitcoin"]:
-            return []
-
         # Cap at 7 days of history for performance
         hours = min(int(hours), 168)
-        cutoff = datetime.utcnow() - timedelta(hours=hours)
-
-        return [p for p in self.price_history["bitcoin"] if p["timestamp"] > cutoff]
+        history = await price_history_service.get_series(["bitcoin"], hours=hours)
+        return [
+            {"price": price, "timestamp": timestamp}
+            for timestamp, price in zip(history["timestamps"], history["series"]["bitcoin"])
+            if price is not None
+        ]
 
     @cached(ttl=600)  # Cache for 10 minutes
     async def get_global_market_data(self) -> Dict[str, Any]:
@@ -0,0 +1,197 @@
+"""
+Shared price tick stream for every tracked coin.
+
+``PriceTickService`` fetches the prices of all tracked coins in one batched
+CoinGecko ``simple/price`` request per interval and publishes the resulting
+ticks to in-process subscribers (price history, price alerts, movement
+detection), so API calls stay constant as coins are added and consumers no
+longer poll on their own.
+
+The polling interval adapts to volatility: the largest tick-to-tick move,
+scaled to PRICE_CHECK_INTERVAL, halves the interval (down to
+PRICE_TICK_MIN_INTERVAL) once it reaches PRICE_TICK_VOLATILE_MOVE_PERCENT,
+and the interval relaxes back towards PRICE_CHECK_INTERVAL while prices are
+calm.
+
+One stream runs per deployment: the price monitor starts it under the
+"price_monitor" lease.
+"""
+
+import asyncio
+import logging
+import math
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from ..core.config import get_settings
+from .price_service import COIN_ID_TO_SYMBOL, get_price_service
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PriceTick:
+    """One coin's price as of one poll."""
+
+    symbol: str  # CoinGecko coin id, e.g. "bitcoin"
+    price: float
+    change_24h: float
+    timestamp: datetime
+    volume_24h: Optional[float] = None
+
+    def as_price_data(self) -> Dict[str, Any]:
+        """The tick in the shape returned by CoinGeckoPriceService.get_prices."""
+        return {
+            "price": self.price,
+            "change_24h": self.change_24h,
+            "volume_24h": self.volume_24h,
+            "timestamp": self.timestamp,
+        }
+
+
+TickSubscriber = Callable[[List[PriceTick]], Awaitable[None]]
+
+
+def next_interval(
+    current: float,
+    move_percent: float,
+    min_interval: float,
+    max_interval: float,
+    volatile_move_percent: float,
+) -> float:
+    """
+    Polling interval after a tick whose largest move was ``move_percent``.
+
+    ``move_percent`` is the move scaled to ``max_interval``. Volatile ticks
+    halve the interval, calm ticks (under half the volatile move) grow it by
+    half, anything in between keeps it.
+    """
+    if move_percent >= volatile_move_percent:
+        current /= 2
+    elif move_percent < volatile_move_percent / 2:
+        current *= 1.5
+    return min(max(current, min_interval), max_interval)
+
+
+class PriceTickService:
+    """Polls prices for all tracked coins in one request and fans ticks out to subscribers."""
+
+    def __init__(self, symbols: Optional[Iterable[str]] = None):
+        self.price_service = get_price_service()
+        self.symbols: Set[str] = set(symbols if symbols is not None else COIN_ID_TO_SYMBOL)
+        self.subscribers: Dict[str, TickSubscriber] = {}
+        self.latest: Dict[str, PriceTick] = {}
+        self.interval = float(get_settings().PRICE_CHECK_INTERVAL)
+        self.is_running = False
+        self._last_tick_at: Optional[float] = None
+
+    def track(self, *symbols: str) -> None:
+        """Include more coins in the next poll."""
+        new = {symbol.lower() for symbol in symbols} - self.symbols
+        if new:
+            logger.info(f"Tracking prices for {sorted(new)}")
+            self.symbols.update(new)
+
+    def subscribe(self, name: str, callback: TickSubscriber) -> None:
+        """Register ``callback`` for every tick batch (re-subscribing a name replaces it)."""
+        self.subscribers[name] = callback
+
+    def unsubscribe(self, name: str) -> None:
+        self.subscribers.pop(name, None)
+
+    async def poll(self) -> List[PriceTick]:
+        """
+        Fetch all tracked prices in one request, publish them and adapt the interval.
+
+        Returns:
+            The ticks published (coins whose price could not be fetched are left out)
+        """
+        symbols = sorted(self.symbols)
+        prices = await self.price_service.fetch_prices(symbols)
+        ticks = []
+        for symbol in symbols:
+            data = prices.get(symbol) or {}
+            if data.get("price") is None:
+                continue
+            ticks.append(
+                PriceTick(
+                    symbol=symbol,
+                    price=data["price"],
+                    change_24h=data.get("change_24h") or 0.0,
+                    timestamp=data.get("timestamp") or datetime.now(timezone.utc),
+                    volume_24h=data.get("volume_24h"),
+                )
+            )
+        if len(ticks) < len(symbols):
+            logger.warning(f"No price for {len(symbols) - len(ticks)} of {len(symbols)} tracked coins")
+
+        self._adapt_interval(ticks)
+        for tick in ticks:
+            self.latest[tick.symbol] = tick
+        if ticks:
+            await self.publish(ticks)
+        return ticks
+
+    async def publish(self, ticks: List[PriceTick]) -> None:
+        """Hand ``ticks`` to every subscriber concurrently; one failing doesn't affect the others."""
+        names = list(self.subscribers)
+        results = await asyncio.gather(
+            *(self.subscribers[name](ticks) for name in names), return_exceptions=True
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.error(f"Price tick subscriber {name} failed: {result}", exc_info=result)
+
+    def _adapt_interval(self, ticks: List[PriceTick]) -> None:
+        settings = get_settings()
+        now = asyncio.get_running_loop().time()
+        elapsed = now - self._last_tick_at if self._last_tick_at is not None else None
+        self._last_tick_at = now
+        moves = [
+            abs(tick.price / self.latest[tick.symbol].price - 1) * 100
+            for tick in ticks
+            if tick.symbol in self.latest and self.latest[tick.symbol].price
+        ]
+        if not moves or not elapsed:
+            return
+        # Price moves grow with the square root of time; compare them over a full calm interval
+        move = max(moves) * math.sqrt(settings.PRICE_CHECK_INTERVAL / elapsed)
+        interval = next_interval(
+            self.interval,
+            move,
+            min_interval=settings.PRICE_TICK_MIN_INTERVAL,
+            max_interval=settings.PRICE_CHECK_INTERVAL,
+            volatile_move_percent=settings.PRICE_TICK_VOLATILE_MOVE_PERCENT,
+        )
+        if interval != self.interval:
+            logger.info(f"Price polling interval {self.interval:.0f}s -> {interval:.0f}s (move {move:.2f}%)")
+            self.interval = interval
+
+    async def run(self) -> None:
+        """Poll and publish until stopped."""
+        if self.is_running:
+            logger.warning("Price tick stream is already running")
+            return
+
+        self.is_running = True
+        logger.info(f"Starting price tick stream for {len(self.symbols)} coins")
+        try:
+            while self.is_running:
+                try:
+                    await self.poll()
+                except Exception as e:
+                    logger.error(f"Error polling prices: {e}", exc_info=True)
+                await asyncio.sleep(self.interval)
+        finally:
+            self.is_running = False
+
+    def stop(self) -> None:
+        self.is_running = False
+
+
+# Factory function for dependency injection
+@lru_cache()
+def get_price_tick_service() -> PriceTickService:
+    return PriceTickService()
@@ -7,12 +7,198 @@ Classifies articles into relevance tiers:
 - Tier 3: Low signal - speculation, price predictions, unrelated content
 
 Used to filter noise from signals and narratives.
+
+Each group of rules (tier 3, tier 1, tier 1 exceptions) is a _RuleSet: every
+rule is reduced to the literal text any match must contain ("sec"; "hack";
+"bitcoin"/"btc"/"eth" followed later by "bought"/"buy"/...) and only rules
+whose literals all occur in the article are run as regexes. Rules are still tried in list order, so the tier,
+reason and reported pattern are the same as searching every pattern in turn.
 """
 
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 from loguru import logger
 
+# Articles per worker task when classify_batch runs across processes
+BATCH_CHUNK_SIZE = 500
+
+# Regex metacharacters that end a run of literal text
+_SPECIAL = set(".^$*+?{}[]|()\\")
+
+# Stop expanding a literal once it has more alternatives than this
+_MAX_ALTERNATIVES = 16
+
+# Non-ASCII characters that still match ASCII letters case-insensitively
+# after lowercasing ("ſ" matches "s" under re.IGNORECASE)
+_ASCII_FOLDS = str.maketrans({"ı": "i", "ſ": "s"})
+
+
+def _class_end(source: str, i: int) -> int:
+    """Index just past the character class starting at ``source[i]`` ("[")."""
+    i += 2 if source.startswith("[^", i) else 1
+    # "]" right after "[" or "[^" is a literal
+    i += 1 if source[i:i + 1] == "]" else 0
+    while i < len(source) and source[i] != "]":
+        i += 2 if source[i] == "\\" else 1
+    return i + 1
+
+
+def _scan(source: str, i: int, stops: str) -> int:
+    """
+    Index of the first character in ``stops`` from ``source[i]`` on, outside
+    nested groups and character classes (len(source) if there is none).
+    """
+    depth = 0
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "[":
+            i = _class_end(source, i)
+            continue
+        if char == "(":
+            depth += 1
+        elif depth == 0 and char in stops:
+            return i
+        elif char == ")":
+            depth -= 1
+        i += 1
+    return len(source)
+
+
+def _skip(source: str, i: int) -> int:
+    """Index just past the regex item at ``source[i]`` and its quantifier."""
+    char = source[i]
+    if char == "\\":
+        i += 2
+    elif char == "[":
+        i = _class_end(source, i)
+    elif char == "(":
+        i = _scan(source, i + 1, ")") + 1
+    elif char not in "*+?{":
+        i += 1
+    if source[i:i + 1] in ("*", "+", "?"):
+        i += 1
+    elif source[i:i + 1] == "{":
+        i = source.find("}", i) + 1 or len(source)
+    if source[i:i + 1] in ("?", "+"):
+        # Lazy or possessive quantifier
+        i += 1
+    return i
+
+
+def _sequence_prefixes(source: str, i: int) -> tuple[set[str], bool, int]:
+    """
+    Literal text at the start of the regex sequence beginning at ``source[i]``.
+
+    Returns the alternatives every match starts with, whether they span the
+    whole sequence (up to "|", ")" or the end), and the index where parsing
+    stopped.
+    """
+    prefixes = {""}
+    while i < len(source) and source[i] not in "|)":
+        char = source[i]
+        if source.startswith(r"\b", i):
+            # Zero-width word boundary
+            i += 2
+            continue
+        complete = True
+        if char == "\\" and i + 1 < len(source) and not source[i + 1].isalnum():
+            item, end = {source[i + 1]}, i + 2
+        elif char == "(" and (not source.startswith("(?", i) or source.startswith("(?:", i)):
+            body = i + (3 if source.startswith("(?:", i) else 1)
+            # A group we could only partly parse still contributes its prefixes
+            item, complete = _alternative_prefixes(source, body)
+            end = _scan(source, body, ")") + 1
+        elif char in _SPECIAL:
+            return prefixes, False, i
+        else:
+            item, end = {char}, i + 1
+
+        quantifier = source[end:end + 1]
+        if quantifier in ("?", "*") or source.startswith(("{0", "{,"), end):
+            # Optional item: matches may continue with anything after it
+            return prefixes, False, i
+        prefixes = {prefix + text for prefix in prefixes for text in item}
+        if not complete or quantifier in ("+", "{") or len(prefixes) > _MAX_ALTERNATIVES:
+            return prefixes, False, end
+        i = end
+    return prefixes, True, i
+
+
+def _alternative_prefixes(source: str, i: int) -> tuple[set[str], bool]:
+    """Literal prefixes of the alternation starting at ``source[i]``."""
+    prefixes: set[str] = set()
+    complete = True
+    while True:
+        sequence, sequence_complete, _ = _sequence_prefixes(source, i)
+        prefixes |= sequence
+        complete = complete and sequence_complete
+        end = _scan(source, i, "|)")
+        if source[end:end + 1] != "|":
+            return prefixes, complete
+        i = end + 1
+
+
+def required_literals(pattern: str) -> tuple[tuple[str, ...], ...]:
+    """
+    Literal text that must occur in any text ``pattern`` matches.
+
+    Returns groups of lowercase alternatives; a match contains at least one
+    alternative from every group. For example ``\\bcould\\s+reach\\s+\\$[\\d,]+``
+    gives (("could",), ("reach",), ("$",)). Parts of the pattern that aren't
+    plain literals (character classes, optional items, lookarounds) are
+    skipped, so an empty result means the pattern has to be run on every text.
+    """
+    if _scan(pattern, 0, "|") < len(pattern):
+        # Top-level alternation: only the common start is certain
+        groups = [_alternative_prefixes(pattern, 0)[0]]
+    else:
+        groups = []
+        i = 0
+        while i < len(pattern):
+            prefixes, _, i = _sequence_prefixes(pattern, i)
+            groups.append(prefixes)
+            if i < len(pattern):
+                i = _skip(pattern, i)
+    return tuple(
+        tuple(sorted({prefix.lower() for prefix in prefixes}))
+        for prefixes in groups
+        if prefixes and "" not in prefixes
+    )
+
+
+class _RuleSet:
+    """
+    Ordered regex rules with a literal prefilter.
+
+    Rules are tried in list order and the first one that matches wins, the
+    same result as searching each pattern in turn; rules whose required
+    literals don't all occur in the text are skipped without running the
+    regex.
+    """
+
+    def __init__(self, rules: list[tuple[str, re.Pattern]]):
+        self.rules = rules
+        self._literals = [required_literals(pattern.pattern) for _, pattern in rules]
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def search(self, text: str) -> Optional[tuple[str, str]]:
+        """Return (rule name, pattern) of the first matching rule, or None."""
+        folded = text.lower()
+        if not folded.isascii():
+            folded = folded.translate(_ASCII_FOLDS)
+        for (name, pattern), literals in zip(self.rules, self._literals):
+            if not all(any(literal in folded for literal in group) for group in literals):
+                continue
+            if pattern.search(text):
+                return name, pattern.pattern
+        return None
+
 
 class RelevanceClassifier:
     """
@@ -158,40 +344,36 @@ class RelevanceClassifier:
 
     def __init__(self):
         # Pre-compile patterns for performance
-        self._tier3_patterns = self._compile_patterns([
-            *self.NON_CRYPTO_PATTERNS,
-            *self.SPECULATION_PATTERNS,
-            *self.PRICE_PREDICTION_PATTERNS,
-            *self.RETROSPECTIVE_PATTERNS,
-        ])
-
-        self._tier1_patterns = self._compile_patterns([
-            *self.REGULATORY_KEYWORDS,
-            *self.SECURITY_KEYWORDS,
-            *self.MARKET_DATA_KEYWORDS,
-            *self.INSTITUTIONAL_KEYWORDS,
-            *self.ADOPTION_KEYWORDS,
-        ])
+        self._tier3_patterns = self._compile_rules({
+            "non_crypto": self.NON_CRYPTO_PATTERNS,
+            "speculation": self.SPECULATION_PATTERNS,
+            "price_prediction": self.PRICE_PREDICTION_PATTERNS,
+            "retrospective": self.RETROSPECTIVE_PATTERNS,
+        })
+
+        self._tier1_patterns = self._compile_rules({
+            "regulatory": self.REGULATORY_KEYWORDS,
+            "security": self.SECURITY_KEYWORDS,
+            "market_data": self.MARKET_DATA_KEYWORDS,
+            "institutional": self.INSTITUTIONAL_KEYWORDS,
+            "adoption": self.ADOPTION_KEYWORDS,
+        })
 
         # Patterns that demote from Tier 1 to Tier 2 (historical/follow-up stories)
-        self._tier1_exceptions = self._compile_patterns(self.HISTORICAL_SECURITY_PATTERNS)
+        self._tier1_exceptions = self._compile_rules({
+            "historical_security": self.HISTORICAL_SECURITY_PATTERNS,
+        })
 
-    def _compile_patterns(self, patterns: list[str]) -> list[re.Pattern]:
-        """Compile regex patterns with case-insensitive flag."""
+    def _compile_rules(self, groups: dict[str, list[str]]) -> _RuleSet:
+        """Compile named groups of regex patterns with case-insensitive flag."""
         compiled = []
-        for pattern in patterns:
-            try:
-                compiled.append(re.compile(pattern, re.IGNORECASE))
-            except re.error as e:
-                logger.warning(f"Invalid regex pattern '{pattern}': {e}")
-        return compiled
-
-    def _matches_any(self, text: str, patterns: list[re.Pattern]) -> tuple[bool, Optional[str]]:
-        """Check if text matches any pattern, return match details."""
-        for pattern in patterns:
-            if pattern.search(text):
-                return True, pattern.pattern
-        return False, None
+        for name, patterns in groups.items():
+            for pattern in patterns:
+                try:
+                    compiled.append((name, re.compile(pattern, re.IGNORECASE)))
+                except re.error as e:
+                    logger.warning(f"Invalid regex pattern '{pattern}': {e}")
+        return _RuleSet(compiled)
 
     def classify(
         self,
@@ -212,76 +394,75 @@ class RelevanceClassifier:
                 - tier: int (1, 2, or 3)
                 - reason: str explaining classification
                 - matched_pattern: str or None
+                - matched_rule: rule group that fired (e.g. "security") or None
         """
-        # Combine title and text for matching, but weight title heavily
         title_lower = title.lower()
-        combined = f"{title} {text[:500] if text else ''}".lower()
 
         # Check Tier 3 patterns first (exclude)
         # Title-only check for most patterns (more reliable)
-        is_tier3, pattern = self._matches_any(title_lower, self._tier3_patterns)
-        if is_tier3:
-            return {
-                "tier": 3,
-                "reason": "low_signal",
-                "matched_pattern": pattern,
-            }
+        hit = self._tier3_patterns.search(title_lower)
+        if hit:
+            return self._result(3, "low_signal", hit)
 
         # Check Tier 1 patterns (high signal)
-        is_tier1_title, pattern = self._matches_any(title_lower, self._tier1_patterns)
-        if is_tier1_title:
+        hit = self._tier1_patterns.search(title_lower)
+        if hit:
             # Check for exceptions (historical stories that shouldn't be Tier 1)
-            is_exception, _ = self._matches_any(title_lower, self._tier1_exceptions)
-            if is_exception:
-                return {
-                    "tier": 2,
-                    "reason": "historical_security",
-                    "matched_pattern": pattern,
-                }
-            return {
-                "tier": 1,
-                "reason": "high_signal_title",
-                "matched_pattern": pattern,
-            }
+            if self._tier1_exceptions.search(title_lower):
+                return self._result(2, "historical_security", hit)
+            return self._result(1, "high_signal_title", hit)
 
         # Check body text for Tier 1 patterns (weaker signal)
         if text:
             # Only check first portion of text to avoid false positives
-            text_preview = text[:1000].lower()
-            is_tier1_body, pattern = self._matches_any(text_preview, self._tier1_patterns)
-            if is_tier1_body:
-                return {
-                    "tier": 1,
-                    "reason": "high_signal_body",
-                    "matched_pattern": pattern,
-                }
+            hit = self._tier1_patterns.search(text[:1000].lower())
+            if hit:
+                return self._result(1, "high_signal_body", hit)
 
         # Default to Tier 2 (standard crypto news)
+        return self._result(2, "default", None)
+
+    @staticmethod
+    def _result(tier: int, reason: str, hit: Optional[tuple[str, str]]) -> dict:
+        rule, pattern = hit or (None, None)
         return {
-            "tier": 2,
-            "reason": "default",
-            "matched_pattern": None,
+            "tier": tier,
+            "reason": reason,
+            "matched_pattern": pattern,
+            "matched_rule": rule,
         }
 
-    def classify_batch(self, articles: list[dict]) -> list[dict]:
+    def classify_batch(
+        self,
+        articles: list[dict],
+        processes: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> list[dict]:
         """
         Classify multiple articles.
 
         Args:
             articles: List of dicts with 'title', optional 'text', optional 'source'
+            processes: Worker processes to spread large batches over (backfills);
+                None or 1 classifies in this process
+            chunk_size: Articles per worker task when using processes
+                (default: split evenly, at most BATCH_CHUNK_SIZE per task)
 
         Returns:
-            List of classification results with article index
+            List of classification results with article index, in input order
         """
-        results = []
-        for i, article in enumerate(articles):
-            result = self.classify(
-                title=article.get("title", ""),
-                text=article.get("text"),
-                source=article.get("source"),
-            )
+        pairs = [(article.get("title") or "", article.get("text")) for article in articles]
+
+        if processes and processes > 1 and len(pairs) > 1:
+            chunk_size = chunk_size or min(BATCH_CHUNK_SIZE, -(-len(pairs) // processes))
+            chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                results = [result for chunk in executor.map(_classify_pairs, chunks) for result in chunk]
+        else:
+            results = [self.classify(title, text) for title, text in pairs]
+
+        for i, result in enumerate(results):
             result["index"] = i
-            results.append(result)
         return results
 
 
@@ -306,6 +487,12 @@ def classify_article(
     Convenience function to classify a single article.
 
     Returns:
-        dict with tier (1-3), reason, and matched_pattern
+        dict with tier (1-3), reason, matched_pattern and matched_rule
     """
     return get_classifier().classify(title, text, source)
+
+
+def _classify_pairs(pairs: list[tuple[str, Optional[str]]]) -> list[dict]:
+    """Process pool worker: classify (title, text) pairs with this process's classifier."""
+    classifier = get_classifier()
+    return [classifier.classify(title, text) for title, text in pairs]
@@ -1,20 +1,58 @@
 import feedparser
 import asyncio
-from datetime import datetime
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 from time import mktime
 
+import httpx
+
 from crypto_news_aggregator.models.article import (
     ArticleCreate,
     ArticleMetrics,
     ArticleAuthor,
 )
 from crypto_news_aggregator.core.config import get_settings
+from crypto_news_aggregator.db.operations.feed_state import (
+    get_feed_states,
+    save_feed_states,
+)
+from crypto_news_aggregator.services.near_duplicates import minhash_signature
+
+logger = logging.getLogger(__name__)
+
+# Feed fetch outcomes
+CHANGED = "changed"
+NOT_MODIFIED = "not_modified"
+FAILED = "failed"
+
+USER_AGENT = "crypto-news-aggregator/1.0 (+feed reader)"
+
+
+@dataclass
+class FeedFetchResult:
+    """Outcome of fetching one feed: new articles and the state to persist."""
+
+    source: str
+    status: str
+    articles: List[ArticleCreate] = field(default_factory=list)
+    state: Optional[Dict[str, Any]] = None
+
+
+def _entry_id(entry) -> Optional[str]:
+    """Stable identifier for a feed entry (GUID, falling back to the link)."""
+    return entry.get("id") or entry.get("link")
 
 
 class RSSService:
     def __init__(self):
         settings = get_settings()
+        self.max_concurrency = settings.RSS_FETCH_CONCURRENCY
+        self.feed_timeout = settings.RSS_FEED_TIMEOUT_SECONDS
+        # Updated validators from the last fetch_all_feeds, saved by save_feed_states
+        self._pending_states: List[Dict[str, Any]] = []
         self.feed_urls = {
             # Original 4 feeds
             # "chaingpt": settings.CHAINGPT_RSS_URL,  # Removed - returns 404
@@ -41,42 +79,156 @@ class RSSService:
             # Note: defillama returns HTML, dune has malformed XML
         }
 
-    async def fetch_feed(self, url: str) -> Optional[feedparser.FeedParserDict]:
-        """Asynchronously fetches and parses an RSS feed."""
+    async def fetch_feed(
+        self,
+        client: httpx.AsyncClient,
+        source: str,
+        url: str,
+        state: Optional[Dict[str, Any]] = None,
+    ) -> FeedFetchResult:
+        """
+        Conditionally fetch one feed and parse it only if it changed.
+
+        Sends the stored ETag/Last-Modified validators; a 304 (or a body
+        identical to the last one) short-circuits without parsing. Entries
+        already seen in the previous body are skipped.
+        """
+        now = datetime.now(timezone.utc)
+        # Validators only apply to the URL they were issued for
+        if state and state.get("url") != url:
+            state = None
+
+        headers = {}
+        if state and state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state and state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+
         try:
-            loop = asyncio.get_event_loop()
-            # feedparser is not async, so we run it in a thread pool
-            feed = await loop.run_in_executor(None, feedparser.parse, url)
+            response = await client.get(url, headers=headers)
+            if response.status_code == 304:
+                return FeedFetchResult(
+                    source,
+                    NOT_MODIFIED,
+                    state={"_id": source, "last_status": 304, "last_fetched_at": now},
+                )
+            response.raise_for_status()
+
+            new_state = {
+                "_id": source,
+                "url": url,
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+                "content_hash": hashlib.sha256(response.content).hexdigest(),
+                "last_status": response.status_code,
+                "last_fetched_at": now,
+            }
+            # Servers without validators still often return byte-identical bodies
+            if state and state.get("content_hash") == new_state["content_hash"]:
+                return FeedFetchResult(source, NOT_MODIFIED, state=new_state)
+
+            # feedparser is not async, so we run it in a worker thread
+            feed = await asyncio.to_thread(
+                feedparser.parse,
+                response.content,
+                response_headers=dict(response.headers),
+            )
             if feed.bozo:
-                print(f"Error parsing feed {url}: {feed.bozo_exception}")
-                return None
-            return feed
-        except Exception as e:
-            print(f"An error occurred while fetching feed {url}: {e}")
-            return None
+                # feedparser also flags recoverable problems (a missing or
+                # wrong Content-Type, encoding overrides); only a feed it
+                # couldn't read anything from has failed
+                if not feed.entries:
+                    logger.warning(f"Error parsing feed {url}: {feed.bozo_exception}")
+                    return FeedFetchResult(source, FAILED)
+                logger.debug(f"Recovered from feed problem in {url}: {feed.bozo_exception}")
+        except httpx.HTTPError as e:
+            logger.warning(f"An error occurred while fetching feed {url}: {e}")
+            return FeedFetchResult(source, FAILED)
+
+        seen_ids = set(state.get("entry_ids") or []) if state else set()
+        new_entries = [entry for entry in feed.entries if _entry_id(entry) not in seen_ids]
+
+        new_state["entry_ids"] = [eid for eid in map(_entry_id, feed.entries) if eid]
+        new_state["last_changed_at"] = now
+        return FeedFetchResult(
+            source,
+            CHANGED,
+            articles=self.parse_feed(new_entries, source),
+            state=new_state,
+        )
+
+    async def _fetch_feed_limited(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        source: str,
+        url: str,
+        state: Optional[Dict[str, Any]],
+    ) -> FeedFetchResult:
+        """Fetch a feed under the concurrency limit and its own time budget."""
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    self.fetch_feed(client, source, url, state), timeout=self.feed_timeout
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"Feed {source} timed out after {self.feed_timeout:.0f}s")
+            except Exception as e:
+                logger.exception(f"Unexpected error fetching feed {source}: {e}")
+        return FeedFetchResult(source, FAILED)
 
     async def fetch_all_feeds(self) -> List[ArticleCreate]:
-        """Fetches and processes all configured RSS feeds."""
-        tasks = [self.fetch_feed(url) for url in self.feed_urls.values()]
-        feeds = await asyncio.gather(*tasks)
+        """
+        Fetches all configured RSS feeds and returns their new entries.
 
-        all_articles = []
-        source_names = list(self.feed_urls.keys())
+        Feeds are downloaded over one pooled HTTP client. The updated
+        validators are kept until ``save_feed_states`` is called, so a run
+        that fails to store its articles re-reads the same entries next time.
+        """
+        try:
+            states = await get_feed_states(self.feed_urls.keys())
+        except Exception as e:
+            # Without stored validators every feed is simply fetched in full
+            logger.warning(f"Could not load feed state, fetching all feeds in full: {e}")
+            states = {}
 
-        for i, feed in enumerate(feeds):
-            if feed:
-                source = source_names[i]
-                articles = self.parse_feed(feed, source)
-                all_articles.extend(articles)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with httpx.AsyncClient(
+            headers={"User-Agent": USER_AGENT},
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.max_concurrency),
+            timeout=httpx.Timeout(self.feed_timeout, connect=10.0),
+        ) as client:
+            results = await asyncio.gather(
+                *(
+                    self._fetch_feed_limited(client, semaphore, source, url, states.get(source))
+                    for source, url in self.feed_urls.items()
+                )
+            )
 
+        all_articles = []
+        self._pending_states = []
+        for result in results:
+            all_articles.extend(result.articles)
+            if result.state is not None:
+                self._pending_states.append(result.state)
+
+        statuses = {
+            status: sum(result.status == status for result in results)
+            for status in (CHANGED, NOT_MODIFIED, FAILED)
+        }
+        logger.info(f"Fetched {len(results)} feeds {statuses}, {len(all_articles)} new entries")
         return all_articles
 
-    def parse_feed(
-        self, feed: feedparser.FeedParserDict, source: str
-    ) -> List[ArticleCreate]:
-        """Parses a feed and returns a list of Article objects."""
+    async def save_feed_states(self) -> int:
+        """Persist the validators from the last ``fetch_all_feeds`` call."""
+        states, self._pending_states = self._pending_states, []
+        return await save_feed_states(states)
+
+    def parse_feed(self, entries: List[Any], source: str) -> List[ArticleCreate]:
+        """Parses feed entries and returns a list of Article objects."""
         articles = []
-        for entry in feed.entries:
+        for entry in entries:
             published_date = (
                 datetime.fromtimestamp(mktime(entry.published_parsed))
                 if hasattr(entry, "published_parsed") and entry.published_parsed
@@ -98,6 +250,8 @@ class RSSService:
                 published_at=published_date,
                 metrics=ArticleMetrics(),
                 raw_data=entry,
+                # Near-duplicate signature, checked before enrichment (see services.near_duplicates)
+                minhash=minhash_signature(f"{entry.title or ''} {entry.summary or ''}"),
             )
             articles.append(article)
         return articles
@@ -107,6 +261,7 @@ async def main():
     rss_service = RSSService()
     articles = await rss_service.fetch_all_feeds()
     await create_or_update_articles(articles)
+    await rss_service.save_feed_states()
     print(f"Successfully fetched and saved {len(articles)} articles.")
 
 
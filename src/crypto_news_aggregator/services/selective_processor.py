@@ -6,11 +6,12 @@ Implements smart filtering to reduce LLM API calls by ~50%:
 3. Low-priority sources always use regex extraction
 """
 
-import re
 from typing import List, Dict, Any, Set, Optional
 from datetime import datetime
 from bson import ObjectId
 
+from .entity_matcher import EntityMatcher
+
 
 class SelectiveArticleProcessor:
     """
@@ -91,19 +92,22 @@ class SelectiveArticleProcessor:
         "Aptos": ["apt", "$apt", "aptos"]
     }
     
+    # Matchers built from ENTITY_MAPPING, shared by every instance of a class
+    _matchers: Dict[type, EntityMatcher] = {}
+    
     def __init__(self, db):
         """Initialize selective processor with database connection"""
         self.db = db
-        self._compile_patterns()
+        self.entity_matcher = self._get_matcher()
     
-    def _compile_patterns(self):
-        """Compile regex patterns for fast entity extraction"""
-        self.entity_patterns = {}
-        
-        for canonical, variants in self.ENTITY_MAPPING.items():
-            # Create pattern that matches any variant (case-insensitive, word boundaries)
-            pattern = r'\b(' + '|'.join(re.escape(v) for v in variants) + r')\b'
-            self.entity_patterns[canonical] = re.compile(pattern, re.IGNORECASE)
+    @classmethod
+    def _get_matcher(cls) -> EntityMatcher:
+        """Compile ENTITY_MAPPING into a single-pass matcher (once per class)"""
+        matcher = SelectiveArticleProcessor._matchers.get(cls)
+        if matcher is None:
+            matcher = EntityMatcher(cls.ENTITY_MAPPING)
+            SelectiveArticleProcessor._matchers[cls] = matcher
+        return matcher
     
     def should_use_llm(self, article: Dict) -> bool:
         """
@@ -164,37 +168,31 @@ class SelectiveArticleProcessor:
         Returns:
             List of entity mention dictionaries
         """
-        text = f"{article.get('title', '')} {article.get('text', '')}".lower()
+        title = article.get('title', '') or ''
+        text = f"{title} {article.get('text', '') or ''}"
+        
+        # One pass over title + body; the title is the prefix of ``text``
+        matches = self.entity_matcher.find_all(text)
         
         entities = []
         seen_entities = set()
+        for match in matches:
+            if match.canonical not in seen_entities:
+                entities.append({
+                    "entity": match.canonical,
+                    "entity_type": "cryptocurrency",
+                    "article_id": article_id,
+                    "is_primary": False,
+                    "confidence": 0.7,  # Lower confidence for regex
+                    "source": article.get('source', 'unknown'),
+                    "created_at": datetime.utcnow()
+                })
+                seen_entities.add(match.canonical)
         
-        # Match entities using compiled regex patterns
-        for canonical, pattern in self.entity_patterns.items():
-            if pattern.search(text):
-                if canonical not in seen_entities:
-                    entities.append({
-                        "entity": canonical,
-                        "entity_type": "cryptocurrency",
-                        "article_id": article_id,
-                        "is_primary": False,
-                        "confidence": 0.7,  # Lower confidence for regex
-                        "source": article.get('source', 'unknown'),
-                        "created_at": datetime.utcnow()
-                    })
-                    seen_entities.add(canonical)
-        
-        # Try to identify primary entity (first mentioned in title)
-        title_lower = article.get('title', '').lower()
-        for canonical, pattern in self.entity_patterns.items():
-            if pattern.search(title_lower):
-                # Mark first title mention as primary
-                for entity in entities:
-                    if entity['entity'] == canonical:
-                        entity['is_primary'] = True
-                        entity['confidence'] = 0.85  # Higher confidence for title
-                        break
-                break
+        # The first entity mentioned in the title is the primary one
+        if matches and matches[0].end <= len(title):
+            entities[0]['is_primary'] = True
+            entities[0]['confidence'] = 0.85  # Higher confidence for title
         
         return entities
     
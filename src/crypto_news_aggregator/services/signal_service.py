@@ -11,7 +11,8 @@ which should already be normalized to canonical form by the RSS fetcher.
 
 IMPORTANT: Signal calculations only include mentions from articles with
 relevance_tier <= 2 (high and medium signal). Low-signal articles (tier 3)
-are excluded to reduce noise.
+are excluded to reduce noise. The tier is denormalized onto each mention
+(see create_entity_mentions_batch), so no query joins against articles.
 """
 
 import logging
@@ -19,6 +20,12 @@ from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, Optional, List
 from bson import ObjectId
 from crypto_news_aggregator.db.mongodb import mongo_manager
+from crypto_news_aggregator.db.operations.entity_mention_rollups import (
+    get_entity_rollup_history,
+    get_entity_rollup_totals,
+    hour_bucket,
+    source_key,
+)
 from crypto_news_aggregator.services.entity_normalization import normalize_entity_name
 
 logger = logging.getLogger(__name__)
@@ -27,46 +34,27 @@ logger = logging.getLogger(__name__)
 # Tier 1 = high signal, Tier 2 = medium, Tier 3 = low (excluded)
 MAX_RELEVANCE_TIER = 2
 
+# Mention filter for high/medium signal articles. Matches tier <= MAX_RELEVANCE_TIER
+# and unclassified mentions (missing/null tier) as a single index range.
+HIGH_SIGNAL_MENTION_FILTER = {"relevance_tier": {"$not": {"$gt": MAX_RELEVANCE_TIER}}}
 
-async def _get_high_signal_article_ids(
-    db,
-    start_time: datetime = None,
-    end_time: datetime = None
-) -> set:
-    """
-    Get article IDs that have relevance_tier <= MAX_RELEVANCE_TIER.
-
-    Args:
-        db: Database instance
-        start_time: Optional start time filter (published_at)
-        end_time: Optional end time filter (published_at)
+# Timeframes computed by the batched scoring engine (label -> hours)
+SIGNAL_TIMEFRAMES = {
+    "24h": 24,
+    "7d": 168,
+    "30d": 720,
+}
 
-    Returns:
-        Set of article IDs (as strings) that are high/medium signal
-    """
-    query = {
-        "$or": [
-            {"relevance_tier": {"$lte": MAX_RELEVANCE_TIER}},
-            {"relevance_tier": {"$exists": False}},  # Include unclassified articles
-            {"relevance_tier": None},
-        ]
-    }
-
-    if start_time or end_time:
-        time_filter = {}
-        if start_time:
-            time_filter["$gte"] = start_time
-        if end_time:
-            time_filter["$lt"] = end_time
-        if time_filter:
-            query["created_at"] = time_filter
+# calculate_signal_scores_batch counts raw mentions this recent exactly and
+# takes older history from the hourly rollups
+RAW_SCORING_HOURS = 48
 
-    cursor = db.articles.find(query, {"_id": 1})
-    article_ids = set()
-    async for doc in cursor:
-        article_ids.add(str(doc["_id"]))
-
-    return article_ids
+# Numeric scores for sentiment labels on entity mentions
+SENTIMENT_SCORES = {
+    "positive": 1.0,
+    "neutral": 0.0,
+    "negative": -1.0,
+}
 
 
 async def _count_filtered_mentions(
@@ -74,7 +62,6 @@ async def _count_filtered_mentions(
     entity: str,
     start_time: datetime = None,
     end_time: datetime = None,
-    high_signal_article_ids: set = None
 ) -> int:
     """
     Count entity mentions, filtering by relevance tier.
@@ -84,17 +71,14 @@ async def _count_filtered_mentions(
         entity: Entity to count mentions for
         start_time: Optional start time filter
         end_time: Optional end time filter
-        high_signal_article_ids: Pre-fetched set of high-signal article IDs
 
     Returns:
         Count of mentions from high/medium signal articles
     """
-    collection = db.entity_mentions
-
-    # Build base query
     query = {
         "entity": entity,
         "is_primary": True,
+        **HIGH_SIGNAL_MENTION_FILTER,
     }
 
     if start_time or end_time:
@@ -106,43 +90,7 @@ async def _count_filtered_mentions(
         if time_filter:
             query["created_at"] = time_filter
 
-    # If we have a pre-fetched set of article IDs, use it
-    if high_signal_article_ids is not None:
-        query["article_id"] = {"$in": list(high_signal_article_ids)}
-        return await collection.count_documents(query)
-
-    # Otherwise, use aggregation to join and filter
-    pipeline = [
-        {"$match": query},
-        {
-            "$lookup": {
-                "from": "articles",
-                "let": {"article_id": {"$toObjectId": "$article_id"}},
-                "pipeline": [
-                    {
-                        "$match": {
-                            "$expr": {"$eq": ["$_id", "$$article_id"]},
-                        }
-                    },
-                    {
-                        "$match": {
-                            "$or": [
-                                {"relevance_tier": {"$lte": MAX_RELEVANCE_TIER}},
-                                {"relevance_tier": {"$exists": False}},
-                                {"relevance_tier": None},
-                            ]
-                        }
-                    }
-                ],
-                "as": "article"
-            }
-        },
-        {"$match": {"article": {"$ne": []}}},  # Only keep mentions with matching articles
-        {"$count": "total"}
-    ]
-
-    result = await collection.aggregate(pipeline).to_list(length=1)
-    return result[0]["total"] if result else 0
+    return await db.entity_mentions.count_documents(query)
 
 
 async def calculate_mentions_and_velocity(entity: str, timeframe_hours: int) -> Dict[str, float]:
@@ -168,34 +116,21 @@ async def calculate_mentions_and_velocity(entity: str, timeframe_hours: int) ->
     current_period_start = now - timedelta(hours=timeframe_hours)
     previous_period_start = now - timedelta(hours=timeframe_hours * 2)
 
-    # Get high-signal article IDs for the full time range (for efficiency)
-    high_signal_ids = await _get_high_signal_article_ids(
-        db,
-        start_time=previous_period_start
-    )
-
     # Count mentions in current period (primary entities only, high-signal articles only)
     current_mentions = await _count_filtered_mentions(
         db, entity,
-        start_time=current_period_start,
-        high_signal_article_ids=high_signal_ids
+        start_time=current_period_start
     )
 
     # Count mentions in previous period (primary entities only, high-signal articles only)
     previous_mentions = await _count_filtered_mentions(
         db, entity,
         start_time=previous_period_start,
-        end_time=current_period_start,
-        high_signal_article_ids=high_signal_ids
+        end_time=current_period_start
     )
 
     # Calculate velocity as growth rate percentage
-    if previous_mentions == 0:
-        # If no previous data, velocity is 100% if we have current mentions, else 0%
-        velocity = 100.0 if current_mentions > 0 else 0.0
-    else:
-        # Growth rate as percentage: (current - previous) / previous * 100
-        velocity = ((current_mentions - previous_mentions) / previous_mentions) * 100
+    velocity = _growth_velocity(current_mentions, previous_mentions)
 
     return {
         "mentions": float(current_mentions),
@@ -227,24 +162,25 @@ async def calculate_velocity(entity: str, timeframe_hours: int = 24) -> float:
     one_hour_ago = now - timedelta(hours=1)
     timeframe_ago = now - timedelta(hours=timeframe_hours)
 
-    # Get high-signal article IDs for efficiency
-    high_signal_ids = await _get_high_signal_article_ids(db, start_time=timeframe_ago)
-
     # Count mentions in last hour (primary entities only, high-signal only)
     mentions_1h = await _count_filtered_mentions(
         db, entity,
-        start_time=one_hour_ago,
-        high_signal_article_ids=high_signal_ids
+        start_time=one_hour_ago
     )
 
     # Count mentions in full timeframe (primary entities only, high-signal only)
     mentions_timeframe = await _count_filtered_mentions(
         db, entity,
-        start_time=timeframe_ago,
-        high_signal_article_ids=high_signal_ids
+        start_time=timeframe_ago
     )
 
-    # Calculate velocity
+    return _acceleration_velocity(mentions_1h, mentions_timeframe, timeframe_hours)
+
+
+def _acceleration_velocity(mentions_1h: int, mentions_timeframe: int, timeframe_hours: int) -> float:
+    """
+    Legacy velocity ratio: mentions in the last hour vs the timeframe hourly average.
+    """
     if mentions_timeframe == 0:
         # No historical data, return current hour count as baseline
         return float(mentions_1h)
@@ -256,9 +192,7 @@ async def calculate_velocity(entity: str, timeframe_hours: int = 24) -> float:
         return float(mentions_1h)
 
     # Velocity ratio: actual vs expected
-    velocity = mentions_1h / expected_per_hour
-
-    return velocity
+    return mentions_1h / expected_per_hour
 
 
 async def calculate_source_diversity(entity: str) -> int:
@@ -278,16 +212,13 @@ async def calculate_source_diversity(entity: str) -> int:
     """
     db = await mongo_manager.get_async_database()
 
-    # Get high-signal article IDs
-    high_signal_ids = await _get_high_signal_article_ids(db)
-
     # Use aggregation to get unique sources from high-signal articles only
     pipeline = [
         {
             "$match": {
                 "entity": entity,
                 "is_primary": True,
-                "article_id": {"$in": list(high_signal_ids)} if high_signal_ids else {"$exists": True}
+                **HIGH_SIGNAL_MENTION_FILTER,
             }
         },
         {
@@ -319,20 +250,7 @@ async def calculate_sentiment_metrics(entity: str) -> Dict[str, float]:
     db = await mongo_manager.get_async_database()
     collection = db.entity_mentions
 
-    # Get high-signal article IDs
-    high_signal_ids = await _get_high_signal_article_ids(db)
-
-    # Map sentiment labels to numeric scores
-    sentiment_map = {
-        "positive": 1.0,
-        "neutral": 0.0,
-        "negative": -1.0,
-    }
-
-    # Build query with article filter
-    query = {"entity": entity, "is_primary": True}
-    if high_signal_ids:
-        query["article_id"] = {"$in": list(high_signal_ids)}
+    query = {"entity": entity, "is_primary": True, **HIGH_SIGNAL_MENTION_FILTER}
 
     # Get all mentions with sentiment (primary mentions only, high-signal only)
     cursor = collection.find(query)
@@ -340,7 +258,7 @@ async def calculate_sentiment_metrics(entity: str) -> Dict[str, float]:
     sentiment_scores = []
     async for mention in cursor:
         sentiment = mention.get("sentiment", "neutral")
-        score = sentiment_map.get(sentiment, 0.0)
+        score = SENTIMENT_SCORES.get(sentiment, 0.0)
         sentiment_scores.append(score)
 
     if not sentiment_scores:
@@ -413,14 +331,10 @@ async def calculate_recency_factor(entity: str, timeframe_hours: int) -> float:
     recent_window_hours = timeframe_hours * 0.2  # Most recent 20%
     recent_start = now - timedelta(hours=recent_window_hours)
 
-    # Get high-signal article IDs for the timeframe
-    high_signal_ids = await _get_high_signal_article_ids(db, start_time=timeframe_start)
-
     # Count total mentions in timeframe (high-signal only)
     total_mentions = await _count_filtered_mentions(
         db, entity,
-        start_time=timeframe_start,
-        high_signal_article_ids=high_signal_ids
+        start_time=timeframe_start
     )
 
     if total_mentions == 0:
@@ -429,8 +343,7 @@ async def calculate_recency_factor(entity: str, timeframe_hours: int) -> float:
     # Count mentions in recent window (high-signal only)
     recent_mentions = await _count_filtered_mentions(
         db, entity,
-        start_time=recent_start,
-        high_signal_article_ids=high_signal_ids
+        start_time=recent_start
     )
 
     # Recency factor is the proportion of mentions that are recent
@@ -438,6 +351,57 @@ async def calculate_recency_factor(entity: str, timeframe_hours: int) -> float:
     return recency
 
 
+def _growth_velocity(current_mentions: int, previous_mentions: int) -> float:
+    """
+    Growth rate of the current period over the previous one, as a percentage.
+
+    If there is no previous data, velocity is 100% when there are current
+    mentions and 0% otherwise.
+    """
+    if previous_mentions == 0:
+        return 100.0 if current_mentions > 0 else 0.0
+    return ((current_mentions - previous_mentions) / previous_mentions) * 100
+
+
+def _timeframe_score(velocity: float, diversity: int, recency: float) -> float:
+    """
+    Normalized (0-10) score for a specific timeframe.
+
+    - Velocity (growth rate as percentage, e.g., 67.0 for 67%) weighted at 50%
+    - Diversity weighted at 30%
+    - Recency factor weighted at 20%
+    """
+    # Note: velocity is a percentage (0-300+), so we scale it down
+    velocity_component = (velocity / 100) * 0.5
+    diversity_component = diversity * 0.3
+    recency_component = recency * 0.2
+
+    raw_score = velocity_component + diversity_component + recency_component
+
+    # Normalize to 0-10 scale
+    # Max realistic: velocity=3.0 (300% growth), diversity=20, recency=1.0
+    # Max raw: (3.0*0.5) + (20*0.3) + (1.0*0.2) = 1.5 + 6.0 + 0.2 = 7.7
+    max_expected_score = 7.7
+    return min(10.0, (raw_score / max_expected_score) * 10.0)
+
+
+def _legacy_score(velocity: float, diversity: int, sentiment_avg: float) -> float:
+    """
+    Normalized (0-10) score using the legacy formula.
+
+    - Velocity weighted at 40%
+    - Diversity weighted at 30%
+    - Sentiment strength (absolute value) weighted at 30%, scaled by 30x
+    """
+    raw_score = (velocity * 0.4) + (diversity * 0.3) + (abs(sentiment_avg) * 30)
+
+    # Normalize to 0-10 scale
+    # Assuming max realistic values: velocity=10, diversity=20, sentiment=1
+    # Max raw score would be: (10*0.4) + (20*0.3) + (1*30) = 4 + 6 + 30 = 40
+    max_expected_score = 40.0
+    return min(10.0, (raw_score / max_expected_score) * 10.0)
+
+
 async def calculate_signal_score(
     entity: str,
     timeframe_hours: Optional[int] = None
@@ -472,22 +436,7 @@ async def calculate_signal_score(
         recency = await calculate_recency_factor(canonical_entity, timeframe_hours)
         sentiment_metrics = await calculate_sentiment_metrics(canonical_entity)
         
-        # New formula:
-        # - Velocity (growth rate as percentage, e.g., 67.0 for 67%) weighted at 50%
-        # - Diversity weighted at 30%
-        # - Recency factor weighted at 20%
-        # Note: velocity is now a percentage (0-300+), so we scale it down
-        velocity_component = (metrics["velocity"] / 100) * 0.5
-        diversity_component = diversity * 0.3
-        recency_component = recency * 0.2
-        
-        raw_score = velocity_component + diversity_component + recency_component
-        
-        # Normalize to 0-10 scale
-        # Max realistic: velocity=3.0 (300% growth), diversity=20, recency=1.0
-        # Max raw: (3.0*0.5) + (20*0.3) + (1.0*0.2) = 1.5 + 6.0 + 0.2 = 7.7
-        max_expected_score = 7.7
-        normalized_score = min(10.0, (raw_score / max_expected_score) * 10.0)
+        normalized_score = _timeframe_score(metrics["velocity"], diversity, recency)
         
         # Query narratives containing this entity
         narrative_ids = await get_narratives_for_entity(canonical_entity)
@@ -516,17 +465,7 @@ async def calculate_signal_score(
         
         sentiment_avg = sentiment_metrics["avg"]
         
-        # Calculate raw score
-        # - Velocity weighted at 40%
-        # - Diversity weighted at 30% 
-        # - Sentiment strength (absolute value) weighted at 30%, scaled by 30x
-        raw_score = (velocity * 0.4) + (diversity * 0.3) + (abs(sentiment_avg) * 30)
-        
-        # Normalize to 0-10 scale
-        # Assuming max realistic values: velocity=10, diversity=20, sentiment=1
-        # Max raw score would be: (10*0.4) + (20*0.3) + (1*30) = 4 + 6 + 30 = 40
-        max_expected_score = 40.0
-        normalized_score = min(10.0, (raw_score / max_expected_score) * 10.0)
+        normalized_score = _legacy_score(velocity, diversity, sentiment_avg)
         
         # Query narratives containing this entity
         narrative_ids = await get_narratives_for_entity(canonical_entity)
@@ -547,6 +486,212 @@ async def calculate_signal_score(
         }
 
 
+def _since_count(start: datetime) -> Dict[str, Any]:
+    """$group accumulator counting mentions created at or after ``start``."""
+    return {"$sum": {"$cond": [{"$gte": ["$created_at", start]}, 1, 0]}}
+
+
+async def calculate_signal_scores_batch(
+    entities: List[str],
+    timeframes: Optional[Dict[str, int]] = None,
+    include_legacy: bool = True,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Calculate signal scores for many entities and timeframes at once.
+
+    Produces the same metrics as calling ``calculate_signal_score`` once per
+    entity and timeframe, but computes velocity, source diversity, recency and
+    sentiment for every entity from two aggregations: one ``$facet``/``$group``
+    over the last RAW_SCORING_HOURS of ``entity_mentions``, counted exactly,
+    and one over the hourly ``entity_mention_rollups`` for everything older
+    (window starts past RAW_SCORING_HOURS are truncated to the hour). Narrative
+    links are fetched with one extra query, so scoring 100 entities costs
+    three round-trips instead of thousands, and no query scans more than
+    RAW_SCORING_HOURS of raw mentions.
+
+    Args:
+        entities: Entities to score (will be normalized to canonical form)
+        timeframes: Mapping of label -> hours (defaults to SIGNAL_TIMEFRAMES)
+        include_legacy: Also compute the legacy (timeframe-less) score
+
+    Returns:
+        Dict keyed by canonical entity. Each value holds one entry per timeframe
+        label (same shape as ``calculate_signal_score(entity, hours)``), a
+        ``legacy`` entry (same shape as ``calculate_signal_score(entity)``) when
+        requested, and ``first_seen``. The relevance tier filter applies to
+        the metrics only; ``first_seen`` is the earliest primary mention of
+        any tier, from the raw mentions or the rollups.
+    """
+    if timeframes is None:
+        timeframes = SIGNAL_TIMEFRAMES
+
+    canonical_entities = list(dict.fromkeys(normalize_entity_name(e) for e in entities))
+    if not canonical_entities:
+        return {}
+
+    db = await mongo_manager.get_async_database()
+
+    # MongoDB stores datetimes as UTC but returns them as naive
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    horizon = hour_bucket(now - timedelta(hours=RAW_SCORING_HOURS))
+
+    # Every window boundary we need, in hours back from now. Period counts are
+    # derived from cumulative "since" counts, e.g. previous = since(2T) - since(T).
+    boundaries = set()
+    for hours in timeframes.values():
+        boundaries.update((hours, hours * 2, hours * 0.2))
+    if include_legacy:
+        boundaries.update((1, 24))
+    recent = sorted(hours for hours in boundaries if now - timedelta(hours=hours) >= horizon)
+    older = sorted(boundaries.difference(recent))
+    boundary_fields = {hours: f"since_{i}" for i, hours in enumerate(recent)}
+
+    sentiment_score = {
+        "$switch": {
+            "branches": [
+                {"case": {"$eq": ["$sentiment", label]}, "then": score}
+                for label, score in SENTIMENT_SCORES.items()
+            ],
+            "default": 0.0,
+        }
+    }
+
+    group_stage: Dict[str, Any] = {
+        "_id": "$entity",
+        "sources": {"$addToSet": "$source"},
+        "sentiment_count": {"$sum": 1},
+        "sentiment_sum": {"$sum": sentiment_score},
+        "sentiment_sum_sq": {"$sum": {"$multiply": [sentiment_score, sentiment_score]}},
+        "sentiment_min": {"$min": sentiment_score},
+        "sentiment_max": {"$max": sentiment_score},
+    }
+    for hours, field in boundary_fields.items():
+        group_stage[field] = _since_count(now - timedelta(hours=hours))
+
+    pipeline = [
+        {
+            "$match": {
+                "entity": {"$in": canonical_entities},
+                "is_primary": True,
+                "created_at": {"$gte": horizon},
+            }
+        },
+        {
+            "$facet": {
+                "metrics": [
+                    {"$match": HIGH_SIGNAL_MENTION_FILTER},
+                    {"$group": group_stage},
+                ],
+                "first_seen": [
+                    {"$group": {"_id": "$entity", "first_seen": {"$min": "$created_at"}}},
+                ],
+            }
+        },
+    ]
+
+    facets = await db.entity_mentions.aggregate(pipeline).to_list(length=1)
+    facets = facets[0] if facets else {"metrics": [], "first_seen": []}
+    metrics_by_entity = {doc["_id"]: doc for doc in facets["metrics"]}
+    first_seen_by_entity = {doc["_id"]: doc["first_seen"] for doc in facets["first_seen"]}
+
+    history_by_entity = await get_entity_rollup_history(
+        canonical_entities,
+        before=horizon,
+        since={hours: now - timedelta(hours=hours) for hours in older},
+        relevance_filter=HIGH_SIGNAL_MENTION_FILTER,
+    )
+
+    # Narrative links for all entities in one query
+    narrative_map: Dict[str, List[str]] = {entity: [] for entity in canonical_entities}
+    cursor = db.narratives.find({"entities": {"$in": canonical_entities}}, {"entities": 1})
+    async for narrative in cursor:
+        for entity in narrative.get("entities", []):
+            if entity in narrative_map:
+                narrative_map[entity].append(str(narrative["_id"]))
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for entity in canonical_entities:
+        doc = metrics_by_entity.get(entity, {})
+        history = history_by_entity.get(entity)
+        recent_count = doc.get("sentiment_count", 0)
+
+        def since(hours: float) -> int:
+            if hours in boundary_fields:
+                return doc.get(boundary_fields[hours], 0)
+            older_count = history["counts"].get(hours, 0) if history else 0
+            return recent_count + older_count
+
+        # Rollups key sources by a field-safe name; use the same form for raw sources
+        sources = {source_key(source) for source in doc.get("sources", [])}
+        if history:
+            sources.update(history["sources"])
+        diversity = len(sources)
+
+        # Sentiment over all mentions: exact recent stats plus the rollup histogram
+        count = recent_count
+        total = doc.get("sentiment_sum", 0.0)
+        total_sq = doc.get("sentiment_sum_sq", 0.0)
+        scores = [doc["sentiment_min"], doc["sentiment_max"]] if recent_count else []
+        if history:
+            for label, mentions in history["sentiment"].items():
+                if mentions > 0:
+                    score = SENTIMENT_SCORES[label]
+                    count += mentions
+                    total += mentions * score
+                    total_sq += mentions * score * score
+                    scores.append(score)
+        avg = total / count if count else 0.0
+        if count:
+            variance = max(total_sq / count - avg ** 2, 0.0)
+            sentiment = {
+                "avg": round(avg, 3),
+                "min": round(min(scores), 3),
+                "max": round(max(scores), 3),
+                "divergence": round(variance ** 0.5, 3),
+            }
+        else:
+            sentiment = {"avg": 0.0, "min": 0.0, "max": 0.0, "divergence": 0.0}
+
+        first_seen = (history or {}).get("first_seen") or first_seen_by_entity.get(entity)
+
+        narrative_ids = narrative_map[entity]
+        is_emerging = len(narrative_ids) == 0
+
+        entity_scores: Dict[str, Any] = {"first_seen": first_seen}
+
+        for label, hours in timeframes.items():
+            current_mentions = since(hours)
+            previous_mentions = since(hours * 2) - current_mentions
+            velocity = _growth_velocity(current_mentions, previous_mentions)
+            recency = since(hours * 0.2) / current_mentions if current_mentions else 0.0
+
+            entity_scores[label] = {
+                "score": round(_timeframe_score(velocity, diversity, recency), 2),
+                "velocity": round(velocity, 2),
+                "mentions": current_mentions,
+                "source_count": diversity,
+                "recency_factor": round(recency, 3),
+                "sentiment": dict(sentiment),
+                "narrative_ids": list(narrative_ids),
+                "is_emerging": is_emerging,
+            }
+
+        if include_legacy:
+            velocity = _acceleration_velocity(since(1), since(24), 24)
+            entity_scores["legacy"] = {
+                "score": round(_legacy_score(velocity, diversity, avg), 2),
+                "velocity": round(velocity, 2),
+                "source_count": diversity,
+                "sentiment": dict(sentiment),
+                "narrative_ids": list(narrative_ids),
+                "is_emerging": is_emerging,
+            }
+
+        results[entity] = entity_scores
+
+    return results
+
+
 async def get_top_entities_by_mentions(
     timeframe_hours: int,
     limit: int = 100,
@@ -558,8 +703,8 @@ async def get_top_entities_by_mentions(
     This is an efficient first-pass query to identify which entities
     are worth computing full signal scores for.
 
-    Uses aggregation pipeline with $lookup to filter by article relevance_tier
-    without loading all article IDs into memory.
+    Filters on the relevance_tier denormalized onto each mention, so this is
+    a single range scan with no join against articles.
 
     Args:
         timeframe_hours: Timeframe in hours (24, 168, 720)
@@ -577,48 +722,14 @@ async def get_top_entities_by_mentions(
     # Build base match criteria
     match_criteria = {
         "is_primary": True,
+        **HIGH_SIGNAL_MENTION_FILTER,
         "created_at": {"$gte": cutoff},
     }
     if entity_type:
         match_criteria["entity_type"] = entity_type
 
-    # Use aggregation pipeline with $lookup to join with articles
-    # and filter by relevance_tier - more efficient than loading all article IDs
     pipeline = [
         {"$match": match_criteria},
-        # Convert article_id string to ObjectId for lookup
-        {
-            "$addFields": {
-                "article_oid": {
-                    "$cond": [
-                        {"$eq": [{"$type": "$article_id"}, "string"]},
-                        {"$toObjectId": "$article_id"},
-                        "$article_id"
-                    ]
-                }
-            }
-        },
-        # Join with articles collection
-        {
-            "$lookup": {
-                "from": "articles",
-                "localField": "article_oid",
-                "foreignField": "_id",
-                "as": "article"
-            }
-        },
-        # Unwind the article array
-        {"$unwind": "$article"},
-        # Filter to high/medium signal articles only (tier <= 2)
-        {
-            "$match": {
-                "$or": [
-                    {"article.relevance_tier": {"$lte": MAX_RELEVANCE_TIER}},
-                    {"article.relevance_tier": {"$exists": False}},
-                    {"article.relevance_tier": None},
-                ]
-            }
-        },
         # Group by entity
         {
             "$group": {
@@ -655,10 +766,14 @@ async def compute_trending_signals(
     Compute trending signals on-demand (no pre-computation required).
 
     This function uses a fast aggregation-based approach:
-    1. Aggregates entity_mentions to find top entities by mention count
+    1. Sums the hourly entity_mention_rollups to find top entities by mention count
     2. Calculates velocity (current vs previous period growth)
     3. Returns results sorted by a lightweight score
 
+    Rollup buckets are hour-aligned, so period boundaries are truncated to
+    the hour. Each entity contributes at most 2 * hours bucket documents.
+    Unlike the per-entity scores, mentions of every relevance tier count.
+
     This is optimized for speed over full signal score accuracy.
     Full signal scores with sentiment/recency can be computed per-entity
     if detailed analysis is needed.
@@ -686,54 +801,15 @@ async def compute_trending_signals(
     current_period_start = now - timedelta(hours=hours)
     previous_period_start = now - timedelta(hours=hours * 2)
 
-    # Build base match criteria
-    match_criteria = {
-        "is_primary": True,
-        "created_at": {"$gte": previous_period_start},  # Include both periods
-    }
-    if entity_type:
-        match_criteria["entity_type"] = entity_type
-
-    # Single aggregation to get all metrics we need
-    pipeline = [
-        {"$match": match_criteria},
-        # Group by entity with period-based counts
-        {
-            "$group": {
-                "_id": "$entity",
-                "entity_type": {"$first": "$entity_type"},
-                "total_mentions": {"$sum": 1},
-                "current_mentions": {
-                    "$sum": {
-                        "$cond": [
-                            {"$gte": ["$created_at", current_period_start]},
-                            1,
-                            0
-                        ]
-                    }
-                },
-                "previous_mentions": {
-                    "$sum": {
-                        "$cond": [
-                            {"$lt": ["$created_at", current_period_start]},
-                            1,
-                            0
-                        ]
-                    }
-                },
-                "sources": {"$addToSet": "$source"},
-                "latest_mention": {"$max": "$created_at"},
-                "first_seen": {"$min": "$created_at"},
-            }
-        },
-        # Only include entities with current period mentions
-        {"$match": {"current_mentions": {"$gte": 1}}},
-        # Sort by current mentions descending
-        {"$sort": {"current_mentions": -1}},
-        {"$limit": limit * 2},  # Fetch extra to account for min_score filtering
-    ]
-
-    results = await db.entity_mentions.aggregate(pipeline).to_list(length=limit * 2)
+    # Sum hourly rollups for both periods in one aggregation, keeping only
+    # entities with current period mentions, most mentioned first
+    results = await get_entity_rollup_totals(
+        start=previous_period_start,
+        split_at=current_period_start,
+        entity_type=entity_type,
+        min_current_mentions=1,
+        limit=limit * 2,  # Fetch extra to account for min_score filtering
+    )
 
     if not results:
         return []
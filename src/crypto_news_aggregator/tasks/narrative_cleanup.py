@@ -15,6 +15,7 @@ from typing import Dict, Any, List
 from bson import ObjectId
 
 from ..db.mongodb import mongo_manager
+from ..services.narrative_index import index_narrative
 
 logger = logging.getLogger(__name__)
 
@@ -91,16 +92,18 @@ async def cleanup_invalid_article_references() -> Dict[str, Any]:
                 narratives_updated += 1
 
                 # Update narrative with only valid article IDs
+                now = datetime.now(timezone.utc)
                 await narratives_collection.update_one(
                     {"_id": narrative_id},
                     {
                         "$set": {
                             "article_ids": list(valid_articles_set),
                             "article_count": new_count,
-                            "last_updated": datetime.now(timezone.utc)
+                            "last_updated": now
                         }
                     }
                 )
+                index_narrative({**narrative, "last_updated": now})
 
                 logger.info(
                     f"Cleaned up narrative {narrative_id}: "
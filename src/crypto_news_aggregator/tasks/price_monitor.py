@@ -1,5 +1,9 @@
 """
 Background task for monitoring cryptocurrency prices and triggering alerts.
+
+The monitor runs the shared price tick stream and subscribes the price
+consumers to it: price history recording, user price alerts and detection
+of significant moves for every tracked coin.
 """
 
 import asyncio
@@ -8,7 +12,11 @@ from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 from functools import lru_cache
 
-from ..services.price_service import get_price_service
+from ..services.price_service import COIN_ID_TO_SYMBOL, get_price_service
+from ..services.price_history import price_history_service
+from ..services.price_ticks import PriceTick, get_price_tick_service
+from ..services.alert_index import get_alert_index
+from ..services.alert_notification_service import get_alert_notification_service
 from ..services.notification_service import get_notification_service
 from ..services.news_correlator import NewsCorrelator
 from ..core.config import get_settings
@@ -22,17 +30,18 @@ class PriceMonitor:
 
     def __init__(self):
         self.price_service = get_price_service()
+        self.ticks = get_price_tick_service()
         self.is_running = False
         self.task: Optional[asyncio.Task] = None
         self.last_alert_time: Dict[str, datetime] = {}
         self.last_checked_price: Dict[str, float] = {}
+        self.last_checked_at: Dict[str, datetime] = {}
         self.min_alert_interval = timedelta(
             minutes=30
         )  # Minimum time between alerts for the same coin
 
     async def start(self):
-        """Start the price monitoring service."""
-        settings = get_settings()
+        """Start the price tick stream with the monitor's subscribers."""
         if self.is_running:
             logger.warning("Price monitor is already running")
             return
@@ -40,19 +49,19 @@ class PriceMonitor:
         self.is_running = True
         logger.info("Starting price monitor")
 
-        while self.is_running:
-            try:
-                await self._check_prices()
-            except Exception as e:
-                logger.error(f"Error in price monitor: {e}", exc_info=True)
-
-            # Wait for the next check interval
-            await asyncio.sleep(settings.PRICE_CHECK_INTERVAL)
+        self.ticks.subscribe("price_history", self._record_prices)
+        self.ticks.subscribe("price_alerts", self._check_price_alerts)
+        self.ticks.subscribe("price_movements", self._check_prices)
+        try:
+            await self.ticks.run()
+        finally:
+            self.is_running = False
 
     async def stop(self):
         """Stop the price monitoring service."""
         logger.info("Stopping price monitor")
         self.is_running = False
+        self.ticks.stop()
         if self.task and not self.task.done():
             self.task.cancel()
             try:
@@ -60,38 +69,63 @@ class PriceMonitor:
             except asyncio.CancelledError:
                 logger.info("Price monitor task has been cancelled.")
 
-    async def _check_prices(self):
-        """Check prices and trigger alerts if needed."""
-        settings = get_settings()
-        symbol = "bitcoin"  # Hardcoded for now
-
-        price_data = await self.price_service.get_bitcoin_price()
-        current_price = price_data.get("price")
-
-        if current_price is None:
-            logger.warning("Could not retrieve current price for bitcoin.")
-            return
-
-        last_price = self.last_checked_price.get(symbol)
-        self.last_checked_price[symbol] = current_price
-
-        if last_price is None:
-            logger.info(f"First price check for {symbol}: {current_price}")
-            return
+    async def _record_prices(self, ticks: List[PriceTick]):
+        """Record each tick in the price history."""
+        for tick in ticks:
+            await price_history_service.record_price(
+                tick.symbol,
+                tick.price,
+                change_24h=tick.change_24h,
+                volume=tick.volume_24h,
+                timestamp=tick.timestamp,
+            )
 
-        should_alert, change_pct = await self.price_service.should_trigger_alert(
-            current_price=current_price,
-            last_alert_price=last_price,
-            threshold=settings.PRICE_CHANGE_THRESHOLD,
+    async def _check_price_alerts(self, ticks: List[PriceTick]):
+        """Evaluate user price alerts against the tick and track their coins."""
+        await get_alert_notification_service().check_and_send_alerts(
+            prices={tick.symbol: tick.as_price_data() for tick in ticks}
         )
+        index = get_alert_index()
+        if index is not None:
+            self.ticks.track(*index.symbols())
+
+    async def _check_prices(self, ticks: List[PriceTick]):
+        """
+        Trigger alerts for coins that moved past PRICE_CHANGE_THRESHOLD.
+
+        Moves are measured from a reference price that is reset every
+        PRICE_CHECK_INTERVAL (and after an alert), so faster polling in
+        volatile markets doesn't split a move across ticks.
+        """
+        settings = get_settings()
+        window = timedelta(seconds=settings.PRICE_CHECK_INTERVAL)
+        for tick in ticks:
+            symbol, current_price = tick.symbol, tick.price
+            last_price = self.last_checked_price.get(symbol)
+            checked_at = self.last_checked_at.get(symbol)
+            if last_price is None or tick.timestamp - checked_at >= window:
+                self.last_checked_price[symbol] = current_price
+                self.last_checked_at[symbol] = tick.timestamp
+
+            if last_price is None:
+                logger.info(f"First price check for {symbol}: {current_price}")
+                continue
+
+            should_alert, change_pct = await self.price_service.should_trigger_alert(
+                current_price=current_price,
+                last_alert_price=last_price,
+                threshold=settings.PRICE_CHANGE_THRESHOLD,
+            )
 
-        if should_alert and self._should_alert(symbol):
-            movement = {
-                "symbol": symbol,
-                "current_price": current_price,
-                "change_pct": change_pct,
-            }
-            await self._handle_price_movement(movement)
+            if should_alert and self._should_alert(symbol):
+                self.last_checked_price[symbol] = current_price
+                self.last_checked_at[symbol] = tick.timestamp
+                movement = {
+                    "symbol": symbol,
+                    "current_price": current_price,
+                    "change_pct": change_pct,
+                }
+                await self._handle_price_movement(movement)
 
     def _should_alert(self, symbol: str) -> bool:
         """Check if we should send an alert for this symbol."""
@@ -138,7 +172,7 @@ class PriceMonitor:
                     db=db,
                     crypto_id=crypto_id,
                     crypto_name=crypto_name,
-                    crypto_symbol=symbol.upper(),
+                    crypto_symbol=COIN_ID_TO_SYMBOL.get(crypto_id, symbol.upper()),
                     current_price=current_price,
                     price_change_24h=change_pct,
                     context_articles=relevant_articles,
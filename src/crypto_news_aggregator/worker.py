@@ -9,11 +9,13 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 from crypto_news_aggregator.background.rss_fetcher import schedule_rss_fetch
 from crypto_news_aggregator.core.config import get_settings
+from crypto_news_aggregator.core.leases import run_as_leader
+from crypto_news_aggregator.services.price_history import price_history_service
 from crypto_news_aggregator.db.mongodb import initialize_mongodb, mongo_manager
-from crypto_news_aggregator.services.signal_service import calculate_signal_score
+from crypto_news_aggregator.llm.http_client import close_anthropic_http_client
+from crypto_news_aggregator.services.signal_service import calculate_signal_scores_batch
 from crypto_news_aggregator.db.operations.signal_scores import upsert_signal_score
-from crypto_news_aggregator.services.narrative_service import detect_narratives
-from crypto_news_aggregator.db.operations.narratives import upsert_narrative
+from crypto_news_aggregator.services.narrative_service import detect_narratives, save_narrative
 from crypto_news_aggregator.services.entity_alert_service import detect_alerts
 from crypto_news_aggregator.services.entity_normalization import normalize_entity_name
 from crypto_news_aggregator.services.narrative_deduplication import deduplicate_narratives
@@ -83,27 +85,23 @@ async def update_signal_scores(run_immediately: bool = False):
                 await asyncio.sleep(120)  # 2 minutes
                 continue
             
-            # Calculate scores for each entity
+            # Calculate scores for all entities and timeframes in one batched pass
+            batch_scores = await calculate_signal_scores_batch(
+                [entity_info["entity"] for entity_info in entities_to_score]
+            )
+            
             scored_entities = []
             for entity_info in entities_to_score:
                 entity = entity_info["entity"]
                 entity_type = entity_info["entity_type"]
                 
                 try:
-                    # Calculate signal scores for all three timeframes
-                    signal_24h = await calculate_signal_score(entity, timeframe_hours=24)
-                    signal_7d = await calculate_signal_score(entity, timeframe_hours=168)  # 7 days
-                    signal_30d = await calculate_signal_score(entity, timeframe_hours=720)  # 30 days
-                    
-                    # Also calculate legacy score for backward compatibility
-                    signal_legacy = await calculate_signal_score(entity)
-                    
-                    # Get first_seen timestamp (primary mentions only)
-                    first_mention = await entity_mentions_collection.find_one(
-                        {"entity": entity, "is_primary": True},
-                        sort=[("created_at", 1)]
-                    )
-                    first_seen = first_mention["created_at"] if first_mention else datetime.now(timezone.utc)
+                    entity_scores = batch_scores[entity]
+                    signal_24h = entity_scores["24h"]
+                    signal_7d = entity_scores["7d"]
+                    signal_30d = entity_scores["30d"]
+                    signal_legacy = entity_scores["legacy"]
+                    first_seen = entity_scores["first_seen"] or datetime.now(timezone.utc)
                     
                     # Store the signal score with all timeframes
                     await upsert_signal_score(
@@ -170,11 +168,14 @@ async def update_narratives():
     
     Runs narrative detection, deduplicates similar narratives,
     and upserts results to the database.
-    Scheduled to run every 10 minutes.
+    Scheduled to run every 10 minutes. With NARRATIVE_INCREMENTAL_DETECTION
+    only narratives whose clusters gained articles are returned and written.
     """
     try:
         logger.info("Starting narrative update cycle...")
-        narratives = await detect_narratives()
+        narratives = await detect_narratives(
+            incremental=get_settings().NARRATIVE_INCREMENTAL_DETECTION
+        )
         
         if not narratives:
             logger.info("No narratives detected in this cycle")
@@ -188,7 +189,7 @@ async def update_narratives():
         
         # Upsert each deduplicated narrative to database
         for narrative in deduplicated_narratives:
-            await upsert_narrative(
+            await save_narrative(
                 theme=narrative["theme"],
                 title=narrative["title"],
                 summary=narrative["summary"],
@@ -294,28 +295,34 @@ async def main():
         
         price_monitor = get_price_monitor()
         logger.info("Starting price monitor task...")
-        tasks.append(asyncio.create_task(price_monitor.start()))
+        tasks.append(asyncio.create_task(run_as_leader("price_monitor", price_monitor.start)))
         logger.info("Price monitor task created.")
 
         rss_interval = 60 * 30  # 30 minutes
         logger.info("Starting RSS ingestion schedule (every %s seconds)", rss_interval)
-        tasks.append(asyncio.create_task(schedule_rss_fetch(rss_interval)))
+        tasks.append(asyncio.create_task(
+            run_as_leader("rss_fetcher", lambda: schedule_rss_fetch(rss_interval))
+        ))
         logger.info("RSS ingestion task created.")
         
         # Signal score update task is DISABLED - signals are now computed on-demand
         # when the API is called (compute-on-read pattern). This eliminates staleness
         # issues and reduces background computation load. See ADR-001.
-        # tasks.append(asyncio.create_task(update_signal_scores()))
+        # tasks.append(asyncio.create_task(run_as_leader("signal_scores", update_signal_scores)))
         logger.info("Signal score update task DISABLED (using compute-on-read pattern)")
         
         narrative_interval = 60 * 10  # 10 minutes
         logger.info("Starting narrative update schedule (every %s seconds)", narrative_interval)
-        tasks.append(asyncio.create_task(schedule_narrative_updates(narrative_interval)))
+        tasks.append(asyncio.create_task(
+            run_as_leader("narratives", lambda: schedule_narrative_updates(narrative_interval))
+        ))
         logger.info("Narrative update task created.")
         
         alert_interval = 60 * 2  # 2 minutes
         logger.info("Starting alert check schedule (every %s seconds)", alert_interval)
-        tasks.append(asyncio.create_task(schedule_alert_checks(alert_interval)))
+        tasks.append(asyncio.create_task(
+            run_as_leader("alerts", lambda: schedule_alert_checks(alert_interval))
+        ))
         logger.info("Alert check task created.")
 
     if not tasks:
@@ -333,7 +340,9 @@ async def main():
         for task in tasks:
             task.cancel()
         await asyncio.gather(*tasks, return_exceptions=True)
+        await price_history_service.flush()
         await mongo_manager.aclose()
+        await close_anthropic_http_client()
         logger.info("Worker process shut down gracefully.")
 
 
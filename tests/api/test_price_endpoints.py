@@ -3,6 +3,7 @@ API tests for price endpoints.
 """
 
 import pytest
+from datetime import datetime
 from fastapi.testclient import TestClient
 from unittest.mock import patch, AsyncMock
 
@@ -72,10 +73,10 @@ class TestPriceEndpoints:
     ):
         """Test successful Bitcoin price history retrieval."""
         mock_service = mock_price_service.return_value
-        mock_service.get_recent_price_history.return_value = [
-            {"price": 50000.0, "timestamp": "2023-01-01T12:00:00"},
-            {"price": 50100.0, "timestamp": "2023-01-01T13:00:00"},
-        ]
+        mock_service.get_recent_price_history = AsyncMock(return_value=[
+            {"price": 50000.0, "timestamp": datetime(2023, 1, 1, 12)},
+            {"price": 50100.0, "timestamp": datetime(2023, 1, 1, 13)},
+        ])
 
         response = client.get("/api/v1/price/bitcoin/history")
 
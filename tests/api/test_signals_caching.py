@@ -2,12 +2,14 @@
 Unit and integration tests for signals endpoint caching.
 """
 
+import asyncio
 import pytest
 import pytest_asyncio
 import time
 from datetime import datetime, timezone, timedelta
+from fastapi import HTTPException
 from httpx import AsyncClient, ASGITransport
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch
 
 from crypto_news_aggregator.main import app
 from crypto_news_aggregator.db.mongodb import mongo_manager
@@ -25,7 +27,7 @@ def get_test_client():
 async def test_signal_data(mongo_db):
     """Create test signal score data."""
     # Clear cache before test
-    signals._memory_cache.clear()
+    signals.signals_cache.clear()
     
     collection = mongo_db.signal_scores
     
@@ -69,144 +71,108 @@ async def test_signal_data(mongo_db):
     
     # Clean up after tests
     await collection.delete_many({"entity": {"$in": ["$TEST1", "$TEST2"]}})
-    signals._memory_cache.clear()
+    signals.signals_cache.clear()
 
 
 @pytest.fixture(autouse=True)
 def clear_cache():
     """Clear the in-memory cache before each test."""
-    signals._memory_cache.clear()
-    signals._signals_cache.clear()
+    signals.signals_cache.clear()
     yield
-    signals._memory_cache.clear()
-    signals._signals_cache.clear()
+    signals.signals_cache.clear()
 
 
 # ============================================================================
 # Unit Tests for Cache Functions
 # ============================================================================
 
-def test_get_from_cache_empty():
-    """Test get_from_cache returns None when cache is empty."""
-    result = signals.get_from_cache("nonexistent_key")
-    assert result is None
+def _run(coro):
+    return asyncio.run(coro)
 
 
-def test_set_and_get_from_cache():
-    """Test setting and getting data from in-memory cache."""
+def test_signals_cache_lookup_empty():
+    """Test that an empty cache has no value for a key."""
+    assert signals.signals_cache.get("nonexistent_key") is None
+
+
+def test_signals_cache_set_and_get():
+    """Test setting and getting data from the in-memory tier."""
     cache_key = "test:key:1"
     test_data = {"count": 5, "signals": [{"entity": "$BTC"}]}
-    
-    # Set in cache
-    signals.set_in_cache(cache_key, test_data)
-    
-    # Get from cache
-    result = signals.get_from_cache(cache_key)
-    
-    assert result is not None
-    assert result == test_data
 
+    signals.signals_cache.set(cache_key, test_data)
 
-def test_cache_expiry():
-    """Test that cache entries expire after TTL."""
-    cache_key = "test:key:expiry"
-    test_data = {"count": 1}
-    
-    # Set in cache
-    signals.set_in_cache(cache_key, test_data)
-    
-    # Manually expire the cache entry
-    cached_data, cached_time = signals._memory_cache[cache_key]
-    expired_time = datetime.now() - timedelta(seconds=120)  # 2 minutes ago
-    signals._memory_cache[cache_key] = (cached_data, expired_time)
-    
-    # Should return None (expired)
-    result = signals.get_from_cache(cache_key)
-    assert result is None
-    
-    # Entry should be removed from cache
-    assert cache_key not in signals._memory_cache
+    assert signals.signals_cache.get(cache_key) == test_data
 
 
-def test_cache_cleanup():
-    """Test that cache automatically cleans up when exceeding max size."""
-    # Fill cache with exactly 100 entries
-    for i in range(100):
-        cache_key = f"test:key:{i}"
-        signals.set_in_cache(cache_key, {"data": i})
-    
-    # Should have 100 entries
-    assert len(signals._memory_cache) == 100
-    
-    # Add one more - should trigger cleanup
-    signals.set_in_cache("test:key:100", {"data": 100})
-    
-    # Should still be at or below 100 after cleanup
-    assert len(signals._memory_cache) <= 101  # May keep some fresh entries
+def test_signals_cache_is_bounded():
+    """Test that the LRU never grows past max_entries."""
+    for i in range(signals.signals_cache.max_entries + 10):
+        signals.signals_cache.set(f"test:key:{i}", {"data": i})
 
+    assert len(signals.signals_cache) == signals.signals_cache.max_entries
+    assert signals.signals_cache.get("test:key:0") is None
 
-def test_cache_cleanup_removes_expired_only():
-    """Test that cleanup only removes expired entries."""
-    # Add some fresh entries
-    for i in range(50):
-        signals.set_in_cache(f"fresh:{i}", {"data": i})
-    
-    # Add some expired entries
-    for i in range(60):
-        cache_key = f"expired:{i}"
-        expired_time = datetime.now() - timedelta(seconds=120)
-        signals._memory_cache[cache_key] = ({"data": i}, expired_time)
-    
-    # Trigger cleanup by adding one more entry
-    signals.set_in_cache("trigger:cleanup", {"data": "cleanup"})
-    
-    # Fresh entries should still be there
-    assert signals.get_from_cache("fresh:0") is not None
-    assert signals.get_from_cache("fresh:49") is not None
-    
-    # Expired entries should be gone
-    assert "expired:0" not in signals._memory_cache
 
-
-def test_cache_key_isolation():
+def test_signals_cache_key_isolation():
     """Test that different cache keys are isolated."""
-    signals.set_in_cache("key1", {"data": "value1"})
-    signals.set_in_cache("key2", {"data": "value2"})
-    
-    assert signals.get_from_cache("key1") == {"data": "value1"}
-    assert signals.get_from_cache("key2") == {"data": "value2"}
+    signals.signals_cache.set("key1", {"data": "value1"})
+    signals.signals_cache.set("key2", {"data": "value2"})
+
+    assert signals.signals_cache.get("key1") == {"data": "value1"}
+    assert signals.signals_cache.get("key2") == {"data": "value2"}
+
+
+def test_get_signals_reports_cached_flag():
+    """Test that GET /signals computes once and flags the second response as cached."""
+    computed = {"count": 1, "signals": [{"entity": "$BTC"}], "cached": False}
 
+    with patch.object(signals, "_compute_top_signals", AsyncMock(return_value=computed)) as mock_compute:
+        first = _run(signals.get_signals())
+        second = _run(signals.get_signals())
 
-@patch('crypto_news_aggregator.api.v1.endpoints.signals.redis_client')
-def test_redis_fallback_to_memory(mock_redis):
-    """Test that cache falls back to memory when Redis fails."""
-    # Mock Redis as enabled but failing
-    mock_redis.enabled = True
+    mock_compute.assert_awaited_once()
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert second["signals"] == first["signals"]
+    assert computed["cached"] is False  # the cached value itself is not mutated
+
+
+def test_get_signals_compute_error_returns_500():
+    """Test that compute errors surface as HTTP 500 and nothing is cached."""
+    with patch.object(signals, "_compute_top_signals", AsyncMock(side_effect=RuntimeError("db down"))):
+        with pytest.raises(HTTPException) as exc_info:
+            _run(signals.get_signals())
+
+    assert exc_info.value.status_code == 500
+    assert signals.signals_cache.get("top20:v2") is None
+
+
+def test_redis_failure_falls_back_to_memory():
+    """Test that Redis errors don't fail the request."""
+    mock_redis = AsyncMock(enabled=True)
     mock_redis.get.side_effect = Exception("Redis connection failed")
     mock_redis.set.side_effect = Exception("Redis connection failed")
-    
-    cache_key = "test:redis:fallback"
-    test_data = {"count": 3}
-    
-    # Should not raise exception, should use memory cache
-    signals.set_in_cache(cache_key, test_data)
-    result = signals.get_from_cache(cache_key)
-    
-    assert result == test_data
+    computed = {"count": 3, "signals": []}
+
+    with patch('crypto_news_aggregator.core.async_redis.get_redis_client', return_value=mock_redis), \
+         patch.object(signals, "_compute_top_signals", AsyncMock(return_value=computed)):
+        result = _run(signals.get_signals())
+
+    assert result["count"] == 3
+    assert signals.signals_cache.get("top20:v2") == computed
 
 
-@patch('crypto_news_aggregator.api.v1.endpoints.signals.redis_client')
-def test_redis_disabled_uses_memory(mock_redis):
+def test_redis_disabled_uses_memory():
     """Test that memory cache is used when Redis is disabled."""
-    mock_redis.enabled = False
-    
-    cache_key = "test:redis:disabled"
-    test_data = {"count": 2}
-    
-    signals.set_in_cache(cache_key, test_data)
-    result = signals.get_from_cache(cache_key)
-    
-    assert result == test_data
+    mock_redis = AsyncMock(enabled=False)
+    computed = {"count": 2, "signals": []}
+
+    with patch('crypto_news_aggregator.core.async_redis.get_redis_client', return_value=mock_redis), \
+         patch.object(signals, "_compute_top_signals", AsyncMock(return_value=computed)):
+        _run(signals.get_signals())
+
+    assert signals.signals_cache.get("top20:v2") == computed
     # Redis should not have been called
     mock_redis.get.assert_not_called()
     mock_redis.set.assert_not_called()
@@ -439,7 +405,7 @@ async def test_cache_performance_improvement(test_signal_data):
     
     async with get_test_client() as client:
         # Clear cache to ensure first request is uncached
-        signals._memory_cache.clear()
+        signals.signals_cache.clear()
         
         # First request (uncached)
         start1 = time.time()
@@ -475,59 +441,6 @@ async def test_cache_performance_improvement(test_signal_data):
 # Tests for GET /api/v1/signals endpoint caching (5 min TTL)
 # ============================================================================
 
-def test_signals_cache_empty():
-    """Test that signals cache is initially empty."""
-    assert len(signals._signals_cache) == 0
-
-
-def test_signals_cache_stores_data():
-    """Test that GET /signals endpoint stores data in dedicated cache."""
-    cache_key = "signals:top20"
-    test_data = {"count": 3, "signals": [{"entity": "$BTC"}]}
-    
-    # Manually set cache
-    signals._signals_cache[cache_key] = (test_data, datetime.now())
-    
-    # Verify it's stored
-    assert cache_key in signals._signals_cache
-    cached_data, cached_time = signals._signals_cache[cache_key]
-    assert cached_data == test_data
-
-
-def test_signals_cache_expiration():
-    """Test that signals cache expires after 5 minutes."""
-    cache_key = "signals:top20"
-    test_data = {"count": 1, "signals": []}
-    
-    # Set cache with expired timestamp (6 minutes ago)
-    expired_time = datetime.now() - timedelta(minutes=6)
-    signals._signals_cache[cache_key] = (test_data, expired_time)
-    
-    # Check if expired
-    cached_data, cached_time = signals._signals_cache[cache_key]
-    time_diff = datetime.now() - cached_time
-    
-    # Should be expired (> 5 minutes)
-    assert time_diff > signals._signals_cache_ttl
-
-
-def test_signals_cache_not_expired():
-    """Test that signals cache is valid within 5 minutes."""
-    cache_key = "signals:top20"
-    test_data = {"count": 1, "signals": []}
-    
-    # Set cache with recent timestamp (2 minutes ago)
-    recent_time = datetime.now() - timedelta(minutes=2)
-    signals._signals_cache[cache_key] = (test_data, recent_time)
-    
-    # Check if still valid
-    cached_data, cached_time = signals._signals_cache[cache_key]
-    time_diff = datetime.now() - cached_time
-    
-    # Should not be expired (< 5 minutes)
-    assert time_diff < signals._signals_cache_ttl
-
-
 @pytest.mark.asyncio
 async def test_get_signals_endpoint_caching(test_signal_data):
     """Test that GET /signals endpoint uses cache."""
@@ -554,10 +467,10 @@ async def test_get_signals_endpoint_caching(test_signal_data):
     
     # Results should be identical (from cache)
     assert data1["signals"] == data2["signals"]
-    assert data1["cached_at"] == data2["cached_at"]
+    assert data1["computed_at"] == data2["computed_at"]
     
     # Cache should contain the key
-    assert "signals:top20" in signals._signals_cache
+    assert signals.signals_cache.get("top20:v2") is not None
 
 
 @pytest.mark.asyncio
@@ -574,28 +487,19 @@ async def test_get_signals_cache_ttl_5_minutes(test_signal_data):
     
     assert response.status_code == 200
     
-    # Verify cache entry exists
-    cache_key = "signals:top20"
-    assert cache_key in signals._signals_cache
-    
-    # Check TTL is set correctly
-    cached_data, cached_time = signals._signals_cache[cache_key]
-    time_since_cached = datetime.now() - cached_time
-    
-    # Should be very recent (just cached)
-    assert time_since_cached < timedelta(seconds=5)
+    # Verify a fresh cache entry exists
+    assert signals.signals_cache.get("top20:v2") is not None
 
 
 @pytest.mark.asyncio
 async def test_get_signals_cache_invalidation(test_signal_data):
     """Test that expired cache is invalidated and refreshed."""
     settings = get_settings()
-    cache_key = "signals:top20"
+    cache_key = "top20:v2"
     
-    # Pre-populate cache with expired data
-    old_data = {"count": 0, "signals": [], "cached_at": "2020-01-01T00:00:00"}
-    expired_time = datetime.now() - timedelta(minutes=6)
-    signals._signals_cache[cache_key] = (old_data, expired_time)
+    # Pre-populate cache with data past its stale window
+    old_data = {"count": 0, "signals": [], "computed_at": "2020-01-01T00:00:00"}
+    signals.signals_cache._entries[cache_key] = (old_data, 0.0, 0.0)
     
     async with get_test_client() as client:
         # Request should invalidate expired cache and fetch fresh data
@@ -609,12 +513,11 @@ async def test_get_signals_cache_invalidation(test_signal_data):
     
     # Should have fresh data (not the old cached data)
     assert data["count"] > 0  # Should have test signals
-    assert data["cached_at"] != "2020-01-01T00:00:00"
+    assert data["computed_at"] != "2020-01-01T00:00:00"
+    assert data["cached"] is False
     
-    # Cache should be updated with fresh timestamp
-    cached_data, cached_time = signals._signals_cache[cache_key]
-    time_since_cached = datetime.now() - cached_time
-    assert time_since_cached < timedelta(seconds=5)
+    # Cache should be updated with the fresh data
+    assert signals.signals_cache.get(cache_key)["count"] == data["count"]
 
 
 @pytest.mark.asyncio
@@ -661,7 +564,7 @@ async def test_get_signals_limit_20_enforced(test_signal_data):
     finally:
         # Clean up
         await collection.delete_many({"entity": {"$in": test_entities}})
-        signals._signals_cache.clear()
+        signals.signals_cache.clear()
 
 
 @pytest.mark.asyncio
@@ -671,7 +574,7 @@ async def test_get_signals_performance_with_cache(test_signal_data):
     
     async with get_test_client() as client:
         # Clear cache
-        signals._signals_cache.clear()
+        signals.signals_cache.clear()
         
         # First request (uncached)
         start1 = time.time()
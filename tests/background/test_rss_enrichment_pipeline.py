@@ -0,0 +1,218 @@
+"""
+Tests for the staged article enrichment pipeline in the RSS fetcher.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from bson import ObjectId
+
+from src.crypto_news_aggregator.background import rss_fetcher
+from src.crypto_news_aggregator.services.near_duplicates import NearDuplicateIndex
+
+
+class FakeCursor:
+    """Async iterator standing in for a Motor cursor."""
+
+    def __init__(self, documents):
+        self._documents = list(documents)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._documents:
+            raise StopAsyncIteration
+        return self._documents.pop(0)
+
+
+def _make_articles(count):
+    return [
+        {
+            "_id": ObjectId(),
+            "title": f"Bitcoin ETF inflows day {i}",
+            # Distinct wording per article, so none is a near-duplicate of another
+            "text": " ".join(f"term{i}x{j}" for j in range(12)),
+            "source": "coindesk",
+            "published_at": None,
+        }
+        for i in range(count)
+    ]
+
+
+def _mock_llm(articles):
+    llm = Mock()
+    llm.model_name = "test-llm"
+    llm.score_relevance.return_value = 0.8
+    llm.analyze_sentiment.return_value = 0.6
+    llm.extract_themes.return_value = ["ETF"]
+    llm.extract_entities_batch.side_effect = lambda batch: {
+        "results": [
+            {
+                "article_id": item["id"],
+                "primary_entities": [{"name": "Bitcoin", "type": "cryptocurrency", "confidence": 0.95}],
+                "context_entities": [],
+                "sentiment": "positive",
+            }
+            for item in batch
+        ],
+        "usage": {},
+    }
+    return llm
+
+
+@pytest.fixture
+def pipeline_env():
+    """Patch the pipeline's database and LLM dependencies."""
+    articles = _make_articles(23)
+    collection = MagicMock()
+    collection.find = Mock(side_effect=lambda query: FakeCursor(articles))
+    collection.bulk_write = AsyncMock()
+    db = MagicMock()
+    db.articles = collection
+
+    mentions_batch = AsyncMock()
+    index = NearDuplicateIndex()
+    with patch.object(rss_fetcher.mongo_manager, "get_async_database", AsyncMock(return_value=db)), \
+         patch.object(rss_fetcher, "get_near_duplicate_index", AsyncMock(return_value=index)), \
+         patch.object(rss_fetcher, "get_optimized_llm", AsyncMock(side_effect=Exception("no key"))), \
+         patch.object(rss_fetcher, "get_llm_provider", return_value=_mock_llm(articles)), \
+         patch.object(rss_fetcher, "create_processor", return_value=MagicMock()), \
+         patch.object(rss_fetcher, "create_entity_mentions_batch", mentions_batch), \
+         patch.object(rss_fetcher, "update_mentions_relevance", AsyncMock()):
+        yield {
+            "articles": articles,
+            "collection": collection,
+            "mentions_batch": mentions_batch,
+            "index": index,
+        }
+
+
+@pytest.mark.asyncio
+async def test_pipeline_enriches_all_articles_with_bulk_writes(pipeline_env):
+    processed = await rss_fetcher.process_new_articles_from_mongodb(
+        concurrency=3, write_batch_size=10
+    )
+
+    assert processed == 23
+    # A single scan of the enrichment query
+    pipeline_env["collection"].find.assert_called_once_with(rss_fetcher.ENRICHMENT_QUERY)
+    assert len(pipeline_env["index"]) == 23
+
+    updates = [
+        op
+        for call in pipeline_env["collection"].bulk_write.await_args_list
+        for op in call.args[0]
+    ]
+    assert len(updates) == 23
+    assert {op._filter["_id"] for op in updates} == {a["_id"] for a in pipeline_env["articles"]}
+    assert all(len(call.args[0]) <= 10 for call in pipeline_env["collection"].bulk_write.await_args_list)
+
+    mentions = [m for call in pipeline_env["mentions_batch"].await_args_list for m in call.args[0]]
+    assert len(mentions) == 23
+    assert all(m["entity"] == "Bitcoin" and m["is_primary"] for m in mentions)
+
+    metrics = rss_fetcher.get_enrichment_pipeline_metrics()
+    assert metrics["articles_queued"] == 23
+    assert metrics["articles_enriched"] == 23
+    assert metrics["mentions_written"] == 23
+    assert metrics["write_batches"] == len(pipeline_env["collection"].bulk_write.await_args_list)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_skips_duplicate_cursor_results(pipeline_env):
+    articles = pipeline_env["articles"]
+    pipeline_env["collection"].find = Mock(return_value=FakeCursor(articles + articles[:5]))
+
+    processed = await rss_fetcher.process_new_articles_from_mongodb(concurrency=2)
+
+    assert processed == 23
+
+
+@pytest.mark.asyncio
+async def test_pipeline_marks_near_duplicates_without_enriching_them(pipeline_env):
+    articles = pipeline_env["articles"]
+    copy = {**articles[0], "_id": ObjectId(), "title": articles[0]["title"] + " (update)"}
+    pipeline_env["collection"].find = Mock(return_value=FakeCursor(articles + [copy]))
+
+    processed = await rss_fetcher.process_new_articles_from_mongodb(concurrency=2)
+
+    assert processed == 23
+    updates = [
+        op
+        for call in pipeline_env["collection"].bulk_write.await_args_list
+        for op in call.args[0]
+    ]
+    marked = [op for op in updates if op._filter["_id"] == copy["_id"]]
+    assert len(marked) == 1
+    assert marked[0]._doc["$set"]["is_duplicate"] is True
+    assert marked[0]._doc["$set"]["duplicate_of"] == articles[0]["_id"]
+    assert rss_fetcher.get_enrichment_pipeline_metrics()["near_duplicates"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pipeline_worker_failure_cancels_blocked_producer(pipeline_env):
+    """A worker that raises must not leave the producer waiting on a full queue."""
+    # Far more batches than the work queue holds, so the producer blocks
+    articles = _make_articles(200)
+    pipeline_env["collection"].find = Mock(return_value=FakeCursor(articles))
+
+    # An enrichment without a relevance_tier makes the worker raise on its first batch
+    with patch.object(rss_fetcher, "_process_entity_extraction_batch", AsyncMock(return_value={})), \
+         patch.object(rss_fetcher, "_enrich_article", AsyncMock(return_value={})):
+        with pytest.raises(KeyError):
+            await asyncio.wait_for(
+                rss_fetcher.process_new_articles_from_mongodb(concurrency=1), timeout=5
+            )
+
+
+@pytest.mark.asyncio
+async def test_pipeline_returns_zero_without_articles(pipeline_env):
+    pipeline_env["collection"].find = Mock(return_value=FakeCursor([]))
+
+    assert await rss_fetcher.process_new_articles_from_mongodb() == 0
+    pipeline_env["collection"].bulk_write.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_uses_combined_call_for_llm_articles(pipeline_env):
+    combined = {
+        "relevance_score": 0.9,
+        "sentiment_score": 0.5,
+        "themes": ["ETF"],
+        "entities": [{"name": "Bitcoin", "type": "cryptocurrency", "confidence": 0.95, "is_primary": True}],
+        "actors": ["Bitcoin"],
+        "actor_salience": {"Bitcoin": 5},
+        "nucleus_entity": "Bitcoin",
+        "narrative_focus": "ETF inflows",
+        "actions": ["ETFs attracted inflows"],
+        "tensions": [],
+        "implications": "Institutional demand",
+        "narrative_summary": "Institutions are buying Bitcoin ETFs.",
+        "narrative_hash": "abc",
+    }
+    processor = MagicMock()
+    processor.should_use_llm.return_value = True
+    optimized_llm = MagicMock()
+    optimized_llm.get_cache_stats = AsyncMock(return_value={})
+    optimized_llm.get_cost_summary = AsyncMock(return_value={})
+    enrich = AsyncMock(return_value=combined)
+
+    with patch.object(rss_fetcher, "get_optimized_llm", AsyncMock(return_value=optimized_llm)), \
+         patch.object(rss_fetcher, "create_processor", return_value=processor), \
+         patch.object(rss_fetcher, "enrich_article_combined", enrich):
+        processed = await rss_fetcher.process_new_articles_from_mongodb(concurrency=2)
+
+    assert processed == 23
+    assert enrich.await_count == 23
+    optimized_llm.extract_entities_batch.assert_not_called()
+
+    update = pipeline_env["collection"].bulk_write.await_args_list[0].args[0][0]._doc["$set"]
+    assert update["relevance_score"] == 0.9
+    assert update["nucleus_entity"] == "Bitcoin"
+    assert update["narrative_hash"] == "abc"
+
+    mentions = [m for call in pipeline_env["mentions_batch"].await_args_list for m in call.args[0]]
+    assert all(m["sentiment"] == "positive" for m in mentions)
+    assert rss_fetcher.get_enrichment_pipeline_metrics()["combined_enrichments"] == 23
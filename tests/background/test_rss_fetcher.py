@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 import pytest
 
 from src.crypto_news_aggregator.background import rss_fetcher
+from src.crypto_news_aggregator.services import near_duplicates
 from src.crypto_news_aggregator.services.rss_service import RSSService
 from src.crypto_news_aggregator.models.article import (
     ArticleCreate,
@@ -12,6 +13,14 @@ from src.crypto_news_aggregator.models.article import (
 )
 
 
+@pytest.fixture(autouse=True)
+def fresh_near_duplicate_index():
+    """Each test builds the near-duplicate index from its own articles."""
+    near_duplicates.reset_near_duplicate_index()
+    yield
+    near_duplicates.reset_near_duplicate_index()
+
+
 class FakeLLMProvider:
     def __init__(self, relevance: float = 0.8, sentiment: float = 0.6, themes=None):
         self._relevance = relevance
@@ -64,6 +73,9 @@ class FakeRSSService:
         await asyncio.sleep(0)
         return self._articles
 
+    async def save_feed_states(self):
+        return 0
+
 
 @pytest.mark.asyncio
 async def test_process_new_articles_from_mongodb_enriches_articles(
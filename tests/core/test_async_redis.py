@@ -0,0 +1,86 @@
+"""
+Tests for the async Redis client and its backends.
+"""
+
+import json
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from crypto_news_aggregator.core.async_redis import (
+    DisabledRedis,
+    InMemoryRedis,
+    RedisCommandError,
+    UpstashRedis,
+)
+
+BASE_URL = "https://test-redis.upstash.io"
+
+
+@pytest.mark.asyncio
+async def test_in_memory_get_set_with_expiry():
+    redis = InMemoryRedis()
+
+    assert await redis.set("k", {"n": 1}, ex=60)
+    assert json.loads(await redis.get("k")) == {"n": 1}
+    assert 59 <= await redis.ttl("k") <= 60
+    assert await redis.ttl("missing") == -2
+
+    assert await redis.expire("k", 0)
+    assert await redis.get("k") is None
+    assert not await redis.exists("k")
+
+
+@pytest.mark.asyncio
+async def test_mget_and_mset_use_one_round_trip():
+    redis = InMemoryRedis()
+
+    assert await redis.mset({"a": "1", "b": 2})
+    assert await redis.mget(["a", "missing", "b"]) == ["1", None, "2"]
+    assert redis.round_trips == 2
+
+    # With an expiry the keys are written as one pipeline of SET ... EX
+    assert await redis.mset({"c": "3", "d": "4"}, ex=30)
+    assert redis.round_trips == 3
+    assert await redis.ttl("d") == 30
+
+
+@pytest.mark.asyncio
+async def test_disabled_client_is_a_no_op():
+    redis = DisabledRedis()
+
+    assert not redis.enabled
+    assert await redis.get("k") is None
+    assert await redis.mget(["a", "b"]) == [None, None]
+    assert not await redis.set("k", "v")
+
+
+@pytest.mark.asyncio
+async def test_upstash_sends_commands_as_json_body(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url=BASE_URL, json={"result": "OK"})
+    httpx_mock.add_response(url=f"{BASE_URL}/pipeline", json=[{"result": "v"}, {"result": 42}])
+
+    redis = UpstashRedis(BASE_URL, "test-token")
+    try:
+        # Values go in the body, so they can contain slashes and be large
+        assert await redis.set("k", "a/b" * 1000, ex=10)
+        assert await redis.pipeline([["GET", "k"], ["TTL", "k"]]) == ["v", 42]
+    finally:
+        await redis.aclose()
+
+    set_request, pipeline_request = httpx_mock.get_requests()
+    assert set_request.headers["Authorization"] == "Bearer test-token"
+    assert json.loads(set_request.content) == ["SET", "k", "a/b" * 1000, "EX", "10"]
+    assert json.loads(pipeline_request.content) == [["GET", "k"], ["TTL", "k"]]
+
+
+@pytest.mark.asyncio
+async def test_upstash_command_errors_raise(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url=BASE_URL, status_code=400, json={"error": "ERR wrong number of arguments"})
+
+    redis = UpstashRedis(BASE_URL, "test-token")
+    try:
+        with pytest.raises(RedisCommandError):
+            await redis.execute("GET")
+    finally:
+        await redis.aclose()
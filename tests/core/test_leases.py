@@ -0,0 +1,84 @@
+"""
+Tests for lease-based leader election of background jobs.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from crypto_news_aggregator.core import leases
+from crypto_news_aggregator.core.leases import current_lease, run_as_leader
+
+TTL = 0.06
+
+
+@pytest.fixture
+def lease_ops():
+    """Patch the lease operations and enable leader election."""
+    settings = SimpleNamespace(LEADER_ELECTION_ENABLED=True, LEASE_TTL_SECONDS=TTL)
+    with patch.object(leases, "get_settings", return_value=settings), \
+         patch.object(leases, "acquire_lease", AsyncMock(return_value=7)) as acquire, \
+         patch.object(leases, "renew_lease", AsyncMock(return_value=True)) as renew, \
+         patch.object(leases, "release_lease", AsyncMock()) as release:
+        yield SimpleNamespace(settings=settings, acquire=acquire, renew=renew, release=release)
+
+
+@pytest.mark.asyncio
+async def test_job_runs_under_the_lease_and_releases_it(lease_ops):
+    seen = []
+
+    async def job():
+        await asyncio.sleep(TTL)
+        seen.append(current_lease())
+
+    await asyncio.wait_for(run_as_leader("narratives", job), timeout=1)
+
+    assert seen == [leases.Lease("narratives", leases.HOLDER_ID, 7)]
+    assert lease_ops.renew.await_count >= 1
+    lease_ops.release.assert_awaited_once_with("narratives", leases.HOLDER_ID, 7)
+    assert current_lease() is None
+
+
+@pytest.mark.asyncio
+async def test_standby_waits_for_the_lease(lease_ops):
+    lease_ops.acquire.side_effect = [None, None, 8]
+    job = AsyncMock()
+
+    await asyncio.wait_for(run_as_leader("alerts", job), timeout=1)
+
+    assert lease_ops.acquire.await_count == 3
+    job.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_lost_lease_cancels_the_job(lease_ops):
+    lease_ops.acquire.side_effect = [7, None, None, None]
+    lease_ops.renew.return_value = False
+    cancelled = asyncio.Event()
+
+    async def job():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    runner = asyncio.create_task(run_as_leader("rss_fetcher", job))
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    runner.cancel()
+    await asyncio.gather(runner, return_exceptions=True)
+
+    lease_ops.release.assert_awaited_with("rss_fetcher", leases.HOLDER_ID, 7)
+
+
+@pytest.mark.asyncio
+async def test_disabled_election_runs_the_job_directly(lease_ops):
+    lease_ops.settings.LEADER_ELECTION_ENABLED = False
+    job = AsyncMock()
+
+    await run_as_leader("price_monitor", job)
+
+    job.assert_awaited_once()
+    lease_ops.acquire.assert_not_called()
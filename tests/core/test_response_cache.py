@@ -0,0 +1,184 @@
+"""
+Tests for the shared API response cache.
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from crypto_news_aggregator.core.async_redis import InMemoryRedis
+from crypto_news_aggregator.core.response_cache import (
+    COALESCED,
+    FRESH,
+    MISS,
+    STALE,
+    ResponseCache,
+    get_response_cache_metrics,
+)
+
+
+def _counting_compute(value="v", delay=0.01):
+    calls = {"count": 0}
+
+    async def compute():
+        calls["count"] += 1
+        await asyncio.sleep(delay)
+        return f"{value}{calls['count']}"
+
+    return compute, calls
+
+
+def _expire(cache, key, stale_for=0.0):
+    """Make ``key`` stale, keeping it servable for ``stale_for`` more seconds."""
+    value, _, _ = cache._entries[key]
+    now = time.monotonic()
+    cache._entries[key] = (value, now - 1, now + stale_for)
+
+
+@pytest.mark.asyncio
+async def test_miss_then_fresh_hit():
+    cache = ResponseCache("test_basic", ttl_seconds=60)
+    compute, calls = _counting_compute()
+
+    first = await cache.fetch("a:1", compute)
+    second = await cache.fetch("a:1", compute)
+
+    assert (first.value, first.status, first.cached) == ("v1", MISS, False)
+    assert (second.value, second.status, second.cached) == ("v1", FRESH, True)
+    assert calls["count"] == 1
+    assert cache.metrics["a"].hits == 1
+    assert cache.metrics["a"].misses == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction():
+    cache = ResponseCache("test_lru", ttl_seconds=60, max_entries=2)
+    cache.set("k:1", 1)
+    cache.set("k:2", 2)
+    await cache.fetch("k:1", _counting_compute()[0])
+    cache.set("k:3", 3)
+
+    assert cache.get("k:2") is None
+    assert cache.get("k:1") == 1
+    assert cache.metrics["k"].evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_compute_once():
+    cache = ResponseCache("test_single_flight", ttl_seconds=60)
+    compute, calls = _counting_compute()
+
+    results = await asyncio.gather(*[cache.fetch("k", compute) for _ in range(5)])
+
+    assert calls["count"] == 1
+    assert {result.value for result in results} == {"v1"}
+    assert [result.status for result in results].count(MISS) == 1
+    assert [result.status for result in results].count(COALESCED) == 4
+    assert cache._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_stale_value_served_while_one_refresh_runs():
+    cache = ResponseCache("test_swr", ttl_seconds=60, stale_ttl_seconds=60)
+    compute, calls = _counting_compute()
+    await cache.fetch("k", compute)
+    _expire(cache, "k", stale_for=60)
+
+    results = await asyncio.gather(*[cache.fetch("k", compute) for _ in range(3)])
+    assert [(result.value, result.status) for result in results] == [("v1", STALE)] * 3
+
+    await asyncio.gather(*cache._refresh_tasks)
+    assert calls["count"] == 2
+    assert (await cache.fetch("k", compute)).value == "v2"
+    assert cache.metrics["k"].refreshes == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_stale_value():
+    cache = ResponseCache("test_refresh_error", ttl_seconds=60, stale_ttl_seconds=60)
+    cache.set("k", "old")
+    _expire(cache, "k", stale_for=60)
+
+    async def failing():
+        raise RuntimeError("db down")
+
+    assert (await cache.fetch("k", failing)).value == "old"
+    await asyncio.gather(*cache._refresh_tasks)
+
+    assert cache.metrics["k"].refresh_errors == 1
+    assert (await cache.fetch("k", failing)).value == "old"
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_recomputed():
+    cache = ResponseCache("test_expired", ttl_seconds=60, stale_ttl_seconds=60)
+    compute, calls = _counting_compute()
+    await cache.fetch("k", compute)
+    _expire(cache, "k", stale_for=-1)
+
+    result = await cache.fetch("k", compute)
+
+    assert (result.value, result.status) == ("v2", MISS)
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_all_waiters_and_are_not_cached():
+    cache = ResponseCache("test_errors", ttl_seconds=60)
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *[cache.fetch("k", failing) for _ in range(3)], return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(cache) == 0
+    assert cache._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_redis_hit_populates_memory():
+    cache = ResponseCache("test_redis", ttl_seconds=60, stale_ttl_seconds=60, use_redis=True)
+    redis = InMemoryRedis()
+    await redis.set("test_redis:k", json.dumps({"stored_at": time.time() - 5, "value": {"n": 1}}))
+    compute, calls = _counting_compute()
+
+    with patch("crypto_news_aggregator.core.async_redis.get_redis_client", return_value=redis):
+        result = await cache.fetch("k", compute)
+
+    assert (result.value, result.status) == ({"n": 1}, FRESH)
+    assert calls["count"] == 0
+    assert cache.get("k") == {"n": 1}
+    assert redis.commands[-1] == ("GET", "test_redis:k")
+
+
+@pytest.mark.asyncio
+async def test_redis_miss_writes_with_stale_window_ttl():
+    cache = ResponseCache("test_redis_write", ttl_seconds=60, stale_ttl_seconds=30, use_redis=True)
+    redis = InMemoryRedis()
+
+    with patch("crypto_news_aggregator.core.async_redis.get_redis_client", return_value=redis):
+        result = await cache.fetch("k", _counting_compute()[0])
+
+    assert result.status == MISS
+    assert json.loads(await redis.get("test_redis_write:k"))["value"] == "v1"
+    assert await redis.ttl("test_redis_write:k") == 90
+
+
+@pytest.mark.asyncio
+async def test_metrics_are_grouped_by_key_prefix():
+    cache = ResponseCache("test_metrics", ttl_seconds=60)
+    compute, _ = _counting_compute()
+    await cache.fetch("trending:7d", compute)
+    await cache.fetch("trending:7d", compute)
+    await cache.fetch("top20", compute)
+
+    metrics = get_response_cache_metrics()
+
+    assert metrics["test_metrics:trending"]["hit_rate_percent"] == 50.0
+    assert metrics["test_metrics:top20"]["misses"] == 1
@@ -0,0 +1,137 @@
+"""
+Tests for bulk article upserts.
+"""
+
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from crypto_news_aggregator.db.operations import articles as article_ops
+from crypto_news_aggregator.db.operations.articles import (
+    DUPLICATE,
+    FAILED,
+    INSERTED,
+    UPDATED,
+    bulk_upsert_articles,
+    create_or_update_articles,
+)
+from crypto_news_aggregator.models.article import ArticleCreate, ArticleMetrics
+
+
+def _article(n: int, url: str = None) -> ArticleCreate:
+    url = url or f"https://example.com/{n}"
+    return ArticleCreate(
+        title=f"Article {n}",
+        text="Body",
+        url=url,
+        source_id=url,
+        source="coindesk",
+        published_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        metrics=ArticleMetrics(views=n),
+        raw_data={},
+    )
+
+
+def _patch_collection(bulk_write):
+    collection = MagicMock()
+    collection.bulk_write = bulk_write
+    db = MagicMock()
+    db.articles = collection
+    manager = MagicMock()
+    manager.get_async_database = AsyncMock(return_value=db)
+    return patch.object(article_ops, "mongo_manager", manager), collection
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_uses_one_bulk_write_and_reports_status():
+    inserted_id = ObjectId()
+    bulk_write = AsyncMock(return_value=MagicMock(upserted_ids={1: inserted_id}))
+    patcher, collection = _patch_collection(bulk_write)
+
+    with patcher:
+        results = await bulk_upsert_articles([_article(1), _article(2)])
+
+    bulk_write.assert_awaited_once()
+    operations = bulk_write.await_args[0][0]
+    assert bulk_write.await_args[1] == {"ordered": False}
+    assert len(operations) == 2
+
+    update = operations[0]._doc
+    assert operations[0]._filter == {"url": "https://example.com/1"}
+    assert update["$set"] == {"metrics": ArticleMetrics(views=1).model_dump()}
+    assert update["$setOnInsert"]["title"] == "Article 1"
+    assert "metrics" not in update["$setOnInsert"]
+    assert "created_at" in update["$setOnInsert"]
+
+    assert [(r.status, r.article_id) for r in results] == [(UPDATED, None), (INSERTED, inserted_id)]
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_reports_in_batch_repeats_as_duplicates():
+    bulk_write = AsyncMock(return_value=MagicMock(upserted_ids={0: ObjectId()}))
+    patcher, _ = _patch_collection(bulk_write)
+
+    with patcher:
+        results = await bulk_upsert_articles([_article(1), _article(2, url="https://example.com/1")])
+
+    assert len(bulk_write.await_args[0][0]) == 1
+    assert [r.status for r in results] == [INSERTED, DUPLICATE]
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_retries_duplicate_key_races():
+    race = BulkWriteError({
+        "writeErrors": [{"index": 1, "code": 11000, "errmsg": "E11000 url_unique"}],
+        "upserted": [{"index": 0, "_id": ObjectId()}],
+    })
+    bulk_write = AsyncMock(side_effect=[race, MagicMock(upserted_ids={})])
+    patcher, _ = _patch_collection(bulk_write)
+
+    with patcher:
+        results = await bulk_upsert_articles([_article(1), _article(2)])
+
+    assert bulk_write.await_count == 2
+    retried = bulk_write.await_args_list[1][0][0]
+    assert [op._filter for op in retried] == [{"url": "https://example.com/2"}]
+    assert [r.status for r in results] == [INSERTED, UPDATED]
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_reports_other_write_errors_as_failed():
+    error = BulkWriteError({
+        "writeErrors": [{"index": 0, "code": 121, "errmsg": "Document failed validation"}],
+        "upserted": [],
+    })
+    bulk_write = AsyncMock(side_effect=error)
+    patcher, _ = _patch_collection(bulk_write)
+
+    with patcher:
+        results = await bulk_upsert_articles([_article(1)])
+
+    assert bulk_write.await_count == 1
+    assert results[0].status == FAILED
+
+
+@pytest.mark.asyncio
+async def test_create_or_update_articles_returns_counts():
+    bulk_write = AsyncMock(return_value=MagicMock(upserted_ids={0: ObjectId()}))
+    patcher, _ = _patch_collection(bulk_write)
+
+    with patcher:
+        counts = await create_or_update_articles([_article(1), _article(2)])
+
+    assert counts == {INSERTED: 1, UPDATED: 1, DUPLICATE: 0, FAILED: 0}
+
+
+@pytest.mark.asyncio
+async def test_empty_batch_skips_database():
+    bulk_write = AsyncMock()
+    patcher, _ = _patch_collection(bulk_write)
+
+    with patcher:
+        assert await bulk_upsert_articles([]) == []
+
+    bulk_write.assert_not_called()
@@ -0,0 +1,127 @@
+"""
+Tests for hourly entity mention rollups.
+"""
+
+import pytest
+from datetime import datetime, timezone, timedelta
+from crypto_news_aggregator.db.operations.entity_mentions import (
+    create_entity_mentions_batch,
+    update_mentions_relevance,
+    delete_entity_mentions_for_article,
+)
+from crypto_news_aggregator.db.operations.entity_mention_rollups import (
+    build_rollup_increments,
+    hour_bucket,
+    get_entity_rollup_totals,
+    rebuild_rollups,
+    check_rollup_consistency,
+)
+
+
+def test_hour_bucket_truncates_to_naive_utc():
+    """Test that timestamps are truncated to the hour in naive UTC."""
+    ts = datetime(2025, 1, 1, 13, 45, 12, tzinfo=timezone.utc)
+    assert hour_bucket(ts) == datetime(2025, 1, 1, 13)
+
+
+def test_build_rollup_increments():
+    """Test grouping mentions into per-hour buckets."""
+    base = datetime(2025, 1, 1, 10, 5)
+    mentions = [
+        {"entity": "Bitcoin", "entity_type": "cryptocurrency", "is_primary": True,
+         "relevance_tier": 1, "source": "coindesk", "sentiment": "positive", "created_at": base},
+        {"entity": "Bitcoin", "entity_type": "cryptocurrency", "is_primary": True,
+         "relevance_tier": 1, "source": "decrypt.co", "sentiment": "negative",
+         "created_at": base + timedelta(minutes=30)},
+        {"entity": "Bitcoin", "entity_type": "cryptocurrency", "is_primary": True,
+         "relevance_tier": 1, "source": "coindesk", "sentiment": "neutral",
+         "created_at": base + timedelta(hours=1)},
+        # Context mentions are not rolled up
+        {"entity": "SEC", "entity_type": "organization", "is_primary": False,
+         "relevance_tier": 1, "source": "coindesk", "sentiment": "neutral", "created_at": base},
+    ]
+
+    buckets = build_rollup_increments(mentions)
+
+    assert set(buckets) == {
+        ("Bitcoin", datetime(2025, 1, 1, 10), 1),
+        ("Bitcoin", datetime(2025, 1, 1, 11), 1),
+    }
+    first = buckets[("Bitcoin", datetime(2025, 1, 1, 10), 1)]
+    assert first["mention_count"] == 2
+    assert dict(first["sources"]) == {"coindesk": 1, "decrypt_co": 1}
+    assert dict(first["sentiment"]) == {"positive": 1, "negative": 1}
+    assert first["first_mention_at"] == base
+    assert first["last_mention_at"] == base + timedelta(minutes=30)
+
+
+@pytest.mark.asyncio
+async def test_rollups_track_ingest_reclassification_and_delete(mongo_db):
+    """Test that rollups stay consistent with raw mentions through their lifecycle."""
+    start = datetime.now(timezone.utc) - timedelta(hours=2)
+
+    await create_entity_mentions_batch([
+        {"entity": "Bitcoin", "entity_type": "cryptocurrency", "article_id": "a1",
+         "sentiment": "positive", "source": "coindesk", "is_primary": True, "relevance_tier": 1},
+        {"entity": "Bitcoin", "entity_type": "cryptocurrency", "article_id": "a2",
+         "sentiment": "neutral", "source": "decrypt", "is_primary": True, "relevance_tier": 2},
+    ])
+
+    totals = await get_entity_rollup_totals(start, entities=["Bitcoin"])
+    assert totals[0]["total_mentions"] == 2
+    assert sorted(totals[0]["sources"]) == ["coindesk", "decrypt"]
+    assert await check_rollup_consistency(start) == []
+
+    await update_mentions_relevance("a2", 3)
+    high_signal = {"relevance_tier": {"$not": {"$gt": 2}}}
+    totals = await get_entity_rollup_totals(start, relevance_filter=high_signal, entities=["Bitcoin"])
+    assert totals[0]["total_mentions"] == 1
+    assert await check_rollup_consistency(start) == []
+
+    await delete_entity_mentions_for_article("a1")
+    totals = await get_entity_rollup_totals(start, relevance_filter=high_signal, entities=["Bitcoin"])
+    assert totals == []
+    assert await check_rollup_consistency(start) == []
+
+
+@pytest.mark.asyncio
+async def test_rebuild_rollups_repairs_drift(mongo_db):
+    """Test that a rebuild recomputes buckets from raw mentions."""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    start = now - timedelta(hours=3)
+
+    # Raw mentions inserted directly bypass incremental rollups
+    await mongo_db.entity_mentions.insert_many([
+        {"entity": "Solana", "entity_type": "cryptocurrency", "article_id": f"s{i}",
+         "sentiment": "neutral", "is_primary": True, "source": "coindesk",
+         "relevance_tier": 1, "created_at": now - timedelta(hours=1)}
+        for i in range(3)
+    ])
+
+    mismatches = await check_rollup_consistency(start)
+    assert len(mismatches) == 1
+    assert mismatches[0]["raw_count"] == 3
+    assert mismatches[0]["rollup_count"] == 0
+
+    stats = await rebuild_rollups(start)
+    assert stats["mentions_scanned"] == 3
+    assert await check_rollup_consistency(start) == []
+
+
+@pytest.mark.asyncio
+async def test_reverted_sources_do_not_count_towards_diversity(mongo_db):
+    """Test that sources whose mentions were all removed drop out of the totals."""
+    start = datetime.now(timezone.utc) - timedelta(hours=2)
+
+    await create_entity_mentions_batch([
+        {"entity": "Ethereum", "entity_type": "cryptocurrency", "article_id": "e1",
+         "sentiment": "positive", "source": "coindesk", "is_primary": True, "relevance_tier": 1},
+        {"entity": "Ethereum", "entity_type": "cryptocurrency", "article_id": "e2",
+         "sentiment": "neutral", "source": "decrypt", "is_primary": True, "relevance_tier": 1},
+    ])
+    # The bucket keeps sources.coindesk == 0 after the revert
+    await delete_entity_mentions_for_article("e1")
+
+    totals = await get_entity_rollup_totals(start, entities=["Ethereum"])
+    assert totals[0]["total_mentions"] == 1
+    assert totals[0]["sources"] == ["decrypt"]
@@ -10,6 +10,7 @@ from crypto_news_aggregator.db.operations.entity_mentions import (
     create_entity_mentions_batch,
     get_entity_mentions,
     get_entity_stats,
+    update_mentions_relevance,
 )
 
 
@@ -339,3 +340,37 @@ async def test_entity_mention_metadata(mongo_db):
     mention = await collection.find_one({"entity": "$BTC"})
 
     assert mention["metadata"] == metadata
+
+
+@pytest.mark.asyncio
+async def test_update_mentions_relevance(mongo_db):
+    """Test that reclassifying an article syncs the tier onto its mentions."""
+    published_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    await create_entity_mentions_batch([
+        {
+            "entity": "Bitcoin",
+            "entity_type": "cryptocurrency",
+            "article_id": "article_tier",
+            "sentiment": "neutral",
+            "relevance_tier": 1,
+            "published_at": published_at,
+        },
+        {
+            "entity": "Ethereum",
+            "entity_type": "cryptocurrency",
+            "article_id": "article_tier",
+            "sentiment": "neutral",
+            "relevance_tier": 1,
+            "published_at": published_at,
+        },
+    ])
+
+    mention = await mongo_db.entity_mentions.find_one({"entity": "Bitcoin"})
+    assert mention["relevance_tier"] == 1
+    assert mention["published_at"] is not None
+
+    modified = await update_mentions_relevance("article_tier", 3)
+    assert modified == 2
+
+    async for mention in mongo_db.entity_mentions.find({"article_id": "article_tier"}):
+        assert mention["relevance_tier"] == 3
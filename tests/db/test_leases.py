@@ -0,0 +1,98 @@
+"""
+Tests for job lease operations.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from crypto_news_aggregator.db.operations.leases import (
+    acquire_lease,
+    get_leases,
+    release_lease,
+    renew_lease,
+)
+from crypto_news_aggregator.db.operations.narrative_cluster_state import save_cluster_state
+from crypto_news_aggregator.db.operations.leases import StaleLeaseError
+
+
+@pytest.mark.asyncio
+async def test_lease_is_exclusive_until_released(mongo_db):
+    """Test that a live lease can't be taken by another holder."""
+    token = await acquire_lease("narratives", "web-1", ttl_seconds=30)
+    assert token == 1
+
+    assert await acquire_lease("narratives", "web-2", ttl_seconds=30) is None
+    assert await renew_lease("narratives", "web-1", token, ttl_seconds=30)
+    assert not await renew_lease("narratives", "web-2", token, ttl_seconds=30)
+
+    await release_lease("narratives", "web-1", token)
+    assert await acquire_lease("narratives", "web-2", ttl_seconds=30) == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_taken_over_with_a_new_token(mongo_db):
+    """Test failover after the holder stops renewing."""
+    token = await acquire_lease("alerts", "web-1", ttl_seconds=30)
+    await mongo_db.leases.update_one(
+        {"_id": "alerts"},
+        {"$set": {"expires_at": datetime.now(timezone.utc) - timedelta(seconds=1)}},
+    )
+
+    new_token = await acquire_lease("alerts", "worker", ttl_seconds=30)
+    assert new_token == token + 1
+    # The old holder can no longer renew
+    assert not await renew_lease("alerts", "web-1", token, ttl_seconds=30)
+
+    leases = await get_leases()
+    assert [(lease["_id"], lease["holder"], lease["held"]) for lease in leases] == [
+        ("alerts", "worker", True)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cluster_state_writes_are_fenced(mongo_db):
+    """Test that a replaced leader can't overwrite newer clustering state."""
+    state = {"window_hours": 48, "watermark": datetime.now(timezone.utc)}
+    await save_cluster_state(state, [], [], fencing_token=2)
+
+    with pytest.raises(StaleLeaseError):
+        await save_cluster_state(state, [], [], fencing_token=1)
+
+    await save_cluster_state(state, [], [], fencing_token=3)
+    stored = await mongo_db.narrative_cluster_state.find_one({"_id": "salience"})
+    assert stored["fencing_token"] == 3
+    assert stored["window_hours"] == 48
+
+
+@pytest.mark.asyncio
+async def test_cluster_member_writes_are_fenced(mongo_db):
+    """Test that a leader paused after claiming the state can't rewrite members of a newer leader."""
+    state = {"window_hours": 48, "watermark": datetime.now(timezone.utc)}
+    await save_cluster_state(state, [{"_id": "a", "cluster": "a", "seq": 1}], [], fencing_token=1)
+
+    collection_cls = type(mongo_db.narrative_cluster_state)
+    claim = collection_cls.find_one_and_update
+
+    async def claim_then_pause(self, spec, update, *args, **kwargs):
+        previous = await claim(self, spec, update, *args, **kwargs)
+        if paused:
+            # A new leader takes over and saves before the old one resumes
+            token, added = paused.pop()
+            await save_cluster_state(state, added, [], fencing_token=token)
+        return previous
+
+    paused = []
+    with patch.object(collection_cls, "find_one_and_update", claim_then_pause):
+        paused.append((2, [{"_id": "b", "cluster": "a", "seq": 2}]))
+        with pytest.raises(StaleLeaseError):
+            await save_cluster_state(state, [{"_id": "c", "cluster": "c", "seq": 4}], [], replace=True, fencing_token=1)
+
+        paused.append((3, [{"_id": "d", "cluster": "a", "seq": 3}]))
+        with pytest.raises(StaleLeaseError):
+            await save_cluster_state(state, [{"_id": "a", "cluster": "x", "seq": 5}], ["b"], fencing_token=2)
+
+    members = await mongo_db.narrative_cluster_members.find({}).sort("_id").to_list(length=None)
+    assert [(m["_id"], m["cluster"], m["fencing_token"]) for m in members] == [
+        ("a", "a", 3), ("b", "a", 3), ("d", "a", 3)
+    ]
@@ -0,0 +1,88 @@
+"""
+Tests for price samples and OHLC rollups.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from crypto_news_aggregator.db.operations.price_series import (
+    align_rollups,
+    bucket_start,
+    build_price_rollups,
+    get_aligned_series,
+    get_price_rollups,
+    insert_price_samples,
+    price_rollup_operations,
+    update_price_rollups,
+)
+
+T0 = datetime(2025, 1, 1, 13, 0, 10, tzinfo=timezone.utc)
+
+
+def sample(symbol, seconds, price):
+    return {"symbol": symbol, "timestamp": T0 + timedelta(seconds=seconds), "price": price}
+
+
+async def store(samples):
+    stored = await insert_price_samples(samples)
+    assert await update_price_rollups(price_rollup_operations(stored)) == []
+
+
+def test_bucket_start_truncates_to_naive_utc():
+    ts = datetime(2025, 1, 1, 13, 45, 12, tzinfo=timezone.utc)
+    assert bucket_start(ts, "1m") == datetime(2025, 1, 1, 13, 45)
+    assert bucket_start(ts, "1h") == datetime(2025, 1, 1, 13)
+    assert bucket_start(ts, "1d") == datetime(2025, 1, 1)
+    with pytest.raises(ValueError):
+        bucket_start(ts, "5m")
+
+
+def test_build_price_rollups_is_order_independent():
+    samples = [sample("bitcoin", 30, 101.0), sample("bitcoin", 0, 100.0), sample("bitcoin", 20, 99.0)]
+
+    buckets = build_price_rollups(samples, "1m")
+
+    assert buckets == {
+        ("bitcoin", datetime(2025, 1, 1, 13)): {
+            "open": 100.0, "high": 101.0, "low": 99.0, "close": 101.0,
+            "open_at": datetime(2025, 1, 1, 13, 0, 10),
+            "close_at": datetime(2025, 1, 1, 13, 0, 40),
+            "sample_count": 3,
+        }
+    }
+
+
+def test_align_rollups_fills_gaps_with_none():
+    rollups = [
+        {"symbol": "bitcoin", "bucket": datetime(2025, 1, 1, 10), "close": 1.0},
+        {"symbol": "bitcoin", "bucket": datetime(2025, 1, 1, 12), "close": 3.0},
+        {"symbol": "ethereum", "bucket": datetime(2025, 1, 1, 11), "close": 2.0},
+    ]
+
+    aligned = align_rollups(
+        rollups, ["bitcoin", "ethereum"], datetime(2025, 1, 1, 10, 30), datetime(2025, 1, 1, 12, 5), "1h"
+    )
+
+    assert aligned["timestamps"] == [datetime(2025, 1, 1, h) for h in (10, 11, 12)]
+    assert aligned["series"] == {"bitcoin": [1.0, None, 3.0], "ethereum": [None, 2.0, None]}
+
+
+@pytest.mark.asyncio
+async def test_batches_merge_into_stored_rollups(mongo_db):
+    """Test that later batches (even with earlier samples) update OHLC correctly."""
+    await store([sample("bitcoin", 20, 100.0), sample("bitcoin", 40, 105.0)])
+    # A late batch with an earlier sample and a new low
+    await store([sample("bitcoin", 5, 98.0), sample("ethereum", 30, 3.0)])
+
+    assert await mongo_db.price_samples.count_documents({}) == 4
+
+    [minute] = await get_price_rollups(["bitcoin"], T0, T0 + timedelta(minutes=1), "1m")
+    assert (minute["open"], minute["high"], minute["low"], minute["close"]) == (98.0, 105.0, 98.0, 105.0)
+    assert minute["sample_count"] == 3
+
+    [day] = await get_price_rollups(["bitcoin"], T0, T0, "1d")
+    assert "expires_at" not in await mongo_db.price_rollups.find_one({"resolution": "1d", "symbol": "bitcoin"})
+    assert day["close"] == 105.0
+
+    aligned = await get_aligned_series(["bitcoin", "ethereum"], T0, T0 + timedelta(hours=1), "1h")
+    assert aligned["series"] == {"bitcoin": [105.0, None], "ethereum": [3.0, None]}
@@ -0,0 +1,139 @@
+"""
+Tests for the shared Anthropic HTTP client and its rate limiter.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from crypto_news_aggregator.llm.http_client import (
+    API_URL,
+    AnthropicHTTPClient,
+    TokenBucket,
+    estimate_tokens,
+    get_anthropic_http_client,
+    close_anthropic_http_client,
+)
+
+
+MESSAGE_RESPONSE = {
+    "content": [{"type": "text", "text": "0.5"}],
+    "usage": {"input_tokens": 10, "output_tokens": 2},
+}
+
+
+def test_token_bucket_unknown_capacity_never_waits():
+    """Test that requests pass through until the API reports a limit."""
+    bucket = TokenBucket()
+    assert bucket.wait_time(1_000_000) == 0
+
+
+def test_token_bucket_waits_for_refill():
+    """Test that an empty bucket waits for the per-minute refill."""
+    bucket = TokenBucket()
+    bucket.update(limit=60, remaining=0)
+
+    # 60 requests/minute refills one token per second
+    assert bucket.wait_time(1) == pytest.approx(1.0, abs=0.05)
+    assert bucket.wait_time(1000) == pytest.approx(60.0, abs=0.5)
+
+
+def test_token_bucket_block_for():
+    """Test that retry-after blocks even when tokens are available."""
+    bucket = TokenBucket()
+    bucket.update(limit=1000, remaining=1000)
+    bucket.block_for(5)
+    assert bucket.wait_time(1) == pytest.approx(5.0, abs=0.05)
+
+
+def test_estimate_tokens_includes_max_tokens():
+    payload = {"max_tokens": 100, "messages": [{"role": "user", "content": "x" * 400}]}
+    assert estimate_tokens(payload) > 200
+
+
+@pytest.mark.asyncio
+async def test_create_message_syncs_rate_limits(httpx_mock: HTTPXMock):
+    """Test that rate-limit headers resync the buckets."""
+    httpx_mock.add_response(
+        url=API_URL,
+        json=MESSAGE_RESPONSE,
+        headers={
+            "anthropic-ratelimit-requests-limit": "50",
+            "anthropic-ratelimit-requests-remaining": "49",
+            "anthropic-ratelimit-tokens-limit": "40000",
+            "anthropic-ratelimit-tokens-remaining": "39000",
+        },
+    )
+
+    client = AnthropicHTTPClient(http2=False)
+    try:
+        data = await client.create_message("test-key", {"model": "m", "max_tokens": 5, "messages": []})
+    finally:
+        await client.aclose()
+
+    assert data == MESSAGE_RESPONSE
+    assert client.request_bucket.capacity == 50
+    assert client.request_bucket.tokens == pytest.approx(49, abs=0.1)
+    assert client.token_bucket.capacity == 40000
+
+    request = httpx_mock.get_requests()[0]
+    assert request.headers["x-api-key"] == "test-key"
+    assert request.headers["anthropic-version"] == "2023-06-01"
+
+
+@pytest.mark.asyncio
+async def test_create_message_429_blocks_and_raises(httpx_mock: HTTPXMock):
+    """Test that a 429 raises and pauses further requests for retry-after."""
+    httpx_mock.add_response(url=API_URL, status_code=429, headers={"retry-after": "30"})
+
+    client = AnthropicHTTPClient(http2=False)
+    try:
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.create_message("test-key", {"model": "m", "max_tokens": 5, "messages": []})
+    finally:
+        await client.aclose()
+
+    assert client.stats["rate_limited"] == 1
+    assert client.request_bucket.wait_time(1) > 25
+
+
+@pytest.mark.asyncio
+async def test_create_message_bounds_concurrency(httpx_mock: HTTPXMock):
+    """Test that no more than max_concurrency requests are in flight."""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=MESSAGE_RESPONSE)
+
+    httpx_mock.add_callback(handler, url=API_URL, is_reusable=True)
+
+    client = AnthropicHTTPClient(max_concurrency=2, http2=False)
+    try:
+        await asyncio.gather(*[
+            client.create_message("test-key", {"model": "m", "max_tokens": 5, "messages": []})
+            for _ in range(6)
+        ])
+    finally:
+        await client.aclose()
+
+    assert peak == 2
+    assert client.stats["requests"] == 6
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_reused_per_loop():
+    client = get_anthropic_http_client()
+    assert get_anthropic_http_client() is client
+
+    await close_anthropic_http_client()
+    assert client.is_closed
+    assert get_anthropic_http_client() is not client
+    await close_anthropic_http_client()
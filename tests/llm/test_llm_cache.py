@@ -0,0 +1,155 @@
+"""
+Tests for the two-tier LLM response cache.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from crypto_news_aggregator.llm import cache as cache_module
+from crypto_news_aggregator.llm.cache import LLMResponseCache, MemoryLRUCache
+
+
+def _cursor(documents):
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(return_value=documents)
+    return cursor
+
+
+@pytest.fixture
+def db():
+    db = MagicMock()
+    db.llm_cache.find = MagicMock(return_value=_cursor([]))
+    db.llm_cache.bulk_write = AsyncMock()
+    db.llm_cache_stats.bulk_write = AsyncMock()
+    return db
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    cache_module._pending_stats.clear()
+    yield
+    cache_module._pending_stats.clear()
+
+
+def test_memory_cache_evicts_least_recently_used():
+    memory = MemoryLRUCache(max_entries=2)
+    memory.set("a", {"v": 1})
+    memory.set("b", {"v": 2})
+    memory.get("a")
+    memory.set("c", {"v": 3})
+
+    assert memory.get("b") is None
+    assert memory.get("a") == {"v": 1}
+    assert memory.evictions == 1
+
+
+def test_memory_cache_bounds_size_and_expires():
+    memory = MemoryLRUCache(max_bytes=30)
+    memory.set("a", {"text": "x" * 10})
+    memory.set("b", {"text": "y" * 10})
+    assert memory.get("a") is None
+    assert memory.size_bytes <= 30
+
+    memory.set("c", {"v": 1}, ttl_seconds=0)
+    assert memory.get("c") is None
+
+
+def test_memory_cache_returns_copies():
+    memory = MemoryLRUCache()
+    memory.set("a", {"entities": []})
+    memory.get("a")["entities"].append("mutated")
+    assert memory.get("a") == {"entities": []}
+
+
+@pytest.mark.asyncio
+async def test_get_many_uses_memory_then_one_mongo_query(db):
+    cache = LLMResponseCache(db, memory_cache=MemoryLRUCache())
+    await cache.set("p1", "m", {"v": 1})
+
+    stored_key = cache._get_cache_key("p2", "m")
+    db.llm_cache.find.return_value = _cursor([{
+        "cache_key": stored_key,
+        "response": {"v": 2},
+        "expires_at": datetime.utcnow() + timedelta(hours=1),
+    }])
+
+    results = await cache.get_many(["p1", "p2", "p3"], "m", "entity_extraction")
+
+    assert results == [{"v": 1}, {"v": 2}, None]
+    db.llm_cache.find.assert_called_once()
+    assert db.llm_cache.find.call_args.args[0]["cache_key"]["$in"].__len__() == 2
+
+    # The Mongo hit now lives in memory too
+    db.llm_cache.find.reset_mock()
+    assert await cache.get("p2", "m") == {"v": 2}
+    db.llm_cache.find.assert_not_called()
+
+    assert cache_module._pending_stats[("entity_extraction", "memory_hits")] == 1
+    assert cache_module._pending_stats[("entity_extraction", "mongo_hits")] == 1
+    assert cache_module._pending_stats[("entity_extraction", "misses")] == 1
+
+
+@pytest.mark.asyncio
+async def test_set_many_is_one_bulk_write(db):
+    cache = LLMResponseCache(db, memory_cache=MemoryLRUCache())
+    await cache.set_many([("p1", {"v": 1}), ("p2", {"v": 2})], "m")
+
+    db.llm_cache.bulk_write.assert_awaited_once()
+    assert len(db.llm_cache.bulk_write.await_args.args[0]) == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesce_runs_identical_requests_once(db):
+    cache = LLMResponseCache(db, memory_cache=MemoryLRUCache())
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"v": calls}
+
+    results = await asyncio.gather(*[
+        cache.coalesce("p", "m", compute, "narrative_summary") for _ in range(5)
+    ])
+
+    assert calls == 1
+    assert results == [{"v": 1}] * 5
+    assert cache_module._pending_stats[("narrative_summary", "coalesced")] == 4
+    assert cache_module._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_coalesce_propagates_errors_to_waiters(db):
+    cache = LLMResponseCache(db, memory_cache=MemoryLRUCache())
+
+    async def compute():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *[cache.coalesce("p", "m", compute) for _ in range(3)],
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_flush_stats_increments_per_operation(db):
+    cache = LLMResponseCache(db, memory_cache=MemoryLRUCache())
+    await cache.get_many(["p1", "p2"], "m", "entity_extraction")
+    await cache.get("p3", "m", "narrative_summary")
+
+    await cache.flush_stats()
+
+    operations = db.llm_cache_stats.bulk_write.await_args.args[0]
+    increments = {op._filter["operation"]: op._doc["$inc"] for op in operations}
+    assert increments == {
+        "entity_extraction": {"misses": 2},
+        "narrative_summary": {"misses": 1},
+    }
+    assert not cache_module._pending_stats
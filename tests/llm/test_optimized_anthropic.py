@@ -0,0 +1,112 @@
+"""
+Tests for batched entity extraction in OptimizedAnthropicLLM.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from crypto_news_aggregator.llm.optimized_anthropic import OptimizedAnthropicLLM
+
+
+def _articles(count):
+    return [{"title": f"Article {i}", "text": f"Bitcoin news number {i}"} for i in range(count)]
+
+
+def _api_response(content, output_tokens=100, stop_reason="end_turn"):
+    return {
+        "content": content if isinstance(content, str) else json.dumps(content),
+        "input_tokens": 500,
+        "output_tokens": output_tokens,
+        "stop_reason": stop_reason,
+    }
+
+
+async def _run_compute(prompt, model, compute, operation):
+    return await compute()
+
+
+@pytest.fixture
+def llm():
+    llm = OptimizedAnthropicLLM(MagicMock(), api_key="test-key")
+    llm.cache = MagicMock()
+    llm.cache.get_many = AsyncMock(side_effect=lambda prompts, model, operation: [None] * len(prompts))
+    llm.cache.set = AsyncMock()
+    llm.cache.set_many = AsyncMock()
+    llm.cache.coalesce = AsyncMock(side_effect=_run_compute)
+    llm._track_call = AsyncMock()
+    return llm
+
+
+@pytest.mark.asyncio
+async def test_misses_are_packed_into_one_request(llm):
+    keyed = {f"a{i}": {"entities": [{"name": f"Entity{i}", "type": "cryptocurrency"}]} for i in range(3)}
+    with patch.object(llm, "_make_api_call", AsyncMock(return_value=_api_response(keyed))) as api:
+        results = await llm.extract_entities_batch(_articles(3))
+
+    assert api.await_count == 1
+    assert [r["entities"][0]["name"] for r in results] == ["Entity0", "Entity1", "Entity2"]
+    # Each article is cached under its own single-article prompt, in one write
+    assert llm.cache.set_many.await_count == 1
+    entries = llm.cache.set_many.await_args.args[0]
+    assert len(entries) == 3
+    assert entries[1][0] == llm._build_entity_extraction_prompt(_articles(3)[1])
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_are_not_sent(llm):
+    hit = {"entities": [{"name": "Cached", "type": "company"}]}
+    llm.cache.get_many = AsyncMock(return_value=[hit, None, None])
+    keyed = {"a0": {"entities": []}, "a1": {"entities": [{"name": "Solana", "type": "cryptocurrency"}]}}
+
+    with patch.object(llm, "_make_api_call", AsyncMock(return_value=_api_response(keyed))) as api:
+        results = await llm.extract_entities_batch(_articles(3))
+
+    assert api.await_count == 1
+    packed_prompt = api.await_args.kwargs["prompt"]
+    assert "Article 0" not in packed_prompt
+    assert "Article 1" in packed_prompt and "Article 2" in packed_prompt
+    assert results[0] == hit
+    assert results[1] == {"entities": []}
+    assert results[2]["entities"][0]["name"] == "Solana"
+
+
+@pytest.mark.asyncio
+async def test_unparsed_articles_fall_back_individually(llm):
+    packed = _api_response({"a0": {"entities": []}, "a1": "garbage"})
+    single = _api_response({"entities": [{"name": "Ethereum", "type": "cryptocurrency"}]})
+
+    with patch.object(llm, "_make_api_call", AsyncMock(side_effect=[packed, single])) as api:
+        results = await llm.extract_entities_batch(_articles(2))
+
+    assert api.await_count == 2
+    assert api.await_args_list[1].kwargs["prompt"] == llm._build_entity_extraction_prompt(_articles(2)[1])
+    assert results[0] == {"entities": []}
+    assert results[1]["entities"][0]["name"] == "Ethereum"
+
+
+@pytest.mark.asyncio
+async def test_batch_size_shrinks_after_truncated_output(llm):
+    assert llm._entity_batch_size() == OptimizedAnthropicLLM.ENTITY_BATCH_MAX_ARTICLES
+
+    truncated = _api_response('{"a0": {"entities": [', output_tokens=4096, stop_reason="max_tokens")
+    single = _api_response({"entities": []}, output_tokens=600)
+    calls = [truncated] + [single] * 10
+
+    with patch.object(llm, "_make_api_call", AsyncMock(side_effect=calls)):
+        results = await llm.extract_entities_batch(_articles(10))
+
+    assert results == [{"entities": []}] * 10
+    assert llm._entity_batch_size() < OptimizedAnthropicLLM.ENTITY_BATCH_MAX_ARTICLES
+
+
+def test_batch_size_tracks_observed_output(llm):
+    for _ in range(20):
+        llm._observe_entity_output(output_tokens=1000, article_count=10)
+    # ~100 tokens/article with 25% headroom fits well over the article cap
+    assert llm._entity_batch_size() == OptimizedAnthropicLLM.ENTITY_BATCH_MAX_ARTICLES
+
+    for _ in range(20):
+        llm._observe_entity_output(output_tokens=1000, article_count=1)
+    assert llm._entity_batch_size() == 3
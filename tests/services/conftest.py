@@ -11,6 +11,24 @@ from decimal import Decimal
 from datetime import datetime, timezone
 
 from src.crypto_news_aggregator.models.alert import AlertInDB, AlertCondition
+from crypto_news_aggregator.services import narrative_index
+from src.crypto_news_aggregator.services import narrative_index as src_narrative_index
+
+
+@pytest.fixture
+def fresh_narrative_index():
+    """
+    Start and end a test without a warm process-wide narrative index.
+
+    Modules that match narratives opt in with
+    ``pytestmark = pytest.mark.usefixtures("fresh_narrative_index")``. Both
+    import paths of the index module are reset, since tests use either one.
+    """
+    for module in (narrative_index, src_narrative_index):
+        module.reset_narrative_index()
+    yield
+    for module in (narrative_index, src_narrative_index):
+        module.reset_narrative_index()
 
 
 @pytest.fixture
@@ -0,0 +1,241 @@
+"""
+Tests for the in-process price alert index and the alert check built on it.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bson import ObjectId
+
+from crypto_news_aggregator.models.alert import AlertInDB
+from crypto_news_aggregator.services import alert_index
+from crypto_news_aggregator.services.alert_index import PriceAlertIndex, trigger_level
+from crypto_news_aggregator.services.alert_notification_service import AlertNotificationService
+
+NOW = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def make_alert_service(alerts):
+    """AlertService mock over a fixed set of alerts, all still active in the collection."""
+    alert_service = MagicMock()
+    alert_service.get_active_alerts = AsyncMock(return_value=alerts)
+    alert_service.get_alerts_updated_since = AsyncMock(return_value=[])
+    alert_service.get_active_alert_ids = AsyncMock(side_effect=lambda ids: set(ids))
+    alert_service.mark_alert_triggered = AsyncMock()
+    return alert_service
+
+
+def make_alert(condition, threshold=0.0, threshold_percent=5.0, crypto_id="bitcoin", **fields):
+    return AlertInDB(
+        _id=str(ObjectId()),
+        user_id=str(ObjectId()),
+        user_email="user@example.com",
+        crypto_id=crypto_id,
+        condition=condition,
+        threshold=threshold,
+        threshold_percent=threshold_percent,
+        **fields,
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_index():
+    alert_index.reset_alert_index()
+    yield
+    alert_index.reset_alert_index()
+
+
+def test_trigger_levels():
+    assert trigger_level(make_alert("above", threshold=60000)) == ("up", 60000)
+    assert trigger_level(make_alert("below", threshold=50000)) == ("down", 50000)
+    assert trigger_level(make_alert("percent_up", last_triggered_price=100.0)) == ("up", pytest.approx(105.0))
+    assert trigger_level(make_alert("percent_down", last_triggered_price=100.0)) == ("down", pytest.approx(95.0))
+    # Percent alerts need a baseline to measure from
+    assert trigger_level(make_alert("percent_up")) is None
+
+
+def test_evaluate_returns_crossed_alerts_only():
+    index = PriceAlertIndex()
+    above = [make_alert("above", threshold=t) for t in (100, 110, 120)]
+    below = [make_alert("below", threshold=t) for t in (80, 90)]
+    pct = make_alert("percent_up", threshold_percent=10, last_triggered_price=100.0)
+    for alert in above + below + [pct]:
+        index.add(alert)
+    index.add(make_alert("above", threshold=1, crypto_id="ethereum"))
+
+    hits = index.evaluate("bitcoin", 110.5, NOW)
+    assert {hit.alert.id for hit in hits} == {above[0].id, above[1].id, pct.id}
+    assert {hit.alert.id for hit in index.evaluate("bitcoin", 85.0, NOW)} == {below[1].id}
+    assert index.symbols() == ["bitcoin", "ethereum"]
+
+
+def test_in_flight_and_cooldown_dedupe_notifications():
+    index = PriceAlertIndex(cooldown=timedelta(minutes=15))
+    alert = make_alert("above", threshold=100)
+    index.add(alert)
+
+    assert len(index.evaluate("bitcoin", 101.0, NOW)) == 1
+    # Still being sent: not returned again
+    assert index.evaluate("bitcoin", 102.0, NOW) == []
+
+    index.release(alert.id)
+    assert len(index.evaluate("bitcoin", 102.0, NOW)) == 1
+
+    index.mark_triggered(alert.id, 102.0, NOW)
+    assert index.evaluate("bitcoin", 103.0, NOW + timedelta(minutes=5)) == []
+    assert len(index.evaluate("bitcoin", 103.0, NOW + timedelta(minutes=16))) == 1
+
+
+def test_mark_triggered_moves_percent_baseline():
+    index = PriceAlertIndex(cooldown=timedelta(0))
+    alert = make_alert("percent_down", threshold_percent=10, last_triggered_price=100.0)
+    index.add(alert)
+
+    [hit] = index.evaluate("bitcoin", 90.0, NOW)
+    assert hit.change_percent == pytest.approx(-10.0)
+    index.mark_triggered(alert.id, 90.0, NOW)
+
+    # Next trigger is 10% below the new baseline of 90
+    assert index.evaluate("bitcoin", 85.0, NOW) == []
+    assert len(index.evaluate("bitcoin", 81.0, NOW)) == 1
+
+
+def test_updates_and_removals_reindex_alerts():
+    index = PriceAlertIndex()
+    alert = make_alert("above", threshold=100)
+    index.add(alert)
+    index.add(alert.model_copy(update={"threshold": 200}))
+    assert index.evaluate("bitcoin", 150.0, NOW) == []
+
+    index.add(alert.model_copy(update={"is_active": False}))
+    assert alert.id not in index
+    assert index.symbols() == []
+
+    index.add(alert)
+    index.remove(alert.id)
+    assert len(index) == 0
+
+
+def test_module_helpers_only_touch_built_index():
+    alert = make_alert("above", threshold=100)
+    alert_index.index_alert(alert)
+    assert alert_index.get_alert_index() is None
+
+    index = alert_index.build_alert_index([])
+    alert_index.index_alert(alert)
+    assert alert.id in index
+    alert_index.unindex_alert(alert.id)
+    assert alert.id not in index
+
+
+@pytest.mark.asyncio
+async def test_check_and_send_alerts_fetches_one_price_batch():
+    alerts = [
+        make_alert("above", threshold=100),
+        make_alert("below", threshold=10, crypto_id="ethereum"),
+        make_alert("above", threshold=500),
+    ]
+    alert_service = make_alert_service(alerts)
+    price_service = MagicMock()
+    price_service.get_prices = AsyncMock(
+        return_value={
+            "bitcoin": {"price": 150.0, "change_24h": 2.0},
+            "ethereum": {"price": 20.0, "change_24h": -1.0},
+        }
+    )
+
+    with patch(
+        "crypto_news_aggregator.services.alert_notification_service.get_price_service",
+        return_value=price_service,
+    ):
+        service = AlertNotificationService(alert_service=alert_service)
+    service._get_relevant_news = AsyncMock(return_value=[])
+    service._send_alert_notification = AsyncMock(return_value=True)
+
+    processed, sent = await service.check_and_send_alerts()
+
+    assert (processed, sent) == (3, 1)
+    price_service.get_prices.assert_awaited_once_with(["bitcoin", "ethereum"])
+    alert_service.mark_alert_triggered.assert_awaited_once_with(alerts[0].id, price=150.0)
+
+    # Within the cooldown the same alert is not sent again
+    processed, sent = await service.check_and_send_alerts()
+    assert sent == 0
+    alert_service.get_active_alerts.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_check_and_send_alerts_uses_tick_prices():
+    alerts = [make_alert("above", threshold=100), make_alert("below", threshold=10, crypto_id="ripple")]
+    alert_service = make_alert_service(alerts)
+    price_service = MagicMock()
+    price_service.get_prices = AsyncMock(return_value={"ripple": {"price": 20.0, "change_24h": 0.0}})
+
+    with patch(
+        "crypto_news_aggregator.services.alert_notification_service.get_price_service",
+        return_value=price_service,
+    ):
+        service = AlertNotificationService(alert_service=alert_service)
+    service._get_relevant_news = AsyncMock(return_value=[])
+    service._send_alert_notification = AsyncMock(return_value=True)
+
+    processed, sent = await service.check_and_send_alerts(
+        prices={"bitcoin": {"price": 150.0, "change_24h": 2.0}}
+    )
+
+    assert (processed, sent) == (2, 1)
+    # Only the symbol the tick didn't cover is fetched
+    price_service.get_prices.assert_awaited_once_with(["ripple"])
+
+
+@pytest.mark.asyncio
+async def test_check_syncs_alerts_changed_by_other_processes():
+    kept = make_alert("above", threshold=100)
+    deactivated = make_alert("above", threshold=90)
+    deleted = make_alert("above", threshold=80)
+    alert_service = make_alert_service([kept, deactivated, deleted])
+    price_service = MagicMock()
+    price_service.get_prices = AsyncMock(return_value={})
+
+    with patch(
+        "crypto_news_aggregator.services.alert_notification_service.get_price_service",
+        return_value=price_service,
+    ):
+        service = AlertNotificationService(alert_service=alert_service)
+    service._get_relevant_news = AsyncMock(return_value=[])
+    service._send_alert_notification = AsyncMock(return_value=True)
+    prices = {"bitcoin": {"price": 150.0, "change_24h": 0.0}}
+
+    # Warm the index without triggering anything
+    await service.check_and_send_alerts(prices={"bitcoin": {"price": 50.0, "change_24h": 0.0}})
+    synced_at = alert_index.get_alert_index().synced_at
+
+    # Another process deactivates one alert, deletes one and creates one
+    created = make_alert("above", threshold=120)
+    alert_service.get_alerts_updated_since.return_value = [
+        deactivated.model_copy(update={"is_active": False}),
+        created,
+    ]
+    alert_service.get_active_alert_ids.side_effect = lambda ids: set(ids) - {deleted.id}
+
+    processed, sent = await service.check_and_send_alerts(prices=prices)
+
+    alert_service.get_alerts_updated_since.assert_awaited_with(synced_at)
+    sent_ids = {call.args[0].id for call in service._send_alert_notification.await_args_list}
+    assert sent_ids == {kept.id, created.id}
+    assert (processed, sent) == (2, 2)
+    assert deleted.id not in alert_index.get_alert_index()
+    alert_service.get_active_alerts.assert_awaited_once()
+
+
+def test_sync_keeps_in_flight_alerts_deduplicated():
+    index = PriceAlertIndex()
+    alert = make_alert("above", threshold=100)
+    index.add(alert)
+    assert len(index.evaluate("bitcoin", 101.0, NOW)) == 1
+
+    index.sync([alert.model_copy(update={"threshold": 95})], synced_at=NOW)
+
+    assert index.evaluate("bitcoin", 101.0, NOW) == []
+    assert index.synced_at == NOW
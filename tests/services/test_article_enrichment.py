@@ -0,0 +1,153 @@
+"""
+Tests for combined single-call article enrichment.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from crypto_news_aggregator.llm import cache as cache_module
+from crypto_news_aggregator.llm.cache import LLMResponseCache, MemoryLRUCache
+from crypto_news_aggregator.services.article_enrichment import (
+    ENRICHMENT_OPERATION,
+    build_enrichment_prompt,
+    enrich_article,
+    validate_enrichment_json,
+)
+from crypto_news_aggregator.services.narrative_themes import narrative_content_hash
+
+
+ARTICLE = {
+    "_id": "a1",
+    "title": "SEC sues Binance over unregistered securities",
+    "text": "The SEC filed a lawsuit against Binance, the largest crypto exchange.",
+}
+
+SCORES = {"relevance_score": 0.9, "sentiment_score": -0.5}
+THEMES = {"themes": ["regulation", "exchanges"]}
+ENTITIES = {"entities": [{"name": "SEC", "type": "organization", "confidence": 0.95, "is_primary": True}]}
+NARRATIVE = {
+    "actors": ["SEC", "Binance"],
+    "actor_salience": {"SEC": 5, "Binance": 4},
+    "nucleus_entity": "SEC",
+    "narrative_focus": "regulatory enforcement action",
+    "actions": ["SEC filed lawsuit"],
+    "tensions": ["Regulation vs Innovation"],
+    "implications": "Escalating enforcement",
+    "narrative_summary": "Regulators are targeting major exchanges.",
+}
+
+
+def _api_response(data):
+    return {"content": json.dumps(data), "input_tokens": 600, "output_tokens": 300, "stop_reason": "end_turn"}
+
+
+async def _run_compute(prompt, model, compute, operation):
+    return await compute()
+
+
+@pytest.fixture
+def llm():
+    llm = MagicMock()
+    llm.HAIKU_MODEL = "haiku"
+    llm.cache.get = AsyncMock(return_value=None)
+    llm.cache.set = AsyncMock()
+    llm.cache.coalesce = AsyncMock(side_effect=_run_compute)
+    llm._track_call = AsyncMock()
+    llm._make_api_call = AsyncMock()
+    return llm
+
+
+def test_validate_reports_invalid_groups():
+    data = {**SCORES, **ENTITIES, **NARRATIVE, "sentiment_score": 3}
+    data["nucleus_entity"] = "Coinbase"
+
+    errors = validate_enrichment_json(data, ARTICLE)
+
+    assert set(errors) == {"scores", "themes", "narrative"}
+
+
+@pytest.mark.asyncio
+async def test_single_call_returns_all_fields(llm):
+    llm._make_api_call.return_value = _api_response({**SCORES, **THEMES, **ENTITIES, **NARRATIVE})
+
+    result = await enrich_article(ARTICLE, llm)
+
+    assert llm._make_api_call.await_count == 1
+    assert result["relevance_score"] == 0.9
+    assert result["themes"] == ["regulation", "exchanges"]
+    assert result["entities"][0]["name"] == "SEC"
+    assert result["nucleus_entity"] == "SEC"
+    assert result["narrative_hash"] == narrative_content_hash(ARTICLE)
+    llm.cache.set.assert_awaited_once_with(build_enrichment_prompt(ARTICLE), "haiku", result)
+
+
+@pytest.mark.asyncio
+async def test_only_invalid_groups_are_requested_again(llm):
+    llm._make_api_call.side_effect = [
+        _api_response({**SCORES, **ENTITIES, **NARRATIVE}),
+        _api_response(THEMES),
+    ]
+
+    result = await enrich_article(ARTICLE, llm)
+
+    repair_prompt = llm._make_api_call.await_args_list[1].kwargs["prompt"]
+    assert repair_prompt == build_enrichment_prompt(ARTICLE, ["themes"])
+    assert "nucleus_entity" not in repair_prompt
+    assert result["themes"] == ["regulation", "exchanges"]
+    assert result["sentiment_score"] == -0.5
+    llm.cache.set.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_incomplete_result_is_returned_but_not_cached(llm):
+    bad_narrative = {**NARRATIVE, "nucleus_entity": "Coinbase"}
+    llm._make_api_call.side_effect = [
+        _api_response({**SCORES, **THEMES, **ENTITIES, **bad_narrative}),
+        _api_response(bad_narrative),
+    ]
+
+    result = await enrich_article(ARTICLE, llm)
+
+    assert result["relevance_score"] == 0.9
+    assert "nucleus_entity" not in result
+    assert "narrative_hash" not in result
+    llm.cache.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_missing_core_fields_returns_none(llm):
+    llm._make_api_call.return_value = _api_response({"themes": []})
+
+    assert await enrich_article(ARTICLE, llm) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_api(llm):
+    cached = {**SCORES, **THEMES, **ENTITIES}
+    llm.cache.get.return_value = cached
+
+    assert await enrich_article(ARTICLE, llm) == cached
+    llm._make_api_call.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_second_enrichment_is_served_from_cache(llm):
+    """A stored enrichment is found again by the lookup (miss, then hit)."""
+    db = MagicMock()
+    db.llm_cache.find = MagicMock(return_value=MagicMock(to_list=AsyncMock(return_value=[])))
+    db.llm_cache.bulk_write = AsyncMock()
+    llm.cache = LLMResponseCache(db, memory_cache=MemoryLRUCache())
+    llm._make_api_call.return_value = _api_response({**SCORES, **THEMES, **ENTITIES, **NARRATIVE})
+    cache_module._pending_stats.clear()
+
+    first = await enrich_article(ARTICLE, llm)
+    second = await enrich_article(ARTICLE, llm)
+
+    assert second == first
+    assert llm._make_api_call.await_count == 1
+    assert cache_module._pending_stats[(ENRICHMENT_OPERATION, "misses")] == 1
+    assert cache_module._pending_stats[(ENRICHMENT_OPERATION, "memory_hits")] == 1
+    llm._track_call.assert_awaited_with(ENRICHMENT_OPERATION, "haiku", cached=True)
+    cache_module._pending_stats.clear()
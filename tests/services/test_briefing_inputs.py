@@ -0,0 +1,212 @@
+"""
+Tests for concurrent briefing input gathering.
+"""
+
+import asyncio
+from datetime import datetime, timezone, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bson import ObjectId
+
+from crypto_news_aggregator.services.briefing_agent import BriefingAgent
+from crypto_news_aggregator.services.memory_manager import MemoryContext
+from crypto_news_aggregator.services.pattern_detector import PatternSummary
+
+
+def _empty_patterns():
+    return PatternSummary(entity_surges=[], sentiment_shifts=[], expected_events=[], narrative_emergences=[])
+
+
+@pytest.fixture
+def agent():
+    agent = BriefingAgent(api_key="test-key")
+    agent.memory_manager = MagicMock()
+    agent.memory_manager.load_memory = AsyncMock(
+        return_value=MemoryContext(feedback="", history=[{"id": 1}], patterns=[], manual_inputs=[])
+    )
+    agent.pattern_detector = MagicMock()
+    agent.pattern_detector.detect_all_patterns = AsyncMock(return_value=_empty_patterns())
+    agent._get_price_moves = AsyncMock(return_value=[])
+    return agent
+
+
+@pytest.fixture
+def detector():
+    detector = MagicMock()
+    detector.detect_market_events = AsyncMock(return_value=[])
+    detector.create_or_update_market_event_narrative = AsyncMock()
+    detector.boost_market_event_in_briefing = AsyncMock(side_effect=lambda narratives: narratives)
+    with patch(
+        "crypto_news_aggregator.services.briefing_agent.get_market_event_detector",
+        return_value=detector,
+    ):
+        yield detector
+
+
+@pytest.mark.asyncio
+async def test_sources_run_concurrently(agent, detector):
+    """Memory, signals and narratives overlap instead of running back to back."""
+
+    async def slow(value):
+        await asyncio.sleep(0.2)
+        return value
+
+    async def load_memory(history_days):
+        return await slow(MemoryContext("", [], [], []))
+
+    agent.memory_manager.load_memory = load_memory
+    agent._get_trending_signals = lambda: slow([{"entity": "Bitcoin"}])
+    agent._get_active_narratives = lambda: slow([{"title": "ETF flows"}])
+
+    started = asyncio.get_running_loop().time()
+    result = await agent._gather_inputs("morning", datetime.now(timezone.utc))
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert elapsed < 0.5
+    assert result.signals == [{"entity": "Bitcoin"}]
+    assert result.narratives == [{"title": "ETF flows"}]
+    assert set(result.timings) == {"memory", "signals", "prices", "market_events", "narratives", "patterns"}
+    assert result.failed_sources == []
+
+
+@pytest.mark.asyncio
+async def test_failed_and_slow_sources_fall_back_to_empty(agent, detector):
+    """A failing or timed-out optional source yields an empty result and is recorded."""
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    agent._get_trending_signals = AsyncMock(side_effect=RuntimeError("db down"))
+    agent._get_price_moves = hang
+    agent._get_active_narratives = AsyncMock(return_value=[{"title": "ETF flows"}])
+
+    with patch("crypto_news_aggregator.services.briefing_agent.get_settings") as settings:
+        settings.return_value.BRIEFING_SOURCE_TIMEOUT_SECONDS = 0.1
+        result = await agent._gather_inputs("evening", datetime.now(timezone.utc))
+
+    assert result.signals == []
+    assert result.prices == []
+    assert result.narratives == [{"title": "ETF flows"}]
+    assert result.memory.history == [{"id": 1}]
+    assert sorted(result.failed_sources) == ["prices", "signals"]
+    agent.pattern_detector.detect_all_patterns.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("narratives", [
+    AsyncMock(side_effect=RuntimeError("db down")),
+    AsyncMock(side_effect=asyncio.TimeoutError()),
+    AsyncMock(return_value=[]),
+], ids=["failed", "timed_out", "empty"])
+async def test_briefing_is_skipped_without_narratives(agent, detector, narratives):
+    """Narratives are required: without them nothing is generated or published."""
+    agent._get_trending_signals = AsyncMock(return_value=[{"entity": "Bitcoin"}])
+    agent._get_active_narratives = narratives
+    agent._generate_with_llm = AsyncMock()
+    agent._save_briefing = AsyncMock()
+
+    with patch(
+        "crypto_news_aggregator.services.briefing_agent.check_briefing_exists_for_slot",
+        AsyncMock(return_value=False),
+    ):
+        assert await agent.generate_briefing("morning") is None
+
+    agent._generate_with_llm.assert_not_awaited()
+    agent._save_briefing.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_market_event_narratives_created_before_narratives_are_read(agent, detector):
+    """Market shock narratives exist before the narrative query and get boosted."""
+    calls = []
+    detector.detect_market_events = AsyncMock(return_value=[{"type": "liquidation"}])
+    detector.create_or_update_market_event_narrative = AsyncMock(
+        side_effect=lambda event: calls.append("create")
+    )
+
+    async def narratives():
+        calls.append("read")
+        return [{"title": "Liquidation cascade"}]
+
+    agent._get_trending_signals = AsyncMock(return_value=[])
+    agent._get_active_narratives = narratives
+
+    result = await agent._gather_inputs("morning", datetime.now(timezone.utc))
+
+    assert calls == ["create", "read"]
+    detector.boost_market_event_in_briefing.assert_awaited_once_with([{"title": "Liquidation cascade"}])
+    assert result.narratives == [{"title": "Liquidation cascade"}]
+
+
+@pytest.mark.asyncio
+async def test_active_narratives_load_articles_in_one_query(agent):
+    """Article dates for all narratives come from a single $in query."""
+    now = datetime.now(timezone.utc)
+    fresh, stale = ObjectId(), ObjectId()
+    narratives = [
+        {"title": "Fresh", "lifecycle_state": "hot", "article_ids": [str(fresh)]},
+        {"title": "Stale", "lifecycle_state": "rising", "article_ids": [stale]},
+        {"title": "Empty", "lifecycle_state": "emerging", "article_ids": []},
+    ]
+
+    class Cursor:
+        def __init__(self, docs):
+            self.docs = docs
+
+        def limit(self, n):
+            return self
+
+        async def to_list(self, length=None):
+            return self.docs
+
+        def __aiter__(self):
+            async def iterate():
+                for doc in self.docs:
+                    yield doc
+            return iterate()
+
+    db = MagicMock()
+    db.narratives.find = MagicMock(return_value=Cursor(narratives))
+    db.articles.find = MagicMock(
+        return_value=Cursor([
+            {"_id": fresh, "published_at": now - timedelta(hours=2)},
+            {"_id": stale, "published_at": now - timedelta(days=30)},
+        ])
+    )
+
+    with patch(
+        "crypto_news_aggregator.services.briefing_agent.mongo_manager.get_async_database",
+        AsyncMock(return_value=db),
+    ):
+        result = await agent._get_active_narratives()
+
+    assert [n["title"] for n in result] == ["Fresh"]
+    db.articles.find.assert_called_once()
+    query = db.articles.find.call_args[0][0]
+    assert set(query["_id"]["$in"]) == {fresh, stale}
+
+
+@pytest.mark.asyncio
+async def test_price_moves_come_from_hourly_rollups():
+    """Price moves are computed from rollup closes, largest move first."""
+    agent = BriefingAgent(api_key="test-key")
+    series = {
+        "resolution": "1h",
+        "timestamps": [],
+        "series": {
+            "bitcoin": [100.0, None, 102.0],
+            "ethereum": [None, 3000.0, 2700.0],
+            "solana": [None, None, 150.0],
+        },
+    }
+
+    with patch(
+        "crypto_news_aggregator.services.briefing_agent.price_history_service.get_series",
+        AsyncMock(return_value=series),
+    ) as get_series:
+        moves = await agent._get_price_moves()
+
+    assert get_series.await_args.kwargs == {"hours": 24, "resolution": "1h"}
+    assert [(m["symbol"], m["price"]) for m in moves] == [("ETH", 2700.0), ("BTC", 102.0)]
+    assert moves[0]["change_pct"] == pytest.approx(-10.0)
@@ -0,0 +1,148 @@
+"""
+Tests for briefing LLM calls: pooled client, cached prompt prefixes and
+single-call refinement.
+"""
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from crypto_news_aggregator.services.briefing_agent import (
+    DEFAULT_MODEL,
+    FALLBACK_MODELS,
+    BriefingAgent,
+    BriefingInput,
+    GeneratedBriefing,
+)
+
+
+@pytest.fixture
+def briefing_input():
+    return BriefingInput(
+        briefing_type="morning",
+        signals=[],
+        narratives=[{"title": "ETF Inflows", "summary": "Spot ETF inflows hit a record", "entities": ["BlackRock"]}],
+        patterns=MagicMock(all_patterns=lambda: [], to_prompt_context=lambda: ""),
+        memory=MagicMock(manual_inputs=[], to_prompt_context=lambda: ""),
+        generated_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.fixture
+def agent():
+    agent = BriefingAgent(api_key="test-key")
+    agent._get_cost_tracker = AsyncMock(return_value=MagicMock(track_call=AsyncMock()))
+    return agent
+
+
+def _response(text, **usage):
+    return {"content": [{"type": "text", "text": text}], "usage": {"input_tokens": 10, "output_tokens": 5, **usage}}
+
+
+def _briefing(narrative="Briefing"):
+    return GeneratedBriefing(
+        narrative=narrative,
+        key_insights=[],
+        entities_mentioned=[],
+        detected_patterns=[],
+        recommendations=[],
+        confidence_score=0.8,
+    )
+
+
+@pytest.mark.asyncio
+async def test_context_and_system_prompt_sent_as_cached_prefixes(agent, briefing_input):
+    client = MagicMock()
+    client.create_message = AsyncMock(
+        return_value=_response('{"narrative": "Done"}', cache_read_input_tokens=3000, cache_creation_input_tokens=0)
+    )
+
+    with patch(
+        "crypto_news_aggregator.services.briefing_agent.get_anthropic_http_client", return_value=client
+    ):
+        generated = await agent._generate_with_llm(briefing_input)
+
+    assert generated.narrative == "Done"
+    payload = client.create_message.call_args[0][1]
+    assert payload["system"][0]["cache_control"] == {"type": "ephemeral"}
+    context, instructions = payload["messages"][0]["content"]
+    assert context["text"] == agent._build_context(briefing_input)
+    assert context["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in instructions
+    assert context["text"] + instructions["text"] == agent._build_generation_prompt(briefing_input)
+
+    assert briefing_input.llm_usage["calls"] == 1
+    assert briefing_input.llm_usage["input_tokens"] == 10
+    assert briefing_input.llm_usage["cache_read_input_tokens"] == 3000
+
+
+@pytest.mark.asyncio
+async def test_forbidden_model_skipped_on_later_calls(agent):
+    forbidden = httpx.HTTPStatusError(
+        "forbidden", request=MagicMock(), response=MagicMock(status_code=403)
+    )
+    client = MagicMock()
+    client.create_message = AsyncMock(side_effect=[forbidden, _response("first"), _response("second")])
+
+    with patch(
+        "crypto_news_aggregator.services.briefing_agent.get_anthropic_http_client", return_value=client
+    ):
+        assert await agent._call_llm("prompt", "system") == "first"
+        assert await agent._call_llm("prompt", "system") == "second"
+
+    models = [call[0][1]["model"] for call in client.create_message.call_args_list]
+    assert models == [DEFAULT_MODEL, FALLBACK_MODELS[0], FALLBACK_MODELS[0]]
+
+
+@pytest.mark.asyncio
+async def test_single_call_refinement_uses_revised_briefing(agent, briefing_input):
+    revised = {"narrative": "BlackRock's ETF drew record inflows.", "confidence_score": 0.9}
+
+    with patch.object(agent, "_call_llm", new_callable=AsyncMock) as mock_llm:
+        mock_llm.side_effect = [
+            json.dumps({"needs_refinement": True, "issues": ["vague"], "revised_briefing": revised}),
+            '{"needs_refinement": false, "issues": []}',
+        ]
+        result = await agent._self_refine(_briefing("The platform grew."), briefing_input, max_iterations=2)
+
+    # Critique and revision share one call per iteration
+    assert mock_llm.call_count == 2
+    assert result.narrative == revised["narrative"]
+    assert "Quality passed on iteration 2" in result.detected_patterns
+    for call in mock_llm.call_args_list:
+        assert call.kwargs["context"] == agent._build_context(briefing_input)
+
+
+def test_combined_critique_prompt_asks_for_revision(agent, briefing_input):
+    prompt = agent._build_critique_prompt(_briefing(), briefing_input, revise=True)
+
+    assert '"revised_briefing"' in prompt
+    assert '"revised_briefing"' not in agent._build_critique_prompt(_briefing(), briefing_input)
+
+
+@pytest.mark.asyncio
+async def test_forbidden_models_are_retried_after_ttl_or_when_none_left(agent):
+    forbidden = httpx.HTTPStatusError(
+        "forbidden", request=MagicMock(), response=MagicMock(status_code=403)
+    )
+    client = MagicMock()
+    client.create_message = AsyncMock(
+        side_effect=[forbidden] * (1 + len(FALLBACK_MODELS)) + [_response("back"), _response("again")]
+    )
+
+    with patch(
+        "crypto_news_aggregator.services.briefing_agent.get_anthropic_http_client", return_value=client
+    ):
+        with pytest.raises(RuntimeError, match="All LLM models failed"):
+            await agent._call_llm("prompt", "system")
+        # Every model was refused: all of them are tried again rather than none
+        assert await agent._call_llm("prompt", "system") == "back"
+
+        agent._unavailable_models = {DEFAULT_MODEL: 0.0}
+        assert await agent._call_llm("prompt", "system") == "again"
+
+    models = [call[0][1]["model"] for call in client.create_message.call_args_list]
+    assert models[-2:] == [DEFAULT_MODEL, DEFAULT_MODEL]
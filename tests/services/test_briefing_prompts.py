@@ -93,3 +93,19 @@ def test_critique_detects_missing_why_it_matters(mock_briefing_input_with_entiti
     # Check for "why it matters" requirement
     assert 'MISSING "WHY IT MATTERS"' in critique_prompt
     assert "significance or implications" in critique_prompt.lower()
+
+
+def test_generation_prompt_includes_price_moves(mock_briefing_input_with_entities):
+    """Test that 24h price moves from the rollups reach the generation prompt."""
+    agent = BriefingAgent()
+    mock_briefing_input_with_entities.patterns = MagicMock(all_patterns=lambda: [], to_prompt_context=lambda: "")
+    mock_briefing_input_with_entities.prices = [
+        {"symbol": "ETH", "price": 2700.0, "change_pct": -10.0},
+        {"symbol": "BTC", "price": 67250.5, "change_pct": 2.04},
+    ]
+
+    prompt = agent._build_generation_prompt(mock_briefing_input_with_entities)
+
+    assert "## Price Moves (24h)" in prompt
+    assert "- ETH: $2,700.00 (-10.0%)" in prompt
+    assert "- BTC: $67,250.50 (+2.0%)" in prompt
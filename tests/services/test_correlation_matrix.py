@@ -0,0 +1,113 @@
+"""
+Tests for the vectorized correlation engine.
+"""
+
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from crypto_news_aggregator.services.correlation_matrix import (
+    CorrelationMatrix,
+    correlation_matrix,
+    lagged_correlation_matrix,
+    log_returns,
+    rolling_correlation,
+)
+
+
+def random_returns(rows=200, columns=6, missing=0.1, seed=5):
+    rng = np.random.default_rng(seed)
+    common = rng.normal(size=(rows, 1))
+    returns = common * rng.uniform(0, 1, size=columns) + rng.normal(size=(rows, columns))
+    returns[rng.random((rows, columns)) < missing] = np.nan
+    return returns
+
+
+def pairwise_corrcoef(a, b):
+    both = ~np.isnan(a) & ~np.isnan(b)
+    return np.corrcoef(a[both], b[both])[0, 1]
+
+
+def test_matches_pairwise_corrcoef_with_gaps():
+    returns = random_returns()
+    corr, counts = correlation_matrix(returns)
+
+    for i in range(returns.shape[1]):
+        for j in range(returns.shape[1]):
+            expected = 1.0 if i == j else pairwise_corrcoef(returns[:, i], returns[:, j])
+            assert corr[i, j] == pytest.approx(expected, abs=1e-9)
+    assert counts[0, 1] == np.count_nonzero(~np.isnan(returns[:, 0]) & ~np.isnan(returns[:, 1]))
+
+
+def test_pairs_without_enough_common_returns_are_nan():
+    returns = random_returns(rows=20, columns=2, missing=0)
+    returns[:17, 1] = np.nan
+
+    corr, _ = correlation_matrix(returns, min_periods=5)
+
+    assert np.isnan(corr[0, 1]) and np.isnan(corr[1, 1])
+    assert corr[0, 0] == 1.0
+
+
+def test_lagged_correlation_finds_a_leading_series():
+    rng = np.random.default_rng(1)
+    leader = rng.normal(size=300)
+    follower = np.concatenate([[0.0, 0.0], leader[:-2]]) + rng.normal(scale=0.1, size=300)
+    returns = np.column_stack([leader, follower])
+
+    assert lagged_correlation_matrix(returns, 2)[0, 1] > 0.9
+    assert abs(lagged_correlation_matrix(returns, 0)[0, 1]) < 0.2
+    assert lagged_correlation_matrix(returns, -2)[1, 0] > 0.9
+
+
+def test_rolling_correlation_matches_each_window():
+    returns = random_returns(rows=60, columns=3)
+    rolling = rolling_correlation(returns, base=0, window=20)
+
+    for t in (25, 40, 59):
+        window = returns[t - 19:t + 1]
+        assert rolling[t, 2] == pytest.approx(pairwise_corrcoef(window[:, 0], window[:, 2]), abs=1e-9)
+    assert np.isnan(rolling[2, 1])
+
+
+def test_matrix_serves_pairs_and_top_k():
+    prices = np.exp(np.cumsum(random_returns(rows=100, columns=4, missing=0) / 100, axis=0))
+    prices[:, 3] = prices[:, 0] * 2  # moves exactly with the first coin
+    timestamps = [datetime(2025, 1, 1) + timedelta(days=i) for i in range(100)]
+
+    matrix = CorrelationMatrix.from_prices(["btc", "eth", "sol", "wbtc"], timestamps, prices)
+
+    assert matrix.pair("btc", "wbtc") == pytest.approx(1.0)
+    assert matrix.pair("btc", "missing") is None
+    assert matrix.top_k("btc", k=2)[0][0] == "wbtc"
+    assert len(matrix.top_k("btc", k=10)) == 3
+    assert np.array_equal(matrix.returns, log_returns(prices))
+
+
+@pytest.mark.asyncio
+async def test_calculate_correlation_reads_rollups_and_fills_gaps_from_coingecko():
+    from crypto_news_aggregator.services import correlation_service as module
+
+    days = [datetime(2025, 1, 1) + timedelta(days=i) for i in range(30)]
+    rng = np.random.default_rng(3)
+    btc = list(np.exp(np.cumsum(rng.normal(size=30) / 50)) * 60000)
+    history = {"timestamps": days, "series": {coin: [None] * 30 for coin in module.COIN_ID_TO_SYMBOL}}
+    history["series"]["bitcoin"] = btc
+    price_service = MagicMock()
+    price_service.get_historical_prices = AsyncMock(
+        side_effect=lambda coin_id, n: {"prices": [(d, p / 20) for d, p in zip(days, btc)]}
+        if coin_id == "ethereum" else None
+    )
+    module.matrix_cache.clear()
+
+    with patch.object(module, "get_price_service", return_value=price_service), \
+         patch.object(module.price_history_service, "get_series", AsyncMock(return_value=history)):
+        result = await module.CorrelationService().calculate_correlation("bitcoin", ["ethereum", "solana"], days=30)
+
+    assert result["ethereum"] == pytest.approx(1.0)
+    assert result["solana"] is None
+    # Only coins without local history went to CoinGecko
+    fetched = {call.args[0] for call in price_service.get_historical_prices.await_args_list}
+    assert "bitcoin" not in fetched and "ethereum" in fetched
+    module.matrix_cache.clear()
@@ -0,0 +1,89 @@
+"""
+Tests for the single-pass entity matcher.
+"""
+
+import pytest
+from bson import ObjectId
+from unittest.mock import MagicMock
+
+from crypto_news_aggregator.services.entity_matcher import EntityMatcher
+from crypto_news_aggregator.services.entity_normalization import (
+    count_entities,
+    find_entities,
+    normalize_entity_name,
+)
+from crypto_news_aggregator.services.selective_processor import SelectiveArticleProcessor
+
+
+@pytest.fixture
+def matcher():
+    return EntityMatcher({
+        "Bitcoin": ["btc", "$btc", "bitcoin"],
+        "Shiba Inu": ["shib", "shiba inu"],
+        "Inu Token": ["inu"],
+    })
+
+
+def test_matches_case_insensitively_with_positions(matcher):
+    text = "BTC and Bitcoin"
+    matches = matcher.find_all(text)
+
+    assert [(m.canonical, m.start, m.end, m.text) for m in matches] == [
+        ("Bitcoin", 0, 3, "BTC"),
+        ("Bitcoin", 8, 15, "Bitcoin"),
+    ]
+
+
+def test_respects_word_boundaries(matcher):
+    assert matcher.find_all("btc2 xbtc bitcoins") == []
+    assert [m.text for m in matcher.find_all("($BTC), btc.")] == ["$BTC", "btc"]
+
+
+def test_prefers_longest_multi_word_variant(matcher):
+    assert matcher.counts("Shiba Inu rallies, inu holders cheer") == {"Shiba Inu": 1, "Inu Token": 1}
+    # Multi-word variants don't span punctuation
+    assert matcher.counts("shiba, inu") == {"Inu Token": 1}
+
+
+def test_counts_are_ordered_by_first_mention(matcher):
+    assert list(matcher.counts("SHIB then BTC then bitcoin")) == ["Shiba Inu", "Bitcoin"]
+    assert matcher.counts("SHIB then BTC then bitcoin")["Bitcoin"] == 2
+
+
+def test_lookup_requires_a_whole_variant(matcher):
+    assert matcher.lookup(" Shiba Inu ") == "Shiba Inu"
+    assert matcher.lookup("Shiba Inu news") is None
+    assert matcher.lookup("") is None
+
+
+def test_entity_normalization_helpers():
+    assert [m.canonical for m in find_entities("$SOL and ETH beat BTC")] == ["Solana", "Ethereum", "Bitcoin"]
+    assert count_entities("BTC, $btc and Bitcoin") == {"Bitcoin": 3}
+    assert normalize_entity_name("Shiba  Inu") == "Shiba Inu"
+    assert normalize_entity_name("Unknown Token") == "Unknown Token"
+
+
+@pytest.mark.asyncio
+async def test_selective_processor_marks_first_title_entity_primary():
+    processor = SelectiveArticleProcessor(MagicMock())
+    article = {
+        "title": "Ethereum upgrade lifts Bitcoin",
+        "text": "ETH and BTC gained while SOL lagged.",
+        "source": "cryptoslate",
+    }
+
+    entities = await processor.extract_entities_simple(ObjectId(), article)
+
+    assert [e["entity"] for e in entities] == ["Ethereum", "Bitcoin", "Solana"]
+    assert [e["is_primary"] for e in entities] == [True, False, False]
+    assert entities[0]["confidence"] == 0.85
+
+
+@pytest.mark.asyncio
+async def test_selective_processor_without_title_entity_has_no_primary():
+    processor = SelectiveArticleProcessor(MagicMock())
+    article = {"title": "Weekly market wrap", "text": "BTC was flat."}
+
+    entities = await processor.extract_entities_simple(ObjectId(), article)
+
+    assert [(e["entity"], e["is_primary"]) for e in entities] == [("Bitcoin", False)]
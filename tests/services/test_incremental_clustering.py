@@ -0,0 +1,224 @@
+"""
+Tests for incremental narrative detection: clustering state carried across cycles.
+"""
+
+import random
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from bson import ObjectId
+
+from crypto_news_aggregator.services import incremental_clustering
+from crypto_news_aggregator.services.incremental_clustering import ClusterState
+from crypto_news_aggregator.services.narrative_service import detect_narratives
+from crypto_news_aggregator.services.narrative_themes import cluster_by_narrative_salience
+
+NOW = datetime.now(timezone.utc)
+
+
+def article(nucleus, actors, tensions=(), hours_ago=1):
+    return {
+        "_id": ObjectId(),
+        "title": f"{nucleus} news",
+        "nucleus_entity": nucleus,
+        "actors": list(actors),
+        "actor_salience": {actor: 5 for actor in actors},
+        "tensions": list(tensions),
+        "published_at": NOW - timedelta(hours=hours_ago),
+    }
+
+
+@pytest.fixture(autouse=True)
+def fresh_cluster_state():
+    incremental_clustering.set_cluster_state(None)
+    yield
+    incremental_clustering.set_cluster_state(None)
+
+
+def random_articles(count, seed=3):
+    rng = random.Random(seed)
+    entities = ["SEC", "Binance", "Coinbase", "Bitcoin", "Ripple", "Solana", "BlackRock", "Tether"]
+    tensions = ["regulation", "adoption", "security", "liquidity"]
+    return [
+        article(rng.choice(entities), rng.sample(entities, 2), rng.sample(tensions, 1), hours_ago=rng.uniform(0, 48))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_assignment_matches_a_full_pass():
+    articles = random_articles(200)
+    full = await cluster_by_narrative_salience(articles, min_cluster_size=1)
+
+    state = ClusterState(window_hours=48)
+    for batch_start in range(0, len(articles), 30):
+        for item in articles[batch_start:batch_start + 30]:
+            state.assign(item)
+
+    incremental = [state.cluster(key) for key in state.keys]
+    assert [[m["_id"] for m in c] for c in incremental] == [[a["_id"] for a in c] for c in full]
+
+
+def test_state_round_trips_through_member_docs():
+    state = ClusterState(window_hours=48, watermark=NOW)
+    for item in random_articles(50):
+        state.assign(item)
+
+    restored = ClusterState.from_members(48, [dict(m) for m in state.members()], watermark=NOW)
+    assert restored.keys == state.keys
+    assert [[m["_id"] for m in restored.cluster(k)] for k in restored.keys] == \
+        [[m["_id"] for m in state.cluster(k)] for k in state.keys]
+
+    # New articles keep being assigned after the stored ones
+    late = article("SEC", ["SEC", "Binance"])
+    assert restored.assign(late)["seq"] == 50
+
+
+def test_expire_drops_old_members_and_keeps_cluster_keys():
+    old = article("SEC", ["SEC", "Binance"], hours_ago=60)
+    recent = article("SEC", ["SEC", "Coinbase"], hours_ago=2)
+    other = article("Solana", ["Solana"], hours_ago=1)
+    state = ClusterState(window_hours=48)
+    for item in (old, recent, other):
+        state.assign(item)
+    sec_key = state.members()[0]["cluster"]
+
+    assert [m["_id"] for m in state.expire(NOW - timedelta(hours=48))] == [old["_id"]]
+    assert old["_id"] not in state
+    assert [m["_id"] for m in state.cluster(sec_key)] == [recent["_id"]]
+    # Aggregates are rebuilt from the remaining members
+    assert state.index.cluster_core_actors[state.keys.index(sec_key)] == {"SEC", "Coinbase"}
+
+
+def test_expire_matches_a_rebuild_from_the_remaining_members():
+    state = ClusterState(window_hours=48)
+    for item in random_articles(200) + [article("Dogecoin", ["Dogecoin", "Musk"], ["memes"], hours_ago=30)]:
+        state.assign(item)
+    cutoff = NOW - timedelta(hours=24)
+
+    expired = state.expire(cutoff)
+    assert expired and all(m["published_at"] < cutoff for m in expired)
+    rebuilt = ClusterState.from_members(48, [dict(m) for m in state.members()])
+
+    for key in rebuilt.keys:
+        position, rebuilt_position = state.keys.index(key), rebuilt.keys.index(key)
+        assert [m["_id"] for m in state.cluster(key)] == [m["_id"] for m in rebuilt.cluster(key)]
+        assert state.index.cluster_nucleus[position] == rebuilt.index.cluster_nucleus[rebuilt_position]
+        assert state.index.cluster_core_actors[position] == rebuilt.index.cluster_core_actors[rebuilt_position]
+        assert state.index.cluster_tensions[position] == rebuilt.index.cluster_tensions[rebuilt_position]
+
+    # Emptied clusters keep their key but are no longer candidates
+    emptied = [key for key in state.keys if key not in rebuilt.keys]
+    assert emptied and all(state.cluster(key) == [] for key in emptied)
+    indexed = set().union(
+        *state.index.nucleus_index.values(),
+        *state.index.core_actor_index.values(),
+        *state.index.tension_index.values(),
+    )
+    assert indexed == {state.keys.index(key) for key in rebuilt.keys}
+    assert state.expire(cutoff) == []
+
+
+def test_articles_without_nucleus_or_actors_are_skipped():
+    state = ClusterState(window_hours=48)
+    assert state.assign({"_id": ObjectId(), "nucleus_entity": "SEC", "actors": []}) is None
+    assert len(state) == 0
+
+
+@pytest.mark.asyncio
+async def test_incremental_cycle_only_saves_changed_clusters():
+    sec = [article("SEC", ["SEC", "Binance"], hours_ago=h) for h in (5, 4, 3)]
+    sol = [article("Solana", ["Solana", "Jito"], hours_ago=h) for h in (5, 4, 3)]
+    state = ClusterState(window_hours=48, built_at=NOW, watermark=NOW - timedelta(minutes=10))
+    for item in sec + sol:
+        state.assign(item)
+    incremental_clustering.set_cluster_state(state)
+
+    new_sol = article("Solana", ["Solana", "Jito"], hours_ago=0)
+    find_results = [[new_sol], sol]
+    mock_db = MagicMock()
+    mock_db.articles.find = MagicMock(
+        side_effect=lambda query: MagicMock(to_list=AsyncMock(return_value=find_results.pop(0)))
+    )
+
+    with patch("crypto_news_aggregator.services.narrative_service.mongo_manager") as mock_mongo, \
+         patch("crypto_news_aggregator.services.narrative_service.backfill_narratives_for_recent_articles",
+               AsyncMock(return_value=0)), \
+         patch("crypto_news_aggregator.services.narrative_service.save_cluster_state", AsyncMock()) as mock_save, \
+         patch("crypto_news_aggregator.services.narrative_service._save_narrative_clusters",
+               AsyncMock(return_value=[])) as mock_save_clusters:
+        mock_mongo.get_async_database = AsyncMock(return_value=mock_db)
+        await detect_narratives(incremental=True)
+
+    # Only articles created or extracted since the watermark were queried
+    new_query = mock_db.articles.find.call_args_list[0][0][0]
+    assert "$and" in new_query
+
+    clusters = mock_save_clusters.call_args[0][0]
+    assert [[a["_id"] for a in c] for c in clusters] == [[a["_id"] for a in sol + [new_sol]]]
+
+    stored_state, added, expired = mock_save.call_args[0]
+    assert [m["_id"] for m in added] == [new_sol["_id"]]
+    assert expired == []
+    assert mock_save.call_args.kwargs["replace"] is False
+
+
+@pytest.mark.asyncio
+async def test_incremental_cycle_resaves_clusters_that_lost_articles():
+    sec = [article("SEC", ["SEC", "Binance"], hours_ago=h) for h in (50, 5, 4, 3)]
+    sol = [article("Solana", ["Solana", "Jito"], hours_ago=h) for h in (5, 4, 3)]
+    state = ClusterState(window_hours=48, built_at=NOW, watermark=NOW - timedelta(minutes=10))
+    for item in sec + sol:
+        state.assign(item)
+    incremental_clustering.set_cluster_state(state)
+
+    find_results = [[], sec[1:]]
+    mock_db = MagicMock()
+    mock_db.articles.find = MagicMock(
+        side_effect=lambda query: MagicMock(to_list=AsyncMock(return_value=find_results.pop(0)))
+    )
+
+    with patch("crypto_news_aggregator.services.narrative_service.mongo_manager") as mock_mongo, \
+         patch("crypto_news_aggregator.services.narrative_service.backfill_narratives_for_recent_articles",
+               AsyncMock(return_value=0)), \
+         patch("crypto_news_aggregator.services.narrative_service.save_cluster_state", AsyncMock()) as mock_save, \
+         patch("crypto_news_aggregator.services.narrative_service._save_narrative_clusters",
+               AsyncMock(return_value=[])) as mock_save_clusters:
+        mock_mongo.get_async_database = AsyncMock(return_value=mock_db)
+        await detect_narratives(incremental=True)
+
+    # The shrunken SEC cluster is re-saved with its remaining articles; Solana is untouched
+    clusters = mock_save_clusters.call_args[0][0]
+    assert [[a["_id"] for a in c] for c in clusters] == [[a["_id"] for a in sec[1:]]]
+    assert mock_save.call_args[0][2] == [sec[0]["_id"]]
+
+
+@pytest.mark.asyncio
+async def test_incremental_cycle_refreshes_clusters_that_expired_below_min_articles():
+    sec = [article("SEC", ["SEC", "Binance"], hours_ago=h) for h in (50, 49, 5, 4)]
+    tiny = [article("Ripple", ["Ripple", "XRP"], hours_ago=h) for h in (50, 5)]
+    state = ClusterState(window_hours=48, built_at=NOW, watermark=NOW - timedelta(minutes=10))
+    for item in sec + tiny:
+        state.assign(item)
+    incremental_clustering.set_cluster_state(state)
+
+    find_results = [[], sec[2:]]
+    mock_db = MagicMock()
+    mock_db.articles.find = MagicMock(
+        side_effect=lambda query: MagicMock(to_list=AsyncMock(return_value=find_results.pop(0)))
+    )
+
+    with patch("crypto_news_aggregator.services.narrative_service.mongo_manager") as mock_mongo, \
+         patch("crypto_news_aggregator.services.narrative_service.backfill_narratives_for_recent_articles",
+               AsyncMock(return_value=0)), \
+         patch("crypto_news_aggregator.services.narrative_service.save_cluster_state", AsyncMock()), \
+         patch("crypto_news_aggregator.services.narrative_service._save_narrative_clusters",
+               AsyncMock(return_value=[])) as mock_save_clusters:
+        mock_mongo.get_async_database = AsyncMock(return_value=mock_db)
+        await detect_narratives(incremental=True)
+
+    # SEC had a narrative at 4 articles and is refreshed with its last 2;
+    # the Ripple cluster never reached min_articles and stays unsaved
+    clusters = mock_save_clusters.call_args[0][0]
+    assert [[a["_id"] for a in c] for c in clusters] == [[a["_id"] for a in sec[2:]]]
+    assert mock_save_clusters.call_args.kwargs["merge_only"] == {0}
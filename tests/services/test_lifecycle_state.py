@@ -15,6 +15,9 @@ from crypto_news_aggregator.services.narrative_service import (
 )
 
 
+pytestmark = pytest.mark.usefixtures("fresh_narrative_index")
+
+
 class TestDetermineLifecycleState:
     """Unit tests for determine_lifecycle_state function."""
     
@@ -0,0 +1,166 @@
+"""
+Tests for the narrative fingerprint index used by matching and consolidation.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from crypto_news_aggregator.services import narrative_index
+from crypto_news_aggregator.services.narrative_index import (
+    NarrativeFingerprintIndex,
+    build_narrative_index,
+    get_narrative_index,
+    index_narrative,
+    narrative_fingerprint,
+)
+from crypto_news_aggregator.services.narrative_service import (
+    find_matching_narrative,
+    load_narrative_index,
+    save_narrative,
+)
+
+
+pytestmark = pytest.mark.usefixtures("fresh_narrative_index")
+
+
+def fingerprint(nucleus, actors, focus=None):
+    fp = {"nucleus_entity": nucleus, "top_actors": actors, "key_actions": []}
+    if focus:
+        fp["narrative_focus"] = focus
+    return fp
+
+
+@pytest.fixture
+def index():
+    index = NarrativeFingerprintIndex()
+    now = datetime.now(timezone.utc)
+    index.add("sec-1", fingerprint("SEC", ["SEC", "Binance", "Coinbase"], "enforcement action"), now)
+    index.add("sec-2", fingerprint("SEC", ["SEC", "Ripple"], "court ruling"), now - timedelta(days=10))
+    index.add("etf", fingerprint("BlackRock", ["BlackRock", "SEC"], "enforcement action"), now)
+    index.add("btc", fingerprint("Bitcoin", ["Bitcoin", "MicroStrategy"], "treasury buys"), now)
+    return index
+
+
+def test_candidates_share_nucleus_or_focus(index):
+    ids = index.candidates(fingerprint("sec", ["SEC", "Binance"], "Enforcement Action"))
+
+    assert set(ids) == {"sec-1", "sec-2", "etf"}
+    # Closest actor/focus overlap ranks first
+    assert ids[0] == "sec-1"
+
+
+def test_candidates_respect_window_limit_and_exclude(index):
+    fp = fingerprint("SEC", ["SEC", "Binance", "Coinbase"], "enforcement action")
+    since = datetime.now(timezone.utc) - timedelta(days=7)
+
+    assert "sec-2" not in index.candidates(fp, since=since)
+    assert index.candidates(fp, limit=1) == ["sec-1"]
+    assert "sec-1" not in index.candidates(fp, exclude=["sec-1"])
+
+
+def test_readding_replaces_and_inactive_narratives_are_dropped(index):
+    index.add("sec-1", fingerprint("Bitcoin", ["Bitcoin"]))
+    assert "sec-1" not in index.candidates(fingerprint("SEC", ["SEC"]))
+
+    index.add_narrative({"_id": "btc", "lifecycle_state": "merged", "theme": "Bitcoin"})
+    assert "btc" not in index
+    assert len(index) == 3
+
+
+def test_legacy_narratives_fingerprint_from_theme_and_entities():
+    legacy = {"_id": "n", "theme": "DeFi", "entities": ["Uniswap"], "status": "emerging"}
+
+    assert narrative_fingerprint(legacy)["nucleus_entity"] == "DeFi"
+    index = NarrativeFingerprintIndex()
+    index.add_narrative(legacy)
+    assert index.candidates(fingerprint("DeFi", ["Aave"])) == ["n"]
+
+
+def test_process_index_expires_and_tracks_writes():
+    build_narrative_index([], window_days=30)
+    assert get_narrative_index(14) is not None
+    # A wider search window than the index covers needs a rebuild
+    assert get_narrative_index(60) is None
+
+    index_narrative({"_id": "new", "theme": "Solana", "status": "emerging"})
+    assert "new" in get_narrative_index(14)
+
+    narrative_index._index.built_at -= timedelta(days=1)
+    assert get_narrative_index(14) is None
+
+
+@pytest.mark.asyncio
+async def test_warm_index_fetches_only_candidates():
+    now = datetime.now(timezone.utc)
+    build_narrative_index([
+        {"_id": "sec", "status": "hot", "last_updated": now,
+         "fingerprint": fingerprint("SEC", ["SEC", "Binance"])},
+        {"_id": "btc", "status": "hot", "last_updated": now,
+         "fingerprint": fingerprint("Bitcoin", ["Bitcoin"])},
+    ], window_days=30)
+
+    stored = {"_id": "sec", "title": "SEC vs Binance", "status": "hot", "last_updated": now,
+              "fingerprint": fingerprint("SEC", ["SEC", "Binance"])}
+    mock_cursor = AsyncMock()
+    mock_cursor.to_list = AsyncMock(return_value=[stored])
+    mock_db = MagicMock()
+    mock_db.narratives.find = MagicMock(return_value=mock_cursor)
+
+    with patch("crypto_news_aggregator.services.narrative_service.mongo_manager") as mock_mongo:
+        mock_mongo.get_async_database = AsyncMock(return_value=mock_db)
+        result = await find_matching_narrative(fingerprint("SEC", ["SEC", "Binance"]), within_days=14)
+
+    assert result["_id"] == "sec"
+    query = mock_db.narratives.find.call_args[0][0]
+    assert query["_id"] == {"$in": ["sec"]}
+    assert "$or" in query
+
+
+@pytest.mark.asyncio
+async def test_detection_cycles_load_the_full_index_window_once():
+    now = datetime.now(timezone.utc)
+    mock_cursor = AsyncMock()
+    mock_cursor.to_list = AsyncMock(return_value=[
+        {"_id": "old", "status": "cooling", "last_updated": now - timedelta(days=20),
+         "fingerprint": fingerprint("SEC", ["SEC", "Ripple"])},
+    ])
+    mock_db = MagicMock()
+    mock_db.narratives.find = MagicMock(return_value=mock_cursor)
+
+    with patch("crypto_news_aggregator.services.narrative_service.mongo_manager") as mock_mongo:
+        mock_mongo.get_async_database = AsyncMock(return_value=mock_db)
+        await load_narrative_index()
+        await load_narrative_index()
+
+    mock_db.narratives.find.assert_called_once()
+    cutoff = mock_db.narratives.find.call_args[0][0]["last_updated"]["$gte"]
+    assert abs((now - timedelta(days=30) - cutoff).total_seconds()) < 5
+    # Every grace period up to the index window is served from the index
+    assert "old" in get_narrative_index(28)
+    # ...but a match still only considers the caller's window
+    assert get_narrative_index(28).candidates(
+        fingerprint("SEC", ["SEC", "Ripple"]), since=now - timedelta(days=14)
+    ) == []
+
+
+@pytest.mark.asyncio
+async def test_saved_narratives_are_indexed():
+    from bson import ObjectId
+
+    existing = {"_id": ObjectId(), "theme": "SEC", "status": "hot",
+                "fingerprint": fingerprint("SEC", ["SEC", "Binance"], "enforcement action")}
+    new_id = ObjectId()
+    build_narrative_index([], window_days=30)
+
+    with patch(
+        "crypto_news_aggregator.services.narrative_service.upsert_narrative",
+        AsyncMock(side_effect=[str(existing["_id"]), str(new_id)]),
+    ):
+        await save_narrative(existing=existing, theme="SEC", entities=["SEC"], lifecycle_state="hot")
+        await save_narrative(theme="Solana", entities=["Solana"], lifecycle_state="emerging")
+
+    index = get_narrative_index(14)
+    # The update keeps the stored fingerprint, the new narrative is indexed by its theme
+    assert index.candidates(fingerprint("SEC", [], "enforcement action")) == [existing["_id"]]
+    assert index.candidates(fingerprint("Solana", [])) == [new_id]
@@ -9,6 +9,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from src.crypto_news_aggregator.services.narrative_service import find_matching_narrative
 
 
+pytestmark = pytest.mark.usefixtures("fresh_narrative_index")
+
+
 @pytest.mark.asyncio
 async def test_find_matching_narrative_with_match():
     """Test finding a matching narrative above similarity threshold."""
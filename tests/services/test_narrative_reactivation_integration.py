@@ -20,6 +20,9 @@ from src.crypto_news_aggregator.services.narrative_service import (
 )
 
 
+pytestmark = pytest.mark.usefixtures("fresh_narrative_index")
+
+
 class TestReactivationIntegration:
     """Integration tests for end-to-end reactivation flow."""
 
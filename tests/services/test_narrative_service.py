@@ -20,6 +20,9 @@ from crypto_news_aggregator.services.narrative_service import (
 )
 
 
+pytestmark = pytest.mark.usefixtures("fresh_narrative_index")
+
+
 @pytest.fixture
 def mock_db():
     """Mock MongoDB database."""
@@ -0,0 +1,111 @@
+"""
+Tests for MinHash/LSH near-duplicate article detection.
+"""
+
+import pytest
+from bson import ObjectId
+
+from crypto_news_aggregator.background.rss_fetcher import _near_duplicate_update
+from crypto_news_aggregator.services.near_duplicates import (
+    NUM_PERMUTATIONS,
+    NearDuplicateIndex,
+    article_signature,
+    estimate_similarity,
+    minhash_signature,
+    shingles,
+)
+
+ORIGINAL = (
+    "Bitcoin ETF inflows hit a record $1.2 billion on Monday as BlackRock's IBIT "
+    "led the pack, according to data from Farside Investors. The surge comes as "
+    "BTC trades near all-time highs."
+)
+REWRITE = (
+    "Bitcoin ETF inflows hit a record $1.2 billion on Monday as BlackRock's IBIT "
+    "led the pack, according to Farside Investors data. The surge comes as BTC "
+    "trades near its all-time highs."
+)
+UNRELATED = (
+    "Ethereum developers scheduled the Pectra upgrade for mainnet in March after "
+    "successful testnet deployments."
+)
+
+
+def test_shingles_normalize_case_punctuation_and_urls():
+    assert shingles("Bitcoin, bitcoin! https://example.com BITCOIN rally", size=2) == {
+        "bitcoin bitcoin",
+        "bitcoin rally",
+    }
+    assert shingles("") == set()
+
+
+def test_signature_is_deterministic_and_fixed_length():
+    signature = minhash_signature(ORIGINAL)
+    assert len(signature) == NUM_PERMUTATIONS
+    assert signature == minhash_signature(ORIGINAL)
+    assert all(0 <= value < 2 ** 63 for value in signature)
+    assert minhash_signature("   ") is None
+
+
+def test_similarity_separates_rewrites_from_other_stories():
+    original = minhash_signature(ORIGINAL)
+    assert estimate_similarity(original, minhash_signature(ORIGINAL)) == 1.0
+    assert estimate_similarity(original, minhash_signature(REWRITE)) >= 0.5
+    assert estimate_similarity(original, minhash_signature(UNRELATED)) < 0.1
+
+
+def test_index_links_rewrite_to_first_copy():
+    index = NearDuplicateIndex(threshold=0.5)
+
+    assert index.check("a", minhash_signature(ORIGINAL)) is None
+    assert index.check("c", minhash_signature(UNRELATED)) is None
+    match = index.check("b", minhash_signature(REWRITE))
+
+    assert match is not None and match[0] == "a"
+    assert "b" not in index
+    assert len(index) == 2
+
+
+def test_already_indexed_article_only_matches_earlier_ones():
+    index = NearDuplicateIndex(threshold=0.5)
+    index.add("first", minhash_signature(ORIGINAL))
+    index.add("second", minhash_signature(ORIGINAL))
+
+    # The first copy stays canonical even though the second one is indexed too
+    assert index.check("first", minhash_signature(ORIGINAL)) is None
+    assert index.check("second", minhash_signature(ORIGINAL)) == ("first", 1.0)
+
+
+def test_index_is_bounded():
+    index = NearDuplicateIndex(max_entries=2)
+    index.add("a", minhash_signature(ORIGINAL))
+    index.add("b", minhash_signature(UNRELATED))
+    index.add("c", minhash_signature("Solana validators vote on a new fee market"))
+
+    assert len(index) == 2
+    assert "a" not in index
+    assert index.find_duplicate(minhash_signature(ORIGINAL)) is None
+
+
+def test_near_duplicate_update_marks_copy_with_canonical_id():
+    index = NearDuplicateIndex(threshold=0.5)
+    canonical_id, copy_id = ObjectId(), ObjectId()
+
+    assert _near_duplicate_update({"_id": canonical_id, "title": "ETF", "text": ORIGINAL}, index) is None
+    update = _near_duplicate_update({"_id": copy_id, "title": "ETF", "text": REWRITE}, index)
+
+    assert update._filter == {"_id": copy_id}
+    fields = update._doc["$set"]
+    assert fields["is_duplicate"] is True
+    assert fields["duplicate_of"] == canonical_id
+
+
+def test_stored_signature_is_preferred():
+    index = NearDuplicateIndex(threshold=0.5)
+    stored = minhash_signature(ORIGINAL)
+    index.add("canonical", stored)
+
+    # Text differs, but the stored signature is what gets compared
+    article = {"_id": ObjectId(), "title": "x", "text": UNRELATED, "minhash": stored}
+    assert _near_duplicate_update(article, index) is not None
+    assert article_signature(article) != stored
@@ -0,0 +1,80 @@
+"""
+Tests for buffered price history writes.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+from crypto_news_aggregator.services.price_history import PriceHistoryService, resolution_for_window
+
+NOW = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_samples_are_written_in_batches():
+    service = PriceHistoryService(batch_size=3, flush_seconds=3600)
+    insert = AsyncMock(side_effect=lambda batch: batch)
+
+    with patch("crypto_news_aggregator.services.price_history.insert_price_samples", insert), \
+         patch("crypto_news_aggregator.services.price_history.update_price_rollups", AsyncMock(return_value=[])):
+        for minute in range(7):
+            await service.record_price("Bitcoin", 100 + minute, timestamp=NOW + timedelta(minutes=minute))
+
+    assert [len(call.args[0]) for call in insert.await_args_list] == [3, 3]
+    assert service.pending == 1
+    assert insert.await_args_list[0].args[0][0] == {"symbol": "bitcoin", "timestamp": NOW, "price": 100.0}
+
+
+@pytest.mark.asyncio
+async def test_repeated_quotes_are_recorded_once():
+    service = PriceHistoryService(batch_size=10, flush_seconds=3600)
+
+    assert await service.record_price("bitcoin", 100, timestamp=NOW)
+    assert not await service.record_price("bitcoin", 100, timestamp=NOW)
+    assert await service.record_price("ethereum", 3, timestamp=NOW)
+    assert service.pending == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_write_keeps_samples_for_the_next_flush():
+    service = PriceHistoryService(batch_size=2, flush_seconds=3600)
+    insert = AsyncMock(side_effect=[RuntimeError("db down"), ["a", "b"]])
+
+    with patch("crypto_news_aggregator.services.price_history.insert_price_samples", insert), \
+         patch("crypto_news_aggregator.services.price_history.price_rollup_operations", return_value=[]):
+        await service.record_price("bitcoin", 100, timestamp=NOW)
+        await service.record_price("bitcoin", 101, timestamp=NOW + timedelta(minutes=1))
+        assert service.pending == 2
+        assert await service.flush() == 2
+
+    assert service.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_rollups_are_retried_without_storing_samples_again():
+    service = PriceHistoryService(batch_size=2, flush_seconds=3600)
+    insert = AsyncMock(side_effect=lambda batch: batch)
+    # One of the batch's upserts fails, then the whole call fails
+    update = AsyncMock(side_effect=[["1m"], RuntimeError("db down"), []])
+
+    with patch("crypto_news_aggregator.services.price_history.insert_price_samples", insert), \
+         patch("crypto_news_aggregator.services.price_history.update_price_rollups", update), \
+         patch(
+             "crypto_news_aggregator.services.price_history.price_rollup_operations",
+             return_value=["1m", "1h", "1d"],
+         ):
+        await service.record_price("bitcoin", 100, timestamp=NOW)
+        await service.record_price("bitcoin", 101, timestamp=NOW + timedelta(minutes=1))
+        assert await service.flush() == 0
+        assert await service.flush() == 0
+
+    insert.assert_awaited_once()
+    assert [call.args[0] for call in update.await_args_list] == [["1m", "1h", "1d"], ["1m"], ["1m"]]
+    assert service.pending == 0
+
+
+def test_resolution_for_window():
+    assert resolution_for_window(24) == "1m"
+    assert resolution_for_window(24 * 30) == "1h"
+    assert resolution_for_window(24 * 365) == "1d"
@@ -0,0 +1,112 @@
+"""
+Tests for the shared price tick stream and the price monitor built on it.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from crypto_news_aggregator.services.price_ticks import PriceTick, PriceTickService, next_interval
+
+NOW = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def make_service(prices, symbols=("bitcoin", "ethereum", "solana")):
+    price_service = MagicMock()
+    price_service.fetch_prices = AsyncMock(return_value=prices)
+    with patch(
+        "crypto_news_aggregator.services.price_ticks.get_price_service",
+        return_value=price_service,
+    ):
+        return PriceTickService(symbols=symbols)
+
+
+def test_next_interval_adapts_to_volatility():
+    kwargs = dict(min_interval=30, max_interval=300, volatile_move_percent=0.5)
+
+    assert next_interval(300, 1.0, **kwargs) == 150
+    assert next_interval(40, 1.0, **kwargs) == 30
+    assert next_interval(100, 0.3, **kwargs) == 100
+    assert next_interval(100, 0.1, **kwargs) == 150
+    assert next_interval(250, 0.1, **kwargs) == 300
+
+
+@pytest.mark.asyncio
+async def test_poll_fetches_all_symbols_once_and_publishes():
+    service = make_service(
+        {
+            "bitcoin": {"price": 60000.0, "change_24h": 1.5, "volume_24h": 3e10, "timestamp": NOW},
+            "ethereum": {"price": 3000.0, "change_24h": -0.5, "timestamp": NOW},
+            "solana": {},
+        }
+    )
+    received = []
+    service.subscribe("collect", AsyncMock(side_effect=received.append))
+    service.subscribe("broken", AsyncMock(side_effect=RuntimeError("subscriber down")))
+
+    ticks = await service.poll()
+
+    service.price_service.fetch_prices.assert_awaited_once_with(["bitcoin", "ethereum", "solana"])
+    assert [tick.symbol for tick in ticks] == ["bitcoin", "ethereum"]
+    assert ticks[0].volume_24h == 3e10
+    # A failing subscriber doesn't keep the others from the tick
+    assert received == [ticks]
+    assert service.latest["ethereum"].price == 3000.0
+
+
+@pytest.mark.asyncio
+async def test_tracked_symbols_join_the_same_request():
+    service = make_service({}, symbols=["bitcoin"])
+    service.track("Ethereum", "bitcoin")
+
+    await service.poll()
+
+    service.price_service.fetch_prices.assert_awaited_once_with(["bitcoin", "ethereum"])
+
+
+@pytest.mark.asyncio
+async def test_interval_tightens_on_volatile_ticks():
+    service = make_service({"bitcoin": {"price": 100.0, "timestamp": NOW}}, symbols=["bitcoin"])
+    await service.poll()
+    assert service.interval == 300
+
+    # 2% in 30 seconds
+    service._last_tick_at = asyncio.get_running_loop().time() - 30
+    service.price_service.fetch_prices.return_value = {"bitcoin": {"price": 102.0, "timestamp": NOW}}
+    await service.poll()
+    assert service.interval == 150
+
+    # Flat prices relax the interval again
+    service._last_tick_at = asyncio.get_running_loop().time() - 150
+    await service.poll()
+    assert service.interval == 225
+
+
+@pytest.mark.asyncio
+async def test_price_monitor_detects_moves_for_every_coin():
+    from crypto_news_aggregator.tasks.price_monitor import PriceMonitor
+
+    monitor = PriceMonitor()
+    monitor.price_service = MagicMock()
+    monitor.price_service.should_trigger_alert = AsyncMock(
+        side_effect=lambda current_price, last_alert_price, threshold: (
+            abs(current_price / last_alert_price - 1) * 100 >= threshold,
+            (current_price / last_alert_price - 1) * 100,
+        )
+    )
+    monitor._handle_price_movement = AsyncMock()
+
+    def ticks(btc, eth, at):
+        return [PriceTick("bitcoin", btc, 0.0, at), PriceTick("ethereum", eth, 0.0, at)]
+
+    await monitor._check_prices(ticks(60000.0, 3000.0, NOW))
+    # Two small steps add up to a move past the threshold within one interval
+    await monitor._check_prices(ticks(60100.0, 3020.0, NOW + timedelta(seconds=30)))
+    await monitor._check_prices(ticks(60150.0, 3040.0, NOW + timedelta(seconds=60)))
+
+    monitor._handle_price_movement.assert_awaited_once()
+    movement = monitor._handle_price_movement.call_args[0][0]
+    assert movement["symbol"] == "ethereum"
+    assert movement["change_pct"] == pytest.approx(4 / 3)
@@ -5,8 +5,15 @@ Tests pattern matching, tier assignment, and edge case handling
 for the relevance classifier service.
 """
 
+import json
+from pathlib import Path
+
 import pytest
-from crypto_news_aggregator.services.relevance_classifier import classify_article
+from crypto_news_aggregator.services.relevance_classifier import (
+    RelevanceClassifier,
+    classify_article,
+    required_literals,
+)
 
 
 class TestTier1SignalPatterns:
@@ -489,3 +496,86 @@ class TestRegressionPrevention:
         # Check patterns are compiled
         assert len(classifier._tier1_patterns) > 0
         assert len(classifier._tier3_patterns) > 0
+
+
+GOLDEN_FILE = Path(__file__).parent / "data" / "relevance_classifier_golden.json"
+
+
+class TestRuleSets:
+    """The prefiltered rule sets must classify exactly like per-pattern matching."""
+
+    def test_matches_golden_classifications(self):
+        """Tier, reason and pattern match the recorded per-pattern results."""
+        classifier = RelevanceClassifier()
+        golden = json.loads(GOLDEN_FILE.read_text())
+        assert len(golden) > 100
+
+        for expected in golden:
+            result = classifier.classify(expected["title"], expected["text"])
+            assert (result["tier"], result["reason"], result["matched_pattern"]) == (
+                expected["tier"],
+                expected["reason"],
+                expected["matched_pattern"],
+            ), expected["title"]
+
+    def test_required_literals(self):
+        """Rules reduce to the literal text every match contains."""
+        assert required_literals(r"\bcould\s+reach\s+\$[\d,]+\b") == (("could",), ("reach",), ("$",))
+        assert required_literals(r"\bhack(ed|ing|s)?\b") == (("hack",),)
+        assert required_literals(r"\b(bought|buys?)\b.*\b(btc|eth)\b") == (("bought", "buy"), ("btc", "eth"))
+        assert required_literals(r"^(?!.*\bcrypto\b).*\b(aapl|tsla)\b") == (("aapl", "tsla"),)
+        assert required_literals(r"^[a-z]+\d?$") == ()
+
+    def test_prefilter_handles_case_folding(self):
+        """Characters that match ASCII letters case-insensitively aren't filtered out."""
+        # "ſ" (long s) matches "s" under re.IGNORECASE
+        assert classify_article("ſEC sues exchange")["matched_pattern"] == r"\bsec\b"
+
+    def test_reports_first_rule_in_list_order(self):
+        """An earlier rule wins even when a later one matches further left."""
+        # "hacked" (security) appears before "sec" (regulatory) in the title
+        result = classify_article("Exchange hacked, SEC investigates")
+        assert result["matched_pattern"] == r"\bsec\b"
+        assert result["matched_rule"] == "regulatory"
+
+    def test_reports_rule_that_fired(self):
+        """Results name the rule group behind the tier."""
+        assert classify_article("Protocol Exploited for $10M")["matched_rule"] == "security"
+        assert classify_article("The Most Anticipated Games of 2026")["matched_rule"] == "non_crypto"
+        assert classify_article("New Crypto Project Launches")["matched_rule"] is None
+
+        result = classify_article("Weekly update", text="BlackRock filed for a new fund.")
+        assert result["reason"] == "high_signal_body"
+        assert result["matched_rule"] == "institutional"
+
+
+class TestClassifyBatch:
+    """Test batch classification."""
+
+    ARTICLES = [
+        {"title": "SEC Approves First Bitcoin ETF"},
+        {"title": "The Most Anticipated Games of 2026", "source": "decrypt"},
+        {"title": "Weekly update", "text": "The protocol was exploited overnight."},
+        {"title": "New Crypto Project Launches", "text": None},
+    ]
+
+    def test_batch_matches_single_classification(self):
+        """Batch results equal classify() per article, tagged with their index."""
+        classifier = RelevanceClassifier()
+        results = classifier.classify_batch(self.ARTICLES)
+
+        assert [r["index"] for r in results] == [0, 1, 2, 3]
+        assert [r["tier"] for r in results] == [1, 3, 1, 2]
+        for article, result in zip(self.ARTICLES, results):
+            expected = classifier.classify(article["title"], article.get("text"))
+            assert {k: v for k, v in result.items() if k != "index"} == expected
+
+    def test_batch_across_processes_keeps_order(self):
+        """Process pool batches return the same results in input order."""
+        classifier = RelevanceClassifier()
+        articles = self.ARTICLES * 5
+
+        serial = classifier.classify_batch(articles)
+        parallel = classifier.classify_batch(articles, processes=2, chunk_size=3)
+
+        assert parallel == serial
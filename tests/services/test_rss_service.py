@@ -0,0 +1,185 @@
+"""
+Tests for conditional RSS feed fetching.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from crypto_news_aggregator.services import rss_service
+from crypto_news_aggregator.services.rss_service import (
+    CHANGED,
+    FAILED,
+    NOT_MODIFIED,
+    RSSService,
+)
+
+FEED_URL = "https://example.com/feed"
+
+FEED_BODY = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Example</title>
+<item><title>Bitcoin rallies</title><link>https://example.com/a</link>
+<guid>guid-a</guid><description>BTC up</description></item>
+<item><title>Ether upgrade ships</title><link>https://example.com/b</link>
+<guid>guid-b</guid><description>ETH news</description></item>
+</channel></rss>"""
+
+
+FEED_HEADERS = {"Content-Type": "application/rss+xml; charset=utf-8"}
+
+
+def _client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_fetch_feed_parses_body_and_records_validators():
+    def handler(request):
+        assert "If-None-Match" not in request.headers
+        return httpx.Response(
+            200,
+            content=FEED_BODY,
+            headers={**FEED_HEADERS, "ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 12:00:00 GMT"},
+        )
+
+    async with _client(handler) as client:
+        result = await RSSService().fetch_feed(client, "coindesk", FEED_URL)
+
+    assert result.status == CHANGED
+    assert [a.title for a in result.articles] == ["Bitcoin rallies", "Ether upgrade ships"]
+    assert result.state["etag"] == '"v1"'
+    assert result.state["last_modified"] == "Wed, 01 Jan 2025 12:00:00 GMT"
+    assert result.state["entry_ids"] == ["guid-a", "guid-b"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_feed_sends_validators_and_short_circuits_on_304():
+    def handler(request):
+        assert request.headers["If-None-Match"] == '"v1"'
+        assert request.headers["If-Modified-Since"] == "Wed, 01 Jan 2025 12:00:00 GMT"
+        return httpx.Response(304)
+
+    state = {
+        "_id": "coindesk",
+        "url": FEED_URL,
+        "etag": '"v1"',
+        "last_modified": "Wed, 01 Jan 2025 12:00:00 GMT",
+    }
+    with patch.object(rss_service.feedparser, "parse") as parse:
+        async with _client(handler) as client:
+            result = await RSSService().fetch_feed(client, "coindesk", FEED_URL, state)
+
+    parse.assert_not_called()
+    assert result.status == NOT_MODIFIED
+    assert result.articles == []
+    assert result.state["last_status"] == 304
+
+
+@pytest.mark.asyncio
+async def test_fetch_feed_skips_identical_body_without_validators():
+    async with _client(lambda request: httpx.Response(200, content=FEED_BODY, headers=FEED_HEADERS)) as client:
+        service = RSSService()
+        first = await service.fetch_feed(client, "coindesk", FEED_URL)
+        with patch.object(rss_service.feedparser, "parse") as parse:
+            second = await service.fetch_feed(client, "coindesk", FEED_URL, first.state)
+
+    parse.assert_not_called()
+    assert second.status == NOT_MODIFIED
+
+
+@pytest.mark.asyncio
+async def test_fetch_feed_returns_only_unseen_entries():
+    state = {"_id": "coindesk", "url": FEED_URL, "entry_ids": ["guid-a"]}
+
+    async with _client(lambda request: httpx.Response(200, content=FEED_BODY, headers=FEED_HEADERS)) as client:
+        result = await RSSService().fetch_feed(client, "coindesk", FEED_URL, state)
+
+    assert result.status == CHANGED
+    assert [a.title for a in result.articles] == ["Ether upgrade ships"]
+    assert result.state["entry_ids"] == ["guid-a", "guid-b"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_feed_ignores_validators_for_a_different_url():
+    def handler(request):
+        assert "If-None-Match" not in request.headers
+        return httpx.Response(200, content=FEED_BODY, headers=FEED_HEADERS)
+
+    state = {"_id": "coindesk", "url": "https://old.example.com/rss", "etag": '"v1"'}
+    async with _client(handler) as client:
+        result = await RSSService().fetch_feed(client, "coindesk", FEED_URL, state)
+
+    assert result.status == CHANGED
+    assert len(result.articles) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_feed_tolerates_missing_content_type():
+    async with _client(lambda request: httpx.Response(200, content=FEED_BODY)) as client:
+        result = await RSSService().fetch_feed(client, "coindesk", FEED_URL)
+
+    assert result.status == CHANGED
+    assert len(result.articles) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_feed_fails_on_unreadable_body():
+    async with _client(
+        lambda request: httpx.Response(200, content=b"<html>not a feed", headers=FEED_HEADERS)
+    ) as client:
+        result = await RSSService().fetch_feed(client, "coindesk", FEED_URL)
+
+    assert result.status == FAILED
+
+
+@pytest.mark.asyncio
+async def test_fetch_feed_reports_http_errors():
+    async with _client(lambda request: httpx.Response(503)) as client:
+        result = await RSSService().fetch_feed(client, "coindesk", FEED_URL)
+
+    assert result.status == FAILED
+    assert result.state is None
+
+
+@pytest.mark.asyncio
+async def test_slow_feed_times_out_without_blocking_others():
+    service = RSSService()
+    service.feed_timeout = 0.05
+
+    async def fake_fetch(client, source, url, state):
+        if source == "slow":
+            await asyncio.sleep(1)
+        return rss_service.FeedFetchResult(source, CHANGED, state={"_id": source})
+
+    service.fetch_feed = fake_fetch
+    semaphore = asyncio.Semaphore(2)
+
+    results = await asyncio.gather(
+        service._fetch_feed_limited(None, semaphore, "slow", FEED_URL, None),
+        service._fetch_feed_limited(None, semaphore, "fast", FEED_URL, None),
+    )
+
+    assert [r.status for r in results] == [FAILED, CHANGED]
+
+
+@pytest.mark.asyncio
+async def test_feed_states_are_saved_only_on_request():
+    service = RSSService()
+    service.feed_urls = {"coindesk": FEED_URL}
+
+    async def fake_fetch(client, source, url, state):
+        return rss_service.FeedFetchResult(source, CHANGED, state={"_id": source, "etag": '"v2"'})
+
+    service.fetch_feed = fake_fetch
+    save = AsyncMock(return_value=1)
+
+    with patch.object(rss_service, "get_feed_states", AsyncMock(return_value={})), \
+         patch.object(rss_service, "save_feed_states", save):
+        await service.fetch_all_feeds()
+        save.assert_not_called()
+
+        await service.save_feed_states()
+
+    save.assert_awaited_once_with([{"_id": "coindesk", "etag": '"v2"'}])
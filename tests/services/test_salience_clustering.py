@@ -421,3 +421,81 @@ async def test_missing_fields():
     # But without salience data, article 3 has no core actors
     # Result depends on implementation details, but should not crash
     assert isinstance(clusters, list)
+
+
+def _reference_cluster(articles, min_cluster_size=3):
+    """Original O(articles x clusters x cluster_size) algorithm, kept as the golden reference."""
+    clusters = []
+    for article in articles:
+        nucleus = article.get('nucleus_entity')
+        actors = article.get('actors') or []
+        actor_salience = article.get('actor_salience') or {}
+        tensions = article.get('tensions') or []
+        if not nucleus or not actors:
+            continue
+        core_actors = [a for a in actors if actor_salience.get(a, 0) >= 4.5]
+
+        best_cluster = None
+        best_strength = 0.0
+        for cluster in clusters:
+            cluster_nucleus = cluster[0].get('nucleus_entity')
+            cluster_core_actors = set()
+            cluster_tensions = set()
+            for cluster_article in cluster:
+                cluster_tensions.update(cluster_article.get('tensions') or [])
+                c_salience = cluster_article.get('actor_salience') or {}
+                cluster_core_actors.update(
+                    a for a in cluster_article.get('actors') or []
+                    if c_salience.get(a, 0) >= 4.5
+                )
+            link_strength = 0.0
+            if nucleus == cluster_nucleus:
+                link_strength += 1.0
+            shared_core = len(set(core_actors) & cluster_core_actors)
+            if shared_core >= 2:
+                link_strength += 0.7
+            elif shared_core >= 1:
+                link_strength += 0.4
+            if set(tensions) & cluster_tensions:
+                link_strength += 0.3
+            if link_strength > best_strength:
+                best_strength = link_strength
+                best_cluster = cluster
+
+        if best_strength >= 0.8 and best_cluster is not None:
+            best_cluster.append(article)
+        else:
+            clusters.append([article])
+    return [c for c in clusters if len(c) >= min_cluster_size]
+
+
+def _golden_articles(count, seed=42):
+    """Deterministic synthetic dataset with overlapping nuclei, actors and tensions."""
+    import random
+
+    rng = random.Random(seed)
+    entities = [f"Entity{i}" for i in range(60)]
+    tensions = [f"Tension{i}" for i in range(25)]
+    articles = []
+    for i in range(count):
+        actors = rng.sample(entities, rng.randint(1, 5))
+        articles.append({
+            "id": str(i),
+            "nucleus_entity": rng.choice(actors) if rng.random() > 0.05 else None,
+            "actors": actors,
+            "actor_salience": {a: rng.choice([2, 3, 4, 4.5, 5]) for a in actors},
+            "tensions": rng.sample(tensions, rng.randint(0, 2)),
+        })
+    return articles
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count,min_cluster_size", [(200, 1), (1500, 3)])
+async def test_indexed_clustering_matches_reference(count, min_cluster_size):
+    """Indexed clustering must produce exactly the clusters of the original algorithm."""
+    articles = _golden_articles(count)
+
+    expected = _reference_cluster(articles, min_cluster_size=min_cluster_size)
+    actual = await cluster_by_narrative_salience(articles, min_cluster_size=min_cluster_size)
+
+    assert [[a["id"] for a in c] for c in actual] == [[a["id"] for a in c] for c in expected]
@@ -12,9 +12,12 @@ from crypto_news_aggregator.services.signal_service import (
     calculate_signal_score,
     calculate_mentions_and_velocity,
     calculate_recency_factor,
+    calculate_signal_scores_batch,
+    compute_trending_signals,
 )
 from crypto_news_aggregator.db.mongodb import mongo_manager
 from crypto_news_aggregator.db.operations.entity_mentions import create_entity_mention
+from crypto_news_aggregator.db.operations.entity_mention_rollups import rebuild_rollups
 
 
 @pytest.mark.asyncio
@@ -425,3 +428,137 @@ async def test_calculate_signal_score_with_timeframe(mongo_db):
     assert signal["source_count"] == 5
     
     await collection.delete_many({"entity": "TEST_MF_SIGNAL"})
+
+
+@pytest.mark.asyncio
+async def test_calculate_signal_scores_batch(mongo_db):
+    """Test batched scoring across entities and timeframes in one pass."""
+    collection = mongo_db.entity_mentions
+    
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    
+    docs = []
+    # BATCH_A: 4 mentions in the last 24h (2 in the last hour), 2 in the previous 24h
+    for hours_ago, source in [(0.5, "s1"), (0.5, "s2"), (6, "s1"), (12, "s3"), (30, "s1"), (40, "s2")]:
+        docs.append({
+            "entity": "BATCH_A",
+            "entity_type": "cryptocurrency",
+            "article_id": f"batch_a_{hours_ago}_{source}",
+            "sentiment": "positive",
+            "is_primary": True,
+            "source": source,
+            "relevance_tier": 1,
+            "created_at": now - timedelta(hours=hours_ago),
+        })
+    # BATCH_B: one high-signal mention, one excluded low-signal (tier 3) mention
+    docs.append({
+        "entity": "BATCH_B",
+        "entity_type": "company",
+        "article_id": "batch_b_high",
+        "sentiment": "negative",
+        "is_primary": True,
+        "source": "s1",
+        "relevance_tier": 2,
+        "created_at": now - timedelta(hours=2),
+    })
+    docs.append({
+        "entity": "BATCH_B",
+        "entity_type": "company",
+        "article_id": "batch_b_low",
+        "sentiment": "positive",
+        "is_primary": True,
+        "source": "s9",
+        "relevance_tier": 3,
+        "created_at": now - timedelta(hours=3),
+    })
+    await collection.insert_many(docs)
+    
+    scores = await calculate_signal_scores_batch(["BATCH_A", "BATCH_B", "BATCH_NONE"])
+    
+    a = scores["BATCH_A"]
+    assert a["24h"]["mentions"] == 4
+    assert a["24h"]["velocity"] == pytest.approx(100.0)  # 4 vs 2
+    assert a["24h"]["recency_factor"] == pytest.approx(0.5)  # 2 of 4 within 4.8h
+    assert a["24h"]["source_count"] == 3
+    assert a["7d"]["mentions"] == 6
+    assert a["legacy"]["sentiment"]["avg"] == pytest.approx(1.0)
+    assert a["first_seen"] is not None
+    
+    b = scores["BATCH_B"]
+    assert b["24h"]["mentions"] == 1
+    assert b["24h"]["source_count"] == 1
+    assert b["legacy"]["sentiment"]["avg"] == pytest.approx(-1.0)
+    # first_seen covers every tier, so the earlier low-signal mention counts
+    assert abs(b["first_seen"] - docs[-1]["created_at"]) < timedelta(seconds=1)
+    
+    none = scores["BATCH_NONE"]
+    assert none["24h"]["mentions"] == 0
+    assert none["legacy"]["score"] == 0.0
+    assert none["first_seen"] is None
+
+
+@pytest.mark.asyncio
+async def test_calculate_signal_scores_batch_reads_history_from_rollups(mongo_db):
+    """Test that mentions older than RAW_SCORING_HOURS are counted from the rollups."""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    docs = [
+        {
+            "entity": "BATCH_OLD",
+            "entity_type": "cryptocurrency",
+            "article_id": f"batch_old_{hours_ago}",
+            "sentiment": sentiment,
+            "is_primary": True,
+            "source": source,
+            "relevance_tier": tier,
+            "created_at": now - timedelta(hours=hours_ago),
+        }
+        for hours_ago, source, sentiment, tier in [
+            (2, "s1", "positive", 1),
+            (100, "s2", "negative", 1),
+            (200, "s3", "positive", 2),
+            (300, "s4", "positive", 3),  # low signal: excluded from metrics
+        ]
+    ]
+    await mongo_db.entity_mentions.insert_many(docs)
+    await rebuild_rollups(now - timedelta(hours=400))
+
+    scores = await calculate_signal_scores_batch(["BATCH_OLD"])
+    old = scores["BATCH_OLD"]
+
+    assert old["24h"]["mentions"] == 1
+    assert old["7d"]["mentions"] == 2
+    assert old["30d"]["mentions"] == 3
+    assert old["24h"]["source_count"] == 3
+    assert old["legacy"]["sentiment"]["min"] == pytest.approx(-1.0)
+    assert old["legacy"]["sentiment"]["avg"] == pytest.approx(1 / 3, abs=1e-3)
+    # first_seen covers every tier
+    assert abs(old["first_seen"] - docs[3]["created_at"]) < timedelta(seconds=1)
+
+
+@pytest.mark.asyncio
+async def test_compute_trending_signals_counts_every_tier(mongo_db):
+    """Test that trending ranks on mentions of every relevance tier."""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    docs = [
+        {
+            "entity": "TRENDING_LOW",
+            "entity_type": "cryptocurrency",
+            "article_id": f"trending_low_{tier}",
+            "sentiment": "neutral",
+            "is_primary": True,
+            "source": f"s{tier}",
+            "relevance_tier": tier,
+            "created_at": now - timedelta(hours=2),
+        }
+        for tier in (1, 3)
+    ]
+    await mongo_db.entity_mentions.insert_many(docs)
+    await rebuild_rollups(now - timedelta(hours=48))
+
+    signals = await compute_trending_signals(timeframe="24h")
+    signal = next(s for s in signals if s["entity"] == "TRENDING_LOW")
+
+    assert signal["mentions"] == 2
+    assert signal["source_count"] == 2
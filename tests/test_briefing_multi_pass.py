@@ -15,7 +15,7 @@ def mock_briefing_input():
         briefing_type="morning",
         signals=[],
         narratives=[{"title": "Test Narrative", "summary": "Test summary"}],
-        patterns=MagicMock(all_patterns=lambda: []),
+        patterns=MagicMock(all_patterns=lambda: [], to_prompt_context=lambda: ""),
         memory=MagicMock(manual_inputs=[], to_prompt_context=lambda: ""),
         generated_at=datetime.now(timezone.utc),
     )